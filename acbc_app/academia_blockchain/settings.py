@@ -83,7 +83,8 @@ INSTALLED_APPS = [
     'rest_framework_simplejwt',
     'drf_yasg',
     'bookmarks',
-    'notifications'
+    'notifications',
+    'jobs',
 ]
 
 MIDDLEWARE = [
@@ -501,12 +502,38 @@ else:
     }
 
 # In-process cache for lightweight read-mostly data (e.g. unread notification counts).
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'acbc-default',
-    },
-}
+# Shared between gunicorn workers when REDIS_URL is set (notification counts, response
+# cache); otherwise a per-process LocMemCache for local development and tests.
+REDIS_URL = os.getenv('REDIS_URL', '')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': os.getenv('CACHE_KEY_PREFIX', 'acbc'),
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'acbc-default',
+        },
+    }
+
+# Tag-versioned response cache (utils.shared_cache): L1 in-process LRU over the L2 alias.
+SHARED_CACHE_ENABLED = os.getenv('SHARED_CACHE_ENABLED', '1') == '1'
+SHARED_CACHE_ALIAS = os.getenv('SHARED_CACHE_ALIAS', 'default')
+SHARED_CACHE_TIMEOUT = int(os.getenv('SHARED_CACHE_TIMEOUT', '300'))
+SHARED_CACHE_L1_SIZE = int(os.getenv('SHARED_CACHE_L1_SIZE', '256'))
+SHARED_CACHE_L1_TTL = float(os.getenv('SHARED_CACHE_L1_TTL', '30'))
+# Book club hub: member progress/next event cache lifetime and how often the pulse
+# recounts its 7-day active readers (book_clubs.pulse).
+BOOK_CLUB_PROGRESS_CACHE_TIMEOUT = int(os.getenv('BOOK_CLUB_PROGRESS_CACHE_TIMEOUT', '60'))
+BOOK_CLUB_PULSE_ACTIVE_TTL = int(os.getenv('BOOK_CLUB_PULSE_ACTIVE_TTL', '900'))
+# Views using utils.http_compression compress bodies of at least this many bytes
+# (brotli when installed and accepted, else gzip).
+RESPONSE_COMPRESSION_MIN_BYTES = int(os.getenv('RESPONSE_COMPRESSION_MIN_BYTES', '1024'))
 
 # REST Framework configuration
 # Default deny: views must explicitly use AllowAny for public endpoints (login, register, search, health).
@@ -600,6 +627,8 @@ LOGIN_URL = "account_login"
 LOGIN_REDIRECT_URL = "profiles:set_jwt_token"
 LOGOUT_REDIRECT_URL = "http://localhost:5173/profiles/login"
 LANGUAGE_CODE = "en-us"
+# Read notifications older than this are deleted by `python manage.py purge_notifications` (run daily).
+NOTIFICATION_RETENTION_DAYS = int(os.getenv('NOTIFICATION_RETENTION_DAYS', '30'))
 # Set to True in .env when SMTP (SMTP2GO) is ready; keeps all email features disabled until then
 SEND_EMAILS = os.getenv("SEND_EMAILS", "false").lower() == "true"
 ACCOUNT_EMAIL_VERIFICATION = "none"
@@ -697,6 +726,26 @@ else:
     STATIC_URL = '/static/'
     STATICFILES_DIRS = [os.path.join(BASE_DIR, "static")]
 
+# Background jobs (jobs app): `python manage.py run_worker` runs them from the database queue.
+# JOBS_EAGER=1 runs handlers inline in the request instead (no worker process needed).
+JOBS_EAGER = os.getenv('JOBS_EAGER', '0') == '1'
+# Queue name -> worker threads, e.g. "default=2,media=1,notifications=2,badges=1".
+JOBS_QUEUES = {
+    name.strip(): int(concurrency or 1)
+    for name, _, concurrency in (
+        item.partition('=')
+        for item in os.getenv('JOBS_QUEUES', 'default=2,media=1,notifications=2,badges=1').split(',')
+        if item.strip()
+    )
+}
+JOBS_MAX_ATTEMPTS = int(os.getenv('JOBS_MAX_ATTEMPTS', '5'))
+# Retry delay: JOBS_RETRY_BACKOFF * 2**(attempt-1) seconds, capped at JOBS_RETRY_BACKOFF_MAX.
+JOBS_RETRY_BACKOFF = float(os.getenv('JOBS_RETRY_BACKOFF', '10'))
+JOBS_RETRY_BACKOFF_MAX = float(os.getenv('JOBS_RETRY_BACKOFF_MAX', '3600'))
+# A job 'running' longer than this (seconds) is assumed lost with its worker and requeued.
+JOBS_LOCK_TIMEOUT = int(os.getenv('JOBS_LOCK_TIMEOUT', '600'))
+JOBS_POLL_INTERVAL = float(os.getenv('JOBS_POLL_INTERVAL', '2'))
+
 # Use SQLite for tests when running locally without PostgreSQL (manage.py test or run_events_tests.py)
 import sys
 if "test" in sys.argv or "run_events_tests" in " ".join(sys.argv) or os.getenv("USE_SQLITE_FOR_TESTS") == "1":
@@ -706,6 +755,11 @@ if "test" in sys.argv or "run_events_tests" in " ".join(sys.argv) or os.getenv("
             "NAME": ":memory:",
         }
     }
+    # The LocMem cache outlives each test's rolled-back transaction; tests that
+    # exercise response caching enable it explicitly.
+    SHARED_CACHE_ENABLED = False
+    # Background jobs run inline so tests observe their side effects synchronously.
+    JOBS_EAGER = True
 
 # WhiteNoise configuration for serving static files in production
 # WhiteNoise allows Django to serve static files even when DEBUG=False
@@ -740,6 +794,46 @@ OPENAI_EMBEDDING_MODEL = os.getenv('OPENAI_EMBEDDING_MODEL', 'text-embedding-3-l
 OPENAI_CHAT_MODEL = os.getenv('OPENAI_CHAT_MODEL', 'gpt-4o-mini')
 TOPIC_CHAT_TOP_K = int(os.getenv('TOPIC_CHAT_TOP_K', '8'))
 TOPIC_CHAT_MAX_CONTEXT_CHARS = int(os.getenv('TOPIC_CHAT_MAX_CONTEXT_CHARS', '12000'))
+# Rerank + context packing (content.topic_chat_rerank).
+TOPIC_CHAT_RERANK_CANDIDATES = int(os.getenv('TOPIC_CHAT_RERANK_CANDIDATES', '16'))
+# 'diversify' uses payloads only; 'mmr' also asks Qdrant for every candidate's vector.
+TOPIC_CHAT_RERANKERS = [name for name in os.getenv('TOPIC_CHAT_RERANKERS', 'diversify').split(',') if name.strip()]
+TOPIC_CHAT_MMR_LAMBDA = float(os.getenv('TOPIC_CHAT_MMR_LAMBDA', '0.7'))
+TOPIC_CHAT_CROSS_ENCODER_MODEL = os.getenv('TOPIC_CHAT_CROSS_ENCODER_MODEL', '')
+TOPIC_CHAT_CONTEXT_TOKENS = int(os.getenv('TOPIC_CHAT_CONTEXT_TOKENS', '3000'))
+# Query-embedding cache (utils.embedding_cache): in-process LRU + optional shared CACHES alias.
+TOPIC_CHAT_EMBEDDING_CACHE_SIZE = int(os.getenv('TOPIC_CHAT_EMBEDDING_CACHE_SIZE', '512'))
+TOPIC_CHAT_EMBEDDING_CACHE_TTL = int(os.getenv('TOPIC_CHAT_EMBEDDING_CACHE_TTL', '3600'))
+TOPIC_CHAT_EMBEDDING_CACHE_ALIAS = os.getenv('TOPIC_CHAT_EMBEDDING_CACHE_ALIAS', '')
+# Answer cache (content.topic_chat_cache): reuse prior answers to near-identical questions.
+TOPIC_CHAT_ANSWER_CACHE_ENABLED = os.getenv('TOPIC_CHAT_ANSWER_CACHE_ENABLED', '1') == '1'
+TOPIC_CHAT_ANSWER_CACHE_THRESHOLD = float(os.getenv('TOPIC_CHAT_ANSWER_CACHE_THRESHOLD', '0.95'))
+TOPIC_CHAT_ANSWER_CACHE_TTL = int(os.getenv('TOPIC_CHAT_ANSWER_CACHE_TTL', str(7 * 24 * 3600)))
+TOPIC_CHAT_ANSWER_CACHE_CANDIDATES = int(os.getenv('TOPIC_CHAT_ANSWER_CACHE_CANDIDATES', '50'))
+# Async pipeline (content.topic_chat_async): overlapped stages, multi-query retrieval.
+TOPIC_CHAT_ASYNC_PIPELINE = os.getenv('TOPIC_CHAT_ASYNC_PIPELINE', '0') == '1'
+TOPIC_CHAT_QUERY_VARIANTS = int(os.getenv('TOPIC_CHAT_QUERY_VARIANTS', '0'))
+TOPIC_CHAT_HYDE = os.getenv('TOPIC_CHAT_HYDE', '0') == '1'
+# Per-stage budgets in seconds, e.g. "embed=5,search=5,completion=30" (unset stages keep defaults).
+TOPIC_CHAT_STAGE_TIMEOUTS = {
+    stage.strip(): float(seconds)
+    for stage, _, seconds in (
+        item.partition('=') for item in os.getenv('TOPIC_CHAT_STAGE_TIMEOUTS', '').split(',')
+    )
+    if stage.strip() and seconds.strip()
+}
+
+# Shared HTTP sessions for OpenAI/Qdrant (utils.http_session): pooling, retries, circuit breaker.
+UPSTREAM_HTTP_POOL_SIZE = int(os.getenv('UPSTREAM_HTTP_POOL_SIZE', '10'))
+UPSTREAM_HTTP_RETRIES = int(os.getenv('UPSTREAM_HTTP_RETRIES', '3'))
+UPSTREAM_HTTP_BACKOFF = float(os.getenv('UPSTREAM_HTTP_BACKOFF', '0.5'))
+UPSTREAM_CIRCUIT_FAILURES = int(os.getenv('UPSTREAM_CIRCUIT_FAILURES', '5'))
+UPSTREAM_CIRCUIT_RESET = float(os.getenv('UPSTREAM_CIRCUIT_RESET', '30'))
+
+# Transcript search from the main search endpoint (type=transcripts / hybrid).
+SEARCH_TRANSCRIPT_CANDIDATES = int(os.getenv('SEARCH_TRANSCRIPT_CANDIDATES', '32'))
+# Offline development: in-memory Qdrant/OpenAI stand-ins (utils.vector_fakes).
+VECTOR_CLIENTS_FAKE = os.getenv('VECTOR_CLIENTS_FAKE', '0') == '1'
 
 # Bitcoin OP_RETURN anchoring for transcript text_hash (platform wallet).
 # Network: signet (recommended for tests), testnet, or mainnet.
@@ -758,6 +852,10 @@ BTC_API_BASE = os.getenv(
     _BTC_API_DEFAULTS.get(BTC_NETWORK, _BTC_API_DEFAULTS['signet']),
 ).rstrip('/')
 BTC_MIN_CONFIRMATIONS = int(os.getenv('BTC_MIN_CONFIRMATIONS', '1'))
+# Broadcast anchors are polled by the job worker every BTC_ANCHOR_REFRESH_INTERVAL seconds,
+# at most BTC_ANCHOR_REFRESH_MAX_POLLS times (manage.py refresh_transcript_anchors restarts it).
+BTC_ANCHOR_REFRESH_INTERVAL = int(os.getenv('BTC_ANCHOR_REFRESH_INTERVAL', '600'))
+BTC_ANCHOR_REFRESH_MAX_POLLS = int(os.getenv('BTC_ANCHOR_REFRESH_MAX_POLLS', '432'))
 # Fee rate floor in sat/vB when the API fee endpoint is unavailable.
 BTC_FALLBACK_FEE_SAT_VB = int(os.getenv('BTC_FALLBACK_FEE_SAT_VB', '25'))
 # Reject broadcast when estimated fee USD exceeds this (0 disables the check).
@@ -8,6 +8,7 @@ from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 from profiles.views import GoogleLoginView, newsletter_subscribe
+from utils.views import upstream_metrics
 
 
 def health_check(request):
@@ -29,6 +30,7 @@ schema_view = get_schema_view(
 
 urlpatterns = [
     path('health/', health_check, name='health_check'),
+    path('health/upstreams/', upstream_metrics, name='upstream_metrics'),
     path('admin/', admin.site.urls),
     path('subscribe/', newsletter_subscribe, name='newsletter_subscribe'),
     path('api/profiles/', include('profiles.urls')),
@@ -5,3 +5,6 @@ class BookClubsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'book_clubs'
     verbose_name = 'Book Clubs'
+
+    def ready(self):
+        import book_clubs.signals  # noqa
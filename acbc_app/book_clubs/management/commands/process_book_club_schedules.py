@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+
+from book_clubs.models import BookClub, BookClubMissionRelease, DiscussionQuestion, DiscussionQuestionStatus
+from book_clubs.schedule import apply_due_question_transitions, schedule_mission_release, schedule_question
+
+
+class Command(BaseCommand):
+    help = (
+        'Apply discussion question transitions that are due and queue the future ones '
+        '(and future mission releases) for the job worker. Run after deploying the '
+        'scheduler, or from cron as a safety net when no worker is running.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--no-enqueue',
+            action='store_true',
+            help='Only apply due transitions; do not queue future ones.',
+        )
+
+    def handle(self, *args, **options):
+        opened, closed = apply_due_question_transitions()
+        self.stdout.write(f'Opened {opened} and closed {closed} question(s).')
+        if options['no_enqueue']:
+            return
+
+        now = timezone.now()
+        pending = DiscussionQuestion.objects.filter(
+            Q(status=DiscussionQuestionStatus.DRAFT, opens_at__gt=now)
+            | Q(closes_at__gt=now) & ~Q(status=DiscussionQuestionStatus.CLOSED)
+        )
+        questions = 0
+        for question in pending.iterator():
+            schedule_question(question)
+            questions += 1
+        releases = 0
+        for book_club_id, opens_at in BookClubMissionRelease.objects.filter(
+            opens_at__gt=now,
+        ).values_list('book_club_id', 'opens_at'):
+            schedule_mission_release(book_club_id, opens_at)
+            releases += 1
+        for book_club_id, starts_at in BookClub.objects.filter(
+            starts_at__gt=now,
+        ).values_list('id', 'starts_at'):
+            schedule_mission_release(book_club_id, starts_at)
+            releases += 1
+        self.stdout.write(self.style.SUCCESS(
+            f'Queued transitions for {questions} question(s) and {releases} mission release(s).'
+        ))
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from book_clubs.models import BookClub, DiscussionQuestion
+from book_clubs.pulse import rebuild_pulse, sync_answer_counts
+
+
+class Command(BaseCommand):
+    help = (
+        'Recount every BookClubPulse and DiscussionQuestion.answer_count. '
+        'Run after bulk imports that skip model signals, or to repair drift.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--slug',
+            default=None,
+            help='Only rebuild this club (default: all clubs).',
+        )
+
+    def handle(self, *args, **options):
+        clubs = BookClub.objects.all()
+        if options['slug']:
+            clubs = clubs.filter(slug=options['slug'])
+            if not clubs.exists():
+                raise CommandError(f'Book club "{options["slug"]}" not found.')
+
+        rebuilt = 0
+        for club in clubs.iterator():
+            rebuild_pulse(club)
+            rebuilt += 1
+        answers = sync_answer_counts(DiscussionQuestion.objects.filter(book_club__in=clubs))
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt pulse for {rebuilt} club(s) and answer counts for {answers} question(s).'
+        ))
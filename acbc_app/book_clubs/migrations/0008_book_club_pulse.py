@@ -0,0 +1,57 @@
+# Generated by Django 5.0 on 2026-10-17 01:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_answer_counts(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    Comment = apps.get_model('comments', 'Comment')
+    DiscussionQuestion = apps.get_model('book_clubs', 'DiscussionQuestion')
+    content_type = ContentType.objects.filter(app_label='book_clubs', model='discussionquestion').first()
+    if content_type is None:
+        return
+    answers = (
+        Comment.objects.filter(
+            content_type=content_type, object_id=OuterRef('pk'), parent=None, is_active=True,
+        )
+        .order_by()
+        .values('object_id')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    DiscussionQuestion.objects.update(answer_count=Coalesce(Subquery(answers, output_field=IntegerField()), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('book_clubs', '0007_bookclubmissionrelease'),
+        ('comments', '0002_comment_path'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('knowledge_paths', '0006_knowledgepath_vote_score'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='discussionquestion',
+            name='answer_count',
+            field=models.IntegerField(default=0, help_text='Active top-level answers; kept in sync by book_clubs.signals.'),
+        ),
+        migrations.RunPython(backfill_answer_counts, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='BookClubPulse',
+            fields=[
+                ('book_club', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='pulse', serialize=False, to='book_clubs.bookclub')),
+                ('member_count', models.IntegerField(default=0)),
+                ('completed_pairs', models.IntegerField(default=0, help_text='Completed (member, mission) pairs on the path.')),
+                ('first_mission_completions', models.IntegerField(default=0)),
+                ('active_readers_7d', models.IntegerField(default=0)),
+                ('active_readers_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('knowledge_path', models.ForeignKey(blank=True, help_text='Path the completion counts were computed for.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='knowledge_paths.knowledgepath')),
+            ],
+        ),
+    ]
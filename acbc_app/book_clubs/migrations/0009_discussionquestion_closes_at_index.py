@@ -0,0 +1,31 @@
+# Generated by Django 5.0 on 2026-10-17 01:56
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def apply_due_transitions(apps, schema_editor):
+    """Read paths used to apply schedules; catch up on anything due before the scheduler."""
+    DiscussionQuestion = apps.get_model('book_clubs', 'DiscussionQuestion')
+    now = timezone.now()
+    DiscussionQuestion.objects.filter(status='draft', opens_at__lte=now).update(status='open', updated_at=now)
+    DiscussionQuestion.objects.filter(status='open', closes_at__lte=now).update(status='closed', updated_at=now)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('book_clubs', '0008_book_club_pulse'),
+        ('events', '0002_event_is_visible'),
+        ('knowledge_paths', '0006_knowledgepath_vote_score'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(apply_due_transitions, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='discussionquestion',
+            index=models.Index(fields=['closes_at'], name='book_clubs__closes__c0bc36_idx'),
+        ),
+    ]
@@ -129,6 +129,39 @@ class BookClubMembership(models.Model):
         return self.intro_updated_at is not None
 
 
+class BookClubPulse(models.Model):
+    """
+    Club-wide reading signals shown in the hub, maintained by book_clubs.pulse from
+    membership and completion events instead of being counted on every load.
+    """
+    book_club = models.OneToOneField(
+        BookClub,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='pulse',
+    )
+    knowledge_path = models.ForeignKey(
+        'knowledge_paths.KnowledgePath',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text='Path the completion counts were computed for.',
+    )
+    member_count = models.IntegerField(default=0)
+    completed_pairs = models.IntegerField(
+        default=0,
+        help_text='Completed (member, mission) pairs on the path.',
+    )
+    first_mission_completions = models.IntegerField(default=0)
+    active_readers_7d = models.IntegerField(default=0)
+    active_readers_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f'{self.book_club_id} pulse'
+
+
 class BookClubMissionRelease(models.Model):
     """Collective release date for one mission in a club's knowledge path."""
 
@@ -222,6 +255,10 @@ class DiscussionQuestion(models.Model):
     )
     opens_at = models.DateTimeField(null=True, blank=True)
     closes_at = models.DateTimeField(null=True, blank=True)
+    answer_count = models.IntegerField(
+        default=0,
+        help_text='Active top-level answers; kept in sync by book_clubs.signals.',
+    )
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
@@ -236,12 +273,22 @@ class DiscussionQuestion(models.Model):
         indexes = [
             models.Index(fields=['book_club', 'status']),
             models.Index(fields=['opens_at']),
+            models.Index(fields=['closes_at']),
         ]
 
     def __str__(self):
         preview = (self.body[:60] + '…') if len(self.body) > 60 else self.body
         return f'[{self.status}] {preview}'
 
+    def save(self, *args, **kwargs):
+        # Transitions already due are applied on write; later ones are run by the
+        # scheduler (book_clubs.schedule), so read paths never have to.
+        self.apply_schedule()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'status' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'status']
+        super().save(*args, **kwargs)
+
     def apply_schedule(self, now=None):
         """
         Auto-transition draft→open / open→closed based on opens_at / closes_at.
@@ -0,0 +1,222 @@
+"""
+Book club hub aggregates: the club pulse snapshot and the member's cached progress.
+
+BookClubPulse keeps the club-wide counts of the hub (members, completed (member,
+mission) pairs, first-mission completions, readers active in the last 7 days) so a
+hub load reads one row instead of counting over UserNodeCompletion. book_clubs.signals
+moves the counts by deltas on membership and completion writes. active_readers_7d is a
+sliding window, so it is recounted at most every BOOK_CLUB_PULSE_ACTIVE_TTL seconds.
+rebuild_pulse() recomputes everything: on first read, when the club changes path and
+from the rebuild_book_club_pulse command. Answers per discussion question are kept on
+DiscussionQuestion.answer_count.
+
+member_hub_progress() caches one member's progress and next mission for
+BOOK_CLUB_PROGRESS_CACHE_TIMEOUT seconds, under tags bumped by that member's
+completions and quiz attempts on the path and by the club's mission releases.
+"""
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from book_clubs.models import BookClubMembership, BookClubPulse, DiscussionQuestion
+from knowledge_paths.services.progress_service import PathProgress
+from profiles.models import UserNodeCompletion
+from utils.shared_cache import cached_value
+
+ACTIVE_READERS_WINDOW = timezone.timedelta(days=7)
+
+
+def club_tag(club_id):
+    return f'book_club:{club_id}'
+
+
+def progress_tag(knowledge_path_id, user_id):
+    return f'path_progress:{knowledge_path_id}:{user_id}'
+
+
+def _active_readers_ttl():
+    return timezone.timedelta(seconds=getattr(settings, 'BOOK_CLUB_PULSE_ACTIVE_TTL', 900))
+
+
+def first_node_id(knowledge_path_id):
+    from knowledge_paths.models import Node
+
+    return (
+        Node.objects.filter(knowledge_path_id=knowledge_path_id)
+        .order_by('order')
+        .values_list('id', flat=True)
+        .first()
+    )
+
+
+def _member_completions(club):
+    return UserNodeCompletion.objects.filter(
+        knowledge_path_id=club.knowledge_path_id,
+        is_completed=True,
+        user_id__in=BookClubMembership.objects.filter(book_club=club).values('user_id'),
+    )
+
+
+def _count_active_readers(club, now):
+    return (
+        _member_completions(club)
+        .filter(completed_at__gte=now - ACTIVE_READERS_WINDOW)
+        .values('user_id')
+        .distinct()
+        .count()
+    )
+
+
+def rebuild_pulse(club, now=None):
+    """Recount every pulse field of club and store them."""
+    now = now or timezone.now()
+    values = {
+        'knowledge_path_id': club.knowledge_path_id,
+        'member_count': BookClubMembership.objects.filter(book_club=club).count(),
+        'completed_pairs': 0,
+        'first_mission_completions': 0,
+        'active_readers_7d': 0,
+        'active_readers_at': now,
+    }
+    if club.knowledge_path_id and values['member_count']:
+        completions = _member_completions(club)
+        values['completed_pairs'] = completions.count()
+        first_id = first_node_id(club.knowledge_path_id)
+        if first_id:
+            values['first_mission_completions'] = completions.filter(node_id=first_id).count()
+        values['active_readers_7d'] = _count_active_readers(club, now)
+    pulse, _ = BookClubPulse.objects.update_or_create(book_club=club, defaults=values)
+    return pulse
+
+
+def get_pulse(club):
+    """The club's pulse row, rebuilt if missing or stale for its path."""
+    pulse = BookClubPulse.objects.filter(book_club=club).first()
+    if pulse is None or pulse.knowledge_path_id != club.knowledge_path_id:
+        return rebuild_pulse(club)
+    now = timezone.now()
+    if pulse.active_readers_at is None or pulse.active_readers_at <= now - _active_readers_ttl():
+        pulse.active_readers_7d = _count_active_readers(club, now) if club.knowledge_path_id else 0
+        pulse.active_readers_at = now
+        BookClubPulse.objects.filter(pk=pulse.pk).update(
+            active_readers_7d=pulse.active_readers_7d,
+            active_readers_at=now,
+        )
+    return pulse
+
+
+def pulse_payload(pulse, open_questions, total_nodes):
+    """The hub's club_pulse dict: collective signals for the reading experience."""
+    member_count = pulse.member_count
+    path_completion_pct = 0
+    if total_nodes and member_count:
+        path_completion_pct = round((pulse.completed_pairs / (member_count * total_nodes)) * 100)
+    return {
+        'member_count': member_count,
+        'active_readers_7d': pulse.active_readers_7d,
+        'open_debates': len(open_questions),
+        'total_answers': sum(question.answer_count for question in open_questions),
+        'first_mission_completions': pulse.first_mission_completions,
+        'path_completion_pct': path_completion_pct,
+    }
+
+
+def apply_membership_delta(book_club_id, knowledge_path_id, user_id, sign):
+    """A member joined (sign=1) or left (sign=-1): move them and their completions."""
+    changes = {'member_count': F('member_count') + sign}
+    if knowledge_path_id:
+        done = set(
+            UserNodeCompletion.objects.filter(
+                user_id=user_id, knowledge_path_id=knowledge_path_id, is_completed=True,
+            ).values_list('node_id', flat=True)
+        )
+        if done:
+            changes['completed_pairs'] = F('completed_pairs') + sign * len(done)
+            if first_node_id(knowledge_path_id) in done:
+                changes['first_mission_completions'] = F('first_mission_completions') + sign
+    BookClubPulse.objects.filter(
+        book_club_id=book_club_id, knowledge_path_id=knowledge_path_id,
+    ).update(**changes)
+
+
+def apply_completion_delta(completion, sign):
+    """completion became completed (sign=1) or stopped counting (sign=-1)."""
+    pulses = BookClubPulse.objects.filter(
+        knowledge_path_id=completion.knowledge_path_id,
+        book_club__memberships__user_id=completion.user_id,
+    )
+    changes = {'completed_pairs': F('completed_pairs') + sign}
+    if completion.node_id == first_node_id(completion.knowledge_path_id):
+        changes['first_mission_completions'] = F('first_mission_completions') + sign
+    pulses.update(**changes)
+
+
+def _answer_counts():
+    from comments.models import Comment
+
+    answers = (
+        Comment.objects.filter(
+            content_type=ContentType.objects.get_for_model(DiscussionQuestion),
+            object_id=OuterRef('pk'),
+            parent=None,
+            is_active=True,
+        )
+        .order_by()
+        .values('object_id')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    return Coalesce(Subquery(answers, output_field=IntegerField()), 0)
+
+
+def sync_answer_counts(questions):
+    """Recount answer_count for a DiscussionQuestion queryset with one UPDATE."""
+    return questions.update(answer_count=_answer_counts())
+
+
+def member_hub_progress(club, user):
+    """(progress, next_mission) of a member in the club's path, cached briefly."""
+
+    def compute():
+        path_progress = PathProgress(user, club.knowledge_path, book_club=club)
+        progress = path_progress.as_dict()
+        return progress, _next_mission(club, path_progress.nodes, progress)
+
+    return cached_value(
+        f'book_club_hub_progress:{club.id}:{user.id}',
+        compute,
+        tags=[club_tag(club.id), progress_tag(club.knowledge_path_id, user.id)],
+        timeout=getattr(settings, 'BOOK_CLUB_PROGRESS_CACHE_TIMEOUT', 60),
+    )
+
+
+def _next_mission(club, nodes, progress):
+    """First available incomplete mission, else the first incomplete one (locked)."""
+    nodes_by_id = {node.id: node for node in nodes}
+    incomplete = [n for n in progress['nodes_progress'] if not n.get('is_completed')]
+    for node_data in incomplete:
+        if node_data.get('is_available'):
+            node = nodes_by_id.get(node_data['node_id'])
+            return {
+                'node_id': node_data['node_id'],
+                'title': node_data['title'],
+                'order': node_data['order'],
+                'path_id': club.knowledge_path_id,
+                'description': (node.description or '') if node else '',
+                'locked': False,
+            }
+    for node_data in incomplete[:1]:
+        node = nodes_by_id.get(node_data['node_id'])
+        return {
+            'node_id': node_data['node_id'],
+            'title': node_data['title'],
+            'order': node_data['order'],
+            'path_id': club.knowledge_path_id,
+            'description': (node.description or '') if node else '',
+            'locked': not node_data.get('is_available', False),
+            'club_schedule_locked': node_data.get('club_schedule_locked', False),
+            'opens_at': node_data.get('club_opens_at'),
+        }
+    return None
@@ -0,0 +1,74 @@
+"""
+Scheduled book club transitions: discussion questions opening and closing, missions
+being released.
+
+Every future transition time is a job in the jobs queue with run_after set to that
+time (jobs.queue orders due jobs by run_after, so the queue is the timing wheel), keyed
+by the time itself so questions due at the same instant share one job:
+
+- 'book_clubs.question_transitions' applies every transition that is due, for all
+  clubs, with two UPDATEs (draft→open, open→closed). It is idempotent: a job left
+  behind by an edited opens_at/closes_at finds nothing to do.
+- 'book_clubs.mission_released' bumps the club's cache tag when a mission opens, so
+  cached hub progress (book_clubs.pulse) shows it right away.
+
+DiscussionQuestion.save() applies transitions already due on write, and
+book_clubs.signals schedules the future ones; read paths only read the stored status.
+process_book_club_schedules runs the same sweep from cron if no worker is running.
+"""
+import logging
+
+from django.utils import timezone
+
+from book_clubs.models import DiscussionQuestion, DiscussionQuestionStatus
+from jobs.queue import enqueue_on_commit
+
+logger = logging.getLogger('academia_blockchain.book_clubs.schedule')
+
+QUESTION_TRANSITIONS_TASK = 'book_clubs.question_transitions'
+MISSION_RELEASED_TASK = 'book_clubs.mission_released'
+
+
+def apply_due_question_transitions(now=None):
+    """Open and close every question whose time has come. Returns (opened, closed)."""
+    now = now or timezone.now()
+    opened = DiscussionQuestion.objects.filter(
+        status=DiscussionQuestionStatus.DRAFT, opens_at__lte=now,
+    ).update(status=DiscussionQuestionStatus.OPEN, updated_at=now)
+    closed = DiscussionQuestion.objects.filter(
+        status=DiscussionQuestionStatus.OPEN, closes_at__lte=now,
+    ).update(status=DiscussionQuestionStatus.CLOSED, updated_at=now)
+    if opened or closed:
+        logger.info('Applied discussion question schedule', extra={'opened': opened, 'closed': closed})
+    return opened, closed
+
+
+def pending_question_transitions(question, now=None):
+    """Future times at which question changes status (opening, then closing)."""
+    now = now or timezone.now()
+    times = []
+    if question.status == DiscussionQuestionStatus.DRAFT and question.opens_at and question.opens_at > now:
+        times.append(question.opens_at)
+    if question.status != DiscussionQuestionStatus.CLOSED and question.closes_at and question.closes_at > now:
+        times.append(question.closes_at)
+    return times
+
+
+def schedule_question(question):
+    for due in pending_question_transitions(question):
+        enqueue_on_commit(
+            QUESTION_TRANSITIONS_TASK,
+            run_after=due,
+            idempotency_key=f'{QUESTION_TRANSITIONS_TASK}:{due.isoformat()}',
+        )
+
+
+def schedule_mission_release(book_club_id, opens_at):
+    if opens_at is None or opens_at <= timezone.now():
+        return
+    enqueue_on_commit(
+        MISSION_RELEASED_TASK,
+        book_club_id=book_club_id,
+        run_after=opens_at,
+        idempotency_key=f'{MISSION_RELEASED_TASK}:{book_club_id}:{opens_at.isoformat()}',
+    )
@@ -1,4 +1,3 @@
-from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
 from rest_framework import serializers
 
@@ -9,7 +8,6 @@ from book_clubs.models import (
     DiscussionQuestion,
     DiscussionQuestionStatus,
 )
-from comments.models import Comment
 from content.image_utils import validate_cover_image_size
 from content.models import Topic
 from content.utils import build_media_url
@@ -462,13 +460,7 @@ class DiscussionQuestionSerializer(serializers.ModelSerializer):
         user = getattr(request, 'user', None) if request else None
         if not user_can_see_answers(obj, user):
             return None
-        ct = ContentType.objects.get_for_model(DiscussionQuestion)
-        return Comment.objects.filter(
-            content_type=ct,
-            object_id=obj.id,
-            parent=None,
-            is_active=True,
-        ).count()
+        return obj.answer_count
 
     def get_effective_status(self, obj):
         # Reflect schedule without mutating in serializer
@@ -31,28 +31,42 @@ def resolve_book_club_context(knowledge_path, user, slug=None):
     )
 
 
-def get_collective_release(node, club):
-    """Return (released, opens_at) for a node in a club context."""
-    if club is None:
-        return True, None
+class ReleaseCalendar:
+    """
+    A club's collective mission releases, loaded with one query and answered in
+    memory, so a request checks any number of missions without querying per node.
+    """
 
-    release = BookClubMissionRelease.objects.filter(
-        book_club=club,
-        node=node,
-    ).first()
-    opens_at = release.opens_at if release else None
+    def __init__(self, club, node_ids=None):
+        self.club = club
+        releases = BookClubMissionRelease.objects.filter(book_club=club)
+        if node_ids is not None:
+            releases = releases.filter(node_id__in=node_ids)
+        self.opens_at = dict(releases.values_list('node_id', 'opens_at'))
 
-    # A newly created club/path remains usable: its first mission opens at the
-    # club start (or immediately if no start exists). Later unscheduled nodes
-    # stay locked until staff assigns a date.
-    if release is None and node.get_preceding_node() is None:
-        opens_at = club.starts_at or club.created_at
-        return opens_at <= timezone.now(), opens_at
+    def release(self, node_id, is_first, now=None):
+        """(released, opens_at) for a mission; is_first: it has no preceding node."""
+        now = now or timezone.now()
+        # A newly created club/path remains usable: its first mission opens at the
+        # club start (or immediately if no start exists). Later unscheduled nodes
+        # stay locked until staff assigns a date.
+        if node_id not in self.opens_at and is_first:
+            opens_at = self.club.starts_at or self.club.created_at
+            return opens_at <= now, opens_at
+        opens_at = self.opens_at.get(node_id)
+        return bool(opens_at and opens_at <= now), opens_at
 
-    return bool(opens_at and opens_at <= timezone.now()), opens_at
+
+def get_collective_release(node, club, calendar=None):
+    """Return (released, opens_at) for a node in a club context."""
+    if club is None:
+        return True, None
+    calendar = calendar or ReleaseCalendar(club, node_ids=[node.id])
+    is_first = node.id not in calendar.opens_at and node.get_preceding_node() is None
+    return calendar.release(node.id, is_first)
 
 
-def is_node_released_for_club(node, club, user):
+def is_node_released_for_club(node, club, user, calendar=None):
     if club is None or club.user_can_manage(user):
         return True, None
-    return get_collective_release(node, club)
+    return get_collective_release(node, club, calendar=calendar)
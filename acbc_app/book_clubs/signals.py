@@ -0,0 +1,139 @@
+"""
+Keep the book club hub aggregates current (see book_clubs.pulse).
+
+Membership and completion writes move BookClubPulse by deltas, answers on discussion
+questions recount DiscussionQuestion.answer_count, and the hub's cached progress and
+next event are invalidated through their cache tags. Bulk writes that skip signals
+are repaired by the rebuild_book_club_pulse command. Future question transitions and
+mission releases are queued for the scheduler (book_clubs.schedule).
+"""
+import logging
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from book_clubs.models import BookClub, BookClubEvent, BookClubMembership, BookClubMissionRelease, DiscussionQuestion
+from book_clubs.pulse import (
+    apply_completion_delta,
+    apply_membership_delta,
+    club_tag,
+    progress_tag,
+    sync_answer_counts,
+)
+from book_clubs.schedule import schedule_mission_release, schedule_question
+from comments.signals import subtree_deactivated
+from utils.shared_cache import invalidate_tags_on_commit
+
+logger = logging.getLogger('academia_blockchain.book_clubs.signals')
+
+
+@receiver(post_save, sender=BookClubMembership)
+def pulse_member_joined(sender, instance, created, **kwargs):
+    if created:
+        _apply_membership(instance, 1)
+
+
+@receiver(post_delete, sender=BookClubMembership)
+def pulse_member_left(sender, instance, **kwargs):
+    _apply_membership(instance, -1)
+
+
+def _apply_membership(membership, sign):
+    try:
+        club = BookClub.objects.filter(pk=membership.book_club_id).only('knowledge_path').first()
+        if club is None:
+            return
+        apply_membership_delta(club.pk, club.knowledge_path_id, membership.user_id, sign)
+    except Exception:
+        logger.exception('Failed to update book club pulse on membership change')
+
+
+@receiver(pre_save, sender='profiles.UserNodeCompletion')
+def completion_capture_state(sender, instance, **kwargs):
+    instance._pulse_was_completed = bool(
+        instance.pk
+        and sender.objects.filter(pk=instance.pk, is_completed=True).exists()
+    )
+
+
+@receiver(post_save, sender='profiles.UserNodeCompletion')
+def completion_saved(sender, instance, **kwargs):
+    was_completed = getattr(instance, '_pulse_was_completed', False)
+    try:
+        if instance.is_completed != was_completed:
+            apply_completion_delta(instance, 1 if instance.is_completed else -1)
+    except Exception:
+        logger.exception('Failed to update book club pulse on completion')
+    invalidate_tags_on_commit(progress_tag(instance.knowledge_path_id, instance.user_id))
+
+
+@receiver(post_delete, sender='profiles.UserNodeCompletion')
+def completion_deleted(sender, instance, **kwargs):
+    try:
+        if instance.is_completed:
+            apply_completion_delta(instance, -1)
+    except Exception:
+        logger.exception('Failed to update book club pulse on completion delete')
+    invalidate_tags_on_commit(progress_tag(instance.knowledge_path_id, instance.user_id))
+
+
+@receiver(post_save, sender='quizzes.UserQuizAttempt')
+@receiver(post_delete, sender='quizzes.UserQuizAttempt')
+def quiz_attempt_changed(sender, instance, **kwargs):
+    """Passing a mission's quiz can unlock the next one."""
+    from quizzes.models import Quiz
+
+    path_id = Quiz.objects.filter(pk=instance.quiz_id).values_list('node__knowledge_path_id', flat=True).first()
+    if path_id:
+        invalidate_tags_on_commit(progress_tag(path_id, instance.user_id))
+
+
+@receiver(post_save, sender=BookClub)
+@receiver(post_delete, sender=BookClub)
+def club_changed(sender, instance, **kwargs):
+    invalidate_tags_on_commit(club_tag(instance.pk))
+
+
+@receiver(post_save, sender=BookClub)
+def schedule_club_start(sender, instance, **kwargs):
+    """The first mission opens at starts_at unless it has its own release."""
+    schedule_mission_release(instance.pk, instance.starts_at)
+
+
+@receiver(post_save, sender=BookClubMissionRelease)
+def schedule_release(sender, instance, **kwargs):
+    schedule_mission_release(instance.book_club_id, instance.opens_at)
+
+
+@receiver(post_save, sender=BookClubMissionRelease)
+@receiver(post_delete, sender=BookClubMissionRelease)
+@receiver(post_save, sender=BookClubEvent)
+@receiver(post_delete, sender=BookClubEvent)
+def club_schedule_changed(sender, instance, **kwargs):
+    invalidate_tags_on_commit(club_tag(instance.book_club_id))
+
+
+@receiver(post_save, sender=DiscussionQuestion)
+def schedule_question_transitions(sender, instance, **kwargs):
+    schedule_question(instance)
+
+
+def _is_answer(comment):
+    return (
+        comment.parent_id is None
+        and comment.content_type_id == ContentType.objects.get_for_model(DiscussionQuestion).id
+    )
+
+
+@receiver(post_save, sender='comments.Comment')
+@receiver(post_delete, sender='comments.Comment')
+def answer_changed(sender, instance, **kwargs):
+    if _is_answer(instance):
+        sync_answer_counts(DiscussionQuestion.objects.filter(pk=instance.object_id))
+
+
+@receiver(subtree_deactivated)
+def answer_deactivated(sender, comment, **kwargs):
+    if _is_answer(comment):
+        sync_answer_counts(DiscussionQuestion.objects.filter(pk=comment.object_id))
@@ -0,0 +1,15 @@
+"""Background job handlers for the book_clubs app (see jobs.queue and book_clubs.schedule)."""
+from book_clubs.pulse import club_tag
+from book_clubs.schedule import MISSION_RELEASED_TASK, QUESTION_TRANSITIONS_TASK, apply_due_question_transitions
+from jobs.registry import job_task
+from utils.shared_cache import invalidate_tags
+
+
+@job_task(QUESTION_TRANSITIONS_TASK)
+def question_transitions():
+    apply_due_question_transitions()
+
+
+@job_task(MISSION_RELEASED_TASK)
+def mission_released(book_club_id):
+    invalidate_tags(club_tag(book_club_id))
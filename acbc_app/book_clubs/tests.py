@@ -2,9 +2,12 @@
 Tests for the Book Club Hub, membership, and DiscussionQuestions.
 """
 import unittest.mock
+from io import StringIO
 
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import override_settings
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -15,14 +18,19 @@ from book_clubs.models import (
     BookClubEvent,
     BookClubMissionRelease,
     BookClubMembership,
+    BookClubPulse,
     BookClubStatus,
     DiscussionQuestion,
     DiscussionQuestionStatus,
 )
+from book_clubs.pulse import rebuild_pulse
 from comments.models import Comment
 from content.models import Topic
 from events.models import Event
+from jobs.models import Job
+from jobs.worker import drain
 from knowledge_paths.models import KnowledgePath, Node
+from profiles.models import UserNodeCompletion
 
 
 class BookClubAPITestCase(APITestCase):
@@ -365,7 +373,7 @@ class BookClubAPITestCase(APITestCase):
         # Past answers still readable
         listing = self.client.get(f'/api/comments/discussion-question/{qid}/')
         self.assertEqual(listing.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(listing.data), 1)
+        self.assertEqual(len(listing.data['results']), 1)
 
         # Cannot answer closed
         blocked = self.client.post(
@@ -596,7 +604,7 @@ class BookClubAPITestCase(APITestCase):
         self.auth(other)
         locked = self.client.get(f'/api/comments/discussion-question/{question.id}/')
         self.assertEqual(locked.status_code, status.HTTP_200_OK)
-        self.assertEqual(locked.data, [])
+        self.assertEqual(locked.data['results'], [])
 
         detail = self.client.get(
             f'/api/book_clubs/cypherpunk/discussion-questions/{question.id}/'
@@ -624,7 +632,7 @@ class BookClubAPITestCase(APITestCase):
         self.assertEqual(posted.status_code, status.HTTP_201_CREATED)
         unlocked = self.client.get(f'/api/comments/discussion-question/{question.id}/')
         self.assertEqual(unlocked.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(unlocked.data), 2)
+        self.assertEqual(len(unlocked.data['results']), 2)
         detail2 = self.client.get(
             f'/api/book_clubs/cypherpunk/discussion-questions/{question.id}/'
         )
@@ -637,7 +645,7 @@ class BookClubAPITestCase(APITestCase):
         )
         relocked = self.client.get(f'/api/comments/discussion-question/{question.id}/')
         self.assertEqual(relocked.status_code, status.HTTP_200_OK)
-        self.assertEqual(relocked.data, [])
+        self.assertEqual(relocked.data['results'], [])
         detail3 = self.client.get(
             f'/api/book_clubs/cypherpunk/discussion-questions/{question.id}/'
         )
@@ -650,7 +658,7 @@ class BookClubAPITestCase(APITestCase):
             f'/api/comments/discussion-question/{question.id}/'
         )
         self.assertEqual(mentor_list.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(mentor_list.data), 1)
+        self.assertEqual(len(mentor_list.data['results']), 1)
         mentor_detail = self.client.get(
             f'/api/book_clubs/cypherpunk/discussion-questions/{question.id}/'
         )
@@ -716,6 +724,172 @@ class BookClubAPITestCase(APITestCase):
         self.assertEqual(len(ok.data), 1)
 
 
+class BookClubPulseTests(BookClubAPITestCase):
+    """The hub's club pulse is read from a snapshot kept current by events."""
+
+    def _open_question(self):
+        return DiscussionQuestion.objects.create(
+            book_club=self.club,
+            body='¿Qué te pareció?',
+            status=DiscussionQuestionStatus.OPEN,
+            created_by=self.admin,
+        )
+
+    def _complete(self, user, node):
+        return UserNodeCompletion.objects.create(
+            user=user, knowledge_path=self.path, node=node,
+            is_completed=True, completed_at=timezone.now(),
+        )
+
+    def _answer(self, question, user):
+        return Comment.objects.create(
+            author=user, body='Respuesta',
+            content_type=ContentType.objects.get_for_model(DiscussionQuestion),
+            object_id=question.id,
+        )
+
+    def _hub_pulse(self):
+        self.auth(self.admin)
+        response = self.client.get('/api/book_clubs/cypherpunk/hub/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data['club_pulse']
+
+    def test_pulse_follows_membership_completion_and_answers(self):
+        question = self._open_question()
+        self._complete(self.member, self.node1)
+        self.assertEqual(self._hub_pulse()['member_count'], 2)
+
+        membership = BookClubMembership.objects.create(book_club=self.club, user=self.member)
+        self._complete(self.admin, self.node1)
+        completion = self._complete(self.admin, self.node2)
+        answer = self._answer(question, self.member)
+        self._answer(question, self.admin)
+
+        pulse = self._hub_pulse()
+        self.assertEqual(pulse['member_count'], 3)
+        self.assertEqual(pulse['first_mission_completions'], 2)
+        self.assertEqual(pulse['path_completion_pct'], 50)
+        self.assertEqual(pulse['total_answers'], 2)
+        self.assertEqual(pulse['open_debates'], 1)
+
+        Comment.objects.logic_delete(answer)
+        completion.is_completed = False
+        completion.save()
+        membership.delete()
+        pulse = self._hub_pulse()
+        self.assertEqual(pulse['member_count'], 2)
+        self.assertEqual(pulse['first_mission_completions'], 1)
+        self.assertEqual(pulse['path_completion_pct'], 25)
+        self.assertEqual(pulse['total_answers'], 1)
+
+        snapshot = BookClubPulse.objects.get(book_club=self.club)
+        rebuilt = rebuild_pulse(self.club)
+        for field in ('member_count', 'completed_pairs', 'first_mission_completions'):
+            self.assertEqual(getattr(snapshot, field), getattr(rebuilt, field), field)
+
+    def test_hub_query_count_does_not_grow_with_members(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        self._hub_pulse()
+        with CaptureQueriesContext(connection) as before:
+            self._hub_pulse()
+        for index in range(5):
+            reader = User.objects.create_user(username=f'reader{index}', password='pass123')
+            BookClubMembership.objects.create(book_club=self.club, user=reader)
+            self._complete(reader, self.node1)
+        with CaptureQueriesContext(connection) as after:
+            pulse = self._hub_pulse()
+        self.assertEqual(len(after.captured_queries), len(before.captured_queries))
+        self.assertEqual(pulse['member_count'], 7)
+        self.assertEqual(pulse['first_mission_completions'], 5)
+
+    def test_rebuild_command_repairs_drift(self):
+        question = self._open_question()
+        self._hub_pulse()
+        self._answer(question, self.admin)
+        BookClubPulse.objects.filter(book_club=self.club).update(member_count=0)
+        DiscussionQuestion.objects.filter(pk=question.pk).update(answer_count=0)
+
+        call_command('rebuild_book_club_pulse', '--slug', 'cypherpunk', stdout=StringIO())
+        pulse = self._hub_pulse()
+        self.assertEqual(pulse['member_count'], 2)
+        self.assertEqual(pulse['total_answers'], 1)
+
+
+class BookClubScheduleTests(BookClubAPITestCase):
+    """Question transitions run from the job queue; reads never apply schedules."""
+
+    def _captured_writes(self, context, table):
+        return [q['sql'] for q in context.captured_queries if q['sql'].startswith(f'UPDATE "{table}"')]
+
+    @override_settings(JOBS_EAGER=False)
+    def test_transitions_are_queued_and_applied_when_due(self):
+        now = timezone.now()
+        with self.captureOnCommitCallbacks(execute=True):
+            question = DiscussionQuestion.objects.create(
+                book_club=self.club,
+                body='Programada',
+                status=DiscussionQuestionStatus.DRAFT,
+                opens_at=now + timezone.timedelta(hours=1),
+                closes_at=now + timezone.timedelta(hours=2),
+                created_by=self.admin,
+            )
+        jobs = Job.objects.filter(task='book_clubs.question_transitions').order_by('run_after')
+        self.assertEqual([job.run_after for job in jobs], [question.opens_at, question.closes_at])
+
+        self.assertEqual(drain(['default']), 0)
+        DiscussionQuestion.objects.filter(pk=question.pk).update(opens_at=now - timezone.timedelta(minutes=1))
+        Job.objects.filter(pk=jobs[0].pk).update(run_after=now)
+        self.assertEqual(drain(['default']), 1)
+        question.refresh_from_db()
+        self.assertEqual(question.status, DiscussionQuestionStatus.OPEN)
+
+    def test_reads_do_not_apply_schedules(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        question = DiscussionQuestion.objects.create(
+            book_club=self.club, body='Pendiente', status=DiscussionQuestionStatus.DRAFT, created_by=self.admin,
+        )
+        DiscussionQuestion.objects.filter(pk=question.pk).update(
+            opens_at=timezone.now() - timezone.timedelta(minutes=1),
+        )
+        self.auth(self.admin)
+        with CaptureQueriesContext(connection) as context:
+            self.client.get('/api/book_clubs/cypherpunk/hub/')
+            self.client.get('/api/book_clubs/cypherpunk/discussion-questions/')
+            self.client.get(f'/api/book_clubs/cypherpunk/discussion-questions/{question.pk}/')
+        self.assertEqual(self._captured_writes(context, 'book_clubs_discussionquestion'), [])
+
+        call_command('process_book_club_schedules', stdout=StringIO())
+        question.refresh_from_db()
+        self.assertEqual(question.status, DiscussionQuestionStatus.OPEN)
+
+    def test_release_calendar_loads_once_per_progress(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from knowledge_paths.services.progress_service import PathProgress
+
+        for order in range(3, 8):
+            node = Node.objects.create(
+                knowledge_path=self.path, title=f'Misión {order}', order=order, media_type='TEXT',
+            )
+            BookClubMissionRelease.objects.create(
+                book_club=self.club, node=node, opens_at=timezone.now() + timezone.timedelta(days=order),
+            )
+        BookClubMembership.objects.create(book_club=self.club, user=self.member)
+        with CaptureQueriesContext(connection) as context:
+            progress = PathProgress(self.member, self.path, book_club=self.club)
+        release_queries = [
+            q for q in context.captured_queries if 'book_clubs_bookclubmissionrelease' in q['sql']
+        ]
+        self.assertEqual(len(release_queries), 1)
+        self.assertTrue(progress.node(self.node1.id).released)
+        self.assertFalse(progress.node(self.node2.id).released)
+
+
 class BookClubCreateUpdateAPITestCase(APITestCase):
     def setUp(self):
         self.staff = User.objects.create_user(
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core import signing
 from django.core.exceptions import ValidationError as DjangoValidationError
@@ -29,6 +30,7 @@ from book_clubs.permissions import (
     user_can_view_question,
     user_has_answered,
 )
+from book_clubs.pulse import club_tag, get_pulse, member_hub_progress, pulse_payload
 from book_clubs.serializers import (
     BookClubCreateUpdateSerializer,
     BookClubDetailSerializer,
@@ -41,9 +43,10 @@ from book_clubs.serializers import (
     DiscussionQuestionSerializer,
     DiscussionQuestionWriteSerializer,
 )
+from book_clubs.services import ReleaseCalendar
 from comments.models import Comment
-from knowledge_paths.services.node_user_activity_service import get_knowledge_path_progress
-from profiles.models import NewsletterSubscription, UserNodeCompletion
+from profiles.models import NewsletterSubscription
+from utils.shared_cache import cached_value
 
 
 def _get_club(slug):
@@ -75,77 +78,40 @@ def _resolve_guest_payload(request, slug):
         return 'invalid', token
 
 
-def _sync_question_schedules(queryset):
-    """Persist auto open/close transitions for questions with schedule fields."""
-    now = timezone.now()
-    to_update = []
-    for question in queryset:
-        if question.apply_schedule(now=now):
-            to_update.append(question)
-    if to_update:
-        DiscussionQuestion.objects.bulk_update(to_update, ['status', 'updated_at'])
-    return queryset
-
-
-def _build_club_pulse(club, open_questions, member_ids):
-    """Collective signals for the reading experience (not admin stats)."""
-    member_count = len(member_ids)
-    open_debates = len(open_questions)
-    total_answers = 0
-    if open_questions:
-        ct = ContentType.objects.get_for_model(DiscussionQuestion)
-        total_answers = Comment.objects.filter(
-            content_type=ct,
-            object_id__in=[q.id for q in open_questions],
-            parent=None,
-            is_active=True,
-        ).count()
-
-    first_mission_completions = 0
-    active_readers_7d = 0
-    path_completion_pct = 0
-    if club.knowledge_path_id and member_ids:
-        nodes = list(club.knowledge_path.nodes.order_by('order').values_list('id', 'order'))
-        node_ids = [n[0] for n in nodes]
-        if nodes:
-            first_node_id = nodes[0][0]
-            first_mission_completions = UserNodeCompletion.objects.filter(
-                user_id__in=member_ids,
-                node_id=first_node_id,
-                is_completed=True,
-            ).count()
-            week_ago = timezone.now() - timezone.timedelta(days=7)
-            active_readers_7d = (
-                UserNodeCompletion.objects.filter(
-                    user_id__in=member_ids,
-                    node_id__in=node_ids,
-                    is_completed=True,
-                    completed_at__gte=week_ago,
-                )
-                .values('user_id')
-                .distinct()
-                .count()
-            )
-            # Average path completion across members (rough social pulse)
-            total_nodes = len(node_ids)
-            if total_nodes and member_count:
-                completed_pairs = UserNodeCompletion.objects.filter(
-                    user_id__in=member_ids,
-                    node_id__in=node_ids,
-                    is_completed=True,
-                ).count()
-                path_completion_pct = round(
-                    (completed_pairs / (member_count * total_nodes)) * 100
-                )
+def _next_event_data(club):
+    """Next (or, failing that, latest) club event, cached until the club's events change."""
 
-    return {
-        'member_count': member_count,
-        'active_readers_7d': active_readers_7d,
-        'open_debates': open_debates,
-        'total_answers': total_answers,
-        'first_mission_completions': first_mission_completions,
-        'path_completion_pct': path_completion_pct,
-    }
+    def compute():
+        now = timezone.now()
+        next_link = (
+            BookClubEvent.objects.filter(book_club=club, event__deleted=False)
+            .filter(Q(event__date_start__gte=now) | Q(event__date_start__isnull=True))
+            .select_related('event')
+            .order_by('event__date_start')
+            .first()
+        )
+        if next_link is None:
+            next_link = (
+                BookClubEvent.objects.filter(book_club=club, event__deleted=False)
+                .select_related('event')
+                .order_by('-event__date_start')
+                .first()
+            )
+            if next_link is None:
+                return None
+            data = dict(BookClubEventSerializer(next_link).data)
+            data['is_past'] = True
+            return data
+        data = dict(BookClubEventSerializer(next_link).data)
+        data['is_past'] = bool(next_link.event.date_start and next_link.event.date_start < now)
+        return data
+
+    return cached_value(
+        f'book_club_next_event:{club.id}',
+        compute,
+        tags=[club_tag(club.id)],
+        timeout=getattr(settings, 'BOOK_CLUB_PROGRESS_CACHE_TIMEOUT', 60),
+    )
 
 
 class BookClubGuestAccessView(APIView):
@@ -423,19 +389,12 @@ class BookClubMissionScheduleView(APIView):
     def _payload(self, club):
         if not club.knowledge_path_id:
             return []
-        releases = {
-            release.node_id: release
-            for release in club.mission_releases.select_related('node')
-        }
+        calendar = ReleaseCalendar(club)
         now = timezone.now()
         payload = []
         nodes = club.knowledge_path.nodes.order_by('order')
         for index, node in enumerate(nodes):
-            release = releases.get(node.id)
-            opens_at = release.opens_at if release else (
-                (club.starts_at or club.created_at) if index == 0 else None
-            )
-            is_released = bool(opens_at and opens_at <= now)
+            is_released, opens_at = calendar.release(node.id, is_first=index == 0, now=now)
             payload.append({
                 'node_id': node.id,
                 'title': node.title,
@@ -572,51 +531,18 @@ class BookClubHubView(APIView):
         # until the frontend joins them.
         can_view_content = is_member or is_guest
 
-        progress = {
-            'completed_nodes': 0,
-            'total_nodes': club.knowledge_path.nodes.count() if club.knowledge_path_id else 0,
-            'percentage': 0,
-            'is_completed': False,
-            'nodes_progress': [],
-        }
         next_mission = None
         if is_member and club.knowledge_path_id:
-            progress = get_knowledge_path_progress(
-                user,
-                club.knowledge_path,
-                book_club=club,
-            )
-            nodes_by_id = {n.id: n for n in club.knowledge_path.nodes.all()}
-            for node_data in progress.get('nodes_progress', []):
-                if not node_data.get('is_completed') and node_data.get('is_available'):
-                    node = nodes_by_id.get(node_data['node_id'])
-                    next_mission = {
-                        'node_id': node_data['node_id'],
-                        'title': node_data['title'],
-                        'order': node_data['order'],
-                        'path_id': club.knowledge_path_id,
-                        'description': (node.description or '') if node else '',
-                        'locked': False,
-                    }
-                    break
-            if next_mission is None:
-                for node_data in progress.get('nodes_progress', []):
-                    if not node_data.get('is_completed'):
-                        node = nodes_by_id.get(node_data['node_id'])
-                        next_mission = {
-                            'node_id': node_data['node_id'],
-                            'title': node_data['title'],
-                            'order': node_data['order'],
-                            'path_id': club.knowledge_path_id,
-                            'description': (node.description or '') if node else '',
-                            'locked': not node_data.get('is_available', False),
-                            'club_schedule_locked': node_data.get(
-                                'club_schedule_locked', False
-                            ),
-                            'opens_at': node_data.get('club_opens_at'),
-                        }
-                        break
-        elif is_guest and club.knowledge_path_id:
+            progress, next_mission = member_hub_progress(club, user)
+        else:
+            progress = {
+                'completed_nodes': 0,
+                'total_nodes': club.knowledge_path.nodes.count() if club.knowledge_path_id else 0,
+                'percentage': 0,
+                'is_completed': False,
+                'nodes_progress': [],
+            }
+        if is_guest and not is_member and club.knowledge_path_id:
             # Teaser: first mission of the path (no personal progress).
             first = club.knowledge_path.nodes.order_by('order').first()
             if first:
@@ -630,43 +556,13 @@ class BookClubHubView(APIView):
                     'teaser': True,
                 }
 
-        now = timezone.now()
-        next_link = (
-            BookClubEvent.objects.filter(book_club=club, event__deleted=False)
-            .filter(Q(event__date_start__gte=now) | Q(event__date_start__isnull=True))
-            .select_related('event')
-            .order_by('event__date_start')
-            .first()
-        )
-        if next_link is None:
-            next_link = (
-                BookClubEvent.objects.filter(book_club=club, event__deleted=False)
-                .select_related('event')
-                .order_by('-event__date_start')
-                .first()
-            )
-            next_event_data = (
-                BookClubEventSerializer(next_link).data if next_link else None
-            )
-            if next_event_data:
-                next_event_data['is_past'] = True
-        else:
-            next_event_data = BookClubEventSerializer(next_link).data
-            next_event_data['is_past'] = bool(
-                next_link.event.date_start and next_link.event.date_start < now
-            )
+        next_event_data = _next_event_data(club)
 
         questions = list(
             DiscussionQuestion.objects.filter(book_club=club)
             .select_related('node', 'event', 'created_by')
             .order_by('order', 'created_at')
         )
-        _sync_question_schedules(questions)
-        questions = list(
-            DiscussionQuestion.objects.filter(book_club=club)
-            .select_related('node', 'event', 'created_by')
-            .order_by('order', 'created_at')
-        )
 
         can_manage = bool(user and club.user_can_manage(user))
         visible = []
@@ -743,8 +639,7 @@ class BookClubHubView(APIView):
             recent_activity = recent_activity[:10]
 
         question_ctx = {'request': request}
-        member_ids = list(club.memberships.values_list('user_id', flat=True))
-        club_pulse = _build_club_pulse(club, open_questions, member_ids)
+        club_pulse = pulse_payload(get_pulse(club), open_questions, progress.get('total_nodes', 0))
 
         progress_payload = {
             'completed_nodes': progress.get('completed_nodes', 0),
@@ -919,19 +814,10 @@ class DiscussionQuestionListCreateView(APIView):
                 status=status.HTTP_401_UNAUTHORIZED,
             )
 
-        qs = list(
-            DiscussionQuestion.objects.filter(book_club=club)
-            .select_related('node', 'event')
-            .order_by('order', 'created_at')
-        )
-        _sync_question_schedules(qs)
-        qs = list(
-            DiscussionQuestion.objects.filter(book_club=club)
-            .select_related('node', 'event')
-            .order_by('order', 'created_at')
-        )
+        qs = DiscussionQuestion.objects.filter(book_club=club).select_related('node', 'event')
         if not can_manage:
-            qs = [q for q in qs if q.status != DiscussionQuestionStatus.DRAFT]
+            qs = qs.exclude(status=DiscussionQuestionStatus.DRAFT)
+        qs = qs.order_by('order', 'created_at')
         return Response(
             DiscussionQuestionSerializer(qs, many=True, context={'request': request}).data
         )
@@ -963,8 +849,6 @@ class DiscussionQuestionDetailView(APIView):
             pk=pk,
             book_club=club,
         )
-        if question.apply_schedule():
-            question.save(update_fields=['status', 'updated_at'])
         return club, question
 
     def get(self, request, slug, pk):
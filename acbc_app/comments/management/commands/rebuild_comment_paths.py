@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from comments.models import Comment
+from comments.paths import rebuild_paths
+
+
+class Command(BaseCommand):
+    help = (
+        'Recompute Comment.path and Comment.depth for every comment from parent links. '
+        'Run after importing comments outside the ORM, or to repair drift.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Parent ids per query and rows per bulk update (default: 1000).',
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_paths(Comment, batch_size=max(1, options['batch_size']))
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt path for {written} comment(s).'))
@@ -1,5 +1,8 @@
 from django.db import models
 from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
+
+from comments.signals import subtree_deactivated
 import logging
 
 # Get logger for comments managers
@@ -7,36 +10,60 @@ logger = logging.getLogger('academia_blockchain.comments.managers')
 
 
 class CommentManager(models.Manager):
+    def subtree(self, comment):
+        """
+        The comment and every reply below it, by materialized path prefix.
+
+        A comment without a path (written before paths existed and not yet rebuilt)
+        yields only itself: an empty prefix would match every comment.
+        """
+        if not comment.path:
+            return self.filter(pk=comment.pk)
+        return self.filter(path__startswith=comment.path)
+
     def logic_delete(self, comment):
-        """Logically delete a comment and all its replies by setting is_active to False."""
+        """
+        Logically delete a comment and all its replies by setting is_active to False.
+
+        The whole subtree is deactivated with one UPDATE on the path prefix. UPDATE
+        skips the save signals, so the topic activity score lost by the deactivated
+        topic comments is applied here, one query per topic, and other apps are told
+        through comments.signals.subtree_deactivated.
+        """
         logger.info("Starting logical delete for comment", extra={
             'comment_id': comment.id,
-            'user_id': comment.author.id,
+            'user_id': comment.author_id,
         })
-        
-        # Recursively delete replies
-        replies = comment.replies.all()
-        logger.debug("Found replies for comment", extra={
-            'comment_id': comment.id,
-            'reply_count': replies.count(),
-        })
-        
-        for reply in replies:
-            logger.debug("Recursively deleting reply", extra={
-                'reply_id': reply.id,
-                'parent_comment_id': comment.id,
-            })
-            self.logic_delete(reply)
-        
-        # Mark the comment as inactive
-        logger.info("Marking comment as inactive", extra={
+        if not comment.path:
+            # Rows written before paths existed and not yet rebuilt.
+            self._logic_delete_walk(comment)
+            return
+
+        from content.topic_activity import WEIGHT_COMMENT, apply_topic_score_delta
+
+        active = self.subtree(comment).filter(is_active=True)
+        topic_counts = list(
+            active.filter(topic__isnull=False)
+            .order_by()
+            .values('topic_id')
+            .annotate(total=models.Count('id'))
+        )
+        deactivated = active.update(is_active=False, updated_at=timezone.now())
+        for row in topic_counts:
+            apply_topic_score_delta(row['topic_id'], -WEIGHT_COMMENT * row['total'])
+        comment.is_active = False
+        subtree_deactivated.send(sender=self.model, comment=comment)
+        logger.info("Successfully marked comment subtree as inactive", extra={
             'comment_id': comment.id,
+            'deactivated': deactivated,
         })
+
+    def _logic_delete_walk(self, comment):
+        """Recursive, one save() per comment; used when the path is missing."""
+        for reply in comment.replies.all():
+            self._logic_delete_walk(reply)
         comment.is_active = False
         comment.save()
-        logger.info("Successfully marked comment as inactive", extra={
-            'comment_id': comment.id,
-        })
 
     def get_for_object(self, obj):
         """Get all comments for a specific object"""
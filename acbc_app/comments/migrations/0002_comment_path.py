@@ -0,0 +1,56 @@
+# Generated by Django 5.0 on 2026-10-17 01:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_paths(apps, schema_editor):
+    # Frozen copy of comments.paths.rebuild_paths: migrations must not import live code.
+    Comment = apps.get_model('comments', 'Comment')
+    manager = Comment._base_manager
+    batch_size = 1000
+    depth = 0
+    parent_paths = {None: ''}
+    while parent_paths:
+        parent_ids = list(parent_paths)
+        next_paths = {}
+        for start in range(0, len(parent_ids), batch_size):
+            chunk = parent_ids[start:start + batch_size]
+            if chunk == [None]:
+                rows = list(manager.filter(parent__isnull=True).only('id', 'parent', 'path', 'depth'))
+            else:
+                rows = list(manager.filter(parent_id__in=chunk).only('id', 'parent', 'path', 'depth'))
+            for row in rows:
+                row.path = f'{parent_paths[row.parent_id]}{row.id:010d}/'
+                row.depth = depth
+                next_paths[row.id] = row.path
+            manager.bulk_update(rows, ['path', 'depth'], batch_size=batch_size)
+        parent_paths = next_paths
+        depth += 1
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0001_initial'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='depth',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='path',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(backfill_paths, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['path'], name='comments_path_prefix_idx', opclasses=['text_pattern_ops']),
+        ),
+    ]
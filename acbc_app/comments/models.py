@@ -1,5 +1,5 @@
 import bleach
-from django.db import models
+from django.db import models, transaction
 from django.db.models.signals import pre_save
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.fields import GenericForeignKey
@@ -10,6 +10,7 @@ from django.conf import settings
 from content.models import Topic
 from certificates.models import Certificate
 from comments.managers import CommentManager
+from comments.paths import ancestor_ids, child_path
 from knowledge_paths.models import KnowledgePath
 from content.models import Topic
 
@@ -26,6 +27,10 @@ class Comment(models.Model):
     topic = models.ForeignKey(Topic, null=True, blank=True, on_delete=models.CASCADE)
     parent = models.ForeignKey('self', null=True, blank=True, on_delete=models.CASCADE, related_name='replies')
     is_active = models.BooleanField(default=True)
+    # Materialized path of ids from the root, written on insert (see comments.paths).
+    # TextField: each level adds PATH_STEP_WIDTH + 1 characters and depth is unbounded.
+    path = models.TextField(blank=True, default='', editable=False)
+    depth = models.PositiveSmallIntegerField(default=0, editable=False)
 
     objects = CommentManager()
 
@@ -34,6 +39,8 @@ class Comment(models.Model):
         indexes = [
             models.Index(fields=['content_type', 'object_id']),
             models.Index(fields=['parent']),
+            # Prefix (LIKE 'path%') scans for subtrees.
+            models.Index(fields=['path'], name='comments_path_prefix_idx', opclasses=['text_pattern_ops']),
         ]
 
     def __str__(self):
@@ -68,18 +75,17 @@ class Comment(models.Model):
 
     @property
     def thread_path(self):
-        """Get the full path of parent comments"""
-        path = []
-        current = self
-        while current.parent:
-            path.append(current.parent.id)
-            current = current.parent
-        return path
+        """Get the full path of parent comments (nearest parent first)"""
+        return ancestor_ids(self.path)[-2::-1]
 
     @property
     def thread_depth(self):
         """Get the depth level of the comment in the thread"""
-        return len(self.thread_path)
+        return self.depth
+
+    def get_subtree(self):
+        """This comment and all its replies, at any depth (see CommentManager.subtree)"""
+        return Comment.objects.subtree(self)
 
     def get_thread_siblings(self):
         """Get comments at the same level in the thread"""
@@ -93,7 +99,18 @@ class Comment(models.Model):
         self.body = bleach.clean(self.body)
         if self.id:  # If this is an update
             self.is_edited = True
-        super().save(*args, **kwargs)
+        creating = self.id is None
+        if not creating:
+            super().save(*args, **kwargs)
+            return
+        # The path ends with the comment's own id, known only after the insert; both
+        # writes commit together so no row is left without its path.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            parent_path = self.parent.path if self.parent_id else ''
+            self.path = child_path(parent_path, self.id)
+            self.depth = self.parent.depth + 1 if self.parent_id else 0
+            Comment.objects.filter(pk=self.pk).update(path=self.path, depth=self.depth)
 
     def get_absolute_url(self):
         return f"/comments/{self.id}/"
\ No newline at end of file
@@ -0,0 +1,60 @@
+"""
+Materialized paths for comment threads.
+
+Comment.path is the chain of ids from the root down to the comment, each id
+zero-padded to PATH_STEP_WIDTH digits and followed by '/': a reply 42 under root 7
+has path '0000000007/0000000042/'. Comment.depth is the number of ancestors.
+
+A subtree is then one prefix range (path LIKE '<path>%'), served by the
+text_pattern_ops index on PostgreSQL; ancestors and depth are read from the row
+without walking parent pointers. Paths are written once when a comment is inserted
+(comments are never moved to another parent); rebuild_paths() fills them for
+existing rows from the rebuild_comment_paths command (migration 0002 keeps its own
+frozen copy, so changes here do not alter past migrations).
+"""
+PATH_STEP_WIDTH = 10
+PATH_SEPARATOR = '/'
+
+
+def path_segment(pk):
+    return f'{pk:0{PATH_STEP_WIDTH}d}{PATH_SEPARATOR}'
+
+
+def child_path(parent_path, pk):
+    return f'{parent_path or ""}{path_segment(pk)}'
+
+
+def ancestor_ids(path):
+    """Ids in path from the root down, the comment's own id last."""
+    return [int(step) for step in (path or '').split(PATH_SEPARATOR) if step]
+
+
+def rebuild_paths(model, batch_size=1000):
+    """
+    Recompute path and depth of every row of model (the Comment model, or its
+    historical version in a migration) level by level, one bulk_update per level
+    and batch. Returns the number of rows written.
+    """
+    manager = model._base_manager
+    fields = ('id', 'parent', 'path', 'depth')
+    written = 0
+    depth = 0
+    parent_paths = {None: ''}
+    while parent_paths:
+        parent_ids = list(parent_paths)
+        next_paths = {}
+        for start in range(0, len(parent_ids), batch_size):
+            chunk = parent_ids[start:start + batch_size]
+            if chunk == [None]:
+                rows = list(manager.filter(parent__isnull=True).only(*fields))
+            else:
+                rows = list(manager.filter(parent_id__in=chunk).only(*fields))
+            for row in rows:
+                row.path = child_path(parent_paths[row.parent_id], row.id)
+                row.depth = depth
+                next_paths[row.id] = row.path
+            manager.bulk_update(rows, ['path', 'depth'], batch_size=batch_size)
+            written += len(rows)
+        parent_paths = next_paths
+        depth += 1
+    return written
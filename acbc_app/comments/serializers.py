@@ -1,11 +1,13 @@
 from rest_framework import serializers
+from votes.serializers import VoteContextListSerializer, VoteContextMixin
 from .models import Comment
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(VoteContextMixin, serializers.ModelSerializer):
     author_name = serializers.CharField(source='author.username', read_only=True)
     replies = serializers.SerializerMethodField()  # Changed from have_replies to include actual replies
     reply_count = serializers.SerializerMethodField()
+    replies_next_cursor = serializers.SerializerMethodField()
     vote_count = serializers.SerializerMethodField()
     user_vote = serializers.SerializerMethodField()
     featured_badge = serializers.SerializerMethodField()
@@ -22,6 +24,7 @@ class CommentSerializer(serializers.ModelSerializer):
             'is_edited',
             'replies',
             'reply_count',
+            'replies_next_cursor',  # Cursor for the replies endpoint when not all replies are inlined
             'is_active',
             'vote_count',
             'user_vote',
@@ -29,6 +32,7 @@ class CommentSerializer(serializers.ModelSerializer):
             'featured_badge'  # Author's featured badge
         ]
         read_only_fields = ['created_at', 'updated_at', 'is_edited', 'is_active']
+        list_serializer_class = VoteContextListSerializer
 
     def validate_body(self, value):
         # Validation to ensure the body field is not empty.
@@ -37,39 +41,55 @@ class CommentSerializer(serializers.ModelSerializer):
         return value
 
     def get_replies(self, obj):
-        # Recursively serialize replies
-        replies = obj.replies.filter(is_active=True).order_by('created_at')
-        return CommentSerializer(replies, many=True).data
+        # Recursively serialize replies; a CommentThread in the context (comments.threads)
+        # already holds the whole tree.
+        thread = self.context.get('comment_thread')
+        if thread is not None:
+            replies = thread.children(obj.id)
+        else:
+            replies = obj.replies.filter(is_active=True).order_by('created_at')
+        return CommentSerializer(replies, many=True, context=self.context).data
 
     def get_reply_count(self, obj):
+        thread = self.context.get('comment_thread')
+        if thread is not None:
+            return thread.reply_count(obj.id)
         return obj.replies.filter(is_active=True).count()
 
+    def get_replies_next_cursor(self, obj):
+        thread = self.context.get('comment_thread')
+        return thread.replies_next_cursor(obj.id) if thread is not None else None
+
     def get_vote_count(self, obj):
-        count = obj.vote_count
-        return count
+        cached = self.cached_vote_count(obj)
+        return cached if cached is not None else obj.vote_count
 
     def get_user_vote(self, obj):
         request = self.context.get('request')
         if not request or not request.user.is_authenticated:
             return 0
-        vote = obj.get_user_vote(request.user)
-        return vote
+        cached = self.cached_user_vote(obj)
+        return cached if cached is not None else obj.get_user_vote(request.user)
 
     def get_featured_badge(self, obj):
         """Get the author's featured badge if available."""
         try:
             from profiles.models import Profile
             from gamification.serializers import UserBadgeSummarySerializer
-            
-            # Get the author's profile
-            try:
-                profile = Profile.objects.get(user=obj.author)
-            except Profile.DoesNotExist:
-                return None
-            
+
+            thread = self.context.get('comment_thread')
+            if thread is not None:
+                featured_badge = thread.featured_badge(obj.author_id)
+            else:
+                # Get the author's profile
+                try:
+                    featured_badge = Profile.objects.get(user=obj.author).featured_badge
+                except Profile.DoesNotExist:
+                    return None
+
             # Return featured badge if it exists
-            if profile.featured_badge:
-                return UserBadgeSummarySerializer(profile.featured_badge, context=self.context).data
+            if featured_badge:
+                return UserBadgeSummarySerializer(featured_badge, context=self.context).data
             return None
         except Exception:
             # If there's any error (e.g., gamification app not installed), return None
@@ -84,6 +104,9 @@ class KnowledgePathCommentSerializer(CommentSerializer):
         fields = CommentSerializer.Meta.fields + ['author_is_certified']
 
     def get_author_is_certified(self, obj):
+        thread = self.context.get('comment_thread')
+        if thread is not None:
+            return thread.author_is_certified(obj)
         # We call the model method to check if the author is certified for this KnowledgePath
         return obj.author_is_certified
 
@@ -0,0 +1,6 @@
+"""Signals sent by the comments app."""
+from django.dispatch import Signal
+
+# Sent by CommentManager.logic_delete after it deactivates a subtree with one UPDATE,
+# which skips post_save: sender=Comment, comment=<root of the subtree>.
+subtree_deactivated = Signal()
@@ -1,3 +1,5 @@
+from io import StringIO
+
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework.test import APITestCase
@@ -195,8 +197,8 @@ class KnowledgePathCommentsAPITests(APITestCase):
         url = reverse('comments:knowledge_path_comments', args=[self.knowledge_path.id])
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['body'], 'Test Comment')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['body'], 'Test Comment')
 
     def test_create_knowledge_path_comment(self):
         """Test creating a comment on a knowledge path"""
@@ -237,8 +239,8 @@ class TopicCommentsAPITests(APITestCase):
         url = reverse('comments:topic_comments', args=[self.topic.id])
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['body'], 'Test Comment')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['body'], 'Test Comment')
 
     def test_list_topic_comments_anonymous(self):
         """Anonymous users can read topic comments but not create them."""
@@ -246,7 +248,7 @@ class TopicCommentsAPITests(APITestCase):
         url = reverse('comments:topic_comments', args=[self.topic.id])
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
 
         create_response = self.client.post(url, {'body': 'Anon comment'}, format='json')
         self.assertEqual(create_response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -296,8 +298,8 @@ class ContentTopicCommentsAPITests(APITestCase):
         url = reverse('comments:content_topic_comments', args=[self.topic.id, self.content.id])
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['body'], 'Test Comment')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['body'], 'Test Comment')
 
     def test_create_content_topic_comment(self):
         """Test creating a comment on content in a topic"""
@@ -307,3 +309,239 @@ class ContentTopicCommentsAPITests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Comment.objects.count(), 2)
         self.assertEqual(response.data['body'], 'New Comment')
+
+
+class CommentVoteBatchingAPITests(APITestCase):
+    """Comment lists read votes from one batch load instead of per comment."""
+
+    def setUp(self):
+        from votes.models import Vote, VoteCount
+
+        self.user = User.objects.create_user(
+            username='commentvoter',
+            email='commentvoter@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.topic = Topic.objects.create(
+            title='Voted Comments Topic',
+            description='Test Description',
+            creator=self.user
+        )
+        topic_type = ContentType.objects.get_for_model(Topic)
+        comment_type = ContentType.objects.get_for_model(Comment)
+        for index in range(5):
+            comment = Comment.objects.create(
+                author=self.user,
+                body=f'Comment {index}',
+                content_type=topic_type,
+                object_id=self.topic.id,
+            )
+            VoteCount.objects.create(
+                content_type=comment_type,
+                object_id=comment.id,
+                vote_count=index,
+            )
+            Vote.objects.create(
+                user=self.user,
+                content_type=comment_type,
+                object_id=comment.id,
+                value=1,
+            )
+
+    def test_topic_comments_votes_are_batched(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        url = reverse('comments:topic_comments', args=[self.topic.id])
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        vote_queries = [
+            query['sql']
+            for query in context.captured_queries
+            if 'votes_vote' in query['sql'].lower()
+        ]
+        self.assertLessEqual(len(vote_queries), 2)
+        self.assertEqual(
+            sorted(item['vote_count'] for item in response.data['results']),
+            [0, 1, 2, 3, 4],
+        )
+        self.assertTrue(all(item['user_vote'] == 1 for item in response.data['results']))
+
+
+class CommentThreadAPITests(APITestCase):
+    """Threads load in a fixed number of queries, roots page by cursor, replies load lazily."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='threaduser', password='testpass123')
+        self.client.force_authenticate(user=self.user)
+        self.topic = Topic.objects.create(title='Thread Topic', description='d', creator=self.user)
+        self.topic_type = ContentType.objects.get_for_model(Topic)
+        self.url = reverse('comments:topic_comments', args=[self.topic.id])
+
+    def _comment(self, parent=None, body='c'):
+        return Comment.objects.create(
+            author=self.user, body=body, content_type=self.topic_type,
+            object_id=self.topic.id, parent=parent,
+        )
+
+    def _chain(self, depth):
+        node = root = self._comment(body='root')
+        for level in range(depth):
+            node = self._comment(parent=node, body=f'level {level}')
+        return root
+
+    def _count_queries(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries), response.data
+
+    def test_query_count_does_not_grow_with_depth(self):
+        self._chain(2)
+        shallow, _ = self._count_queries()
+        self._chain(8)
+        deep, data = self._count_queries()
+        self.assertEqual(deep, shallow)
+
+        node, depth = data['results'][0], 0
+        while node['replies']:
+            self.assertEqual(node['reply_count'], 1)
+            node, depth = node['replies'][0], depth + 1
+        self.assertEqual(depth, 8)
+
+    def test_roots_are_cursor_paginated(self):
+        roots = [self._comment(body=f'root {i}') for i in range(5)]
+        seen, cursor = [], None
+        while True:
+            params = {'page_size': 2}
+            if cursor:
+                params['cursor'] = cursor
+            response = self.client.get(self.url, params)
+            seen += [item['id'] for item in response.data['results']]
+            cursor = response.data['next_cursor']
+            if not cursor:
+                break
+        self.assertEqual(seen, [root.id for root in reversed(roots)])
+        self.assertEqual(self.client.get(self.url, {'cursor': 'x'}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_more_replies_load_from_replies_endpoint(self):
+        from comments.threads import REPLIES_PER_COMMENT
+
+        root = self._comment(body='root')
+        replies = [self._comment(parent=root, body=f'reply {i}') for i in range(REPLIES_PER_COMMENT + 3)]
+        item = self.client.get(self.url).data['results'][0]
+        self.assertEqual(item['reply_count'], len(replies))
+        self.assertEqual(len(item['replies']), REPLIES_PER_COMMENT)
+
+        more = self.client.get(
+            reverse('comments:comment_replies', args=[root.id]),
+            {'cursor': item['replies_next_cursor']},
+        ).data
+        self.assertEqual([reply['id'] for reply in more['results']], [r.id for r in replies[REPLIES_PER_COMMENT:]])
+        self.assertIsNone(more['next_cursor'])
+
+
+    def test_replies_past_the_window_are_not_loaded(self):
+        from comments.threads import CommentThread
+
+        root = self._comment(body='root')
+        shown = [self._comment(parent=root, body=f'reply {i}') for i in range(2)]
+        hidden = self._comment(parent=root, body='hidden')
+        self._comment(parent=hidden, body='below hidden')
+        self._comment(parent=shown[0], body='below shown')
+
+        thread = CommentThread([root], replies_per_comment=2)
+        self.assertEqual(thread.children(root.id), shown)
+        self.assertEqual(thread.reply_count(root.id), 3)
+        self.assertIsNotNone(thread.replies_next_cursor(root.id))
+        self.assertEqual(thread.reply_count(shown[0].id), 1)
+        self.assertIsNone(thread.replies_next_cursor(shown[0].id))
+        self.assertEqual(thread.reply_count(hidden.id), 0)
+
+class CommentPathTests(TestCase):
+    """Materialized paths: written on insert, subtree soft-delete in one UPDATE, rebuild."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='pathuser', password='testpass123')
+        self.content = Content.objects.create(uploaded_by=self.user, media_type='TEXT', original_title='C')
+        self.topic = Topic.objects.create(title='Path Topic', description='d', creator=self.user)
+        self.content_type = ContentType.objects.get_for_model(Content)
+        self.root = self._comment()
+        self.reply = self._comment(parent=self.root)
+        self.nested = self._comment(parent=self.reply)
+        self.other = self._comment()
+
+    def _comment(self, parent=None):
+        return Comment.objects.create(
+            author=self.user, body='c', content_type=self.content_type,
+            object_id=self.content.id, parent=parent, topic=self.topic,
+        )
+
+    def test_path_and_depth_written_on_insert(self):
+        from comments.paths import child_path
+
+        self.nested.refresh_from_db()
+        self.assertEqual(self.nested.path, child_path(child_path(child_path('', self.root.id), self.reply.id), self.nested.id))
+        self.assertEqual(self.nested.depth, 2)
+        self.assertEqual(self.nested.thread_path, [self.reply.id, self.root.id])
+        self.assertEqual(self.root.thread_path, [])
+        self.assertEqual(
+            set(Comment.objects.subtree(self.reply).values_list('id', flat=True)),
+            {self.reply.id, self.nested.id},
+        )
+
+    def test_subtree_of_comment_without_path_is_only_itself(self):
+        Comment.objects.filter(pk=self.reply.pk).update(path='')
+        self.reply.refresh_from_db()
+
+        self.assertEqual(list(Comment.objects.subtree(self.reply).values_list('id', flat=True)), [self.reply.id])
+        self.assertEqual(list(self.reply.get_subtree().values_list('id', flat=True)), [self.reply.id])
+
+    def test_deep_threads_fit_in_path(self):
+        node = self.nested
+        for _ in range(30):
+            node = self._comment(parent=node)
+        node.refresh_from_db()
+        self.assertEqual(node.depth, 32)
+        self.assertGreater(len(node.path), 255)
+        self.assertEqual(Comment.objects.subtree(self.root).count(), 33)
+
+    def test_insert_rolls_back_when_path_update_fails(self):
+        from unittest.mock import patch
+
+        before = Comment.objects.count()
+        with patch('comments.models.child_path', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self._comment(parent=self.root)
+        self.assertEqual(Comment.objects.count(), before)
+
+    def test_logic_delete_deactivates_subtree_in_one_update(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        self.topic.refresh_from_db()
+        score = self.topic.activity_score
+        with CaptureQueriesContext(connection) as context:
+            Comment.objects.logic_delete(self.root)
+        updates = [q['sql'] for q in context.captured_queries if q['sql'].startswith('UPDATE "comments_comment"')]
+        self.assertEqual(len(updates), 1)
+
+        active = dict(Comment.objects.values_list('id', 'is_active'))
+        self.assertEqual(active, {self.root.id: False, self.reply.id: False, self.nested.id: False, self.other.id: True})
+        self.topic.refresh_from_db()
+        self.assertEqual(self.topic.activity_score, score - 3 * 5)
+
+    def test_rebuild_comment_paths_command(self):
+        from django.core.management import call_command
+
+        Comment.objects.update(path='', depth=0)
+        call_command('rebuild_comment_paths', '--batch-size', '1', stdout=StringIO())
+        self.nested.refresh_from_db()
+        self.assertEqual(self.nested.depth, 2)
+        self.assertEqual(self.nested.thread_path, [self.reply.id, self.root.id])
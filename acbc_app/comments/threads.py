@@ -0,0 +1,205 @@
+"""
+Comment threads: keyset pages of root comments with their reply trees loaded in batch.
+
+A page costs a fixed number of queries whatever its depth: the roots, one query for
+the active descendants of those roots (a prefix match on their materialized paths,
+see comments.paths, keeping the first REPLIES_PER_COMMENT replies of each parent and
+counting the rest with a window), the vote counts and user votes of
+all of them (votes.services.VoteContext), the authors' featured badges and, for
+knowledge path threads, which authors hold a certificate. CommentSerializer reads
+replies, reply counts and badges from the CommentThread in its context instead of
+querying per comment.
+
+Roots are ordered newest first (-created_at, -id). Replies are ordered oldest first
+(created_at, id); each comment shows its first REPLIES_PER_COMMENT replies and a
+replies_next_cursor to load the rest from the replies endpoint.
+"""
+import base64
+import json
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, F, Q, Window
+from django.db.models.functions import RowNumber
+from django.utils.dateparse import parse_datetime
+
+from comments.models import Comment
+from votes.services import VoteContext
+
+ROOT_ORDERING = ('-created_at', '-id')
+REPLY_ORDERING = ('created_at', 'id')
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+REPLIES_PER_COMMENT = 20
+
+
+class InvalidCommentCursor(ValueError):
+    """The cursor query parameter could not be decoded."""
+
+
+def encode_comment_cursor(comment):
+    payload = [comment.created_at.isoformat(), comment.pk]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_comment_cursor(value):
+    try:
+        created_at, pk = json.loads(base64.urlsafe_b64decode(value.encode()))
+        created_at = parse_datetime(created_at)
+        if created_at is None:
+            raise ValueError('bad date')
+        return created_at, int(pk)
+    except (TypeError, ValueError, UnicodeError) as exc:
+        raise InvalidCommentCursor(str(exc)) from exc
+
+
+def _before_cursor(cursor):
+    created_at, pk = cursor
+    return Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
+
+
+def _after_cursor(cursor):
+    created_at, pk = cursor
+    return Q(created_at__gt=created_at) | Q(created_at=created_at, pk__gt=pk)
+
+
+def _descendants(comments, per_parent):
+    """
+    Active comments below comments, oldest first, reachable through active parents.
+    Only the first per_parent replies of each parent are loaded; each carries
+    sibling_count, the number of active replies of its parent.
+    """
+    prefixes = Q()
+    for comment in comments:
+        if comment.path:
+            prefixes |= Q(path__startswith=comment.path)
+    if not prefixes:
+        return []
+    rows = (
+        Comment.objects.filter(prefixes, is_active=True)
+        .exclude(pk__in=[comment.pk for comment in comments])
+        .annotate(
+            sibling_rank=Window(
+                RowNumber(),
+                partition_by=[F('parent_id')],
+                order_by=[F(field).asc() for field in REPLY_ORDERING],
+            ),
+            sibling_count=Window(Count('id'), partition_by=[F('parent_id')]),
+        )
+        .filter(sibling_rank__lte=per_parent)
+        .select_related('author')
+        .order_by(*REPLY_ORDERING)
+    )
+    reachable = {comment.pk for comment in comments}
+    descendants = []
+    for reply in rows:
+        if reply.parent_id in reachable:
+            reachable.add(reply.pk)
+            descendants.append(reply)
+    return descendants
+
+
+class CommentThread:
+    """
+    The reply trees below a list of comments, with everything the serializer reads.
+
+    children(comment_id) gives the replies shown under a comment, reply_count() the
+    number of active replies, replies_next_cursor() where "load more replies" resumes.
+    """
+
+    def __init__(self, comments, *, user=None, replies_per_comment=REPLIES_PER_COMMENT):
+        self.replies_per_comment = replies_per_comment
+        self._children = {}
+        self._reply_counts = {}
+        self._badges = {}
+        self._certified = set()
+        self.vote_context = VoteContext(user)
+        self.comments = list(comments)
+        if not self.comments:
+            return
+
+        descendants = _descendants(self.comments, replies_per_comment)
+        for reply in descendants:
+            self._children.setdefault(reply.parent_id, []).append(reply)
+            self._reply_counts[reply.parent_id] = reply.sibling_count
+
+        every = self.comments + descendants
+        self._load_badges({comment.author_id for comment in every})
+        self._load_certificates(every)
+        self.vote_context.load_objects(every)
+
+    def _load_badges(self, author_ids):
+        from profiles.models import Profile
+
+        profiles = Profile.objects.filter(
+            user_id__in=author_ids, featured_badge__isnull=False,
+        ).select_related('featured_badge__badge')
+        self._badges = {profile.user_id: profile.featured_badge for profile in profiles}
+
+    def _load_certificates(self, comments):
+        from certificates.models import Certificate
+        from knowledge_paths.models import KnowledgePath
+
+        path_type_id = ContentType.objects.get_for_model(KnowledgePath).id
+        pairs = {
+            (comment.author_id, comment.object_id)
+            for comment in comments if comment.content_type_id == path_type_id
+        }
+        if not pairs:
+            return
+        certified = Certificate.objects.filter(
+            user_id__in={author_id for author_id, _ in pairs},
+            knowledge_path_id__in={path_id for _, path_id in pairs},
+        ).values_list('user_id', 'knowledge_path_id')
+        self._certified = set(certified) & pairs
+
+    def children(self, comment_id):
+        return self._children.get(comment_id, [])
+
+    def reply_count(self, comment_id):
+        return self._reply_counts.get(comment_id, 0)
+
+    def replies_next_cursor(self, comment_id):
+        replies = self._children.get(comment_id)
+        if not replies or self.reply_count(comment_id) <= len(replies):
+            return None
+        return encode_comment_cursor(replies[-1])
+
+    def featured_badge(self, author_id):
+        return self._badges.get(author_id)
+
+    def author_is_certified(self, comment):
+        return (comment.author_id, comment.object_id) in self._certified
+
+
+def root_comment_page(queryset, *, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+    """(roots, next_cursor) for one page of root comments, newest first."""
+    queryset = queryset.select_related('author').order_by(*ROOT_ORDERING)
+    if cursor:
+        queryset = queryset.filter(_before_cursor(decode_comment_cursor(cursor)))
+    roots = list(queryset[:page_size + 1])
+    next_cursor = encode_comment_cursor(roots[page_size - 1]) if len(roots) > page_size else None
+    return roots[:page_size], next_cursor
+
+
+def reply_page(parent, *, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+    """(replies, next_cursor) for one page of parent's active replies, oldest first."""
+    queryset = parent.replies.filter(is_active=True).select_related('author').order_by(*REPLY_ORDERING)
+    if cursor:
+        queryset = queryset.filter(_after_cursor(decode_comment_cursor(cursor)))
+    replies = list(queryset[:page_size + 1])
+    next_cursor = encode_comment_cursor(replies[page_size - 1]) if len(replies) > page_size else None
+    return replies[:page_size], next_cursor
+
+
+def page_size_from(request):
+    try:
+        page_size = int(request.query_params.get('page_size', DEFAULT_PAGE_SIZE))
+    except (TypeError, ValueError):
+        page_size = DEFAULT_PAGE_SIZE
+    return max(1, min(page_size, MAX_PAGE_SIZE))
+
+
+def thread_context(request, comments):
+    """Serializer context whose CommentThread covers comments and their reply trees."""
+    thread = CommentThread(comments, user=getattr(request, 'user', None))
+    return {'request': request, 'comment_thread': thread, 'vote_context': thread.vote_context}
@@ -8,17 +8,46 @@ from rest_framework import status
 from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from utils.permissions import IsAuthor
-from utils.notification_utils import notify_comment_reply, notify_knowledge_path_comment, notify_content_comment
+from utils.notification_utils import (
+    notify_comment_reply,
+    notify_content_comment,
+    notify_knowledge_path_comment,
+    notify_later,
+)
 
 from comments.managers import CommentManager
 from content.models import Topic, Content
 from comments.models import Comment
+from comments.threads import (
+    InvalidCommentCursor,
+    page_size_from,
+    reply_page,
+    root_comment_page,
+    thread_context,
+)
 from comments.serializers import CommentSerializer, KnowledgePathCommentSerializer, ContentTopicCommentSerializer, \
     TopicCommentSerializer, CommentCreateSerializer
 from knowledge_paths.models import KnowledgePath
 from utils.logging_utils import comments_logger, log_error, log_business_event, log_performance_metric
 
 
+def _thread_page(request, serializer_class, queryset):
+    """
+    One page of root comments with their reply trees, as {results, next_cursor, page_size}.
+    Raises InvalidCommentCursor for a bad ?cursor=.
+    """
+    page_size = page_size_from(request)
+    roots, next_cursor = root_comment_page(
+        queryset, cursor=request.query_params.get('cursor'), page_size=page_size,
+    )
+    serializer = serializer_class(roots, many=True, context=thread_context(request, roots))
+    return {'results': serializer.data, 'next_cursor': next_cursor, 'page_size': page_size}
+
+
+def _invalid_cursor_response():
+    return Response({'error': 'Cursor inválido.'}, status=status.HTTP_400_BAD_REQUEST)
+
+
 class BaseCommentView(APIView):
     """ Base view for retrieving and adding comments. """
 
@@ -42,16 +71,17 @@ class BaseCommentView(APIView):
                 'view_type': self.__class__.__name__,
             })
             
-            queryset = self.get_queryset(**kwargs)
-            serializer = self.get_serializer_class()(queryset, many=True, context={'request': request})
+            data = _thread_page(request, self.get_serializer_class(), self.get_queryset(**kwargs))
             
             comments_logger.debug("Comment list retrieved successfully", extra={
                 'user_id': request.user.id if request.user.is_authenticated else None,
                 'view_type': self.__class__.__name__,
-                'comment_count': len(queryset),
+                'comment_count': len(data['results']),
             })
             
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response(data, status=status.HTTP_200_OK)
+        except InvalidCommentCursor:
+            return _invalid_cursor_response()
         except Exception as e:
             log_error(e, "Error retrieving comment list", request.user.id if request.user.is_authenticated else None, {
                 'view_type': self.__class__.__name__,
@@ -143,17 +173,18 @@ class KnowledgePathCommentsView(APIView):
                 topic__isnull=True,  # Ensure these are not topic-related comments
                 parent=None,
                 is_active=True
-            ).order_by('-created_at')
-            
-            serializer = KnowledgePathCommentSerializer(comments, many=True, context={'request': request})
+            )
+            data = _thread_page(request, KnowledgePathCommentSerializer, comments)
             
             comments_logger.debug("Knowledge path comments retrieved successfully", extra={
                 'user_id': request.user.id,
                 'knowledge_path_id': pk,
-                'comment_count': len(comments),
+                'comment_count': len(data['results']),
             })
             
-            return Response(serializer.data)
+            return Response(data)
+        except InvalidCommentCursor:
+            return _invalid_cursor_response()
         except Exception as e:
             log_error(e, "Error retrieving knowledge path comments", request.user.id, {
                 'knowledge_path_id': pk,
@@ -199,8 +230,8 @@ class KnowledgePathCommentsView(APIView):
                 # Send notification to knowledge path author if this is a top-level comment
                 if not comment.parent and knowledge_path.author and knowledge_path.author != request.user:
                     try:
-                        notify_knowledge_path_comment(comment)
-                        comments_logger.debug("Knowledge path comment notification sent", extra={
+                        notify_later(notify_knowledge_path_comment, comment)
+                        comments_logger.debug("Knowledge path comment notification queued", extra={
                             'user_id': request.user.id,
                             'comment_id': comment.id,
                             'knowledge_path_id': pk,
@@ -281,17 +312,18 @@ class TopicCommentsView(APIView):
                 topic__isnull=True,
                 parent=None,
                 is_active=True
-            ).order_by('-created_at')
-            
-            serializer = TopicCommentSerializer(comments, many=True, context={'request': request})
+            )
+            data = _thread_page(request, TopicCommentSerializer, comments)
             
             comments_logger.debug("Topic comments retrieved successfully", extra={
                 'user_id': user_id,
                 'topic_id': pk,
-                'comment_count': len(comments),
+                'comment_count': len(data['results']),
             })
             
-            return Response(serializer.data)
+            return Response(data)
+        except InvalidCommentCursor:
+            return _invalid_cursor_response()
         except Exception as e:
             log_error(e, "Error retrieving topic comments", user_id, {
                 'topic_id': pk,
@@ -402,8 +434,8 @@ class ContentTopicCommentsView(BaseCommentView):
             # Send notification to content owner if this is a top-level comment
             if not comment.parent and content_profile.user and content_profile.user != self.request.user:
                 try:
-                    notify_content_comment(comment)
-                    comments_logger.debug("Content comment notification sent", extra={
+                    notify_later(notify_content_comment, comment)
+                    comments_logger.debug("Content comment notification queued", extra={
                         'user_id': self.request.user.id,
                         'comment_id': comment.id,
                         'content_id': content.id,
@@ -814,9 +846,6 @@ def _discussion_question_access_denied(request, parent_comment, *, writing=False
     if question is None:
         return Response({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
 
-    if question.apply_schedule():
-        question.save(update_fields=['status', 'updated_at'])
-
     if writing:
         if not user_can_answer_question(question, request.user):
             return Response(
@@ -865,8 +894,12 @@ class CommentRepliesView(APIView):
             if denied is not None:
                 return denied
 
-            replies = Comment.objects.filter(parent=parent_comment, is_active=True).order_by('created_at')
-            serializer = CommentSerializer(replies, many=True, context={'request': request})
+            # "Load more replies": a page of direct replies, each with its own subtree.
+            page_size = page_size_from(request)
+            replies, next_cursor = reply_page(
+                parent_comment, cursor=request.query_params.get('cursor'), page_size=page_size,
+            )
+            serializer = CommentSerializer(replies, many=True, context=thread_context(request, replies))
             
             comments_logger.debug("Comment replies retrieved successfully", extra={
                 'user_id': request.user.id,
@@ -874,7 +907,9 @@ class CommentRepliesView(APIView):
                 'reply_count': len(replies),
             })
             
-            return Response(serializer.data)
+            return Response({'results': serializer.data, 'next_cursor': next_cursor, 'page_size': page_size})
+        except InvalidCommentCursor:
+            return _invalid_cursor_response()
         except Comment.DoesNotExist:
             comments_logger.warning("Comment replies request failed - comment not found", extra={
                 'user_id': request.user.id,
@@ -941,8 +976,8 @@ class CommentRepliesView(APIView):
                 
                 # Send notification for the new reply
                 try:
-                    notify_comment_reply(comment)
-                    comments_logger.debug("Comment reply notification sent", extra={
+                    notify_later(notify_comment_reply, comment)
+                    comments_logger.debug("Comment reply notification queued", extra={
                         'user_id': request.user.id,
                         'reply_id': comment.id,
                         'comment_id': pk,
@@ -998,8 +1033,6 @@ class DiscussionQuestionCommentsView(APIView):
             DiscussionQuestion.objects.select_related('book_club', 'node'),
             pk=pk,
         )
-        if question.apply_schedule():
-            question.save(update_fields=['status', 'updated_at'])
         return question
 
     def get(self, request, pk):
@@ -1013,7 +1046,7 @@ class DiscussionQuestionCommentsView(APIView):
 
             # Post-to-see: empty list until the member has answered (or is staff).
             if not user_can_see_answers(question, request.user):
-                return Response([])
+                return Response({'results': [], 'next_cursor': None, 'page_size': page_size_from(request)})
 
             dq_type = ContentType.objects.get_for_model(DiscussionQuestion)
             comments = Comment.objects.filter(
@@ -1022,9 +1055,10 @@ class DiscussionQuestionCommentsView(APIView):
                 topic__isnull=True,
                 parent=None,
                 is_active=True,
-            ).order_by('-created_at')
-            serializer = CommentSerializer(comments, many=True, context={'request': request})
-            return Response(serializer.data)
+            )
+            return Response(_thread_page(request, CommentSerializer, comments))
+        except InvalidCommentCursor:
+            return _invalid_cursor_response()
         except Exception as e:
             log_error(e, "Error retrieving discussion question comments", request.user.id, {
                 'discussion_question_id': pk,
@@ -12,6 +12,7 @@ from content.models import (
     Publication,
     TopicCreationRequest,
     TopicChatQuery,
+    TopicTranscriptStats,
 )
 
 
@@ -152,6 +153,21 @@ class TopicAdmin(admin.ModelAdmin):
     )
 
 
+@admin.register(TopicTranscriptStats)
+class TopicTranscriptStatsAdmin(admin.ModelAdmin):
+    # Maintained by content.topic_transcript_stats; repair with recompute_topic_transcript_stats.
+    list_display = [
+        'topic', 'indexed_count', 'pending_count', 'stale_count', 'failed_count',
+        'chunk_count', 'last_embedded_at', 'updated_at',
+    ]
+    search_fields = ['topic__title']
+    raw_id_fields = ['topic']
+    readonly_fields = [
+        'indexed_count', 'pending_count', 'stale_count', 'failed_count',
+        'chunk_count', 'last_embedded_at', 'updated_at',
+    ]
+
+
 @admin.register(TopicChatQuery)
 class TopicChatQueryAdmin(admin.ModelAdmin):
     list_display = ['id', 'topic', 'user', 'created_at']
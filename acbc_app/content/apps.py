@@ -5,6 +5,12 @@ class ContentConfig(AppConfig):
     name = 'content'
 
     def ready(self):
+        from content.response_cache import connect_response_cache_signals
         from content.signals import connect_topic_activity_signals
+        from content.topic_chat_cache import connect_answer_cache_signals
+        from content.topic_transcript_stats import connect_topic_transcript_stats_signals
 
         connect_topic_activity_signals()
+        connect_answer_cache_signals()
+        connect_response_cache_signals()
+        connect_topic_transcript_stats_signals()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
 from typing import Optional
 
 from django.conf import settings
@@ -186,9 +187,45 @@ def broadcast_anchor(
         txid,
         built.fee_sats,
     )
+    schedule_anchor_refresh(anchor)
     return anchor
 
 
+def schedule_anchor_refresh(
+    anchor: TranscriptAnchor,
+    *,
+    delay: Optional[float] = None,
+    polls: int = 0,
+) -> bool:
+    """
+    Poll confirmations for a broadcast anchor in the job worker, ``delay`` seconds from
+    now (``BTC_ANCHOR_REFRESH_INTERVAL`` by default). The job schedules the next poll
+    itself until the anchor leaves ``btc_broadcast``.
+
+    Delayed polls have no inline equivalent, so they are skipped under ``JOBS_EAGER``.
+    """
+    from jobs.queue import enqueue_on_commit, jobs_eager
+
+    if (
+        anchor.status != TranscriptAnchor.STATUS_BTC_BROADCAST
+        or not anchor.btc_txid
+        or polls >= settings.BTC_ANCHOR_REFRESH_MAX_POLLS
+    ):
+        return False
+    if delay is None:
+        delay = settings.BTC_ANCHOR_REFRESH_INTERVAL
+    if delay and jobs_eager():
+        return False
+    enqueue_on_commit(
+        'content.refresh_anchor_confirmations',
+        anchor_id=anchor.pk,
+        polls=polls,
+        idempotency_key=f'anchor-refresh:{anchor.pk}',
+        run_after=timezone.now() + timedelta(seconds=delay),
+    )
+    return True
+
+
 def refresh_anchor_confirmations(
     anchor: TranscriptAnchor,
     *,
@@ -245,9 +282,9 @@ def maybe_refresh_broadcast_anchor(
     """
     Best-effort confirmation poll for anchors still in ``btc_broadcast``.
 
-    Used by the public GET endpoint so the UI catches up without a manual
-    ``manage.py broadcast_transcript_anchor --refresh``. Failures leave the
-    row unchanged.
+    Used by the refresh job (see ``schedule_anchor_refresh``) so the UI catches
+    up without a manual ``manage.py broadcast_transcript_anchor --refresh``.
+    Failures leave the row unchanged.
     """
     if (
         anchor is None
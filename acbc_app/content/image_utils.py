@@ -174,6 +174,17 @@ def delete_topic_thumbnail(topic, save=False):
     delete_image_field(topic, 'topic_image_thumbnail', save=save)
 
 
+def schedule_topic_thumbnail(topic):
+    """generate_topic_thumbnail() in the job worker once the current transaction commits."""
+    from jobs.queue import enqueue_on_commit
+
+    enqueue_on_commit(
+        'content.topic_thumbnail',
+        topic_id=topic.id,
+        idempotency_key=f'topic-thumbnail:{topic.id}',
+    )
+
+
 def generate_content_profile_thumbnail_preview(profile, save=True):
     return save_listing_preview_from_field(
         profile,
@@ -189,6 +200,16 @@ def delete_content_profile_thumbnail_preview(profile, save=False):
     delete_image_field(profile, 'thumbnail_preview', save=save)
 
 
+def schedule_content_profile_thumbnail_preview(profile):
+    from jobs.queue import enqueue_on_commit
+
+    enqueue_on_commit(
+        'content.content_profile_thumbnail_preview',
+        content_profile_id=profile.id,
+        idempotency_key=f'content-profile-thumbnail:{profile.id}',
+    )
+
+
 def generate_knowledge_path_image_preview(knowledge_path, save=True):
     return save_listing_preview_from_field(
         knowledge_path,
@@ -202,3 +223,13 @@ def generate_knowledge_path_image_preview(knowledge_path, save=True):
 
 def delete_knowledge_path_image_preview(knowledge_path, save=False):
     delete_image_field(knowledge_path, 'image_preview', save=save)
+
+
+def schedule_knowledge_path_image_preview(knowledge_path):
+    from jobs.queue import enqueue_on_commit
+
+    enqueue_on_commit(
+        'knowledge_paths.image_preview',
+        knowledge_path_id=knowledge_path.id,
+        idempotency_key=f'knowledge-path-preview:{knowledge_path.id}',
+    )
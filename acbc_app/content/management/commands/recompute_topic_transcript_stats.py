@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from content.topic_transcript_stats import (
+    recompute_all_topic_transcript_stats,
+    recompute_topic_transcript_stats,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Fully recompute TopicTranscriptStats (transcript counts by embedding status, '
+        'chunk totals, last embedded_at). Run once after migrating, or to repair drift.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--topic-id',
+            type=int,
+            default=None,
+            help='Recompute a single topic by id (default: all topics).',
+        )
+
+    def handle(self, *args, **options):
+        topic_id = options.get('topic_id')
+        if topic_id is not None:
+            stats = recompute_topic_transcript_stats(topic_id)
+            if stats is None:
+                self.stderr.write(self.style.ERROR(f'Topic {topic_id} not found.'))
+                return
+            self.stdout.write(self.style.SUCCESS(
+                f'Recomputed topic {topic_id}: indexed={stats.indexed_count} '
+                f'pending={stats.pending_count} stale={stats.stale_count} '
+                f'failed={stats.failed_count} chunks={stats.chunk_count}'
+            ))
+            return
+
+        updated = recompute_all_topic_transcript_stats()
+        self.stdout.write(self.style.SUCCESS(
+            f'Recomputed transcript stats for {updated} topic(s).'
+        ))
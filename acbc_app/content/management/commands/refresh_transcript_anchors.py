@@ -0,0 +1,26 @@
+"""
+Queue a confirmation poll for every transcript anchor still in btc_broadcast.
+
+Broadcasts schedule their own polls; run this (e.g. from cron) to pick up anchors
+broadcast before that, or whose polls ran out (BTC_ANCHOR_REFRESH_MAX_POLLS).
+"""
+from django.core.management.base import BaseCommand
+
+from content.bitcoin.service import schedule_anchor_refresh
+from content.models import TranscriptAnchor
+
+
+class Command(BaseCommand):
+    help = 'Queue a confirmation poll for every broadcast, unconfirmed transcript anchor.'
+
+    def handle(self, *args, **options):
+        anchors = TranscriptAnchor.objects.filter(
+            status=TranscriptAnchor.STATUS_BTC_BROADCAST,
+        ).exclude(btc_txid='')
+        queued = sum(
+            schedule_anchor_refresh(anchor, delay=0)
+            for anchor in anchors.iterator()
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Queued confirmation polls for {queued} anchor(s).'
+        ))
@@ -0,0 +1,50 @@
+# Generated by Django 5.0 on 2026-10-16 23:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0032_transcript_anchor_default_signet'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='topicchatquery',
+            name='answer_cache_valid',
+            field=models.BooleanField(default=True, help_text='False once a cited transcript changed; the answer is no longer reused.'),
+        ),
+        migrations.AddField(
+            model_name='topicchatquery',
+            name='cited_contents',
+            field=models.ManyToManyField(blank=True, related_name='cited_in_chat_queries', to='content.content'),
+        ),
+        migrations.AddField(
+            model_name='topicchatquery',
+            name='question_embedding',
+            field=models.BinaryField(blank=True, help_text='Question vector as packed float32 (similarity cache lookups).', null=True),
+        ),
+        migrations.AddField(
+            model_name='topicchatquery',
+            name='question_hash',
+            field=models.CharField(blank=True, help_text='SHA-256 of the normalized question (exact-match cache lookups).', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='topicchatquery',
+            name='reused_from',
+            field=models.ForeignKey(blank=True, help_text='Earlier query whose answer was served from the answer cache.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reuses', to='content.topicchatquery'),
+        ),
+        migrations.AddField(
+            model_name='topicchatquery',
+            name='source_text_hashes',
+            field=models.JSONField(blank=True, default=dict, help_text='ContentTranscript.text_hash per cited content_id when the answer was produced.'),
+        ),
+        migrations.AddIndex(
+            model_name='topicchatquery',
+            index=models.Index(fields=['topic', 'question_hash'], name='content_tcq_topic_qhash'),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.0 on 2026-10-16 23:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Max, Sum
+from django.utils import timezone
+
+STATUS_FIELDS = {
+    'indexed': 'indexed_count',
+    'pending': 'pending_count',
+    'stale': 'stale_count',
+    'failed': 'failed_count',
+}
+
+
+def backfill_topic_transcript_stats(apps, schema_editor):
+    """Same aggregation as content.topic_transcript_stats.compute_topic_transcript_stats."""
+    Topic = apps.get_model('content', 'Topic')
+    ContentTranscript = apps.get_model('content', 'ContentTranscript')
+    TopicTranscriptStats = apps.get_model('content', 'TopicTranscriptStats')
+
+    rows = ContentTranscript.objects.filter(
+        content__media_type__in=('VIDEO', 'AUDIO'),
+        content__topics__isnull=False,
+        embedding_status__in=STATUS_FIELDS,
+    ).values('content__topics', 'embedding_status').annotate(
+        transcripts=Count('id', distinct=True),
+        chunks=Sum('chunk_count'),
+        last_embedded_at=Max('embedded_at'),
+    ).order_by()
+
+    stats = {
+        topic_id: TopicTranscriptStats(topic_id=topic_id, updated_at=timezone.now())
+        for topic_id in Topic.objects.values_list('id', flat=True)
+    }
+    for row in rows:
+        topic_stats = stats.get(row['content__topics'])
+        if topic_stats is None:
+            continue
+        setattr(topic_stats, STATUS_FIELDS[row['embedding_status']], row['transcripts'])
+        if row['embedding_status'] == 'indexed':
+            topic_stats.chunk_count = row['chunks'] or 0
+            topic_stats.last_embedded_at = row['last_embedded_at']
+    TopicTranscriptStats.objects.bulk_create(stats.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0033_topic_chat_answer_cache'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TopicTranscriptStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('indexed_count', models.IntegerField(default=0)),
+                ('pending_count', models.IntegerField(default=0)),
+                ('stale_count', models.IntegerField(default=0)),
+                ('failed_count', models.IntegerField(default=0)),
+                ('chunk_count', models.IntegerField(default=0, help_text='Sum of ContentTranscript.chunk_count over indexed transcripts.')),
+                ('last_embedded_at', models.DateTimeField(blank=True, help_text='Newest embedded_at among indexed transcripts.', null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('topic', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='transcript_stats', to='content.topic')),
+            ],
+            options={
+                'verbose_name_plural': 'topic transcript stats',
+            },
+        ),
+        migrations.RunPython(backfill_topic_transcript_stats, migrations.RunPython.noop),
+    ]
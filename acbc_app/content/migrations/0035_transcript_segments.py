@@ -0,0 +1,61 @@
+# Generated by Django 5.0 on 2026-10-17 02:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_transcript_segments(apps, schema_editor):
+    """segment_count and one ContentTranscriptSegment row per cue of ContentTranscript.segments."""
+    ContentTranscript = apps.get_model('content', 'ContentTranscript')
+    ContentTranscriptSegment = apps.get_model('content', 'ContentTranscriptSegment')
+
+    for transcript in ContentTranscript.objects.only('id', 'segments').iterator(chunk_size=100):
+        segments = transcript.segments or []
+        ContentTranscript.objects.filter(pk=transcript.pk).update(segment_count=len(segments))
+        ContentTranscriptSegment.objects.bulk_create(
+            [
+                ContentTranscriptSegment(
+                    transcript_id=transcript.pk,
+                    index=segment['index'],
+                    start_ms=segment['start_ms'],
+                    end_ms=segment['end_ms'],
+                    text=segment.get('text', ''),
+                )
+                for segment in segments
+            ],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0034_topic_transcript_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contenttranscript',
+            name='segment_count',
+            field=models.PositiveIntegerField(default=0, help_text='len(segments), so summaries do not load the segments JSON.'),
+        ),
+        migrations.CreateModel(
+            name='ContentTranscriptSegment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('index', models.PositiveIntegerField()),
+                ('start_ms', models.PositiveIntegerField()),
+                ('end_ms', models.PositiveIntegerField()),
+                ('text', models.TextField(blank=True)),
+                ('transcript', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='segment_rows', to='content.contenttranscript')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['transcript', 'start_ms', 'index'], name='content_tr_segment_start_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='contenttranscriptsegment',
+            constraint=models.UniqueConstraint(fields=('transcript', 'index'), name='content_tr_segment_index_uniq'),
+        ),
+        migrations.RunPython(backfill_transcript_segments, migrations.RunPython.noop),
+    ]
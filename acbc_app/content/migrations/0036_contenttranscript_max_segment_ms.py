@@ -0,0 +1,33 @@
+# Generated by Django 5.0 on 2026-10-17 03:10
+
+from django.db import migrations, models
+from django.db.models import F, Max
+
+
+def backfill_max_segment_ms(apps, schema_editor):
+    ContentTranscript = apps.get_model('content', 'ContentTranscript')
+    ContentTranscriptSegment = apps.get_model('content', 'ContentTranscriptSegment')
+
+    longest = (
+        ContentTranscriptSegment.objects.values('transcript_id')
+        .annotate(longest=Max(F('end_ms') - F('start_ms')))
+        .values_list('transcript_id', 'longest')
+    )
+    for transcript_id, value in longest.iterator(chunk_size=1000):
+        ContentTranscript.objects.filter(pk=transcript_id).update(max_segment_ms=max(0, value or 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0035_transcript_segments'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contenttranscript',
+            name='max_segment_ms',
+            field=models.PositiveIntegerField(default=0, help_text='Longest cue (end_ms - start_ms); bounds start_ms from below in time-window reads.'),
+        ),
+        migrations.RunPython(backfill_max_segment_ms, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,6 @@
 import os
 import uuid
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
@@ -326,6 +326,14 @@ class ContentTranscript(models.Model):
         blank=True,
         help_text='Parsed cues from source_subtitles: index, start_ms, end_ms, text.',
     )
+    segment_count = models.PositiveIntegerField(
+        default=0,
+        help_text='len(segments), so summaries do not load the segments JSON.',
+    )
+    max_segment_ms = models.PositiveIntegerField(
+        default=0,
+        help_text='Longest cue (end_ms - start_ms); bounds start_ms from below in time-window reads.',
+    )
     text_length = models.PositiveIntegerField(blank=True, null=True)
     text_hash = models.CharField(
         max_length=64,
@@ -412,7 +420,71 @@ class ContentTranscript(models.Model):
 
         self.obsidian_frontmatter = prepare_json_for_db(self.obsidian_frontmatter or {})
         self.segments = prepare_json_for_db(self.segments or [])
-        super().save(*args, **kwargs)
+        self.segment_count = len(self.segments)
+        self.max_segment_ms = max(
+            (max(0, segment['end_ms'] - segment['start_ms']) for segment in self.segments),
+            default=0,
+        )
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'segments' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'segment_count', 'max_segment_ms'}
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if update_fields is None or 'segments' in update_fields:
+                self.sync_segment_rows()
+
+    def sync_segment_rows(self):
+        """Replace the ContentTranscriptSegment rows with the current segments."""
+        ContentTranscriptSegment.objects.filter(transcript=self).delete()
+        ContentTranscriptSegment.objects.bulk_create(
+            [
+                ContentTranscriptSegment(
+                    transcript=self,
+                    index=segment['index'],
+                    start_ms=segment['start_ms'],
+                    end_ms=segment['end_ms'],
+                    text=segment.get('text', ''),
+                )
+                for segment in self.segments or []
+            ],
+            batch_size=1000,
+        )
+
+
+class ContentTranscriptSegment(models.Model):
+    """
+    One timed cue of a ContentTranscript, copied from ContentTranscript.segments on save.
+
+    Indexed by start time so the player can fetch the cues around the playhead
+    (content.transcript_segments) without loading the whole segments JSON.
+    """
+
+    transcript = models.ForeignKey(
+        ContentTranscript,
+        on_delete=models.CASCADE,
+        related_name='segment_rows',
+    )
+    index = models.PositiveIntegerField()
+    start_ms = models.PositiveIntegerField()
+    end_ms = models.PositiveIntegerField()
+    text = models.TextField(blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['transcript', 'index'],
+                name='content_tr_segment_index_uniq',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['transcript', 'start_ms', 'index'],
+                name='content_tr_segment_start_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f"Segment {self.index} of transcript {self.transcript_id}"
 
 
 class BlockchainInteraction(models.Model):
@@ -639,17 +711,56 @@ class Topic(models.Model):
         return False
 
     def indexed_transcript_count(self):
-        """VIDEO/AUDIO in this topic with embedding_status=indexed."""
-        from content.models import ContentTranscript
-        return self.contents.filter(
-            media_type__in=('VIDEO', 'AUDIO'),
-            transcript__embedding_status=ContentTranscript.EMBEDDING_STATUS_INDEXED,
-        ).count()
+        """VIDEO/AUDIO in this topic with embedding_status=indexed (from TopicTranscriptStats)."""
+        if self.pk is None:
+            return 0
+        try:
+            return self.transcript_stats.indexed_count
+        except TopicTranscriptStats.DoesNotExist:
+            # Count directly without creating the row: reads never write. The row comes
+            # from the topic post_save signal or recompute_topic_transcript_stats.
+            from content.topic_transcript_stats import compute_topic_transcript_stats
+            return compute_topic_transcript_stats([self.pk]).get(self.pk, {}).get('indexed_count', 0)
 
     def has_indexed_transcripts(self):
         return self.indexed_transcript_count() > 0
 
 
+class TopicTranscriptStats(models.Model):
+    """
+    Denormalized transcript / embedding counts for the VIDEO/AUDIO contents of a topic.
+
+    Maintained incrementally by content.topic_transcript_stats; repair with
+    `python manage.py recompute_topic_transcript_stats`.
+    """
+
+    topic = models.OneToOneField(
+        Topic,
+        on_delete=models.CASCADE,
+        related_name='transcript_stats',
+    )
+    indexed_count = models.IntegerField(default=0)
+    pending_count = models.IntegerField(default=0)
+    stale_count = models.IntegerField(default=0)
+    failed_count = models.IntegerField(default=0)
+    chunk_count = models.IntegerField(
+        default=0,
+        help_text='Sum of ContentTranscript.chunk_count over indexed transcripts.',
+    )
+    last_embedded_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text='Newest embedded_at among indexed transcripts.',
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = 'topic transcript stats'
+
+    def __str__(self):
+        return f"Transcript stats for topic {self.topic_id}"
+
+
 class TopicChatQuery(models.Model):
     """
     One independent RAG consultation on a topic (question + answer + sources).
@@ -675,6 +786,41 @@ class TopicChatQuery(models.Model):
         blank=True,
         help_text='Citation payloads returned with the answer (index, content_id, excerpt, …).',
     )
+    # Answer cache (content.topic_chat_cache): later equivalent questions in the
+    # same topic reuse this answer while the cited transcripts are unchanged.
+    question_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text='SHA-256 of the normalized question (exact-match cache lookups).',
+    )
+    question_embedding = models.BinaryField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text='Question vector as packed float32 (similarity cache lookups).',
+    )
+    source_text_hashes = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text='ContentTranscript.text_hash per cited content_id when the answer was produced.',
+    )
+    cited_contents = models.ManyToManyField(
+        Content,
+        blank=True,
+        related_name='cited_in_chat_queries',
+    )
+    answer_cache_valid = models.BooleanField(
+        default=True,
+        help_text='False once a cited transcript changed; the answer is no longer reused.',
+    )
+    reused_from = models.ForeignKey(
+        'self',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='reuses',
+        help_text='Earlier query whose answer was served from the answer cache.',
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -684,6 +830,10 @@ class TopicChatQuery(models.Model):
                 fields=['topic', 'user', '-created_at'],
                 name='content_tcq_topic_user_created',
             ),
+            models.Index(
+                fields=['topic', 'question_hash'],
+                name='content_tcq_topic_qhash',
+            ),
         ]
 
     def __str__(self):
@@ -0,0 +1,87 @@
+"""
+Cache tags for public topic responses and the model signals that bump them.
+
+'topics' covers the topic listing (and every topic detail); 'topic:<id>' covers one
+topic detail. See utils.shared_cache for how tag versions invalidate entries.
+"""
+import logging
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from utils.shared_cache import invalidate_tags_on_commit
+
+logger = logging.getLogger('academia_blockchain.content.response_cache')
+
+TOPICS_TAG = 'topics'
+
+
+def topic_tag(topic_id):
+    return f'topic:{topic_id}'
+
+
+def _content_topic_tags(content_id):
+    from content.models import Topic
+
+    return [topic_tag(pk) for pk in Topic.objects.filter(contents__id=content_id).values_list('id', flat=True)]
+
+
+def topic_changed(sender, instance, **kwargs):
+    invalidate_tags_on_commit(TOPICS_TAG, topic_tag(instance.pk))
+
+
+def topic_relation_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Topic.contents / Topic.moderators membership changed (from either side)."""
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    # Reverse side: instance is a Content/User and pk_set holds topic ids. A reverse
+    # clear has no ids, but TOPICS_TAG covers every detail too.
+    tags = [topic_tag(pk) for pk in pk_set or ()] if reverse else [topic_tag(instance.pk)]
+    invalidate_tags_on_commit(TOPICS_TAG, *tags)
+
+
+def content_changed(sender, instance, **kwargs):
+    """Content, ContentProfile, FileDetails or ContentTranscript rendered inside topic details."""
+    try:
+        if sender.__name__ == 'Content' and kwargs.get('signal') is post_delete:
+            # The M2M rows are already gone; bump every topic.
+            invalidate_tags_on_commit(TOPICS_TAG)
+            return
+        content_id = instance.pk if sender.__name__ == 'Content' else instance.content_id
+        tags = _content_topic_tags(content_id)
+        if sender.__name__ == 'ContentTranscript':
+            # Listings show indexed transcript counts.
+            tags.append(TOPICS_TAG)
+        invalidate_tags_on_commit(*tags)
+    except Exception:
+        logger.exception('Failed to invalidate topic cache on %s change', sender.__name__)
+
+
+def vote_count_changed(sender, instance, **kwargs):
+    if instance.topic_id:
+        invalidate_tags_on_commit(topic_tag(instance.topic_id))
+
+
+def connect_response_cache_signals():
+    from content.models import Content, ContentProfile, ContentTranscript, FileDetails, Topic
+    from votes.models import VoteCount
+
+    for signal, name in ((post_save, 'save'), (post_delete, 'delete')):
+        signal.connect(topic_changed, sender=Topic, dispatch_uid=f'response_cache_topic_{name}')
+        for model in (Content, ContentProfile, FileDetails, ContentTranscript):
+            signal.connect(
+                content_changed,
+                sender=model,
+                dispatch_uid=f'response_cache_{model.__name__.lower()}_{name}',
+            )
+        signal.connect(vote_count_changed, sender=VoteCount, dispatch_uid=f'response_cache_vote_count_{name}')
+
+    m2m_changed.connect(
+        topic_relation_changed,
+        sender=Topic.contents.through,
+        dispatch_uid='response_cache_topic_contents_m2m',
+    )
+    m2m_changed.connect(
+        topic_relation_changed,
+        sender=Topic.moderators.through,
+        dispatch_uid='response_cache_topic_moderators_m2m',
+    )
@@ -8,6 +8,7 @@ from content.models import (
     Content,
     Topic,
     TopicTimeline,
+    TopicTranscriptStats,
     TopicTimelineEntry,
     TopicTimelineEntryContent,
     TopicTimelineEntrySuggestion,
@@ -28,11 +29,12 @@ from content.utils import build_media_url
 from content.image_utils import (
     validate_cover_image_size,
     validate_content_profile_thumbnail_size,
-    generate_content_profile_thumbnail_preview,
+    schedule_content_profile_thumbnail_preview,
     delete_content_profile_thumbnail_preview,
 )
 from knowledge_paths.models import KnowledgePath, Node
 from profiles.serializers import UserSerializer
+from votes.serializers import VoteContextListSerializer, VoteContextMixin
 
 
 def _content_has_transcript(obj):
@@ -99,7 +101,7 @@ class FileDetailsSerializer(serializers.ModelSerializer):
         return self._get_file_url(obj)
 
 
-class ContentSerializer(serializers.ModelSerializer):
+class ContentSerializer(VoteContextMixin, serializers.ModelSerializer):
     file_details = serializers.SerializerMethodField()
     topics = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
     vote_count = serializers.SerializerMethodField()
@@ -121,6 +123,10 @@ class ContentSerializer(serializers.ModelSerializer):
             'has_file_available', 'is_original_uploader', 'can_suggest_file',
             'has_transcript', 'transcript_btc_anchored',
         ]
+        list_serializer_class = VoteContextListSerializer
+
+    def prefetch_votes(self, instances):
+        self.get_vote_context().load_objects(instances, topic=self.context.get('topic'))
     
     def get_file_details(self, obj):
         try:
@@ -146,14 +152,16 @@ class ContentSerializer(serializers.ModelSerializer):
     
     def get_vote_count(self, obj):
         topic = self.context.get('topic')
-        return obj.get_vote_count(topic)
+        cached = self.cached_vote_count(obj, topic)
+        return cached if cached is not None else obj.get_vote_count(topic)
 
     def get_user_vote(self, obj):
         request = self.context.get('request')
         topic = self.context.get('topic')
         if not request or not request.user.is_authenticated:
             return 0
-        return obj.get_user_vote(request.user, topic)
+        cached = self.cached_user_vote(obj, topic)
+        return cached if cached is not None else obj.get_user_vote(request.user, topic)
 
     def get_favicon(self, obj):
         """Get favicon URL for URL-based content"""
@@ -252,7 +260,7 @@ class ContentProfileSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         instance = super().create(validated_data)
         if instance.thumbnail:
-            generate_content_profile_thumbnail_preview(instance)
+            schedule_content_profile_thumbnail_preview(instance)
         return instance
 
     def update(self, instance, validated_data):
@@ -261,7 +269,7 @@ class ContentProfileSerializer(serializers.ModelSerializer):
         if thumbnail_updated:
             delete_content_profile_thumbnail_preview(instance, save=False)
             if instance.thumbnail:
-                generate_content_profile_thumbnail_preview(instance)
+                schedule_content_profile_thumbnail_preview(instance)
         return instance
 
     def to_representation(self, instance):
@@ -430,11 +438,24 @@ class TopicBasicSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['creator', 'indexed_transcript_count', 'chat_can_enable']
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Sparse fieldset (?fields=id,title,...) requested by the listing view.
+        requested = self.context.get('fields')
+        if requested:
+            for name in set(self.fields) - set(requested):
+                self.fields.pop(name)
+
+    def _indexed_transcripts(self, obj):
+        # Annotated by content.topic_listing; otherwise read from TopicTranscriptStats.
+        annotated = getattr(obj, 'indexed_transcripts', None)
+        return annotated if annotated is not None else obj.indexed_transcript_count()
+
     def get_indexed_transcript_count(self, obj):
-        return obj.indexed_transcript_count()
+        return self._indexed_transcripts(obj)
 
     def get_chat_can_enable(self, obj):
-        return obj.has_indexed_transcripts()
+        return self._indexed_transcripts(obj) > 0
 
     def validate_chat_enabled(self, value):
         if value is True:
@@ -449,7 +470,7 @@ class TopicBasicSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         ret = super().to_representation(instance)
-        if instance.topic_image:
+        if instance.topic_image and 'topic_image' in ret:
             url = build_media_url(instance.topic_image, self.context.get('request'))
             if url and getattr(instance, 'updated_at', None):
                 sep = '&' if '?' in url else '?'
@@ -458,14 +479,14 @@ class TopicBasicSerializer(serializers.ModelSerializer):
                 ret['topic_image'] = url
         # Downsized cover for listings; falls back to None so the client can
         # use topic_image when no thumbnail exists yet.
-        if instance.topic_image_thumbnail:
+        if 'topic_image_thumbnail' in ret and instance.topic_image_thumbnail:
             turl = build_media_url(instance.topic_image_thumbnail, self.context.get('request'))
             if turl and getattr(instance, 'updated_at', None):
                 sep = '&' if '?' in turl else '?'
                 ret['topic_image_thumbnail'] = f"{turl}{sep}t={int(instance.updated_at.timestamp())}"
             else:
                 ret['topic_image_thumbnail'] = turl
-        else:
+        elif 'topic_image_thumbnail' in ret:
             ret['topic_image_thumbnail'] = None
         return ret
 
@@ -486,9 +507,24 @@ class TopicBasicSerializer(serializers.ModelSerializer):
 class TopicDetailSerializer(TopicBasicSerializer):
     contents = serializers.SerializerMethodField()
     moderators = UserSerializer(many=True, read_only=True)
+    transcript_stats = serializers.SerializerMethodField()
 
     class Meta(TopicBasicSerializer.Meta):
-        fields = TopicBasicSerializer.Meta.fields + ['contents', 'moderators']
+        fields = TopicBasicSerializer.Meta.fields + ['contents', 'moderators', 'transcript_stats']
+
+    def get_transcript_stats(self, instance):
+        try:
+            stats = instance.transcript_stats
+        except TopicTranscriptStats.DoesNotExist:
+            return None
+        return {
+            'indexed': stats.indexed_count,
+            'pending': stats.pending_count,
+            'stale': stats.stale_count,
+            'failed': stats.failed_count,
+            'chunk_count': stats.chunk_count,
+            'last_embedded_at': stats.last_embedded_at,
+        }
 
     def get_contents(self, instance):
         ordered_contents = self.context.get('ordered_contents')
@@ -701,7 +737,7 @@ class TopicModeratorInvitationSerializer(serializers.ModelSerializer):
                   'created_at', 'updated_at', 'message']
 
 
-class PublicationSerializer(serializers.ModelSerializer):
+class PublicationSerializer(VoteContextMixin, serializers.ModelSerializer):
     content_profile_id = serializers.PrimaryKeyRelatedField(
         queryset=ContentProfile.objects.all(),
         source='content_profile',
@@ -718,6 +754,17 @@ class PublicationSerializer(serializers.ModelSerializer):
         model = Publication
         fields = ['id', 'content_profile_id', 'content_profile', 'content', 'text_content', 'status', 'published_at', 'updated_at', 'username', 'vote_count', 'user_vote']
         read_only_fields = ['published_at', 'updated_at']
+        list_serializer_class = VoteContextListSerializer
+
+    def prefetch_votes(self, instances):
+        # content_profile nests ContentSerializer (global, topic-less votes).
+        vote_context = self.get_vote_context()
+        vote_context.load_objects(instances)
+        vote_context.load(Content, [
+            instance.content_profile.content_id
+            for instance in instances
+            if instance.content_profile_id
+        ])
 
     def get_content(self, instance):
         if not instance.content_profile or not instance.content_profile.content:
@@ -731,13 +778,15 @@ class PublicationSerializer(serializers.ModelSerializer):
         return serializer.data
 
     def get_vote_count(self, obj):
-        return obj.vote_count
+        cached = self.cached_vote_count(obj)
+        return cached if cached is not None else obj.vote_count
 
     def get_user_vote(self, obj):
         request = self.context.get('request')
         if not request or not request.user.is_authenticated:
             return 0
-        return obj.get_user_vote(request.user)
+        cached = self.cached_user_vote(obj)
+        return cached if cached is not None else obj.get_user_vote(request.user)
 
     def create(self, validated_data):
         # Get the user from the request context
@@ -1072,7 +1121,7 @@ class PreviewContentProfileSerializer(serializers.ModelSerializer):
             }
 
 
-class ContentSuggestionSerializer(serializers.ModelSerializer):
+class ContentSuggestionSerializer(VoteContextMixin, serializers.ModelSerializer):
     suggested_by = UserSerializer(read_only=True)
     reviewed_by = UserSerializer(read_only=True)
     topic = TopicBasicSerializer(read_only=True)
@@ -1087,6 +1136,13 @@ class ContentSuggestionSerializer(serializers.ModelSerializer):
                   'reviewed_by', 'status', 'message', 'rejection_reason', 
                   'is_duplicate', 'created_at', 'updated_at', 'reviewed_at',
                   'vote_count', 'user_vote']
+        list_serializer_class = VoteContextListSerializer
+
+    def prefetch_votes(self, instances):
+        # Suggestion votes and the nested content's votes are both topic-less.
+        vote_context = self.get_vote_context()
+        vote_context.load_objects(instances)
+        vote_context.load(Content, [instance.content_id for instance in instances])
     
     def get_content_profile(self, obj):
         """Get the content profile for the suggested_by user. If not found, fallback to topic creator's profile."""
@@ -1119,6 +1175,10 @@ class ContentSuggestionSerializer(serializers.ModelSerializer):
     
     def get_vote_count(self, obj):
         """Get the vote count for this content suggestion. Votes are not topic-specific."""
+        cached = self.cached_vote_count(obj)
+        if cached is not None:
+            return cached
+
         from django.contrib.contenttypes.models import ContentType
         from votes.models import VoteCount
         
@@ -1136,6 +1196,10 @@ class ContentSuggestionSerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         if not request or not request.user.is_authenticated:
             return 0
+
+        cached = self.cached_user_vote(obj)
+        if cached is not None:
+            return cached
         
         from django.contrib.contenttypes.models import ContentType
         from votes.models import Vote
@@ -1452,7 +1516,6 @@ class ContentTranscriptPublicSerializer(serializers.ModelSerializer):
     """User-facing transcript payload for content detail pages."""
 
     text = serializers.SerializerMethodField()
-    segment_count = serializers.SerializerMethodField()
 
     class Meta:
         model = ContentTranscript
@@ -1472,12 +1535,8 @@ class ContentTranscriptPublicSerializer(serializers.ModelSerializer):
 
         return resolve_hash_source_text(obj)
 
-    def get_segment_count(self, obj):
-        return len(obj.segments or [])
-
 
 class ContentTranscriptIngestSummarySerializer(serializers.ModelSerializer):
-    segment_count = serializers.SerializerMethodField()
     has_parsed_plain = serializers.SerializerMethodField()
     has_processed_plain = serializers.SerializerMethodField()
     has_obsidian_markdown = serializers.SerializerMethodField()
@@ -1504,9 +1563,6 @@ class ContentTranscriptIngestSummarySerializer(serializers.ModelSerializer):
             'updated_at',
         ]
 
-    def get_segment_count(self, obj):
-        return len(obj.segments or [])
-
     def get_has_parsed_plain(self, obj):
         return bool((obj.parsed_plain or '').strip())
 
@@ -1690,6 +1746,7 @@ class TopicChatQuerySerializer(serializers.ModelSerializer):
             'question',
             'answer',
             'sources',
+            'reused_from',
             'created_at',
         ]
         read_only_fields = fields
@@ -0,0 +1,34 @@
+"""Background job handlers for the content app (see jobs.queue)."""
+import logging
+
+from content.bitcoin.service import maybe_refresh_broadcast_anchor, schedule_anchor_refresh
+from content.image_utils import generate_content_profile_thumbnail_preview, generate_topic_thumbnail
+from content.models import ContentProfile, Topic, TranscriptAnchor
+from jobs.registry import job_task
+
+logger = logging.getLogger('academia_blockchain.content.tasks')
+
+
+@job_task('content.topic_thumbnail', queue='media')
+def topic_thumbnail(topic_id):
+    # Regenerates from the current topic_image, so a re-run after a newer upload is harmless.
+    topic = Topic.objects.filter(pk=topic_id).first()
+    if topic is None or not topic.topic_image:
+        return
+    generate_topic_thumbnail(topic)
+
+
+@job_task('content.content_profile_thumbnail_preview', queue='media')
+def content_profile_thumbnail_preview(content_profile_id):
+    profile = ContentProfile.objects.filter(pk=content_profile_id).first()
+    if profile is None or not profile.thumbnail:
+        return
+    generate_content_profile_thumbnail_preview(profile)
+
+
+@job_task('content.refresh_anchor_confirmations', queue='default', priority=-1, max_attempts=1)
+def refresh_anchor_confirmations(anchor_id, polls=0):
+    # The next poll is scheduled while the anchor is unconfirmed, so a failed refresh is not retried.
+    anchor = maybe_refresh_broadcast_anchor(TranscriptAnchor.objects.filter(pk=anchor_id).first())
+    if anchor is not None:
+        schedule_anchor_refresh(anchor, polls=polls + 1)
@@ -1,4 +1,4 @@
-from django.test import TestCase, override_settings
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
@@ -12,14 +12,33 @@ from content.models import (
     TopicTimelineEntrySuggestionContent, TopicTimelineEntryContentSuggestion,
     TopicTimelineEntryContent, Publication,
     TopicModeratorInvitation, FileSuggestion, ContentSuggestion, ContentTranscript,
-    TopicCreationRequest, TopicChatQuery, TranscriptAnchor,
+    TopicCreationRequest, TopicChatQuery, TranscriptAnchor, TopicTranscriptStats,
+    ContentTranscriptSegment,
 )
 from knowledge_paths.models import KnowledgePath, Node
 from django.utils import timezone
 from django.db import IntegrityError
+import asyncio
+import gzip
 import json
 import os
 from unittest.mock import patch, Mock
+from asgiref.sync import async_to_sync
+from content.topic_chat import TopicChatError
+from content.topic_chat_async import arun_topic_chat
+from content.topic_chat_rerank import mmr_rerank, needs_vectors, pack_sources, select_hits
+from content.topic_transcript_stats import recompute_all_topic_transcript_stats, recompute_topic_transcript_stats
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from utils.embedding_cache import get_embedding_cache, reset_embedding_cache
+from utils.shared_cache import reset_shared_cache
+from utils.vector_fakes import (
+    AsyncFakeOpenAIClient,
+    AsyncFakeQdrantClient,
+    FakeOpenAIClient,
+    FakeQdrantClient,
+)
 
 class ContentModelTests(TestCase):
     """Test suite for Content model"""
@@ -1470,10 +1489,87 @@ class TopicAPITests(APITestCase):
         url = reverse('content:topics')
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        topic_ids = {item['id'] for item in response.data}
+        topic_ids = {item['id'] for item in response.data['results']}
         self.assertIn(self.topic.id, topic_ids)
         self.assertNotIn(hidden_topic.id, topic_ids)
 
+    def test_topic_list_keyset_pages_follow_activity_score(self):
+        scores = [5, 40, 40, 10]
+        created = []
+        for index, score in enumerate(scores):
+            topic = Topic.objects.create(title=f'T{index}', creator=self.user, is_public=True)
+            Topic.objects.filter(pk=topic.pk).update(activity_score=score)
+            created.append(topic.id)
+        url = reverse('content:topics')
+        seen = []
+        cursor = None
+        while True:
+            params = {'page_size': 2}
+            if cursor:
+                params['cursor'] = cursor
+            data = self.client.get(url, params).data
+            self.assertLessEqual(len(data['results']), 2)
+            seen.extend(row['id'] for row in data['results'])
+            cursor = data['next_cursor']
+            if not cursor:
+                break
+        expected = list(
+            Topic.objects.filter(is_public=True)
+            .order_by('-activity_score', '-created_at', '-id')
+            .values_list('id', flat=True)
+        )
+        self.assertEqual(seen, expected)
+        self.assertEqual(seen[:2], [created[2], created[1]])
+
+    def test_topic_list_counts_indexed_transcripts_in_one_query(self):
+        for index in range(3):
+            topic = Topic.objects.create(title=f'Video {index}', creator=self.user, is_public=True)
+            video = Content.objects.create(uploaded_by=self.user, media_type='VIDEO', original_title=f'v{index}')
+            transcript = ContentTranscript.objects.create(content=video, parsed_plain='Texto de la transcripción.')
+            ContentTranscript.objects.filter(pk=transcript.pk).update(
+                embedding_status=ContentTranscript.EMBEDDING_STATUS_INDEXED,
+            )
+            topic.contents.add(video)
+        url = reverse('content:topics')
+        # One page query joined to TopicTranscriptStats; no separate validator query.
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        by_title = {row['title']: row for row in response.data['results']}
+        self.assertEqual(by_title['Video 0']['indexed_transcript_count'], 1)
+        self.assertTrue(by_title['Video 0']['chat_can_enable'])
+        self.assertEqual(by_title[self.topic.title]['indexed_transcript_count'], 0)
+
+    def test_topic_list_sparse_fields_and_bad_cursor(self):
+        url = reverse('content:topics')
+        response = self.client.get(url, {'fields': 'title,unknown'})
+        self.assertEqual(set(response.data['results'][0]), {'id', 'title'})
+        response = self.client.get(url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_topic_list_conditional_get(self):
+        url = reverse('content:topics')
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+        Topic.objects.filter(pk=self.topic.pk).update(title='Título nuevo')
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(changed['ETag'], etag)
+
+    def test_topic_list_etag_changes_when_scores_swap(self):
+        url = reverse('content:topics')
+        other = Topic.objects.create(title='Otro tema', creator=self.user, is_public=True)
+        Topic.objects.filter(pk=self.topic.pk).update(activity_score=10)
+        Topic.objects.filter(pk=other.pk).update(activity_score=7)
+        etag = self.client.get(url)['ETag']
+
+        # Same score total, different order.
+        Topic.objects.filter(pk=self.topic.pk).update(activity_score=7)
+        Topic.objects.filter(pk=other.pk).update(activity_score=10)
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(changed.data['results'][0]['id'], other.id)
+
     def test_hidden_topic_detail_visible_to_creator(self):
         self.topic.is_public = False
         self.topic.save(update_fields=['is_public'])
@@ -1530,6 +1626,8 @@ class TopicAPITests(APITestCase):
             chunk_count=1,
             embedded_text_hash=transcript.text_hash or ('a' * 64),
         )
+        # The raw update skips the stats signals (the ingest ack applies them itself).
+        recompute_topic_transcript_stats(self.topic.id)
         url = reverse('content:topic-detail', args=[self.topic.id])
         detail = self.client.get(url)
         self.assertTrue(detail.data['chat_can_enable'])
@@ -1726,6 +1824,63 @@ class TopicAPITests(APITestCase):
         self.assertEqual(invalid.status_code, status.HTTP_400_BAD_REQUEST)
 
 
+@override_settings(SHARED_CACHE_ENABLED=True)
+class TopicResponseCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        reset_shared_cache()
+        self.user = User.objects.create_user(username='cacheuser', password='testpass123')
+        self.topic = Topic.objects.create(title='Primero', creator=self.user, is_public=True)
+        self.content = Content.objects.create(uploaded_by=self.user, media_type='TEXT', original_title='Texto')
+
+    def titles(self):
+        return [item['title'] for item in self.client.get('/api/content/topics/').data['results']]
+
+    def test_listing_is_cached_until_a_topic_changes(self):
+        self.assertEqual(self.titles(), ['Primero'])
+        with self.assertNumQueries(0):
+            self.assertEqual(self.titles(), ['Primero'])
+        self.topic.title = 'Renombrado'
+        self.topic.save()
+        self.assertEqual(self.titles(), ['Renombrado'])
+        Topic.objects.create(title='Segundo', creator=self.user, is_public=True)
+        self.assertEqual(sorted(self.titles()), ['Renombrado', 'Segundo'])
+
+    def test_listing_follows_activity_score_updates(self):
+        other = Topic.objects.create(title='Segundo', creator=self.user, is_public=True)
+        self.assertEqual(self.titles(), ['Segundo', 'Primero'])
+        self.topic.contents.add(self.content)
+        self.assertEqual(self.titles(), ['Primero', 'Segundo'])
+        self.assertEqual(other.contents.count(), 0)
+
+    def test_anonymous_detail_is_cached_and_invalidated_by_content_changes(self):
+        url = f'/api/content/topics/{self.topic.id}/'
+        self.assertEqual(self.client.get(url).data['contents'], [])
+        with self.assertNumQueries(0):
+            self.client.get(url)
+        self.topic.contents.add(self.content)
+        self.assertEqual(len(self.client.get(url).data['contents']), 1)
+
+        self.client.force_authenticate(user=self.user)
+        self.client.get('/api/content/topics/')
+        with self.assertNumQueries(0):
+            # The listing has nothing user-specific and is shared with signed-in users.
+            self.client.get('/api/content/topics/')
+        queries = CaptureQueriesContext(connection)
+        with queries:
+            self.client.get(url)
+        self.assertGreater(len(queries), 0)
+
+    def test_not_found_detail_is_not_a_stale_cache_entry(self):
+        url = f'/api/content/topics/{self.topic.id + 100}/'
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+        hidden = Topic.objects.create(title='Privado', creator=self.user, is_public=False)
+        self.assertEqual(self.client.get(f'/api/content/topics/{hidden.id}/').status_code, status.HTTP_404_NOT_FOUND)
+        hidden.is_public = True
+        hidden.save()
+        self.assertEqual(self.client.get(f'/api/content/topics/{hidden.id}/').status_code, status.HTTP_200_OK)
+
+
 class TopicActivityScoreTests(TestCase):
     """Incremental activity_score updates and list ordering."""
 
@@ -1898,10 +2053,143 @@ class TopicActivityScoreTests(TestCase):
         url = reverse('content:topics')
         response = client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        ids = [row['id'] for row in response.data]
+        ids = [row['id'] for row in response.data['results']]
         self.assertLess(ids.index(self.topic_hot.id), ids.index(self.topic_cold.id))
 
 
+@override_settings(TRANSCRIPT_INGEST_API_KEY='test-embed-key')
+class TopicTranscriptStatsTests(APITestCase):
+    """Incremental TopicTranscriptStats updates and the full recompute."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='statsuser',
+            email='stats@example.com',
+            password='pass12345',
+        )
+        self.topic = Topic.objects.create(title='Stats', creator=self.user, is_public=True)
+        self.video = Content.objects.create(
+            uploaded_by=self.user,
+            media_type='VIDEO',
+            original_title='Video con transcript',
+        )
+        self.topic.contents.add(self.video)
+
+    def _stats(self, topic=None):
+        return TopicTranscriptStats.objects.get(topic=topic or self.topic)
+
+    def _index(self, transcript, chunks=3):
+        transcript.embedding_status = ContentTranscript.EMBEDDING_STATUS_INDEXED
+        transcript.embedded_text_hash = transcript.text_hash
+        transcript.chunk_count = chunks
+        transcript.embedded_at = timezone.now()
+        transcript.save()
+
+    def test_transcript_saves_move_counts_between_statuses(self):
+        transcript = ContentTranscript.objects.create(content=self.video, processed_plain='Texto inicial.')
+        stats = self._stats()
+        self.assertEqual((stats.pending_count, stats.indexed_count), (1, 0))
+
+        self._index(transcript)
+        stats = self._stats()
+        self.assertEqual((stats.pending_count, stats.indexed_count, stats.chunk_count), (0, 1, 3))
+        self.assertIsNotNone(stats.last_embedded_at)
+
+        transcript.processed_plain = 'Texto inicial. Con más contenido.'
+        transcript.save()
+        stats = self._stats()
+        self.assertEqual((stats.indexed_count, stats.stale_count, stats.chunk_count), (0, 1, 0))
+        self.assertEqual(Topic.objects.get(pk=self.topic.pk).indexed_transcript_count(), 0)
+
+    def test_embedding_ack_updates_stats(self):
+        ContentTranscript.objects.create(content=self.video, processed_plain='Hola, bienvenidos.')
+        response = self.client.put(
+            f'/api/content/embedding-ingest/{self.video.id}/',
+            {'status': 'indexed', 'embedding_model': 'text-embedding-3-large', 'embedding_dims': 3072, 'chunk_count': 4},
+            format='json',
+            HTTP_X_TRANSCRIPT_INGEST_KEY='test-embed-key',
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        stats = self._stats()
+        self.assertEqual((stats.pending_count, stats.indexed_count, stats.chunk_count), (0, 1, 4))
+        self.assertTrue(Topic.objects.get(pk=self.topic.pk).has_indexed_transcripts())
+
+        response = self.client.put(
+            f'/api/content/embedding-ingest/{self.video.id}/',
+            {'status': 'failed', 'embedding_error': 'timeout'},
+            format='json',
+            HTTP_X_TRANSCRIPT_INGEST_KEY='test-embed-key',
+        )
+        stats = self._stats()
+        self.assertEqual((stats.indexed_count, stats.failed_count, stats.chunk_count), (0, 1, 0))
+
+    def test_linking_and_deleting_contents_updates_stats(self):
+        self._index(ContentTranscript.objects.create(content=self.video, processed_plain='Texto.'), chunks=2)
+        other = Topic.objects.create(title='Otro', creator=self.user, is_public=True)
+
+        other.contents.add(self.video)
+        self.assertEqual((self._stats(other).indexed_count, self._stats(other).chunk_count), (1, 2))
+        self.video.topics.remove(other)
+        self.assertEqual(self._stats(other).indexed_count, 0)
+
+        text = Content.objects.create(uploaded_by=self.user, media_type='TEXT', original_title='Texto')
+        ContentTranscript.objects.create(content=text, processed_plain='No cuenta.')
+        self.topic.contents.add(text)
+        self.assertEqual(self._stats().pending_count, 0)
+
+        self.video.delete()
+        stats = self._stats()
+        self.assertEqual((stats.indexed_count, stats.chunk_count), (0, 0))
+
+    def test_media_type_change_moves_counts(self):
+        self._index(ContentTranscript.objects.create(content=self.video, processed_plain='Texto.'), chunks=2)
+        self.video.media_type = 'TEXT'
+        self.video.save()
+        self.assertEqual((self._stats().indexed_count, self._stats().chunk_count), (0, 0))
+
+        self.video.media_type = 'AUDIO'
+        self.video.save()
+        self.assertEqual((self._stats().indexed_count, self._stats().chunk_count), (1, 2))
+
+        self.video.original_title = 'Sigue siendo audio'
+        self.video.save()
+        self.assertEqual(self._stats().indexed_count, 1)
+
+    def test_indexed_count_without_stats_row_does_not_write(self):
+        self._index(ContentTranscript.objects.create(content=self.video, processed_plain='Texto.'))
+        TopicTranscriptStats.objects.filter(topic=self.topic).delete()
+        topic = Topic.objects.get(pk=self.topic.pk)
+        self.assertEqual(topic.indexed_transcript_count(), 1)
+        self.assertFalse(TopicTranscriptStats.objects.filter(topic=self.topic).exists())
+
+    def test_recompute_matches_incremental_stats(self):
+        self._index(ContentTranscript.objects.create(content=self.video, processed_plain='Uno.'), chunks=5)
+        audio = Content.objects.create(uploaded_by=self.user, media_type='AUDIO', original_title='Audio')
+        ContentTranscript.objects.create(content=audio, processed_plain='Dos.')
+        self.topic.contents.add(audio)
+        incremental = self._stats()
+
+        TopicTranscriptStats.objects.filter(topic=self.topic).update(indexed_count=9, pending_count=9)
+        self.assertEqual(recompute_all_topic_transcript_stats(), 1)
+        recomputed = self._stats()
+        for field in ('indexed_count', 'pending_count', 'stale_count', 'failed_count', 'chunk_count'):
+            self.assertEqual(getattr(recomputed, field), getattr(incremental, field), field)
+        self.assertEqual(recomputed.last_embedded_at, incremental.last_embedded_at)
+
+    def test_recompute_command_creates_missing_rows(self):
+        from io import StringIO
+        from django.core.management import call_command
+
+        empty = Topic.objects.create(title='Vacío', creator=self.user, is_public=True)
+        out = StringIO()
+        call_command('recompute_topic_transcript_stats', stdout=out)
+        self.assertIn('2 topic(s)', out.getvalue())
+        self.assertEqual(self._stats(empty).indexed_count, 0)
+
+        call_command('recompute_topic_transcript_stats', '--topic-id', str(self.topic.id), stdout=out)
+        self.assertIn(f'Recomputed topic {self.topic.id}', out.getvalue())
+
+
 class TopicCreationRequestAPITests(APITestCase):
     def setUp(self):
         self.user = User.objects.create_user(
@@ -4152,6 +4440,137 @@ class TopicContentSuggestionsAPITests(APITestCase):
         self.assertFalse(ContentSuggestion.objects.filter(id=suggestion.id).exists())
 
 
+class VoteContextQueryCountAPITests(APITestCase):
+    """Vote counts and user votes are batch-loaded, not queried per row."""
+
+    def setUp(self):
+        from django.contrib.contenttypes.models import ContentType
+        from votes.models import Vote, VoteCount
+
+        self.user = User.objects.create_user(
+            username='votebatchuser',
+            email='votebatchuser@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.topic = Topic.objects.create(
+            title='Vote Batch Topic',
+            description='Vote N+1 regression tests',
+            creator=self.user,
+        )
+        content_type = ContentType.objects.get_for_model(Content)
+        suggestion_type = ContentType.objects.get_for_model(ContentSuggestion)
+        publication_type = ContentType.objects.get_for_model(Publication)
+        self.contents = []
+        for index in range(6):
+            content = Content.objects.create(
+                uploaded_by=self.user,
+                media_type='TEXT',
+                original_title=f'Voted Content {index}',
+            )
+            profile = ContentProfile.objects.create(
+                content=content,
+                user=self.user,
+                title=f'Voted Profile {index}',
+            )
+            self.topic.contents.add(content)
+            VoteCount.objects.create(
+                content_type=content_type,
+                object_id=content.id,
+                topic=self.topic,
+                vote_count=index,
+            )
+            Vote.objects.create(
+                user=self.user,
+                content_type=content_type,
+                object_id=content.id,
+                topic=self.topic,
+                value=1 if index % 2 else -1,
+            )
+            suggestion = ContentSuggestion.objects.create(
+                topic=self.topic,
+                content=content,
+                suggested_by=self.user,
+            )
+            VoteCount.objects.create(
+                content_type=suggestion_type,
+                object_id=suggestion.id,
+                vote_count=index + 10,
+            )
+            publication = Publication.objects.create(
+                user=self.user,
+                content_profile=profile,
+                text_content=f'Publication {index}',
+            )
+            VoteCount.objects.create(
+                content_type=publication_type,
+                object_id=publication.id,
+                vote_count=index + 20,
+            )
+            Vote.objects.create(
+                user=self.user,
+                content_type=publication_type,
+                object_id=publication.id,
+                value=1,
+            )
+            self.contents.append(content)
+
+    def _vote_queries(self, url, params=None):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        queries = [
+            query['sql']
+            for query in context.captured_queries
+            if 'votes_vote' in query['sql'].lower()
+        ]
+        return response, queries
+
+    def test_topic_detail_votes_are_batched(self):
+        url = reverse('content:topic-detail', args=[self.topic.id])
+        response, queries = self._vote_queries(url)
+        # get_top_voted_contents orders by VoteCount (1 per media type) + 2 for the page.
+        self.assertLessEqual(len(queries), 6)
+        by_id = {item['id']: item for item in response.data['contents']}
+        for index, content in enumerate(self.contents):
+            self.assertEqual(by_id[content.id]['vote_count'], index)
+            self.assertEqual(by_id[content.id]['user_vote'], 1 if index % 2 else -1)
+
+    def test_topic_content_media_type_votes_are_batched(self):
+        url = reverse('content:topic-content-media-type', args=[self.topic.id, 'text'])
+        response, queries = self._vote_queries(url)
+        # Ordering subquery + VoteCount + Vote for the page.
+        self.assertLessEqual(len(queries), 3)
+        self.assertEqual(response.data['results'][0]['vote_count'], 5)
+        self.assertEqual(response.data['results'][0]['user_vote'], 1)
+
+    def test_publication_list_votes_are_batched(self):
+        url = reverse('content:publication-list')
+        response, queries = self._vote_queries(url)
+        # Publication VoteCount + Vote, nested content VoteCount + Vote.
+        self.assertLessEqual(len(queries), 4)
+        self.assertEqual(len(response.data), 6)
+        self.assertEqual(
+            sorted(item['vote_count'] for item in response.data),
+            list(range(20, 26)),
+        )
+        self.assertTrue(all(item['user_vote'] == 1 for item in response.data))
+
+    def test_topic_content_suggestions_votes_are_batched(self):
+        url = reverse('content:topic-content-suggestions', args=[self.topic.id])
+        response, queries = self._vote_queries(url)
+        # Ordering subquery + suggestion VoteCount/Vote + nested content VoteCount/Vote.
+        self.assertLessEqual(len(queries), 5)
+        self.assertEqual(
+            [item['vote_count'] for item in response.data],
+            list(range(15, 9, -1)),
+        )
+        self.assertTrue(all(item['user_vote'] == 0 for item in response.data))
+
+
 class AdditionalEndpointCoverageAPITests(APITestCase):
     def setUp(self):
         self.owner = User.objects.create_user(
@@ -4964,6 +5383,125 @@ class ContentTranscriptPublicAPITests(APITestCase):
         self.assertEqual(response.data['language'], 'es')
         self.assertNotIn('text', response.data)
         self.assertNotIn('segments', response.data)
+        self.assertEqual(response.data['segment_count'], 0)
+
+
+class ContentTranscriptSegmentsAPITests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='transcriptplayer',
+            email='transcriptplayer@example.com',
+            password='testpass123',
+        )
+        self.video = Content.objects.create(
+            uploaded_by=self.user,
+            media_type='VIDEO',
+            original_title='Video largo',
+        )
+        cues = []
+        for i in range(10):
+            start = i * 10
+            cues.append(
+                f'{i + 1}\n00:00:{start:02d},000 --> 00:00:{start + 5:02d},000\nFrase {i + 1} ñandú 🎧\n'
+            )
+        self.transcript = ContentTranscript.objects.create(
+            content=self.video,
+            processed_plain='Texto completo.',
+            language='es',
+            source_subtitles='\n'.join(cues),
+            format='SRT',
+        )
+        self.url = f'/api/content/content_details/{self.video.id}/transcript/segments/'
+
+    def test_save_stores_segment_count_and_rows(self):
+        self.assertEqual(self.transcript.segment_count, 10)
+        self.assertEqual(ContentTranscriptSegment.objects.filter(transcript=self.transcript).count(), 10)
+
+        self.transcript.source_subtitles = ContentTranscriptModelTests.SAMPLE_SRT
+        self.transcript.save()
+
+        rows = ContentTranscriptSegment.objects.filter(transcript=self.transcript).order_by('index')
+        self.assertEqual([row.start_ms for row in rows], [1000, 5000])
+        self.assertEqual(ContentTranscript.objects.get(pk=self.transcript.pk).segment_count, 2)
+
+    def test_time_window_returns_overlapping_segments_columnar(self):
+        response = self.client.get(self.url, {'from_ms': 22000, 'to_ms': 41000})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['encoding'], 'columnar')
+        self.assertEqual(response.data['segment_count'], 10)
+        segments = response.data['segments']
+        # Cue 3 (20-25s) still overlaps 22s; cue 5 (40-45s) starts before 41s.
+        self.assertEqual(segments['index'], [3, 4, 5])
+        self.assertEqual(segments['start_ms'], [20000, 30000, 40000])
+        self.assertEqual(segments['end_ms'], [25000, 35000, 45000])
+        offsets = segments['text_offsets']
+        self.assertEqual(len(offsets), 4)
+        text = segments['text'].encode('utf-16-le')
+        self.assertEqual(text[offsets[1] * 2:offsets[2] * 2].decode('utf-16-le'), 'Frase 4 ñandú 🎧')
+        self.assertIsNone(response.data['next_cursor'])
+
+    def test_window_start_is_bounded_by_longest_cue(self):
+        self.assertEqual(self.transcript.max_segment_ms, 5000)
+        long_cue = '11\n00:01:40,000 --> 00:02:30,000\nFrase larga\n'
+        self.transcript.source_subtitles += '\n' + long_cue
+        self.transcript.save()
+        self.assertEqual(ContentTranscript.objects.get(pk=self.transcript.pk).max_segment_ms, 50000)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {'from_ms': 140000, 'encoding': 'rows'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # The 100-150s cue still overlaps 140s although it starts 40s earlier.
+        self.assertEqual([segment['index'] for segment in response.data['segments']], [11])
+        segment_sql = next(q['sql'] for q in queries if 'content_contenttranscriptsegment' in q['sql'])
+        self.assertIn('"start_ms" >= 90000', segment_sql)
+
+    def test_cursor_pages_through_rows(self):
+        response = self.client.get(self.url, {'limit': 4, 'encoding': 'rows'})
+        self.assertEqual([cue['index'] for cue in response.data['segments']], [1, 2, 3, 4])
+        self.assertEqual(response.data['segments'][0]['text'], 'Frase 1 ñandú 🎧')
+
+        seen = []
+        cursor = response.data['next_cursor']
+        while cursor:
+            response = self.client.get(self.url, {'limit': 4, 'encoding': 'rows', 'cursor': cursor})
+            seen.extend(cue['index'] for cue in response.data['segments'])
+            cursor = response.data['next_cursor']
+        self.assertEqual(seen, [5, 6, 7, 8, 9, 10])
+
+    def test_invalid_parameters_return_400(self):
+        for params in ({'cursor': 'no-es-un-cursor'}, {'from_ms': 'abc'}, {'to_ms': -1}, {'encoding': 'xml'}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+    def test_missing_transcript_returns_404(self):
+        other = Content.objects.create(uploaded_by=self.user, media_type='VIDEO', original_title='Sin transcript')
+        response = self.client.get(f'/api/content/content_details/{other.id}/transcript/segments/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(RESPONSE_COMPRESSION_MIN_BYTES=100)
+    def test_gzip_when_accepted(self):
+        response = self.client.get(self.url, {'encoding': 'rows'}, HTTP_ACCEPT_ENCODING='gzip, deflate')
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        payload = json.loads(gzip.decompress(response.content))
+        self.assertEqual(len(payload['segments']), 10)
+
+        plain = self.client.get(self.url, {'encoding': 'rows'})
+        self.assertFalse(plain.has_header('Content-Encoding'))
+
+    def test_summary_does_not_load_text_or_segments(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                f'/api/content/content_details/{self.video.id}/transcript/?summary=1',
+            )
+        self.assertEqual(response.data['segment_count'], 10)
+        transcript_sql = [q['sql'] for q in queries.captured_queries if 'content_contenttranscript' in q['sql']]
+        self.assertEqual(len(transcript_sql), 1)
+        self.assertNotIn('processed_plain', transcript_sql[0])
+        self.assertNotIn('"segments"', transcript_sql[0])
 
 @override_settings(TRANSCRIPT_INGEST_API_KEY='test-embed-key')
 class ContentEmbeddingIngestAPITests(APITestCase):
@@ -5078,6 +5616,7 @@ class ContentEmbeddingIngestAPITests(APITestCase):
 )
 class TopicChatAPITests(APITestCase):
     def setUp(self):
+        reset_embedding_cache()
         self.user = User.objects.create_user(
             username='chatuser',
             email='chatuser@example.com',
@@ -5224,6 +5763,309 @@ class TopicChatAPITests(APITestCase):
         self.assertEqual(result['sources'][0]['content_id'], self.video.id)
         self.assertEqual(result['sources'][0]['title'], 'Video citado')
         self.assertNotIn('text', result['sources'][0])
+        search_kwargs = qdrant.search.call_args.kwargs
+        self.assertEqual(search_kwargs['limit'], 16)
+        self.assertFalse(search_kwargs['with_vector'])
+
+    def test_run_topic_chat_reuses_cached_question_embedding(self):
+        from content.topic_chat import run_topic_chat
+
+        openai = FakeOpenAIClient()
+        qdrant = FakeQdrantClient()
+        qdrant.add_text(openai, 'Los bloques grandes facilitan mas transacciones.',
+                        topic_id=self.topic.id, content_id=self.video.id, chunk_index=0)
+        openai.embed_calls = 0
+        for message in ('¿Qué dicen de los bloques?', 'qué dicen de los  bloques'):
+            run_topic_chat(
+                topic_id=self.topic.id,
+                topic_title=self.topic.title,
+                message=message,
+                openai_client=openai,
+                qdrant_client=qdrant,
+            )
+        self.assertEqual(openai.embed_calls, 1)
+        self.assertEqual(openai.chat_calls, 2)
+        self.assertEqual(get_embedding_cache().stats()['hits'], 1)
+
+
+    def _post_chat(self, message):
+        return self.client.post(
+            f'/api/content/topics/{self.topic.id}/chat/',
+            {'message': message},
+            format='json',
+        )
+
+    @override_settings(TOPIC_CHAT_ANSWER_CACHE_THRESHOLD=0.85)
+    def test_answer_cache_reuses_answer_until_transcript_changes(self):
+        transcript = ContentTranscript.objects.create(
+            content=self.video,
+            processed_plain='Los bloques grandes facilitan mas transacciones.',
+        )
+        openai = FakeOpenAIClient()
+        qdrant = FakeQdrantClient.from_transcripts(
+            ContentTranscript.objects.select_related('content'), openai
+        )
+        with patch('content.topic_chat.OpenAIClient', return_value=openai), \
+                patch('content.topic_chat.QdrantClient', return_value=qdrant):
+            first = self._post_chat('Que dicen de los bloques grandes?')
+            self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+            self.assertIsNone(first.data['reused_from'])
+            stored = TopicChatQuery.objects.get(pk=first.data['id'])
+            self.assertEqual(
+                stored.source_text_hashes, {str(self.video.id): transcript.text_hash}
+            )
+
+            # Exact (normalized) repeat: no embedding, retrieval or completion.
+            repeat = self._post_chat('  que dicen de los bloques grandes ')
+            self.assertEqual(repeat.data['reused_from'], first.data['id'])
+            self.assertEqual(repeat.data['answer'], first.data['answer'])
+            self.assertEqual(openai.embed_calls, 1)
+
+            # Similar wording: embedded, but no retrieval or completion.
+            similar = self._post_chat('Que dicen sobre los bloques grandes?')
+            self.assertEqual(similar.data['reused_from'], first.data['id'])
+            self.assertEqual(len(qdrant.search_calls), 1)
+            self.assertEqual(openai.chat_calls, 1)
+
+            transcript.processed_plain = 'Texto reprocesado sobre bloques grandes.'
+            transcript.save()
+            stored.refresh_from_db()
+            self.assertFalse(stored.answer_cache_valid)
+
+            fresh = self._post_chat('Que dicen de los bloques grandes?')
+            self.assertIsNone(fresh.data['reused_from'])
+            self.assertEqual(openai.chat_calls, 2)
+
+
+    def test_streaming_chat_sends_sources_tokens_then_done(self):
+        openai = FakeOpenAIClient(answer='Los bloques grandes ayudan [1].')
+        qdrant = FakeQdrantClient()
+        qdrant.add_text(openai, 'Los bloques grandes facilitan mas transacciones.',
+                        topic_id=self.topic.id, content_id=self.video.id, chunk_index=0)
+        with patch('content.topic_chat.OpenAIClient', return_value=openai), \
+                patch('content.topic_chat.QdrantClient', return_value=qdrant):
+            response = self.client.post(
+                f'/api/content/topics/{self.topic.id}/chat/?stream=1',
+                {'message': 'Que dicen de los bloques?'},
+                format='json',
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response['Content-Type'], 'text/event-stream')
+            self.assertFalse(TopicChatQuery.objects.exists())
+            body = b''.join(response.streaming_content).decode('utf-8')
+
+        events = []
+        for block in body.strip().split('\n\n'):
+            event_line, data_line = block.split('\n')
+            events.append((event_line[len('event: '):], json.loads(data_line[len('data: '):])))
+        names = [name for name, _data in events]
+        self.assertEqual(names[0], 'sources')
+        self.assertEqual(names[-1], 'done')
+        self.assertGreater(names.count('token'), 1)
+        self.assertEqual(events[0][1]['sources'][0]['content_id'], self.video.id)
+        streamed = ''.join(data['delta'] for name, data in events if name == 'token')
+        self.assertEqual(streamed, 'Los bloques grandes ayudan [1].')
+        saved = TopicChatQuery.objects.get(pk=events[-1][1]['id'])
+        self.assertEqual(saved.answer, streamed)
+
+    def test_streaming_chat_reports_transport_error_midway(self):
+        import requests
+
+        openai = FakeOpenAIClient()
+        qdrant = FakeQdrantClient()
+        qdrant.add_text(openai, 'Los bloques grandes facilitan mas transacciones.',
+                        topic_id=self.topic.id, content_id=self.video.id, chunk_index=0)
+
+        def broken_stream(messages, **kwargs):
+            yield 'Los bloques '
+            raise requests.exceptions.ChunkedEncodingError('Connection broken')
+
+        openai.chat_stream = broken_stream
+        with patch('content.topic_chat.OpenAIClient', return_value=openai), \
+                patch('content.topic_chat.QdrantClient', return_value=qdrant):
+            response = self.client.post(
+                f'/api/content/topics/{self.topic.id}/chat/?stream=1',
+                {'message': 'Que dicen de los bloques?'},
+                format='json',
+            )
+            body = b''.join(response.streaming_content).decode('utf-8')
+
+        names = [block.split('\n')[0][len('event: '):] for block in body.strip().split('\n\n')]
+        self.assertEqual(names, ['sources', 'token', 'error'])
+        error = json.loads(body.strip().split('\n\n')[-1].split('\n')[1][len('data: '):])
+        self.assertEqual(error['status'], 502)
+        self.assertFalse(TopicChatQuery.objects.exists())
+
+
+
+class TopicChatAsyncPipelineTests(APITestCase):
+    def setUp(self):
+        reset_embedding_cache()
+        self.user = User.objects.create_user(
+            username='asyncchat',
+            email='asyncchat@example.com',
+            password='testpass123',
+        )
+        self.topic = Topic.objects.create(
+            title='Escalabilidad', creator=self.user, is_public=True, chat_enabled=True,
+        )
+        self.video = Content.objects.create(
+            uploaded_by=self.user, media_type='VIDEO', original_title='Video de bloques',
+        )
+        self.topic.contents.add(self.video)
+        self.sync_openai = FakeOpenAIClient(answer='Bloques mas grandes [1].')
+        self.sync_qdrant = FakeQdrantClient()
+        self.sync_qdrant.add_text(self.sync_openai, 'Los bloques grandes facilitan mas transacciones.',
+                                  topic_id=self.topic.id, content_id=self.video.id, chunk_index=0)
+        self.sync_qdrant.add_text(self.sync_openai, 'La red lightning procesa pagos fuera de la cadena.',
+                                  topic_id=self.topic.id, content_id=self.video.id, chunk_index=1)
+
+    def run_chat(self, message, openai=None, qdrant=None, **kwargs):
+        return async_to_sync(arun_topic_chat)(
+            topic_id=self.topic.id,
+            topic_title=self.topic.title,
+            message=message,
+            openai_client=openai or AsyncFakeOpenAIClient(self.sync_openai),
+            qdrant_client=qdrant or AsyncFakeQdrantClient(self.sync_qdrant),
+            **kwargs,
+        )
+
+    def test_answers_with_titled_sources_and_stage_timings(self):
+        result = self.run_chat('Que pasa con los bloques grandes?')
+        self.assertEqual(result['answer'], 'Bloques mas grandes [1].')
+        self.assertEqual(result['sources'][0]['content_id'], self.video.id)
+        self.assertEqual(result['sources'][0]['title'], 'Video de bloques')
+        self.assertNotIn('text', result['sources'][0])
+        for stage in ('embed', 'search', 'titles', 'completion', 'total'):
+            self.assertIn(stage, result['timings'])
+
+    def test_query_variants_are_searched_concurrently_and_merged(self):
+        openai = AsyncFakeOpenAIClient(
+            self.sync_openai,
+            chat_answers=['Como funcionan los pagos en lightning?\nBloques grandes', 'Respuesta final [1].'],
+        )
+        with override_settings(TOPIC_CHAT_QUERY_VARIANTS=2):
+            result = self.run_chat('Que pasa con los bloques grandes?', openai=openai)
+        self.assertEqual(len(self.sync_qdrant.search_calls), 3)
+        self.assertEqual({src['chunk_index'] for src in result['sources']}, {0, 1})
+        self.assertEqual(result['answer'], 'Respuesta final [1].')
+        self.assertIn('rewrite', result['timings'])
+
+    @override_settings(TOPIC_CHAT_STAGE_TIMEOUTS={'search': 0.01})
+    def test_search_timeout_returns_504(self):
+        with self.assertRaises(TopicChatError) as ctx:
+            self.run_chat('bloques', qdrant=AsyncFakeQdrantClient(self.sync_qdrant, delay=0.2))
+        self.assertEqual(ctx.exception.status_code, 504)
+
+    @override_settings(TOPIC_CHAT_QUERY_VARIANTS=2, TOPIC_CHAT_STAGE_TIMEOUTS={'rewrite': 0.01})
+    def test_rewrite_timeout_falls_back_to_original_question(self):
+        class SlowChat(AsyncFakeOpenAIClient):
+            async def chat(self, messages, **kwargs):
+                if messages[0]['content'].startswith('Reformula'):
+                    await asyncio.sleep(0.2)
+                return await super().chat(messages, **kwargs)
+
+        result = self.run_chat('bloques grandes', openai=SlowChat(self.sync_openai))
+        self.assertEqual(len(self.sync_qdrant.search_calls), 1)
+        self.assertEqual(result['answer'], 'Bloques mas grandes [1].')
+
+    @override_settings(
+        TOPIC_CHAT_ASYNC_PIPELINE=True,
+        TOPIC_CHAT_ANSWER_CACHE_ENABLED=True,
+        OPENAI_API_KEY='test-openai-key',
+        QDRANT_URL='https://qdrant.example',
+        QDRANT_API_KEY='test-qdrant-key',
+    )
+    def test_view_uses_async_pipeline_and_reports_server_timing(self):
+        self.client.force_authenticate(user=self.user)
+        with patch('utils.async_clients.AsyncOpenAIClient',
+                   return_value=AsyncFakeOpenAIClient(self.sync_openai)), \
+                patch('utils.async_clients.AsyncQdrantClient',
+                      return_value=AsyncFakeQdrantClient(self.sync_qdrant)):
+            response = self.client.post(
+                f'/api/content/topics/{self.topic.id}/chat/',
+                {'message': 'Que pasa con los bloques grandes?'},
+                format='json',
+            )
+            repeat = self.client.post(
+                f'/api/content/topics/{self.topic.id}/chat/',
+                {'message': 'Que pasa con los bloques grandes?'},
+                format='json',
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIn('completion;dur=', response['Server-Timing'])
+        self.assertEqual(response.data['sources'][0]['title'], 'Video de bloques')
+        self.assertEqual(repeat.data['reused_from'], response.data['id'])
+        self.assertEqual(self.sync_openai.chat_calls, 1)
+
+
+def reverse_hits(query_text, query_vector, hits):
+    return list(reversed(hits))
+
+
+class TopicChatRerankTests(SimpleTestCase):
+    def hit(self, point_id, score, vector, content_id, text='texto'):
+        return {'id': point_id, 'score': score, 'vector': vector,
+                'payload': {'content_id': content_id, 'chunk_index': point_id, 'text': text}}
+
+    @override_settings(TOPIC_CHAT_RERANKERS=['mmr'], TOPIC_CHAT_MMR_LAMBDA=0.5)
+    def test_mmr_prefers_a_different_passage_over_a_near_duplicate(self):
+        hits = [
+            self.hit(1, 0.95, [1.0, 0.0, 0.0], content_id=1),
+            self.hit(2, 0.94, [0.99, 0.01, 0.0], content_id=2),
+            self.hit(3, 0.80, [0.0, 1.0, 0.0], content_id=3),
+        ]
+        selected = select_hits('q', [1.0, 0.0, 0.0], hits, top_k=2)
+        self.assertEqual([h['id'] for h in selected], [1, 3])
+        self.assertNotIn('vector', selected[0])
+
+    def test_default_diversify_skips_repeated_and_adjacent_chunks_without_vectors(self):
+        hits = [
+            self.hit(1, 0.95, None, content_id=1, text='Los bloques grandes'),
+            self.hit(2, 0.94, None, content_id=1, text='y las comisiones bajas'),
+            self.hit(5, 0.93, None, content_id=2, text='los  BLOQUES grandes'),
+            self.hit(7, 0.80, None, content_id=3, text='La red lightning'),
+        ]
+        selected = select_hits('q', [1.0], hits, top_k=2)
+        self.assertEqual([h['id'] for h in selected], [1, 7])
+        self.assertFalse(needs_vectors())
+
+    @override_settings(TOPIC_CHAT_RERANKERS=['mmr'], TOPIC_CHAT_TOP_K=1)
+    def test_mmr_stops_after_enough_picks(self):
+        hits = [self.hit(i, 1 - i / 10, [1.0, float(i)], content_id=i) for i in range(5)]
+        ordered = mmr_rerank('q', [1.0, 0.0], hits)
+        self.assertEqual(len(ordered), 5)
+        self.assertEqual([h['id'] for h in ordered[2:]], [2, 3, 4])
+        self.assertTrue(needs_vectors())
+
+    @override_settings(TOPIC_CHAT_RERANKERS=[])
+    def test_caps_chunks_per_content_and_keeps_top_k(self):
+        hits = [self.hit(i, 1 - i / 10, None, content_id=7) for i in range(4)]
+        hits.append(self.hit(9, 0.1, None, content_id=8))
+        selected = select_hits('q', [1.0], hits, top_k=3)
+        self.assertEqual([h['id'] for h in selected], [0, 1, 9])
+
+    @override_settings(TOPIC_CHAT_RERANKERS=['content.tests.reverse_hits'])
+    def test_rerankers_can_be_given_by_dotted_path(self):
+        hits = [self.hit(1, 0.9, None, 1), self.hit(2, 0.5, None, 2)]
+        self.assertEqual([h['id'] for h in select_hits('q', [1.0], hits, top_k=2)], [2, 1])
+        self.assertFalse(needs_vectors())
+
+    @override_settings(TOPIC_CHAT_RERANKERS=['cross_encoder'], TOPIC_CHAT_CROSS_ENCODER_MODEL='')
+    def test_cross_encoder_is_a_no_op_without_a_model(self):
+        hits = [self.hit(1, 0.9, None, 1), self.hit(2, 0.5, None, 2)]
+        self.assertEqual([h['id'] for h in select_hits('q', [1.0], hits, top_k=2)], [1, 2])
+
+    def test_pack_sources_fits_token_budget_and_renumbers(self):
+        sources = [
+            {'index': 1, 'title': 'A', 'text': 'a' * 400},
+            {'index': 2, 'title': 'B', 'text': 'b' * 4000},
+            {'index': 3, 'title': 'C', 'text': 'c' * 400},
+        ]
+        with patch('content.topic_chat_rerank._tiktoken_encoding', return_value=None):
+            packed = pack_sources(sources, token_budget=300)
+        self.assertEqual([(s['index'], s['title']) for s in packed], [(1, 'A'), (2, 'C')])
+        self.assertEqual(sources[2]['index'], 3)
 
 
 class TranscriptAnchorModelTests(TestCase):
@@ -5380,9 +6222,12 @@ class TranscriptAnchorAPITests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['text_hash'], self.transcript.text_hash)
 
-    @patch('content.views_transcript_anchor.maybe_refresh_broadcast_anchor')
-    def test_get_current_refreshes_broadcast_anchor(self, mock_refresh):
-        anchor = TranscriptAnchor.objects.create(
+    @override_settings(JOBS_EAGER=False)
+    @patch('content.tasks.maybe_refresh_broadcast_anchor')
+    def test_public_reads_do_not_poll_or_enqueue(self, mock_refresh):
+        from jobs.models import Job
+
+        TranscriptAnchor.objects.create(
             content=self.content,
             text_hash=self.transcript.text_hash,
             text_length=self.transcript.text_length,
@@ -5391,23 +6236,18 @@ class TranscriptAnchorAPITests(APITestCase):
             btc_txid='e0f0a67142aa325783a85c084864f87e2565fc22dfd0d52024ce2b87caba6103',
         )
 
-        def _mark_anchored(row, **kwargs):
-            row.status = TranscriptAnchor.STATUS_ANCHORED
-            row.btc_confirmations = 30
-            row.save(update_fields=['status', 'btc_confirmations', 'updated_at'])
-            return row
-
-        mock_refresh.side_effect = _mark_anchored
-
-        response = self.client.get(
-            f'/api/content/content_details/{self.content.id}/transcript/anchor/',
-        )
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        mock_refresh.assert_called_once()
-        self.assertEqual(response.data['anchor']['status'], 'anchored')
-        self.assertTrue(response.data['anchor']['is_btc_confirmed'])
-        anchor.refresh_from_db()
-        self.assertEqual(anchor.status, TranscriptAnchor.STATUS_ANCHORED)
+        with self.captureOnCommitCallbacks(execute=True):
+            current = self.client.get(
+                f'/api/content/content_details/{self.content.id}/transcript/anchor/',
+            )
+            listing = self.client.get(
+                f'/api/content/content_details/{self.content.id}/transcript/anchors/',
+            )
+        self.assertEqual(current.status_code, status.HTTP_200_OK)
+        self.assertEqual(listing.status_code, status.HTTP_200_OK)
+        self.assertEqual(current.data['anchor']['status'], 'btc_broadcast')
+        mock_refresh.assert_not_called()
+        self.assertFalse(Job.objects.exists())
 
     @patch('content.views_transcript_anchor.broadcast_anchor')
     @patch('content.views_transcript_anchor.ensure_pending_anchor')
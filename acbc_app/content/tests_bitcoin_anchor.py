@@ -1,6 +1,8 @@
+from io import StringIO
 from unittest.mock import MagicMock, patch
 
 from django.contrib.auth.models import User
+from django.core.management import call_command
 from django.test import TestCase, override_settings
 
 from content.bitcoin.fees import FEE_TOO_HIGH_MESSAGE, FeeBudgetError, assert_fee_within_usd_budget
@@ -9,6 +11,7 @@ from content.bitcoin.service import (
     broadcast_anchor,
     ensure_pending_anchor,
     refresh_anchor_confirmations,
+    schedule_anchor_refresh,
 )
 from content.bitcoin.tx_builder import (
     build_and_sign_op_return_tx,
@@ -18,6 +21,8 @@ from content.bitcoin.tx_builder import (
     select_utxos,
 )
 from content.models import Content, ContentTranscript, TranscriptAnchor
+from content.tasks import refresh_anchor_confirmations as refresh_anchor_job
+from jobs.models import Job
 from embit import ec
 from embit.networks import NETWORKS
 import os
@@ -168,3 +173,68 @@ class AnchorBroadcastServiceTests(TestCase):
         # 1600 sats at $60k ≈ $0.96
         usd = assert_fee_within_usd_budget(1600, btc_usd=60000)
         self.assertLessEqual(usd, 1.0)
+
+
+class AnchorRefreshSchedulingTests(TestCase):
+    """Confirmation polls run in the job worker, scheduled from the broadcast."""
+
+    def setUp(self):
+        self.user = User.objects.create_user('btcpoll', 'btcpoll@example.com', 'pass')
+        self.content = Content.objects.create(
+            uploaded_by=self.user,
+            media_type='VIDEO',
+            original_title='BTC poll video',
+        )
+        ContentTranscript.objects.create(content=self.content, processed_plain='Texto.', language='es')
+        self.anchor = ensure_pending_anchor(self.content, network='signet')
+
+    def _broadcast(self):
+        self.anchor.status = TranscriptAnchor.STATUS_BTC_BROADCAST
+        self.anchor.btc_txid = 'ee' * 32
+        self.anchor.save()
+
+    @override_settings(JOBS_EAGER=False, BTC_ANCHOR_REFRESH_INTERVAL=600, BTC_MAX_FEE_USD=0)
+    def test_live_broadcast_schedules_delayed_poll(self):
+        wif = _signet_wif()
+        client = MagicMock()
+        client.get_address_utxos.return_value = [
+            {'txid': '33' * 32, 'vout': 0, 'value': 200_000, 'status': {'confirmed': True}},
+        ]
+        client.get_recommended_fee_sat_vb.return_value = 2
+        client.broadcast.return_value = 'abcd' * 16
+
+        with override_settings(BTC_PRIVATE_KEY_WIF=wif), self.captureOnCommitCallbacks(execute=True):
+            broadcast_anchor(self.anchor, client=client)
+
+        job = Job.objects.get(task='content.refresh_anchor_confirmations')
+        self.assertEqual(job.kwargs, {'anchor_id': self.anchor.pk, 'polls': 0})
+        self.assertGreater((job.run_after - job.created_at).total_seconds(), 590)
+
+    @override_settings(JOBS_EAGER=False, BTC_ANCHOR_REFRESH_MAX_POLLS=3)
+    @patch('content.tasks.maybe_refresh_broadcast_anchor', side_effect=lambda anchor: anchor)
+    def test_job_polls_again_until_confirmed_or_out_of_polls(self, mock_refresh):
+        self._broadcast()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            refresh_anchor_job(anchor_id=self.anchor.pk, polls=1)
+        self.assertEqual(Job.objects.get().kwargs['polls'], 2)
+
+        Job.objects.all().delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            refresh_anchor_job(anchor_id=self.anchor.pk, polls=2)
+        self.assertFalse(Job.objects.exists())
+
+        self.anchor.status = TranscriptAnchor.STATUS_ANCHORED
+        self.anchor.save()
+        self.assertFalse(schedule_anchor_refresh(self.anchor))
+
+    @patch('content.tasks.maybe_refresh_broadcast_anchor')
+    def test_sweep_command_polls_broadcast_anchors(self, mock_refresh):
+        self._broadcast()
+        out = StringIO()
+
+        call_command('refresh_transcript_anchors', stdout=out)
+
+        mock_refresh.assert_called_once()
+        self.assertEqual(mock_refresh.call_args.args[0].pk, self.anchor.pk)
+        self.assertIn('1 anchor(s)', out.getvalue())
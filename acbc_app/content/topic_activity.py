@@ -10,6 +10,9 @@ score =
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import F, Q
 
+from content.response_cache import TOPICS_TAG
+from utils.shared_cache import invalidate_tags_on_commit
+
 WEIGHT_CONTENT = 10
 WEIGHT_LIKE = 3
 WEIGHT_COMMENT = 5
@@ -23,6 +26,8 @@ def apply_topic_score_delta(topic_id, delta):
     from content.models import Topic
 
     Topic.objects.filter(pk=topic_id).update(activity_score=F('activity_score') + delta)
+    # Listings are ordered by activity_score.
+    invalidate_tags_on_commit(TOPICS_TAG)
 
 
 def apply_topics_score_delta(topic_ids, delta):
@@ -35,6 +40,7 @@ def apply_topics_score_delta(topic_ids, delta):
     from content.models import Topic
 
     Topic.objects.filter(pk__in=ids).update(activity_score=F('activity_score') + delta)
+    invalidate_tags_on_commit(TOPICS_TAG)
 
 
 def positive_like_contribution(vote_value):
@@ -131,6 +137,7 @@ def recompute_topic_activity_score(topic_id):
         return None
     score = compute_topic_activity_score(topic)
     Topic.objects.filter(pk=topic_id).update(activity_score=score)
+    invalidate_tags_on_commit(TOPICS_TAG)
     return score
 
 
@@ -147,4 +154,5 @@ def recompute_all_topic_activity_scores(topic_ids=None):
         score = compute_topic_activity_score(topic)
         Topic.objects.filter(pk=topic.pk).update(activity_score=score)
         updated += 1
+    invalidate_tags_on_commit(TOPICS_TAG)
     return updated
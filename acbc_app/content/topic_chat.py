@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
 
+import requests
 from django.conf import settings
 
 from content.models import Content
+from content.topic_chat_cache import find_cached_answer
+from content.topic_chat_rerank import candidate_count, needs_vectors, pack_sources, select_hits
+from utils.embedding_cache import get_embedding_cache
 from utils.openai_client import OpenAIClient, OpenAIClientError, openai_configured
 from utils.qdrant_client import QdrantClient, QdrantClientError, qdrant_configured
 
@@ -62,23 +67,6 @@ def _score_of(hit: dict[str, Any]) -> float:
         return 0.0
 
 
-def _dedupe_hits(hits: list[dict[str, Any]], *, max_per_content: int = 2) -> list[dict[str, Any]]:
-    """Keep highest-scoring hits; limit how many chunks come from the same content."""
-    ordered = sorted(hits, key=_score_of, reverse=True)
-    per_content: dict[Any, int] = {}
-    selected: list[dict[str, Any]] = []
-    for hit in ordered:
-        payload = hit.get('payload') or {}
-        content_id = payload.get('content_id')
-        key = content_id if content_id is not None else id(hit)
-        count = per_content.get(key, 0)
-        if count >= max_per_content:
-            continue
-        per_content[key] = count + 1
-        selected.append(hit)
-    return selected
-
-
 def _load_titles(content_ids: list[int]) -> dict[int, str]:
     if not content_ids:
         return {}
@@ -86,7 +74,7 @@ def _load_titles(content_ids: list[int]) -> dict[int, str]:
     return {pk: (title or '') for pk, title in rows}
 
 
-def build_sources_from_hits(hits: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def hit_content_ids(hits: list[dict[str, Any]]) -> list[int]:
     content_ids = []
     for hit in hits:
         payload = hit.get('payload') or {}
@@ -96,7 +84,16 @@ def build_sources_from_hits(hits: list[dict[str, Any]]) -> list[dict[str, Any]]:
                 content_ids.append(int(cid))
             except (TypeError, ValueError):
                 pass
-    titles = _load_titles(list(dict.fromkeys(content_ids)))
+    return list(dict.fromkeys(content_ids))
+
+
+def build_sources_from_hits(
+    hits: list[dict[str, Any]],
+    titles: Optional[dict[int, str]] = None,
+) -> list[dict[str, Any]]:
+    """Numbered source payloads for hits; titles are loaded unless given."""
+    if titles is None:
+        titles = _load_titles(hit_content_ids(hits))
 
     sources: list[dict[str, Any]] = []
     for index, hit in enumerate(hits, start=1):
@@ -151,7 +148,71 @@ def format_context(sources: list[dict[str, Any]]) -> str:
     return '\n\n'.join(blocks)
 
 
-def run_topic_chat(
+NO_CONTEXT_ANSWER = (
+    'No encontré fragmentos indexados de transcripciones para este tema '
+    'que respondan a tu pregunta. Puede que aún no haya embeddings o que '
+    'la pregunta no coincida con el material disponible.'
+)
+
+
+@dataclass
+class PreparedTopicChat:
+    """
+    Everything up to (not including) the chat completion.
+
+    result is already set when no completion is needed (answer cache hit or no
+    context); otherwise messages is the prompt to send and build_result() wraps the
+    model's answer.
+    """
+    topic_id: int
+    openai: Any = None
+    messages: list = field(default_factory=list)
+    sources: list = field(default_factory=list)
+    query_vector: Optional[list] = None
+    result: Optional[dict[str, Any]] = None
+
+    def build_result(self, answer: str) -> dict[str, Any]:
+        return {
+            'answer': answer,
+            'sources': self.sources,
+            'topic_id': self.topic_id,
+            'question_embedding': self.query_vector,
+        }
+
+
+def build_chat_messages(
+    topic_title: str,
+    context: str,
+    message: str,
+    history: Optional[list[dict[str, str]]] = None,
+) -> list[dict[str, str]]:
+    """System prompt + last turns of history + grounded user prompt."""
+    messages: list[dict[str, str]] = [{'role': 'system', 'content': SYSTEM_PROMPT}]
+    for turn in (history or [])[-6:]:
+        role = (turn.get('role') or '').strip()
+        content = (turn.get('content') or '').strip()
+        if role in ('user', 'assistant') and content:
+            messages.append({'role': role, 'content': content[:4000]})
+    user_prompt = (
+        f'Tema: {topic_title}\n\n'
+        f'Contexto (fragmentos de transcripciones):\n{context}\n\n'
+        f'Pregunta del usuario:\n{message}'
+    )
+    messages.append({'role': 'user', 'content': user_prompt})
+    return messages
+
+
+def _cached_result(cached, topic_id: int) -> dict[str, Any]:
+    logger.info('Topic chat answer cache hit topic_id=%s query_id=%s', topic_id, cached.id)
+    return {
+        'answer': cached.answer,
+        'sources': cached.sources or [],
+        'topic_id': topic_id,
+        'reused_from': cached.id,
+    }
+
+
+def prepare_topic_chat(
     *,
     topic_id: int,
     topic_title: str,
@@ -159,16 +220,30 @@ def run_topic_chat(
     history: Optional[list[dict[str, str]]] = None,
     openai_client: Optional[OpenAIClient] = None,
     qdrant_client: Optional[QdrantClient] = None,
-) -> dict[str, Any]:
+    use_answer_cache: bool = False,
+) -> PreparedTopicChat:
+    """
+    Embed the question, retrieve chunks and build the grounded prompt.
+
+    With use_answer_cache (and no history), an earlier answer to an equivalent question
+    in the topic is returned instead, with 'reused_from' set to that TopicChatQuery id.
+    """
     ready, reason = topic_chat_ready()
     if not ready and openai_client is None and qdrant_client is None:
         raise TopicChatError(reason, status_code=503)
 
+    use_answer_cache = use_answer_cache and not history
+    if use_answer_cache:
+        cached = find_cached_answer(topic_id, message)
+        if cached is not None:
+            return PreparedTopicChat(topic_id=topic_id, result=_cached_result(cached, topic_id))
+
     openai = openai_client or OpenAIClient()
     qdrant = qdrant_client or QdrantClient()
 
     try:
-        query_vector = openai.embed(message)
+        # Same (normalized) question asked recently, in any topic: skip the round trip.
+        query_vector = get_embedding_cache().embed(openai, message)
     except OpenAIClientError as exc:
         logger.exception('Topic chat embed failed topic_id=%s', topic_id)
         raise TopicChatError(
@@ -176,8 +251,18 @@ def run_topic_chat(
             status_code=502,
         ) from exc
 
+    if use_answer_cache:
+        cached = find_cached_answer(topic_id, message, query_vector)
+        if cached is not None:
+            return PreparedTopicChat(topic_id=topic_id, result=_cached_result(cached, topic_id))
+
     try:
-        hits = qdrant.search(query_vector, topic_id=topic_id, limit=_top_k() * 2)
+        hits = qdrant.search(
+            query_vector,
+            topic_id=topic_id,
+            limit=candidate_count(_top_k()),
+            with_vector=needs_vectors(),
+        )
     except QdrantClientError as exc:
         logger.exception('Topic chat Qdrant search failed topic_id=%s', topic_id)
         raise TopicChatError(
@@ -185,51 +270,86 @@ def run_topic_chat(
             status_code=502,
         ) from exc
 
-    hits = _dedupe_hits(hits, max_per_content=2)[: _top_k()]
-    sources = build_sources_from_hits(hits)
+    hits = select_hits(message, query_vector, hits, top_k=_top_k())
+    sources = pack_sources(build_sources_from_hits(hits))
     context = format_context(sources)
 
+    prepared = PreparedTopicChat(topic_id=topic_id, openai=openai, query_vector=query_vector)
     if not context.strip():
-        return {
-            'answer': (
-                'No encontré fragmentos indexados de transcripciones para este tema '
-                'que respondan a tu pregunta. Puede que aún no haya embeddings o que '
-                'la pregunta no coincida con el material disponible.'
-            ),
-            'sources': [],
-            'topic_id': topic_id,
-        }
+        prepared.result = prepared.build_result(NO_CONTEXT_ANSWER)
+        return prepared
 
-    user_prompt = (
-        f'Tema: {topic_title}\n\n'
-        f'Contexto (fragmentos de transcripciones):\n{context}\n\n'
-        f'Pregunta del usuario:\n{message}'
+    prepared.messages = build_chat_messages(topic_title, context, message, history)
+    # Strip full chunk text from API response (keep excerpt only).
+    prepared.sources = [
+        {k: v for k, v in src.items() if k != 'text'}
+        for src in sources
+    ]
+    return prepared
+
+
+def _completion_error(exc: Exception, topic_id: int) -> TopicChatError:
+    logger.exception('Topic chat completion failed topic_id=%s', topic_id)
+    return TopicChatError(
+        f'No se pudo generar la respuesta del modelo: {exc}',
+        status_code=502,
     )
 
-    messages: list[dict[str, str]] = [{'role': 'system', 'content': SYSTEM_PROMPT}]
-    for turn in (history or [])[-6:]:
-        role = (turn.get('role') or '').strip()
-        content = (turn.get('content') or '').strip()
-        if role in ('user', 'assistant') and content:
-            messages.append({'role': role, 'content': content[:4000]})
-    messages.append({'role': 'user', 'content': user_prompt})
 
+def complete_topic_chat(prepared: PreparedTopicChat) -> dict[str, Any]:
+    """Run the chat completion for a prepared chat (no-op if it already has a result)."""
+    if prepared.result is not None:
+        return prepared.result
     try:
-        answer = openai.chat(messages)
+        answer = prepared.openai.chat(prepared.messages)
     except OpenAIClientError as exc:
-        logger.exception('Topic chat completion failed topic_id=%s', topic_id)
-        raise TopicChatError(
-            f'No se pudo generar la respuesta del modelo: {exc}',
-            status_code=502,
-        ) from exc
+        raise _completion_error(exc, prepared.topic_id) from exc
+    prepared.result = prepared.build_result(answer)
+    return prepared.result
+
+
+def stream_topic_chat_answer(prepared: PreparedTopicChat) -> Iterator[str]:
+    """
+    Yield answer text as the model streams it; prepared.result is set once it ends.
+    Prepared chats that already have a result yield their whole answer at once.
+    """
+    if prepared.result is not None:
+        yield prepared.result['answer']
+        return
+    parts: list[str] = []
+    try:
+        for delta in prepared.openai.chat_stream(prepared.messages):
+            parts.append(delta)
+            yield delta
+    except (OpenAIClientError, requests.RequestException) as exc:
+        raise _completion_error(exc, prepared.topic_id) from exc
+    answer = ''.join(parts).strip()
+    if not answer:
+        raise TopicChatError('No se pudo generar la respuesta del modelo: respuesta vacía.', status_code=502)
+    prepared.result = prepared.build_result(answer)
 
-    # Strip full chunk text from API response (keep excerpt only).
-    public_sources = [
-        {k: v for k, v in src.items() if k != 'text'}
-        for src in sources
-    ]
-    return {
-        'answer': answer,
-        'sources': public_sources,
-        'topic_id': topic_id,
-    }
+
+def run_topic_chat(
+    *,
+    topic_id: int,
+    topic_title: str,
+    message: str,
+    history: Optional[list[dict[str, str]]] = None,
+    openai_client: Optional[OpenAIClient] = None,
+    qdrant_client: Optional[QdrantClient] = None,
+    use_answer_cache: bool = False,
+) -> dict[str, Any]:
+    """
+    Answer message from the topic's transcript chunks (prepare + blocking completion).
+    Fresh answers include 'question_embedding' so callers can store it for later reuse.
+    """
+    prepared = prepare_topic_chat(
+        topic_id=topic_id,
+        topic_title=topic_title,
+        message=message,
+        history=history,
+        openai_client=openai_client,
+        qdrant_client=qdrant_client,
+        use_answer_cache=use_answer_cache,
+    )
+    return complete_topic_chat(prepared)
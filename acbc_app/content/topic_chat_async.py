@@ -0,0 +1,322 @@
+"""asyncio variant of the topic RAG chat pipeline (content.topic_chat).
+
+Differences from run_topic_chat:
+- the exact-match answer cache lookup runs concurrently with the question embedding;
+- optional query variants (TOPIC_CHAT_QUERY_VARIANTS rewrites and/or a TOPIC_CHAT_HYDE
+  hypothetical answer) are embedded and searched in parallel and their hits merged;
+- the content title lookup (DB) and the source packing (tokenizer, CPU) run in worker
+  threads side by side;
+- every stage has its own timeout (TOPIC_CHAT_STAGE_TIMEOUTS, seconds) and its latency
+  is recorded in result['timings'] (milliseconds) for logs and Server-Timing headers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from content.topic_chat import (
+    NO_CONTEXT_ANSWER,
+    TopicChatError,
+    _cached_result,
+    _load_titles,
+    _top_k,
+    build_chat_messages,
+    build_sources_from_hits,
+    format_context,
+    hit_content_ids,
+    topic_chat_ready,
+)
+from content.topic_chat_cache import find_cached_answer
+from content.topic_chat_rerank import candidate_count, needs_vectors, pack_sources, select_hits
+from utils.embedding_cache import get_embedding_cache
+from utils.openai_client import OpenAIClientError
+from utils.qdrant_client import QdrantClientError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STAGE_TIMEOUTS = {
+    'cache': 2.0,
+    'rewrite': 4.0,
+    'embed': 8.0,
+    'search': 8.0,
+    'titles': 2.0,
+    'completion': 45.0,
+}
+
+REWRITE_PROMPT = (
+    'Reformula la pregunta del usuario de {n} maneras distintas para buscar en '
+    'transcripciones de videos sobre "{topic}". Devuelve una reformulación por línea, '
+    'sin numeración ni texto adicional.'
+)
+HYDE_PROMPT = (
+    'Escribe un párrafo breve, como si fuera parte de la transcripción de un video sobre '
+    '"{topic}", que responda a la pregunta del usuario. No añadas comentarios.'
+)
+
+
+class StageTimeout(TopicChatError):
+    def __init__(self, stage: str):
+        super().__init__(
+            f'La etapa "{stage}" del chat del tema superó su tiempo límite.',
+            status_code=504,
+        )
+        self.stage = stage
+
+
+class StageTimings:
+    """Per-stage wall time (ms) for one pipeline run; stages may overlap."""
+
+    def __init__(self):
+        self.ms: dict[str, float] = {}
+
+    @staticmethod
+    def timeout_for(stage: str) -> float:
+        overrides = getattr(settings, 'TOPIC_CHAT_STAGE_TIMEOUTS', None) or {}
+        try:
+            return float(overrides.get(stage, DEFAULT_STAGE_TIMEOUTS[stage]))
+        except (TypeError, ValueError):
+            return DEFAULT_STAGE_TIMEOUTS[stage]
+
+    async def run(self, stage: str, awaitable):
+        """Await awaitable within the stage budget; raises StageTimeout when exceeded."""
+        started = time.perf_counter()
+        try:
+            return await asyncio.wait_for(awaitable, timeout=self.timeout_for(stage))
+        except asyncio.TimeoutError as exc:
+            raise StageTimeout(stage) from exc
+        finally:
+            self.ms[stage] = round(self.ms.get(stage, 0.0) + (time.perf_counter() - started) * 1000, 1)
+
+    def server_timing(self) -> str:
+        return ', '.join(f'{stage};dur={ms}' for stage, ms in self.ms.items())
+
+
+def _variant_count() -> int:
+    try:
+        return max(0, min(int(getattr(settings, 'TOPIC_CHAT_QUERY_VARIANTS', 0)), 4))
+    except (TypeError, ValueError):
+        return 0
+
+
+async def _embed(openai, text: str) -> list[float]:
+    cache = get_embedding_cache()
+    vector = cache.get(text)
+    if vector is None:
+        vector = await openai.embed(text)
+        cache.set(text, vector)
+    return vector
+
+
+async def _query_variants(openai, message: str, topic_title: str) -> list[str]:
+    """Rewrites and/or a HyDE passage, generated concurrently. Empty when disabled."""
+    requests = []
+    count = _variant_count()
+    if count:
+        requests.append(openai.chat([
+            {'role': 'system', 'content': REWRITE_PROMPT.format(n=count, topic=topic_title)},
+            {'role': 'user', 'content': message},
+        ], temperature=0.4))
+    if getattr(settings, 'TOPIC_CHAT_HYDE', False):
+        requests.append(openai.chat([
+            {'role': 'system', 'content': HYDE_PROMPT.format(topic=topic_title)},
+            {'role': 'user', 'content': message},
+        ], temperature=0.4))
+    if not requests:
+        return []
+    outputs = await asyncio.gather(*requests)
+    variants = []
+    if count:
+        rewrites = [line.strip(' -•\t') for line in outputs[0].splitlines()]
+        variants.extend(line for line in rewrites if line)
+        variants = variants[:count]
+        outputs = outputs[1:]
+    variants.extend(output.strip() for output in outputs if output.strip())
+    return [variant for variant in dict.fromkeys(variants) if variant != message]
+
+
+def _merge_hits(hit_lists) -> list[dict[str, Any]]:
+    """One entry per (content, chunk) across variant searches, keeping the best score."""
+    merged: dict[Any, dict[str, Any]] = {}
+    for hits in hit_lists:
+        for hit in hits:
+            payload = hit.get('payload') or {}
+            key = (payload.get('content_id'), payload.get('chunk_index'))
+            if key == (None, None):
+                key = ('point', hit.get('id'))
+            current = merged.get(key)
+            if current is None or (hit.get('score') or 0) > (current.get('score') or 0):
+                merged[key] = hit
+    return list(merged.values())
+
+
+def _pack(hits) -> list[dict[str, Any]]:
+    return pack_sources(build_sources_from_hits(hits, titles={}))
+
+
+async def _cancel(*tasks) -> None:
+    for task in tasks:
+        if task is not None and not task.done():
+            task.cancel()
+    await asyncio.gather(*(t for t in tasks if t is not None), return_exceptions=True)
+
+
+async def arun_topic_chat(
+    *,
+    topic_id: int,
+    topic_title: str,
+    message: str,
+    history: Optional[list[dict[str, str]]] = None,
+    openai_client=None,
+    qdrant_client=None,
+    use_answer_cache: bool = False,
+) -> dict[str, Any]:
+    """Async run_topic_chat with overlapped stages; the result adds 'timings' (ms per stage)."""
+    ready, reason = topic_chat_ready()
+    if not ready and openai_client is None and qdrant_client is None:
+        raise TopicChatError(reason, status_code=503)
+
+    if openai_client is None or qdrant_client is None:
+        # Default clients share the process-wide pooled connections (utils.async_clients).
+        from utils.async_clients import AsyncOpenAIClient, AsyncQdrantClient
+
+        try:
+            if openai_client is None:
+                openai_client = AsyncOpenAIClient()
+            if qdrant_client is None:
+                qdrant_client = AsyncQdrantClient()
+        except (OpenAIClientError, QdrantClientError) as exc:
+            raise TopicChatError(str(exc), status_code=503) from exc
+
+    timings = StageTimings()
+    started = time.perf_counter()
+    try:
+        result = await _pipeline(
+            timings,
+            topic_id=topic_id,
+            topic_title=topic_title,
+            message=message,
+            history=history,
+            openai=openai_client,
+            qdrant=qdrant_client,
+            use_answer_cache=use_answer_cache and not history,
+        )
+    finally:
+        timings.ms['total'] = round((time.perf_counter() - started) * 1000, 1)
+        logger.info('Topic chat timings topic_id=%s %s', topic_id, timings.server_timing())
+    result['timings'] = dict(timings.ms)
+    return result
+
+
+async def _pipeline(timings, *, topic_id, topic_title, message, history, openai, qdrant, use_answer_cache):
+    cache_task = None
+    if use_answer_cache:
+        cache_task = asyncio.ensure_future(
+            timings.run('cache', sync_to_async(find_cached_answer)(topic_id, message))
+        )
+    embed_task = asyncio.ensure_future(timings.run('embed', _embed(openai, message)))
+    variants_task = None
+    if _variant_count() or getattr(settings, 'TOPIC_CHAT_HYDE', False):
+        variants_task = asyncio.ensure_future(
+            timings.run('rewrite', _query_variants(openai, message, topic_title))
+        )
+
+    try:
+        if cache_task is not None:
+            try:
+                cached = await cache_task
+            except StageTimeout:
+                cached = None
+            if cached is not None:
+                await _cancel(embed_task, variants_task)
+                return _cached_result(cached, topic_id)
+
+        try:
+            query_vector = await embed_task
+        except OpenAIClientError as exc:
+            logger.exception('Topic chat embed failed topic_id=%s', topic_id)
+            raise TopicChatError(
+                f'No se pudo generar el embedding de la pregunta: {exc}', status_code=502,
+            ) from exc
+
+        if use_answer_cache:
+            cached = await sync_to_async(find_cached_answer)(topic_id, message, query_vector)
+            if cached is not None:
+                await _cancel(variants_task)
+                return _cached_result(cached, topic_id)
+
+        variants: list[str] = []
+        if variants_task is not None:
+            try:
+                variants = await variants_task
+            except (StageTimeout, OpenAIClientError):
+                # Rewrites only widen recall; fall back to the original question.
+                logger.warning('Topic chat query variants unavailable topic_id=%s', topic_id, exc_info=True)
+
+        limit = candidate_count(_top_k())
+        with_vector = needs_vectors()
+        try:
+            vectors = [query_vector]
+            if variants:
+                vectors += await timings.run(
+                    'embed', asyncio.gather(*(_embed(openai, variant) for variant in variants))
+                )
+            hit_lists = await timings.run('search', asyncio.gather(*(
+                qdrant.search(vector, topic_id=topic_id, limit=limit, with_vector=with_vector)
+                for vector in vectors
+            )))
+        except OpenAIClientError as exc:
+            raise TopicChatError(
+                f'No se pudo generar el embedding de la pregunta: {exc}', status_code=502,
+            ) from exc
+        except QdrantClientError as exc:
+            logger.exception('Topic chat Qdrant search failed topic_id=%s', topic_id)
+            raise TopicChatError(f'No se pudo buscar en Qdrant: {exc}', status_code=502) from exc
+    except BaseException:
+        await _cancel(cache_task, embed_task, variants_task)
+        raise
+
+    hits = select_hits(message, query_vector, _merge_hits(hit_lists), top_k=_top_k())
+
+    # Title lookup (DB) and source packing (CPU) each run in a worker thread, side by side.
+    titles_result, sources = await asyncio.gather(
+        timings.run('titles', sync_to_async(_load_titles)(hit_content_ids(hits))),
+        asyncio.to_thread(_pack, hits),
+        return_exceptions=True,
+    )
+    if isinstance(sources, BaseException):
+        raise sources
+    if isinstance(titles_result, StageTimeout):
+        logger.warning('Topic chat title lookup timed out topic_id=%s', topic_id)
+        titles = {}
+    elif isinstance(titles_result, BaseException):
+        raise titles_result
+    else:
+        titles = titles_result
+    has_context = bool(format_context(sources).strip())
+    for src in sources:
+        src['title'] = titles.get(src['content_id'], '') if src['content_id'] else ''
+
+    result = {
+        'sources': [{k: v for k, v in src.items() if k != 'text'} for src in sources],
+        'topic_id': topic_id,
+        'question_embedding': query_vector,
+    }
+    if not has_context:
+        result.update(answer=NO_CONTEXT_ANSWER, sources=[])
+        return result
+
+    messages = build_chat_messages(topic_title, format_context(sources), message, history)
+    try:
+        result['answer'] = await timings.run('completion', openai.chat(messages))
+    except OpenAIClientError as exc:
+        logger.exception('Topic chat completion failed topic_id=%s', topic_id)
+        raise TopicChatError(
+            f'No se pudo generar la respuesta del modelo: {exc}', status_code=502,
+        ) from exc
+    return result
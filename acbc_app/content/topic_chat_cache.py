@@ -0,0 +1,217 @@
+"""Semantic answer cache for topic chat, backed by TopicChatQuery rows.
+
+Before retrieval and chat completion, run_topic_chat asks find_cached_answer() for an
+earlier answer in the same topic whose question is equivalent (same normalized hash)
+or close enough (cosine similarity of question vectors >= threshold). An answer is only
+reused while every cited transcript still has the text_hash it had when answered;
+changing a transcript's text_hash clears answer_cache_valid on the queries citing it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+from array import array
+from datetime import timedelta
+from typing import Any, Optional
+
+from django.conf import settings
+from django.db.models.signals import post_save, pre_save
+from django.utils import timezone
+
+from utils.embedding_cache import normalize_query_text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = 0.95
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_CANDIDATES = 50
+
+
+def answer_cache_enabled() -> bool:
+    return bool(getattr(settings, 'TOPIC_CHAT_ANSWER_CACHE_ENABLED', True))
+
+
+def _threshold() -> float:
+    try:
+        return min(1.0, max(0.5, float(getattr(settings, 'TOPIC_CHAT_ANSWER_CACHE_THRESHOLD', DEFAULT_THRESHOLD))))
+    except (TypeError, ValueError):
+        return DEFAULT_THRESHOLD
+
+
+def _ttl() -> timedelta:
+    try:
+        seconds = int(getattr(settings, 'TOPIC_CHAT_ANSWER_CACHE_TTL', DEFAULT_TTL_SECONDS))
+    except (TypeError, ValueError):
+        seconds = DEFAULT_TTL_SECONDS
+    return timedelta(seconds=max(0, seconds))
+
+
+def _candidate_limit() -> int:
+    try:
+        return max(1, int(getattr(settings, 'TOPIC_CHAT_ANSWER_CACHE_CANDIDATES', DEFAULT_CANDIDATES)))
+    except (TypeError, ValueError):
+        return DEFAULT_CANDIDATES
+
+
+def question_hash(question: str) -> str:
+    return hashlib.sha256(normalize_query_text(question).encode('utf-8')).hexdigest()
+
+
+def pack_vector(vector) -> bytes:
+    return array('f', vector).tobytes()
+
+
+def unpack_vector(data) -> list[float]:
+    values = array('f')
+    values.frombytes(bytes(data))
+    return values.tolist()
+
+
+def cosine_similarity(a, b) -> float:
+    if len(a) != len(b):
+        return 0.0
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+def _cited_content_ids(sources) -> list[int]:
+    ids = []
+    for source in sources or []:
+        try:
+            content_id = int(source.get('content_id'))
+        except (AttributeError, TypeError, ValueError):
+            continue
+        if content_id not in ids:
+            ids.append(content_id)
+    return ids
+
+
+def current_text_hashes(content_ids) -> dict[str, str]:
+    """{str(content_id): text_hash} for the transcripts of content_ids (one query)."""
+    from content.models import ContentTranscript
+
+    if not content_ids:
+        return {}
+    rows = ContentTranscript.objects.filter(content_id__in=content_ids).values_list(
+        'content_id', 'text_hash'
+    )
+    return {str(content_id): text_hash or '' for content_id, text_hash in rows}
+
+
+def _still_valid(query) -> bool:
+    cited = [int(content_id) for content_id in (query.source_text_hashes or {})]
+    return current_text_hashes(cited) == (query.source_text_hashes or {})
+
+
+def find_cached_answer(topic_id: int, question: str, vector=None) -> Optional[Any]:
+    """
+    Most recent reusable TopicChatQuery for question in topic, or None.
+
+    Without vector only an exact normalized-question match is tried (no embedding
+    needed); with vector, prior questions are compared by cosine similarity.
+    """
+    from content.models import TopicChatQuery
+
+    if not answer_cache_enabled():
+        return None
+
+    base = TopicChatQuery.objects.filter(
+        topic_id=topic_id,
+        answer_cache_valid=True,
+        reused_from__isnull=True,
+        created_at__gte=timezone.now() - _ttl(),
+    ).order_by('-created_at')
+
+    if vector is None:
+        candidates = list(base.filter(question_hash=question_hash(question))[:1])
+    else:
+        threshold = _threshold()
+        scored = []
+        rows = base.exclude(question_embedding__isnull=True)[:_candidate_limit()]
+        for row in rows:
+            similarity = cosine_similarity(vector, unpack_vector(row.question_embedding))
+            if similarity >= threshold:
+                scored.append((similarity, row))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        candidates = [row for _similarity, row in scored]
+
+    for candidate in candidates:
+        if _still_valid(candidate):
+            return candidate
+        # A cited transcript changed without going through save() signals (e.g. raw update).
+        TopicChatQuery.objects.filter(pk=candidate.pk).update(answer_cache_valid=False)
+    return None
+
+
+def answer_cache_fields(question: str, result: dict[str, Any]) -> dict[str, Any]:
+    """TopicChatQuery field values that make a fresh answer reusable (or mark it as a reuse)."""
+    reused_from = result.get('reused_from')
+    if reused_from is not None:
+        return {'question_hash': question_hash(question), 'reused_from_id': reused_from}
+
+    vector = result.get('question_embedding')
+    cited = _cited_content_ids(result.get('sources'))
+    if not cited:
+        # "Nothing found" answers are not reused: new transcripts may answer next time.
+        return {'question_hash': question_hash(question), 'answer_cache_valid': False}
+    return {
+        'question_hash': question_hash(question),
+        'question_embedding': pack_vector(vector) if vector else None,
+        'source_text_hashes': current_text_hashes(cited),
+    }
+
+
+def record_cited_contents(query, result: dict[str, Any]) -> None:
+    cited = _cited_content_ids(result.get('sources'))
+    if cited and query.reused_from_id is None:
+        query.cited_contents.add(*cited)
+
+
+def invalidate_answers_citing(content_id: int) -> int:
+    from content.models import TopicChatQuery
+
+    return TopicChatQuery.objects.filter(
+        cited_contents=content_id, answer_cache_valid=True,
+    ).update(answer_cache_valid=False)
+
+
+def transcript_pre_save_capture_hash(sender, instance, **kwargs):
+    if instance.pk:
+        instance._answer_cache_old_hash = (
+            sender.objects.filter(pk=instance.pk).values_list('text_hash', flat=True).first()
+        )
+    else:
+        instance._answer_cache_old_hash = None
+
+
+def transcript_post_save_invalidate(sender, instance, created, **kwargs):
+    if created or getattr(instance, '_answer_cache_old_hash', None) == instance.text_hash:
+        return
+    try:
+        invalidated = invalidate_answers_citing(instance.content_id)
+        if invalidated:
+            logger.info(
+                'Invalidated %s cached topic chat answers for content_id=%s',
+                invalidated,
+                instance.content_id,
+            )
+    except Exception:
+        logger.exception('Failed to invalidate topic chat answers content_id=%s', instance.content_id)
+
+
+def connect_answer_cache_signals():
+    from content.models import ContentTranscript
+
+    pre_save.connect(
+        transcript_pre_save_capture_hash,
+        sender=ContentTranscript,
+        dispatch_uid='topic_chat_answer_cache_transcript_pre_save',
+    )
+    post_save.connect(
+        transcript_post_save_invalidate,
+        sender=ContentTranscript,
+        dispatch_uid='topic_chat_answer_cache_transcript_post_save',
+    )
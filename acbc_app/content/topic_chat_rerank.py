@@ -0,0 +1,270 @@
+"""Rerank and context packing for topic chat retrieval.
+
+Retrieval fetches a candidate set (TOPIC_CHAT_RERANK_CANDIDATES, default 2 × top_k)
+from Qdrant, then:
+1. TOPIC_CHAT_RERANKERS are applied in order. Each reranker is a callable
+   (query_text, query_vector, hits) -> hits, given by name ('diversify', 'mmr',
+   'cross_encoder') or dotted path. The default, 'diversify', pushes back chunks that
+   repeat one already chosen (same text, or the neighbouring chunk of the same content)
+   using only the payload. 'mmr' (maximal marginal relevance) does the same with the
+   hit vectors; only then does Qdrant return vectors, and MMR stops once enough hits
+   are chosen.
+2. At most two chunks per content survive and the first TOPIC_CHAT_TOP_K are kept.
+3. pack_sources() keeps the sources that fit TOPIC_CHAT_CONTEXT_TOKENS prompt tokens.
+
+The cross-encoder is optional (sentence-transformers, CPU) and is only loaded when
+TOPIC_CHAT_CROSS_ENCODER_MODEL is set and the package is installed.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+Reranker = Callable[[str, list[float], list[dict[str, Any]]], list[dict[str, Any]]]
+
+MAX_PER_CONTENT = 2
+# Rough characters-per-token ratio for Spanish/English prose when tiktoken is unavailable.
+CHARS_PER_TOKEN = 4
+
+_cross_encoder = None
+_cross_encoder_lock = threading.Lock()
+
+
+def _int_setting(name: str, default: int, low: int, high: int) -> int:
+    try:
+        return max(low, min(int(getattr(settings, name, default)), high))
+    except (TypeError, ValueError):
+        return default
+
+
+def candidate_count(top_k: int) -> int:
+    """How many hits to request from Qdrant before reranking (Qdrant caps search at 64)."""
+    return max(top_k, _int_setting('TOPIC_CHAT_RERANK_CANDIDATES', top_k * 2, 1, 64))
+
+
+def needs_vectors() -> bool:
+    """True when a configured reranker uses the hit vectors (ask Qdrant for with_vector)."""
+    return 'mmr' in _reranker_names()
+
+
+def _score(hit: dict[str, Any]) -> float:
+    try:
+        return float(hit.get('rerank_score', hit.get('score')) or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _hit_vector(hit: dict[str, Any]) -> Optional[list[float]]:
+    vector = hit.get('vector')
+    if isinstance(vector, dict) and len(vector) == 1:
+        vector = next(iter(vector.values()))
+    return vector if isinstance(vector, list) and vector else None
+
+
+def _unit(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else vector
+
+
+def _dot(a: list[float], b: list[float]) -> float:
+    return sum(x * y for x, y in zip(a, b))
+
+
+def _normalized_text(hit: dict[str, Any]) -> str:
+    return ' '.join(((hit.get('payload') or {}).get('text') or '').lower().split())
+
+
+def diversify_rerank(query_text: str, query_vector: list[float], hits: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Score order, except that a hit repeating a chosen one (same text, or the chunk next
+    to it in the same content, whose text overlaps) moves after the distinct hits.
+    """
+    chosen_texts: set[str] = set()
+    chosen_chunks: set[tuple[Any, int]] = set()
+    distinct: list[dict[str, Any]] = []
+    repeats: list[dict[str, Any]] = []
+    for hit in sorted(hits, key=_score, reverse=True):
+        payload = hit.get('payload') or {}
+        text = _normalized_text(hit)
+        content_id, chunk_index = payload.get('content_id'), payload.get('chunk_index')
+        adjacent = isinstance(chunk_index, int) and content_id is not None and any(
+            (content_id, chunk_index + step) in chosen_chunks for step in (-1, 1)
+        )
+        if (text and text in chosen_texts) or adjacent:
+            repeats.append(hit)
+            continue
+        distinct.append(hit)
+        if text:
+            chosen_texts.add(text)
+        if isinstance(chunk_index, int) and content_id is not None:
+            chosen_chunks.add((content_id, chunk_index))
+    return distinct + repeats
+
+
+def mmr_rerank(query_text: str, query_vector: list[float], hits: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Order hits by maximal marginal relevance: lambda * relevance - (1 - lambda) * max
+    similarity to the hits already chosen. Only the first TOPIC_CHAT_TOP_K × 2 (the most
+    select_hits can keep) are chosen this way; the rest follow in score order, as do hits
+    without vectors.
+    """
+    try:
+        lam = min(1.0, max(0.0, float(getattr(settings, 'TOPIC_CHAT_MMR_LAMBDA', 0.7))))
+    except (TypeError, ValueError):
+        lam = 0.7
+    with_vectors = [(hit, _unit(v)) for hit in hits if (v := _hit_vector(hit)) is not None]
+    without = sorted((hit for hit in hits if _hit_vector(hit) is None), key=_score, reverse=True)
+    if len(with_vectors) < 2:
+        return [hit for hit, _ in with_vectors] + without
+
+    # Relevance on a 0..1 scale so cross-encoder logits and cosine scores mix the same way.
+    scores = [_score(hit) for hit, _ in with_vectors]
+    low, high = min(scores), max(scores)
+    span = (high - low) or 1.0
+    relevance = [(score - low) / span for score in scores]
+
+    remaining = list(range(len(with_vectors)))
+    max_similarity = [0.0] * len(with_vectors)
+    ordered: list[dict[str, Any]] = []
+    picks = _int_setting('TOPIC_CHAT_TOP_K', 8, 1, 64) * MAX_PER_CONTENT
+    while remaining and len(ordered) < picks:
+        best = max(remaining, key=lambda i: lam * relevance[i] - (1 - lam) * max_similarity[i])
+        remaining.remove(best)
+        ordered.append(with_vectors[best][0])
+        chosen = with_vectors[best][1]
+        for i in remaining:
+            max_similarity[i] = max(max_similarity[i], _dot(chosen, with_vectors[i][1]))
+    rest = sorted((with_vectors[i][0] for i in remaining), key=_score, reverse=True)
+    return ordered + rest + without
+
+
+def _load_cross_encoder(model_name: str):
+    global _cross_encoder
+    if _cross_encoder is not None and _cross_encoder[0] == model_name:
+        return _cross_encoder[1]
+    with _cross_encoder_lock:
+        if _cross_encoder is None or _cross_encoder[0] != model_name:
+            try:
+                from sentence_transformers import CrossEncoder
+            except ImportError:
+                logger.warning('sentence-transformers not installed; cross-encoder rerank disabled')
+                _cross_encoder = (model_name, None)
+            else:
+                _cross_encoder = (model_name, CrossEncoder(model_name, device='cpu'))
+    return _cross_encoder[1]
+
+
+def cross_encoder_rerank(query_text: str, query_vector: list[float], hits: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Rescore hits with a CPU cross-encoder over (question, chunk text); no-op when unavailable."""
+    model_name = (getattr(settings, 'TOPIC_CHAT_CROSS_ENCODER_MODEL', '') or '').strip()
+    if not model_name or not hits:
+        return hits
+    model = _load_cross_encoder(model_name)
+    if model is None:
+        return hits
+    texts = [((hit.get('payload') or {}).get('text') or '') for hit in hits]
+    scores = model.predict([(query_text, text) for text in texts])
+    rescored = [dict(hit, rerank_score=float(score)) for hit, score in zip(hits, scores)]
+    return sorted(rescored, key=_score, reverse=True)
+
+
+RERANKERS: dict[str, Reranker] = {
+    'diversify': diversify_rerank,
+    'mmr': mmr_rerank,
+    'cross_encoder': cross_encoder_rerank,
+}
+
+
+def _reranker_names() -> list[str]:
+    names = getattr(settings, 'TOPIC_CHAT_RERANKERS', ('diversify',))
+    if isinstance(names, str):
+        names = names.split(',')
+    return [name.strip() for name in names if name and name.strip()]
+
+
+def get_rerankers() -> list[Reranker]:
+    rerankers = []
+    for name in _reranker_names():
+        reranker = RERANKERS.get(name)
+        if reranker is None:
+            reranker = import_string(name)
+        rerankers.append(reranker)
+    return rerankers
+
+
+def select_hits(
+    query_text: str,
+    query_vector: list[float],
+    hits: list[dict[str, Any]],
+    *,
+    top_k: int,
+) -> list[dict[str, Any]]:
+    """Rerank candidates, cap chunks per content and keep top_k."""
+    ordered = sorted(hits, key=_score, reverse=True)
+    for reranker in get_rerankers():
+        ordered = reranker(query_text, query_vector, ordered)
+
+    per_content: dict[Any, int] = {}
+    selected: list[dict[str, Any]] = []
+    for hit in ordered:
+        content_id = (hit.get('payload') or {}).get('content_id')
+        key = content_id if content_id is not None else id(hit)
+        if per_content.get(key, 0) >= MAX_PER_CONTENT:
+            continue
+        per_content[key] = per_content.get(key, 0) + 1
+        # Vectors are only needed for reranking; don't carry them further.
+        selected.append({k: v for k, v in hit.items() if k != 'vector'})
+        if len(selected) >= top_k:
+            break
+    return selected
+
+
+def _tiktoken_encoding():
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(getattr(settings, 'OPENAI_CHAT_MODEL', '') or 'gpt-4o-mini')
+    except KeyError:
+        return tiktoken.get_encoding('o200k_base')
+
+
+def estimate_tokens(text: str) -> int:
+    """Token count via tiktoken when installed, else a characters-per-token estimate."""
+    encoding = _tiktoken_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def pack_sources(sources: list[dict[str, Any]], *, token_budget: Optional[int] = None) -> list[dict[str, Any]]:
+    """
+    Sources (in rank order) whose text fits the prompt token budget, renumbered 1..n.
+
+    A chunk that does not fit is skipped so smaller, lower-ranked ones can still fill
+    the budget; the top source is always kept.
+    """
+    if token_budget is None:
+        token_budget = _int_setting('TOPIC_CHAT_CONTEXT_TOKENS', 3000, 200, 100_000)
+    packed: list[dict[str, Any]] = []
+    used = 0
+    for src in sources:
+        text = (src.get('text') or src.get('excerpt') or '').strip()
+        if not text:
+            continue
+        # Header line: "[n] title (chunk k)".
+        cost = estimate_tokens(text) + estimate_tokens(src.get('title') or '') + 8
+        if packed and used + cost > token_budget:
+            continue
+        packed.append(src)
+        used += cost
+    return [dict(src, index=index) for index, src in enumerate(packed, start=1)]
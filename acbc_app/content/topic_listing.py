@@ -0,0 +1,93 @@
+"""
+Public topic listing: keyset pages ordered by activity_score, one annotated query
+per page, and an ETag over the page payload for conditional GETs.
+
+Order is (-activity_score, -created_at, -id); the cursor holds those three values of
+the last topic on the page, so page N costs the same as page 1 and a topic moving
+between pages never makes the client skip or repeat the rest of the list.
+"""
+import base64
+import hashlib
+import json
+
+from django.db.models import F, Q
+from django.db.models.functions import Coalesce
+from django.utils.dateparse import parse_datetime
+
+from content.models import Topic
+
+TOPIC_ORDERING = ('-activity_score', '-created_at', '-id')
+DEFAULT_PAGE_SIZE = 24
+MAX_PAGE_SIZE = 100
+
+# Fields that need the per-topic indexed transcript count.
+INDEXED_COUNT_FIELDS = {'indexed_transcript_count', 'chat_can_enable'}
+
+
+class InvalidTopicCursor(ValueError):
+    """The cursor query parameter could not be decoded."""
+
+
+def public_topics():
+    return Topic.objects.filter(is_public=True)
+
+
+def annotate_indexed_transcripts(queryset):
+    """Adds indexed_transcripts from TopicTranscriptStats (a join, no per-content counting)."""
+    return queryset.annotate(
+        indexed_transcripts=Coalesce(F('transcript_stats__indexed_count'), 0),
+    )
+
+
+def encode_topic_cursor(topic):
+    payload = [topic.activity_score, topic.created_at.isoformat(), topic.pk]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_topic_cursor(value):
+    try:
+        score, created_at, pk = json.loads(base64.urlsafe_b64decode(value.encode()))
+        created_at = parse_datetime(created_at)
+        if created_at is None:
+            raise ValueError('bad date')
+        return int(score), created_at, int(pk)
+    except (TypeError, ValueError, UnicodeError) as exc:
+        raise InvalidTopicCursor(str(exc)) from exc
+
+
+def _after_cursor(cursor):
+    score, created_at, pk = cursor
+    return (
+        Q(activity_score__lt=score)
+        | Q(activity_score=score, created_at__lt=created_at)
+        | Q(activity_score=score, created_at=created_at, pk__lt=pk)
+    )
+
+
+def topic_page(*, cursor=None, page_size=DEFAULT_PAGE_SIZE, fields=None):
+    """
+    (topics, next_cursor) for one page of public topics.
+
+    fields limits what the page needs: the indexed-count annotation and the creator
+    join are skipped when no requested field uses them.
+    """
+    queryset = public_topics().order_by(*TOPIC_ORDERING)
+    if fields is None or 'creator_username' in fields:
+        queryset = queryset.select_related('creator')
+    if fields is None or fields & INDEXED_COUNT_FIELDS:
+        queryset = annotate_indexed_transcripts(queryset)
+    if cursor:
+        queryset = queryset.filter(_after_cursor(decode_topic_cursor(cursor)))
+
+    topics = list(queryset[:page_size + 1])
+    next_cursor = encode_topic_cursor(topics[page_size - 1]) if len(topics) > page_size else None
+    return topics[:page_size], next_cursor
+
+
+def topic_list_etag(data, variant):
+    """
+    Strong ETag for one page as served: a hash of its payload (ids, scores and every
+    other field, in order) and the representation variant (host, fields).
+    """
+    body = json.dumps(data, sort_keys=True, default=str)
+    return f'"{hashlib.sha1(f"{body}|{variant}".encode()).hexdigest()}"'
@@ -0,0 +1,365 @@
+"""
+Per-topic transcript / embedding statistics (TopicTranscriptStats).
+
+For the VIDEO/AUDIO contents of a topic that have a transcript:
+- indexed_count / pending_count / stale_count / failed_count by embedding_status
+  (skipped transcripts are not counted);
+- chunk_count: sum of chunk_count over indexed transcripts;
+- last_embedded_at: newest embedded_at among indexed transcripts.
+
+Updated incrementally from ContentTranscript saves and deletes (signals), the
+embedding-ingest ack (explicit call: it writes with QuerySet.update), Content.topics
+changes and a content's media_type moving in or out of VIDEO/AUDIO. last_embedded_at only moves forward on incremental updates; a transcript that
+leaves 'indexed' keeps it until the next full recompute
+(`python manage.py recompute_topic_transcript_stats`).
+"""
+import logging
+from collections import Counter
+
+from django.db.models import Count, DateTimeField, F, Max, Sum, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.utils import timezone
+
+from content.response_cache import TOPICS_TAG, topic_tag
+from utils.shared_cache import invalidate_tags_on_commit
+
+logger = logging.getLogger('academia_blockchain.content.topic_transcript_stats')
+
+TRANSCRIPT_MEDIA_TYPES = ('VIDEO', 'AUDIO')
+STATUS_FIELDS = {
+    'indexed': 'indexed_count',
+    'pending': 'pending_count',
+    'stale': 'stale_count',
+    'failed': 'failed_count',
+}
+COUNT_FIELDS = tuple(STATUS_FIELDS.values()) + ('chunk_count',)
+
+
+def transcript_state(transcript):
+    """(embedding_status, chunk_count, embedded_at) snapshot used to diff a transcript change."""
+    if transcript is None:
+        return None
+    return (transcript.embedding_status, transcript.chunk_count or 0, transcript.embedded_at)
+
+
+def _contribution(state):
+    """Counter of stats fields one transcript in this state adds to each of its topics."""
+    contribution = Counter()
+    if state is None:
+        return contribution
+    status, chunks, _ = state
+    field = STATUS_FIELDS.get(status)
+    if field is None:
+        return contribution
+    contribution[field] = 1
+    if status == 'indexed':
+        contribution['chunk_count'] = chunks or 0
+    return contribution
+
+
+def _indexed_at(state):
+    if state is None or state[0] != 'indexed':
+        return None
+    return state[2]
+
+
+def _transcript_topic_ids(content_id):
+    from content.models import Content
+
+    return list(
+        Content.topics.through.objects.filter(
+            content_id=content_id,
+            content__media_type__in=TRANSCRIPT_MEDIA_TYPES,
+        ).values_list('topic_id', flat=True)
+    )
+
+
+def apply_stats_delta(topic_ids, deltas, embedded_at=None):
+    """
+    Add deltas (field -> int) to the stats of topic_ids and advance last_embedded_at.
+
+    Topics without a stats row yet get a full recompute, which already reflects the
+    change being applied.
+    """
+    from content.models import TopicTranscriptStats
+
+    ids = {tid for tid in topic_ids if tid}
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not ids or (not deltas and embedded_at is None):
+        return
+
+    updates = {field: F(field) + delta for field, delta in deltas.items()}
+    if embedded_at is not None:
+        value = Value(embedded_at, output_field=DateTimeField())
+        updates['last_embedded_at'] = Greatest(Coalesce('last_embedded_at', value), value)
+    updates['updated_at'] = timezone.now()
+
+    updated = TopicTranscriptStats.objects.filter(topic_id__in=ids).update(**updates)
+    if updated < len(ids):
+        existing = set(
+            TopicTranscriptStats.objects.filter(topic_id__in=ids).values_list('topic_id', flat=True)
+        )
+        recompute_all_topic_transcript_stats(ids - existing)
+    invalidate_tags_on_commit(TOPICS_TAG, *(topic_tag(tid) for tid in ids))
+
+
+def apply_transcript_change(content_id, old_state, new_state):
+    """Apply the stats change of one transcript going from old_state to new_state (None = absent)."""
+    deltas = _contribution(new_state)
+    deltas.subtract(_contribution(old_state))
+    embedded_at = _indexed_at(new_state)
+    if embedded_at is not None and embedded_at == _indexed_at(old_state):
+        embedded_at = None
+    if not any(deltas.values()) and embedded_at is None:
+        return
+    apply_stats_delta(_transcript_topic_ids(content_id), deltas, embedded_at)
+
+
+def apply_contents_linked(topic_ids, content_ids, sign, *, check_media_type=True):
+    """
+    Contents were added to (sign=1) or removed from (sign=-1) topics. With
+    check_media_type=False the contents count whatever their current media_type
+    (used when that media_type is what just changed).
+    """
+    from content.models import ContentTranscript
+
+    rows = ContentTranscript.objects.filter(content_id__in=content_ids)
+    if check_media_type:
+        rows = rows.filter(content__media_type__in=TRANSCRIPT_MEDIA_TYPES)
+    rows = rows.values_list('embedding_status', 'chunk_count', 'embedded_at')
+
+    deltas = Counter()
+    embedded_at = None
+    for state in rows:
+        deltas.update(_contribution(state))
+        indexed_at = _indexed_at(state)
+        if sign > 0 and indexed_at is not None:
+            embedded_at = max(embedded_at, indexed_at) if embedded_at else indexed_at
+    apply_stats_delta(topic_ids, {field: delta * sign for field, delta in deltas.items()}, embedded_at)
+
+
+def compute_topic_transcript_stats(topic_ids=None):
+    """{topic_id: {field: value}} from current DB state, one grouped query."""
+    from content.models import ContentTranscript
+
+    queryset = ContentTranscript.objects.filter(
+        content__media_type__in=TRANSCRIPT_MEDIA_TYPES,
+        embedding_status__in=STATUS_FIELDS,
+    )
+    if topic_ids is None:
+        queryset = queryset.filter(content__topics__isnull=False)
+    else:
+        queryset = queryset.filter(content__topics__in=topic_ids)
+    rows = queryset.values('content__topics', 'embedding_status').annotate(
+        transcripts=Count('id', distinct=True),
+        chunks=Sum('chunk_count'),
+        last_embedded_at=Max('embedded_at'),
+    ).order_by()
+
+    stats = {}
+    for row in rows:
+        values = stats.setdefault(row['content__topics'], {
+            **{field: 0 for field in COUNT_FIELDS},
+            'last_embedded_at': None,
+        })
+        values[STATUS_FIELDS[row['embedding_status']]] = row['transcripts']
+        if row['embedding_status'] == 'indexed':
+            values['chunk_count'] = row['chunks'] or 0
+            values['last_embedded_at'] = row['last_embedded_at']
+    return stats
+
+
+def recompute_topic_transcript_stats(topic_id):
+    """Full recompute and persist for one topic. Returns the stats row (None if no topic)."""
+    from content.models import Topic, TopicTranscriptStats
+
+    if not Topic.objects.filter(pk=topic_id).exists():
+        return None
+    values = compute_topic_transcript_stats([topic_id]).get(topic_id, {})
+    defaults = {field: values.get(field, 0) for field in COUNT_FIELDS}
+    defaults['last_embedded_at'] = values.get('last_embedded_at')
+    stats, _ = TopicTranscriptStats.objects.update_or_create(topic_id=topic_id, defaults=defaults)
+    invalidate_tags_on_commit(TOPICS_TAG, topic_tag(topic_id))
+    return stats
+
+
+def recompute_all_topic_transcript_stats(topic_ids=None):
+    """Full recompute for many topics (or all). Returns count updated."""
+    from content.models import Topic, TopicTranscriptStats
+
+    topics = Topic.objects.order_by('id')
+    if topic_ids is not None:
+        topics = topics.filter(pk__in=topic_ids)
+    ids = list(topics.values_list('id', flat=True))
+    if not ids:
+        return 0
+
+    computed = compute_topic_transcript_stats(None if topic_ids is None else ids)
+    existing = {
+        stats.topic_id: stats
+        for stats in TopicTranscriptStats.objects.filter(topic_id__in=ids)
+    }
+    now = timezone.now()
+    to_create, to_update = [], []
+    for topic_id in ids:
+        values = computed.get(topic_id, {})
+        stats = existing.get(topic_id) or TopicTranscriptStats(topic_id=topic_id)
+        for field in COUNT_FIELDS:
+            setattr(stats, field, values.get(field, 0))
+        stats.last_embedded_at = values.get('last_embedded_at')
+        stats.updated_at = now
+        (to_update if stats.pk else to_create).append(stats)
+
+    TopicTranscriptStats.objects.bulk_create(to_create, batch_size=500)
+    TopicTranscriptStats.objects.bulk_update(
+        to_update, COUNT_FIELDS + ('last_embedded_at', 'updated_at'), batch_size=500,
+    )
+    invalidate_tags_on_commit(TOPICS_TAG, *(topic_tag(tid) for tid in ids))
+    return len(ids)
+
+
+# Signals
+
+def topic_post_save_create_stats(sender, instance, created, raw=False, **kwargs):
+    # A new topic has no contents: an all-zero row, so readers never hit the recompute fallback.
+    if created and not raw:
+        from content.models import TopicTranscriptStats
+
+        TopicTranscriptStats.objects.get_or_create(topic=instance)
+
+
+def transcript_pre_save_capture_state(sender, instance, **kwargs):
+    instance._stats_old_state = None
+    if instance.pk:
+        instance._stats_old_state = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list('embedding_status', 'chunk_count', 'embedded_at')
+            .first()
+        )
+
+
+def transcript_post_save_apply(sender, instance, created, **kwargs):
+    try:
+        apply_transcript_change(
+            instance.content_id,
+            getattr(instance, '_stats_old_state', None),
+            transcript_state(instance),
+        )
+    except Exception:
+        logger.exception('Failed to update topic transcript stats for content %s', instance.content_id)
+
+
+def transcript_pre_delete_capture(sender, instance, **kwargs):
+    # The Content.topics rows may be gone by post_delete when the content itself is deleted.
+    try:
+        instance._stats_topic_ids = _transcript_topic_ids(instance.content_id)
+    except Exception:
+        instance._stats_topic_ids = []
+
+
+def transcript_post_delete_apply(sender, instance, **kwargs):
+    topic_ids = getattr(instance, '_stats_topic_ids', None) or []
+    try:
+        deltas = _contribution(transcript_state(instance))
+        apply_stats_delta(topic_ids, {field: -delta for field, delta in deltas.items()})
+    except Exception:
+        logger.exception('Failed to update topic transcript stats after transcript delete')
+
+
+def content_pre_save_capture_media_type(sender, instance, raw=False, **kwargs):
+    instance._stats_old_media_type = None
+    if instance.pk and not raw:
+        instance._stats_old_media_type = (
+            sender.objects.filter(pk=instance.pk).values_list('media_type', flat=True).first()
+        )
+
+
+def content_post_save_apply_media_type(sender, instance, created, raw=False, **kwargs):
+    if created or raw:
+        return
+    was_counted = getattr(instance, '_stats_old_media_type', None) in TRANSCRIPT_MEDIA_TYPES
+    is_counted = instance.media_type in TRANSCRIPT_MEDIA_TYPES
+    if was_counted == is_counted:
+        return
+    try:
+        topic_ids = list(instance.topics.values_list('id', flat=True))
+        if topic_ids:
+            apply_contents_linked(topic_ids, [instance.pk], 1 if is_counted else -1, check_media_type=False)
+    except Exception:
+        logger.exception('Failed to update topic transcript stats on media_type change for content %s', instance.pk)
+
+
+def content_topics_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    # Content.topics is the forward side: instance is a Content unless reverse.
+    if action == 'pre_clear':
+        try:
+            if not reverse:
+                instance._stats_clear_topic_ids = list(instance.topics.values_list('id', flat=True))
+        except Exception:
+            logger.exception('Failed to capture topic ids before clear')
+        return
+
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    try:
+        if action == 'post_clear':
+            topic_ids = [instance.pk] if reverse else getattr(instance, '_stats_clear_topic_ids', [])
+            if topic_ids:
+                recompute_all_topic_transcript_stats(topic_ids)
+            return
+        if not pk_set:
+            return
+        sign = 1 if action == 'post_add' else -1
+        if reverse:
+            apply_contents_linked([instance.pk], pk_set, sign)
+        else:
+            apply_contents_linked(pk_set, [instance.pk], sign)
+    except Exception:
+        logger.exception('Failed to update topic transcript stats on content M2M change')
+
+
+def connect_topic_transcript_stats_signals():
+    from content.models import Content, ContentTranscript, Topic
+
+    post_save.connect(
+        topic_post_save_create_stats,
+        sender=Topic,
+        dispatch_uid='topic_transcript_stats_topic_post_save',
+    )
+    pre_save.connect(
+        content_pre_save_capture_media_type,
+        sender=Content,
+        dispatch_uid='topic_transcript_stats_content_pre_save',
+    )
+    post_save.connect(
+        content_post_save_apply_media_type,
+        sender=Content,
+        dispatch_uid='topic_transcript_stats_content_post_save',
+    )
+    pre_save.connect(
+        transcript_pre_save_capture_state,
+        sender=ContentTranscript,
+        dispatch_uid='topic_transcript_stats_transcript_pre_save',
+    )
+    post_save.connect(
+        transcript_post_save_apply,
+        sender=ContentTranscript,
+        dispatch_uid='topic_transcript_stats_transcript_post_save',
+    )
+    pre_delete.connect(
+        transcript_pre_delete_capture,
+        sender=ContentTranscript,
+        dispatch_uid='topic_transcript_stats_transcript_pre_delete',
+    )
+    post_delete.connect(
+        transcript_post_delete_apply,
+        sender=ContentTranscript,
+        dispatch_uid='topic_transcript_stats_transcript_post_delete',
+    )
+    m2m_changed.connect(
+        content_topics_changed,
+        sender=Content.topics.through,
+        dispatch_uid='topic_transcript_stats_content_topics_m2m',
+    )
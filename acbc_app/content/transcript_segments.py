@@ -0,0 +1,101 @@
+"""
+Timed transcript cues by time range, for a player that fetches the window around
+the playhead instead of the whole transcript.
+
+Cues are read from ContentTranscriptSegment through its (transcript, start_ms, index)
+index. A page holds the cues that overlap [from_ms, to_ms) in start order; the cursor
+holds (start_ms, index) of the last cue, so the next page starts right after it. A cue
+ending after from_ms starts at most ContentTranscript.max_segment_ms before it, so
+start_ms >= from_ms - max_cue_ms gives the index a lower bound to seek to.
+
+The columnar encoding sends one array per field instead of one object per cue: the
+cue texts are concatenated in ``text`` and cue i is ``text[text_offsets[i]:
+text_offsets[i + 1]]``, offsets counted in UTF-16 code units as JavaScript indexes
+strings. It repeats no keys and compresses well.
+"""
+import base64
+import json
+
+from django.db.models import Q
+
+from content.models import ContentTranscriptSegment
+
+SEGMENT_ORDERING = ('start_ms', 'index')
+DEFAULT_PAGE_SIZE = 200
+MAX_PAGE_SIZE = 1000
+ENCODING_COLUMNAR = 'columnar'
+ENCODING_ROWS = 'rows'
+ENCODINGS = (ENCODING_COLUMNAR, ENCODING_ROWS)
+
+
+class InvalidTranscriptCursor(ValueError):
+    """The cursor query parameter could not be decoded."""
+
+
+def encode_segment_cursor(segment):
+    payload = [segment.start_ms, segment.index]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_segment_cursor(value):
+    try:
+        start_ms, index = json.loads(base64.urlsafe_b64decode(value.encode()))
+        return int(start_ms), int(index)
+    except (TypeError, ValueError, UnicodeError) as exc:
+        raise InvalidTranscriptCursor(str(exc)) from exc
+
+
+def _after_cursor(cursor):
+    start_ms, index = cursor
+    return Q(start_ms__gt=start_ms) | Q(start_ms=start_ms, index__gt=index)
+
+
+def segment_page(
+    transcript_id, *, from_ms=None, to_ms=None, cursor=None, page_size=DEFAULT_PAGE_SIZE, max_cue_ms=None,
+):
+    """
+    (segments, next_cursor) for the cues of a transcript overlapping [from_ms, to_ms).
+    max_cue_ms is the transcript's longest cue; without it from_ms scans from the start.
+    """
+    queryset = ContentTranscriptSegment.objects.filter(transcript_id=transcript_id)
+    if from_ms is not None:
+        queryset = queryset.filter(end_ms__gt=from_ms)
+        if max_cue_ms is not None:
+            queryset = queryset.filter(start_ms__gte=max(0, from_ms - max_cue_ms))
+    if to_ms is not None:
+        queryset = queryset.filter(start_ms__lt=to_ms)
+    if cursor:
+        queryset = queryset.filter(_after_cursor(decode_segment_cursor(cursor)))
+    queryset = queryset.order_by(*SEGMENT_ORDERING).only('index', 'start_ms', 'end_ms', 'text')
+    segments = list(queryset[:page_size + 1])
+    next_cursor = encode_segment_cursor(segments[page_size - 1]) if len(segments) > page_size else None
+    return segments[:page_size], next_cursor
+
+
+def encode_rows(segments):
+    return [
+        {
+            'index': segment.index,
+            'start_ms': segment.start_ms,
+            'end_ms': segment.end_ms,
+            'text': segment.text,
+        }
+        for segment in segments
+    ]
+
+
+def _js_length(text):
+    return len(text.encode('utf-16-le')) // 2
+
+
+def encode_columnar(segments):
+    text_offsets = [0]
+    for segment in segments:
+        text_offsets.append(text_offsets[-1] + _js_length(segment.text))
+    return {
+        'index': [segment.index for segment in segments],
+        'start_ms': [segment.start_ms for segment in segments],
+        'end_ms': [segment.end_ms for segment in segments],
+        'text': ''.join(segment.text for segment in segments),
+        'text_offsets': text_offsets,
+    }
@@ -129,6 +129,56 @@ def segments_to_plain_text(segments):
     return '\n'.join(segment['text'] for segment in segments if segment.get('text'))
 
 
+WORD = re.compile(r'\w+', re.UNICODE)
+
+
+def _word_set(text):
+    folded = unicodedata.normalize('NFKD', (text or '').lower())
+    return {
+        word for word in WORD.findall(''.join(ch for ch in folded if not unicodedata.combining(ch)))
+        if len(word) > 2
+    }
+
+
+def locate_text_in_segments(text, segments, min_overlap=0.6):
+    """
+    Find the run of timed segments a chunk of transcript text came from.
+
+    Chunks are cut from processed text, so they rarely match cue text exactly; each
+    segment is scored by the share of its words present in the chunk and the first
+    run of segments above min_overlap is returned (falling back to the single best
+    segment). Returns {'start_ms', 'end_ms', 'segment_index'} or None.
+    """
+    chunk_words = _word_set(text)
+    if not chunk_words or not segments:
+        return None
+
+    best = None
+    best_ratio = 0.0
+    run_start = run_end = None
+    for segment in segments:
+        words = _word_set(segment.get('text'))
+        ratio = len(words & chunk_words) / len(words) if words else 0.0
+        if ratio >= min_overlap:
+            if run_start is None:
+                run_start = segment
+            run_end = segment
+        elif run_start is not None:
+            break
+        if ratio > best_ratio:
+            best, best_ratio = segment, ratio
+
+    if run_start is None:
+        if best is None:
+            return None
+        run_start = run_end = best
+    return {
+        'start_ms': run_start.get('start_ms'),
+        'end_ms': run_end.get('end_ms'),
+        'segment_index': run_start.get('index'),
+    }
+
+
 def normalize_plain_text_for_hash(plain_text):
     normalized = unicodedata.normalize('NFC', plain_text or '')
     return ' '.join(normalized.split())
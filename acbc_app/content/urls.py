@@ -90,6 +90,7 @@ from .views_transcript_ingest import (
     ContentTranscriptIngestQueueView,
     ContentTranscriptIngestDetailView,
     ContentTranscriptPublicView,
+    ContentTranscriptSegmentsView,
 )
 from .views_transcript_anchor import (
     ContentTranscriptAnchorCurrentView,
@@ -131,6 +132,11 @@ urlpatterns = [
         ContentTranscriptPublicView.as_view(),
         name='content-transcript',
     ),
+    path(
+        'content_details/<int:content_id>/transcript/segments/',
+        ContentTranscriptSegmentsView.as_view(),
+        name='content-transcript-segments',
+    ),
     path(
         'content_details/<int:content_id>/transcript/anchor/',
         ContentTranscriptAnchorCurrentView.as_view(),
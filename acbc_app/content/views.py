@@ -18,6 +18,7 @@ from django.db import models, IntegrityError, transaction
 from django.db.models import Q, OuterRef, Subquery, Count, Value
 from django.db.models.functions import Coalesce
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
 import logging
 import random
 import hashlib
@@ -89,7 +90,16 @@ from content.utils import (
     get_topic_content_id_set,
     get_topic_contents_ordered_for_public_view,
 )
-from content.image_utils import generate_topic_thumbnail, delete_topic_thumbnail
+from content.image_utils import delete_topic_thumbnail, schedule_topic_thumbnail
+from content.response_cache import TOPICS_TAG, topic_tag
+from content.topic_listing import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    InvalidTopicCursor,
+    annotate_indexed_transcripts,
+    topic_list_etag,
+    topic_page,
+)
 from content.s3_key_utils import is_unsafe_s3_key, sanitize_filename_for_s3_key
 from bs4 import BeautifulSoup
 import requests
@@ -99,6 +109,7 @@ from math import ceil
 from django.core.validators import URLValidator
 from django.core.exceptions import ValidationError
 from utils.logging_utils import log_error
+from utils.shared_cache import cached_response_data
 import time
 import uuid
 import boto3
@@ -1899,9 +1910,46 @@ class TopicView(APIView):
         return [permission() for permission in self.permission_classes]
 
     def get(self, request):
-        topics = Topic.objects.filter(is_public=True).order_by('-activity_score', '-created_at')
-        serializer = TopicBasicSerializer(topics, many=True, context={'request': request})
-        return Response(serializer.data)
+        """
+        Public topics by activity_score, one keyset page at a time.
+
+        Query params: cursor (next_cursor of the previous page), page_size (default
+        24, max 100), fields (comma-separated subset of TopicBasicSerializer fields).
+        Answers 304 when If-None-Match still matches the page.
+        """
+        try:
+            page_size = int(request.query_params.get('page_size', DEFAULT_PAGE_SIZE))
+        except (TypeError, ValueError):
+            page_size = DEFAULT_PAGE_SIZE
+        page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        cursor = request.query_params.get('cursor') or None
+        fields = None
+        if request.query_params.get('fields'):
+            requested = {name.strip() for name in request.query_params['fields'].split(',')}
+            fields = (requested & set(TopicBasicSerializer.Meta.fields)) | {'id'}
+
+        def build():
+            topics, next_cursor = topic_page(cursor=cursor, page_size=page_size, fields=fields)
+            context = {'request': request, 'fields': fields}
+            return {
+                'results': TopicBasicSerializer(topics, many=True, context=context).data,
+                'next_cursor': next_cursor,
+                'page_size': page_size,
+            }
+
+        try:
+            data = cached_response_data(request, build, tags=(TOPICS_TAG,), public=True)
+        except InvalidTopicCursor:
+            return Response({'error': 'Cursor inválido.'}, status=status.HTTP_400_BAD_REQUEST)
+        etag = topic_list_etag(data, f"{','.join(sorted(fields or ()))}|{request.get_host()}")
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+        response = Response(data)
+        response['ETag'] = etag
+        # Revalidate on every use; a 304 is served from the cached page.
+        response['Cache-Control'] = 'public, no-cache'
+        return response
 
     def post(self, request):
         creation_request = None
@@ -1943,7 +1991,7 @@ class TopicView(APIView):
         if serializer.is_valid():
             topic = serializer.save(creator=request.user)
             if topic.topic_image:
-                generate_topic_thumbnail(topic)
+                schedule_topic_thumbnail(topic)
             if creation_request:
                 creation_request.status = 'COMPLETED'
                 creation_request.topic = topic
@@ -1973,17 +2021,27 @@ class TopicDetailView(APIView):
         )
 
     def get(self, request, pk):
+        # Anonymous visitors share one cached payload per topic; signed-in users get
+        # their own profile/vote context.
+        data, status_code = cached_response_data(
+            request,
+            lambda: self.build_detail(request, pk),
+            tags=(TOPICS_TAG, topic_tag(pk)),
+        )
+        return Response(data, status=status_code)
+
+    def build_detail(self, request, pk):
         topic, error_response = get_topic_or_not_found_response(
             request,
             pk,
-            Topic.objects.prefetch_related(
+            Topic.objects.select_related('transcript_stats').prefetch_related(
                 'contents',
                 'contents__file_details',
                 'contents__profiles',
             ),
         )
         if error_response is not None:
-            return error_response
+            return error_response.data, error_response.status_code
 
         include_contents = request.query_params.get('include_contents', 'true').lower() not in (
             '0', 'false', 'no'
@@ -2028,7 +2086,7 @@ class TopicDetailView(APIView):
             'ordered_contents': ordered_contents,
             'selected_profiles': {item['content'].id: item['selected_profile'] for item in contents_with_profiles}
         })
-        return Response(serializer.data)
+        return serializer.data, status.HTTP_200_OK
 
     def patch(self, request, pk):
         logger.info("Topic PATCH topic_id=%s", pk)
@@ -2073,9 +2131,9 @@ class TopicDetailView(APIView):
 
         try:
             saved_topic = serializer.save()
-            # Best-effort; thumbnail failure must not roll back a successful topic save.
+            # Generated by the job worker; a thumbnail failure never affects the topic save.
             if has_image:
-                generate_topic_thumbnail(saved_topic)
+                schedule_topic_thumbnail(saved_topic)
             logger.info("Topic PATCH saved topic_id=%s", pk)
             return Response(serializer.data)
         except Exception as e:
@@ -2987,6 +3045,7 @@ class UserTopicsView(APIView):
                 Q(creator=request.user) | Q(moderators=request.user)
             ).distinct().order_by('-created_at')
         
+        topics = annotate_indexed_transcripts(topics.select_related('creator'))
         serializer = TopicBasicSerializer(topics, many=True, context={'request': request})
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -3085,7 +3144,9 @@ class PublicationListView(APIView):
         if user_id is not None:
             return self.get_user_publications(request, user_id)
         
-        publications = Publication.objects.filter(user=request.user, deleted=False)
+        publications = Publication.objects.filter(
+            user=request.user, deleted=False
+        ).select_related('user', 'content_profile')
         serializer = PublicationSerializer(publications, many=True, context={'request': request})
         data = serializer.data        
         return Response(data)
@@ -3099,7 +3160,9 @@ class PublicationListView(APIView):
 
     def get_user_publications(self, request, user_id):
         try:
-            publications = Publication.objects.filter(user_id=user_id, deleted=False, status='PUBLISHED')
+            publications = Publication.objects.filter(
+                user_id=user_id, deleted=False, status='PUBLISHED'
+            ).select_related('user', 'content_profile')
             serializer = PublicationSerializer(publications, many=True, context={'request': request})
             return Response(serializer.data)
         except Exception as e:
@@ -4647,7 +4710,9 @@ class TopicContentSuggestionsView(APIView):
         is_duplicate_filter = request.query_params.get('is_duplicate', None)
         
         # All authenticated users can see all suggestions
-        suggestions = ContentSuggestion.objects.filter(topic=topic)
+        suggestions = ContentSuggestion.objects.filter(topic=topic).select_related(
+            'content', 'suggested_by', 'reviewed_by', 'topic',
+        )
         
         # Apply filters
         if status_filter:
@@ -4807,7 +4872,9 @@ class UserContentSuggestionsView(APIView):
         topic_id = request.query_params.get('topic_id', None)
         
         # Build query
-        suggestions = ContentSuggestion.objects.filter(suggested_by=request.user)
+        suggestions = ContentSuggestion.objects.filter(suggested_by=request.user).select_related(
+            'content', 'suggested_by', 'reviewed_by', 'topic',
+        )
         
         # Apply filters
         if status_filter:
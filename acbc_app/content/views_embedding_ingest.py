@@ -32,6 +32,7 @@ from content.serializers import (
     ContentEmbeddingQueueItemSerializer,
     ContentTranscriptIngestSummarySerializer,
 )
+from content.topic_transcript_stats import apply_transcript_change, transcript_state
 from content.views_transcript_ingest import (
     DEFAULT_QUEUE_LIMIT,
     MAX_QUEUE_LIMIT,
@@ -245,6 +246,7 @@ class ContentEmbeddingIngestDetailView(EmbeddingIngestAPIView):
 
         payload = serializer.validated_data
         transcript = content.transcript
+        old_state = transcript_state(transcript)
         ack_status = payload['status']
 
         if ack_status == ContentTranscript.EMBEDDING_STATUS_INDEXED:
@@ -316,6 +318,8 @@ class ContentEmbeddingIngestDetailView(EmbeddingIngestAPIView):
         }
         ContentTranscript.objects.filter(pk=transcript.pk).update(**update_fields)
         transcript.refresh_from_db()
+        # No post_save on update(); keep the topics' transcript stats in step.
+        apply_transcript_change(content.id, old_state, transcript_state(transcript))
 
         logger.info(
             'Embedding ingest ack status=%s content_id=%s model=%s chunks=%s',
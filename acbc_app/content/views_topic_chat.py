@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import json
 import logging
 
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
@@ -16,7 +20,15 @@ from content.serializers import (
     TopicChatQuerySerializer,
     TopicChatRequestSerializer,
 )
-from content.topic_chat import TopicChatError, run_topic_chat, topic_chat_ready
+from content.topic_chat import (
+    TopicChatError,
+    prepare_topic_chat,
+    run_topic_chat,
+    stream_topic_chat_answer,
+    topic_chat_ready,
+)
+from content.topic_chat_async import arun_topic_chat
+from content.topic_chat_cache import answer_cache_fields, record_cited_contents
 
 logger = logging.getLogger(__name__)
 
@@ -45,12 +57,68 @@ def _require_chat_enabled(topic):
     return None
 
 
+def _save_chat_query(topic, user, message, result):
+    query = TopicChatQuery.objects.create(
+        topic=topic,
+        user=user,
+        question=message,
+        answer=result.get('answer') or '',
+        sources=result.get('sources') or [],
+        **answer_cache_fields(message, result),
+    )
+    record_cited_contents(query, result)
+
+    logger.info(
+        'Topic chat query saved id=%s topic_id=%s user_id=%s sources=%s reused_from=%s',
+        query.id,
+        topic.id,
+        user.id,
+        len(query.sources or []),
+        query.reused_from_id,
+    )
+    return query
+
+
+def _sse_event(event, data):
+    return f'event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n'
+
+
+def _stream_chat_events(topic, user, message, prepared):
+    """sources → token* → done (persisted query), or error if generation fails midway."""
+    yield _sse_event('sources', {
+        'topic_id': topic.id,
+        'sources': prepared.result['sources'] if prepared.result else prepared.sources,
+        'reused_from': (prepared.result or {}).get('reused_from'),
+    })
+    try:
+        for delta in stream_topic_chat_answer(prepared):
+            yield _sse_event('token', {'delta': delta})
+    except TopicChatError as exc:
+        yield _sse_event('error', {'error': str(exc), 'status': exc.status_code})
+        return
+    except Exception as exc:
+        # Headers are already sent: anything else escaping here would only drop the
+        # connection, so report it as a failed generation instead.
+        logger.exception('Topic chat stream failed topic_id=%s', topic.id)
+        error = TopicChatError(f'No se pudo generar la respuesta del modelo: {exc}', status_code=502)
+        yield _sse_event('error', {'error': str(error), 'status': error.status_code})
+        return
+    query = _save_chat_query(topic, user, message, prepared.result)
+    yield _sse_event('done', TopicChatQuerySerializer(query).data)
+
+
 class TopicChatView(APIView):
     """
     POST /api/content/topics/<topic_id>/chat/
 
     Runs one independent RAG consultation (no conversational history to the LLM)
-    and persists question + answer + sources for the authenticated user.
+    and persists question + answer + sources for the authenticated user. Equivalent
+    questions already answered in the topic are served from the answer cache
+    (reused_from is set on the new row).
+
+    With ?stream=1 the response is text/event-stream: a `sources` event, then
+    `token` events with answer deltas as the model produces them, then `done`
+    with the persisted query (or `error` if generation fails).
     """
 
     permission_classes = [IsAuthenticated]
@@ -81,39 +149,54 @@ class TopicChatView(APIView):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
         message = serializer.validated_data['message']
+        chat_kwargs = {
+            'topic_id': topic.id,
+            'topic_title': topic.title or f'Tema {topic.id}',
+            'message': message,
+            'history': None,
+            'use_answer_cache': True,
+        }
+
+        if request.query_params.get('stream') in ('1', 'true'):
+            # Retrieval errors still get a regular JSON error response; only the
+            # completion is streamed.
+            try:
+                prepared = prepare_topic_chat(**chat_kwargs)
+            except TopicChatError as exc:
+                return Response({'error': str(exc)}, status=exc.status_code)
+            response = StreamingHttpResponse(
+                _stream_chat_events(topic, request.user, message, prepared),
+                content_type='text/event-stream',
+            )
+            response['Cache-Control'] = 'no-cache'
+            response['X-Accel-Buffering'] = 'no'
+            return response
 
+        use_async = getattr(settings, 'TOPIC_CHAT_ASYNC_PIPELINE', False)
         try:
-            result = run_topic_chat(
-                topic_id=topic.id,
-                topic_title=topic.title or f'Tema {topic.id}',
-                message=message,
-                history=None,
-            )
+            if use_async:
+                # The site is served by gunicorn's sync (WSGI) workers and APIView has no
+                # async handlers, so this thread waits either way; the async pipeline is
+                # for overlapping the upstream calls within one request.
+                result = async_to_sync(arun_topic_chat)(**chat_kwargs)
+            else:
+                result = run_topic_chat(**chat_kwargs)
         except TopicChatError as exc:
             return Response(
                 {'error': str(exc)},
                 status=exc.status_code,
             )
 
-        query = TopicChatQuery.objects.create(
-            topic=topic,
-            user=request.user,
-            question=message,
-            answer=result.get('answer') or '',
-            sources=result.get('sources') or [],
-        )
-
-        logger.info(
-            'Topic chat query saved id=%s topic_id=%s user_id=%s sources=%s',
-            query.id,
-            topic.id,
-            request.user.id,
-            len(query.sources or []),
-        )
-        return Response(
+        query = _save_chat_query(topic, request.user, message, result)
+        response = Response(
             TopicChatQuerySerializer(query).data,
             status=status.HTTP_201_CREATED,
         )
+        if result.get('timings'):
+            response['Server-Timing'] = ', '.join(
+                f'{stage};dur={ms}' for stage, ms in result['timings'].items()
+            )
+        return response
 
 
 class TopicChatQueryListView(APIView):
@@ -18,7 +18,6 @@ from content.bitcoin.service import (
     AnchorBroadcastError,
     broadcast_anchor,
     ensure_pending_anchor,
-    maybe_refresh_broadcast_anchor,
 )
 
 logger = logging.getLogger(__name__)
@@ -48,10 +47,6 @@ class ContentTranscriptAnchorListView(APIView):
 
     def get(self, request, content_id):
         content = get_object_or_404(Content, pk=content_id)
-        anchors = list(TranscriptAnchor.objects.filter(content=content))
-        for anchor in anchors:
-            if anchor.status == TranscriptAnchor.STATUS_BTC_BROADCAST and anchor.btc_txid:
-                maybe_refresh_broadcast_anchor(anchor)
         anchors = TranscriptAnchor.objects.filter(content=content)
         return Response(TranscriptAnchorSerializer(anchors, many=True).data)
 
@@ -123,8 +118,8 @@ class ContentTranscriptAnchorCurrentView(APIView):
     POST /api/content/content_details/<content_id>/transcript/anchor/
 
     GET returns the Bitcoin anchor matching the current transcript hash, or null.
-    If the matching row is still ``btc_broadcast``, polls Esplora once to update
-    confirmations / mark ``anchored`` when ready.
+    Confirmations of a ``btc_broadcast`` row are polled by the job worker (see
+    ``content.bitcoin.service.schedule_anchor_refresh``), not by this read.
 
     POST (uploader/staff) ensures a pending row and broadcasts via the platform
     wallet. Rejects with 503 when estimated fee USD exceeds ``BTC_MAX_FEE_USD``.
@@ -152,7 +147,6 @@ class ContentTranscriptAnchorCurrentView(APIView):
                 text_hash=transcript.text_hash,
             ).first()
             if anchor is not None:
-                anchor = maybe_refresh_broadcast_anchor(anchor)
                 payload['anchor'] = TranscriptAnchorSerializer(anchor).data
         return Response(payload)
 
@@ -26,6 +26,12 @@ User-facing read (JWT optional, same visibility as content detail GET):
 
 * ``GET /api/content/content_details/<content_id>/transcript/``
   Full display text + optional timed segments for the content detail UI.
+
+* ``GET /api/content/content_details/<content_id>/transcript/segments/``
+  Timed segments overlapping ``from_ms``/``to_ms``, paged by ``cursor``, for a player
+  that loads the window around the playhead (see content.transcript_segments).
+
+Both read endpoints are gzip/brotli compressed when the client accepts it.
 """
 import logging
 
@@ -36,6 +42,7 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from content import transcript_segments
 from content.models import Content, ContentTranscript, Topic
 from content.permissions import TranscriptIngestPermission
 from content.serializers import (
@@ -44,10 +51,20 @@ from content.serializers import (
     ContentTranscriptPublicSerializer,
     ContentTranscriptQueueItemSerializer,
 )
+from utils.http_compression import CompressedResponseMixin
 
 logger = logging.getLogger(__name__)
 
 TRANSCRIPT_MEDIA_TYPES = ('VIDEO', 'AUDIO')
+TRANSCRIPT_SUMMARY_FIELDS = ('id', 'content_id', 'language', 'text_length', 'segment_count', 'updated_at')
+# Never part of the public payload; deferred so the full read does not load them.
+TRANSCRIPT_PUBLIC_DEFERRED_FIELDS = (
+    'source_subtitles',
+    'obsidian_frontmatter',
+    'embedding_error',
+    'embedding_model',
+    'embedded_text_hash',
+)
 DEFAULT_QUEUE_LIMIT = 100
 MAX_QUEUE_LIMIT = 500
 
@@ -58,37 +75,121 @@ def _parse_bool(value):
     return str(value).strip().lower() in ('1', 'true', 'yes', 'on')
 
 
-class ContentTranscriptPublicView(APIView):
+class ContentTranscriptPublicView(CompressedResponseMixin, APIView):
     """
     GET /api/content/content_details/<content_id>/transcript/
 
     Returns the user-facing transcript for a content item, or 404 if none exists.
 
     Query ``summary=1`` returns metadata only (no text/segments) for detail-page
-    teasers that link to the dedicated transcript page.
+    teasers that link to the dedicated transcript page; it loads only those columns.
     """
 
     permission_classes = [AllowAny]
 
     def get(self, request, content_id):
         content = get_object_or_404(Content, pk=content_id)
-        transcript = ContentTranscript.objects.filter(content=content).first()
+        summary = _parse_bool(request.query_params.get('summary'))
+        transcripts = ContentTranscript.objects.filter(content=content)
+        if summary:
+            transcripts = transcripts.only(*TRANSCRIPT_SUMMARY_FIELDS)
+        else:
+            transcripts = transcripts.defer(*TRANSCRIPT_PUBLIC_DEFERRED_FIELDS)
+        transcript = transcripts.first()
         if transcript is None:
-            return Response(
-                {'error': 'Este contenido aún no tiene transcripción.'},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-        if _parse_bool(request.query_params.get('summary')):
+            return _transcript_not_found()
+        if summary:
             return Response({
                 'has_transcript': True,
                 'language': transcript.language or '',
                 'text_length': transcript.text_length,
-                'segment_count': len(transcript.segments or []),
+                'segment_count': transcript.segment_count,
                 'updated_at': transcript.updated_at,
             })
         return Response(ContentTranscriptPublicSerializer(transcript).data)
 
 
+class ContentTranscriptSegmentsView(CompressedResponseMixin, APIView):
+    """
+    GET /api/content/content_details/<content_id>/transcript/segments/
+
+    Timed segments overlapping [from_ms, to_ms) in start order. Optional query params:
+    ``from_ms``, ``to_ms``, ``cursor`` (next_cursor of the previous page), ``limit``
+    (default 200, max 1000) and ``encoding`` (``columnar``, the default, or ``rows``).
+    """
+
+    permission_classes = [AllowAny]
+
+    def get(self, request, content_id):
+        content = get_object_or_404(Content, pk=content_id)
+        transcript = (
+            ContentTranscript.objects.filter(content=content)
+            .only('id', 'content_id', 'segment_count', 'max_segment_ms')
+            .first()
+        )
+        if transcript is None:
+            return _transcript_not_found()
+
+        try:
+            from_ms = _parse_ms(request.query_params.get('from_ms'))
+            to_ms = _parse_ms(request.query_params.get('to_ms'))
+        except ValueError:
+            return Response(
+                {'error': 'from_ms y to_ms deben ser enteros no negativos.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        encoding = request.query_params.get('encoding') or transcript_segments.ENCODING_COLUMNAR
+        if encoding not in transcript_segments.ENCODINGS:
+            return Response(
+                {'error': 'encoding debe ser columnar o rows.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            limit = int(request.query_params.get('limit', transcript_segments.DEFAULT_PAGE_SIZE))
+        except (TypeError, ValueError):
+            limit = transcript_segments.DEFAULT_PAGE_SIZE
+        limit = max(1, min(limit, transcript_segments.MAX_PAGE_SIZE))
+
+        try:
+            segments, next_cursor = transcript_segments.segment_page(
+                transcript.id,
+                from_ms=from_ms,
+                to_ms=to_ms,
+                cursor=request.query_params.get('cursor'),
+                page_size=limit,
+                max_cue_ms=transcript.max_segment_ms,
+            )
+        except transcript_segments.InvalidTranscriptCursor:
+            return Response({'error': 'Cursor inválido.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        if encoding == transcript_segments.ENCODING_COLUMNAR:
+            data = transcript_segments.encode_columnar(segments)
+        else:
+            data = transcript_segments.encode_rows(segments)
+        return Response({
+            'segment_count': transcript.segment_count,
+            'encoding': encoding,
+            'segments': data,
+            'next_cursor': next_cursor,
+        })
+
+
+def _transcript_not_found():
+    return Response(
+        {'error': 'Este contenido aún no tiene transcripción.'},
+        status=status.HTTP_404_NOT_FOUND,
+    )
+
+
+def _parse_ms(value):
+    if value in (None, ''):
+        return None
+    value = int(value)
+    if value < 0:
+        raise ValueError(value)
+    return value
+
+
 class TranscriptIngestAPIView(APIView):
     """Shared auth for machine-to-machine transcript ingest."""
 
@@ -280,7 +381,7 @@ class ContentTranscriptIngestDetailView(TranscriptIngestAPIView):
             'Transcript ingest %s for content_id=%s segments=%s',
             'created' if created else 'updated',
             content_id,
-            len(transcript.segments or []),
+            transcript.segment_count,
         )
 
         return Response(
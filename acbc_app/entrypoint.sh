@@ -8,6 +8,11 @@ set -e
 # Default to DEVELOPMENT if not set
 ENVIRONMENT=${ENVIRONMENT:-DEVELOPMENT}
 
+# An explicit command (e.g. the job worker service) runs as-is
+if [ "$#" -gt 0 ]; then
+    exec "$@"
+fi
+
 if [ "$ENVIRONMENT" = "PRODUCTION" ]; then
     # Production: Use Gunicorn
     echo "Starting Gunicorn (PRODUCTION mode)..."
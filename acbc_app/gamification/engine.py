@@ -0,0 +1,349 @@
+"""
+Deferred, coalesced badge evaluation.
+
+Signal receivers only record what may have changed:
+
+- mark_dirty(user_id, rule, subject_id=None): re-check one badge rule for a user
+  (subject_id is the topic / comment / content / knowledge path the rule is about);
+- mark_vote_count_changed(vote_count_id): a VoteCount moved; expanded later into the
+  curator, architect, highly-rated and accumulated-vote rules it can affect.
+
+Marks made inside a transaction are collected in one batch per transaction and
+de-duplicated; after commit the batch becomes a single gamification.evaluate_badges
+job. The job resolves vote counts to (user, rule, subject) pairs with a few batch
+queries, loads the badges those users already hold in one query and skips those rules,
+then runs the remaining checks from gamification.rules. Users known to hold a badge
+are remembered per process, so marks for them are dropped before anything is queued.
+
+Per-rule timing (evaluations, skips, awards, total/max ms) is kept per process:
+rule_timings(), and logged with every batch. With JOBS_EAGER marks are evaluated
+immediately, which keeps tests synchronous.
+"""
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+
+from . import rules
+
+logger = logging.getLogger('academia_blockchain.gamification.engine')
+
+HIGHLY_RATED_COMMENT_VOTES = 5
+HIGHLY_RATED_CONTENT_VOTES = 10
+AWARDED_CACHE_MAX_USERS = 10000
+AWARDED_CACHE_TTL = 300
+
+
+@dataclass(frozen=True)
+class BadgeRule:
+    code: str
+    check: Callable
+    subject_model: Optional[str] = None
+
+
+RULES = {
+    rule.code: rule
+    for rule in (
+        BadgeRule('first_comment', lambda user, subject: rules.check_first_comment(user)),
+        BadgeRule('community_voice', lambda user, subject: rules.check_community_voice(user)),
+        BadgeRule('content_creator', lambda user, subject: rules.check_content_creator(user)),
+        BadgeRule('quiz_master', lambda user, subject: rules.check_quiz_master(user)),
+        BadgeRule('knowledge_seeker', lambda user, subject: rules.check_knowledge_seeker(user)),
+        BadgeRule('first_highly_rated_comment', rules.check_first_highly_rated_comment, 'comments.Comment'),
+        BadgeRule('first_highly_rated_content', rules.check_first_highly_rated_content, 'content.Content'),
+        BadgeRule('topic_curator', rules.check_topic_curator, 'content.Topic'),
+        BadgeRule('topic_architect', rules.check_topic_architect, 'content.Topic'),
+        BadgeRule(
+            'first_knowledge_path_created',
+            rules.check_first_knowledge_path_created,
+            'knowledge_paths.KnowledgePath',
+        ),
+    )
+}
+
+
+# Badges known to be held, per process: {user_id: (loaded_at, {badge_code})}.
+# Awards are permanent for rule badges; the TTL bounds staleness after an admin removes one.
+
+_awarded = {}
+_awarded_lock = threading.Lock()
+
+
+def _held_codes(user_id):
+    """Badge codes user_id holds, from the process cache (one query on a miss)."""
+    entry = _awarded.get(user_id)
+    if entry is not None and time.monotonic() - entry[0] < AWARDED_CACHE_TTL:
+        return entry[1]
+    UserBadge = apps.get_model('gamification', 'UserBadge')
+    codes = set(UserBadge.objects.filter(user_id=user_id).values_list('badge__code', flat=True))
+    _remember_awarded({user_id: codes})
+    return codes
+
+
+def _remember_awarded(user_codes, complete=True):
+    """Cache badge codes; complete=False adds to an already cached set only."""
+    now = time.monotonic()
+    with _awarded_lock:
+        if len(_awarded) > AWARDED_CACHE_MAX_USERS:
+            _awarded.clear()
+        for user_id, codes in user_codes.items():
+            if complete:
+                _awarded[user_id] = (now, set(codes))
+            elif user_id in _awarded:
+                _awarded[user_id][1].update(codes)
+
+
+def forget_awarded(user_id):
+    """Drop a user's cached badges (a UserBadge was deleted)."""
+    with _awarded_lock:
+        _awarded.pop(user_id, None)
+
+
+def reset_awarded_cache():
+    with _awarded_lock:
+        _awarded.clear()
+
+
+# Per-rule timing
+
+@dataclass
+class RuleTiming:
+    evaluations: int = 0
+    skipped: int = 0
+    awarded: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def as_dict(self):
+        return {
+            'evaluations': self.evaluations,
+            'skipped': self.skipped,
+            'awarded': self.awarded,
+            'total_ms': round(self.total_ms, 3),
+            'max_ms': round(self.max_ms, 3),
+            'avg_ms': round(self.total_ms / self.evaluations, 3) if self.evaluations else 0.0,
+        }
+
+
+_timings = defaultdict(RuleTiming)
+_timings_lock = threading.Lock()
+
+
+def rule_timings():
+    """{rule code: {evaluations, skipped, awarded, total_ms, max_ms, avg_ms}} for this process."""
+    with _timings_lock:
+        return {code: timing.as_dict() for code, timing in sorted(_timings.items())}
+
+
+def reset_rule_timings():
+    with _timings_lock:
+        _timings.clear()
+
+
+# Collecting marks
+
+@dataclass
+class _Batch:
+    pairs: set = field(default_factory=set)
+    vote_counts: set = field(default_factory=set)
+
+    def flush(self):
+        pairs, vote_counts = sorted(self.pairs, key=str), sorted(self.vote_counts)
+        self.pairs, self.vote_counts = set(), set()
+        if not pairs and not vote_counts:
+            return
+        from jobs.queue import enqueue
+
+        try:
+            enqueue(
+                'gamification.evaluate_badges',
+                pairs=[list(pair) for pair in pairs],
+                vote_counts=vote_counts,
+            )
+        except Exception:
+            logger.exception('Failed to queue badge evaluation for %s pair(s)', len(pairs))
+
+
+_local = threading.local()
+
+
+def _eager():
+    from jobs.queue import jobs_eager
+
+    return jobs_eager()
+
+
+def _collect(pair=None, vote_count_id=None):
+    """Add a mark to the batch flushed when the current transaction commits."""
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        batch = _Batch()
+    else:
+        batch = getattr(_local, 'batch', None)
+        # After a rollback the batch's callback is gone from run_on_commit: start a new one.
+        if batch is None or not any(entry[1] == batch.flush for entry in connection.run_on_commit):
+            batch = _Batch()
+            _local.batch = batch
+            transaction.on_commit(batch.flush)
+    if pair:
+        batch.pairs.add(pair)
+    if vote_count_id:
+        batch.vote_counts.add(vote_count_id)
+    if not connection.in_atomic_block:
+        batch.flush()
+
+
+def mark_dirty(user_id, rule, subject_id=None):
+    """Re-check badge rule for user_id after the current transaction commits."""
+    if not user_id or rule not in RULES:
+        return
+    pair = (user_id, rule, subject_id)
+    if _eager():
+        evaluate(pairs=[pair])
+        return
+    if rule in _held_codes(user_id):
+        return
+    _collect(pair=pair)
+
+
+def mark_vote_count_changed(vote_count_id):
+    if not vote_count_id:
+        return
+    if _eager():
+        evaluate(vote_counts=[vote_count_id])
+        return
+    _collect(vote_count_id=vote_count_id)
+
+
+# Evaluation
+
+def expand_vote_counts(vote_count_ids):
+    """(user_id, rule, subject_id) pairs affected by these VoteCount rows, in batch queries."""
+    VoteCount = apps.get_model('votes', 'VoteCount')
+    Comment = apps.get_model('comments', 'Comment')
+    Content = apps.get_model('content', 'Content')
+
+    rows = list(
+        VoteCount.objects.filter(pk__in=vote_count_ids).values_list(
+            'content_type_id', 'object_id', 'vote_count', 'topic_id', 'topic__creator_id',
+        )
+    )
+    comment_ct = ContentType.objects.get_for_model(Comment).id
+    content_ct = ContentType.objects.get_for_model(Content).id
+    comment_ids = {object_id for ct, object_id, *_ in rows if ct == comment_ct}
+    content_ids = {object_id for ct, object_id, *_ in rows if ct == content_ct}
+    comment_authors = dict(
+        Comment.objects.filter(pk__in=comment_ids).values_list('id', 'author_id')
+    ) if comment_ids else {}
+    content_uploaders = dict(
+        Content.objects.filter(pk__in=content_ids).values_list('id', 'uploaded_by_id')
+    ) if content_ids else {}
+
+    pairs = set()
+    for ct, object_id, vote_count, topic_id, topic_creator_id in rows:
+        if topic_id and topic_creator_id:
+            pairs.add((topic_creator_id, 'topic_curator', topic_id))
+            pairs.add((topic_creator_id, 'topic_architect', topic_id))
+        if ct == comment_ct and comment_authors.get(object_id):
+            author_id = comment_authors[object_id]
+            if vote_count >= HIGHLY_RATED_COMMENT_VOTES:
+                pairs.add((author_id, 'first_highly_rated_comment', object_id))
+            pairs.add((author_id, 'community_voice', None))
+        elif ct == content_ct and content_uploaders.get(object_id):
+            uploader_id = content_uploaders[object_id]
+            if vote_count >= HIGHLY_RATED_CONTENT_VOTES:
+                pairs.add((uploader_id, 'first_highly_rated_content', object_id))
+            pairs.add((uploader_id, 'content_creator', None))
+    return pairs
+
+
+def _load_subjects(pairs):
+    """{model label: {pk: instance}} for the subjects of pairs, one query per model."""
+    ids = defaultdict(set)
+    for _, code, subject_id in pairs:
+        model = RULES[code].subject_model
+        if model and subject_id:
+            ids[model].add(subject_id)
+    return {
+        model: apps.get_model(model).objects.in_bulk(subject_ids)
+        for model, subject_ids in ids.items()
+    }
+
+
+def evaluate(pairs=(), vote_counts=()):
+    """
+    Evaluate de-duplicated (user_id, rule, subject_id) pairs plus those implied by
+    vote_counts, skipping rules whose badge the user already holds. Returns awards made.
+    """
+    started = time.perf_counter()
+    dirty = {tuple(pair) for pair in pairs if pair[1] in RULES}
+    if vote_counts:
+        dirty |= expand_vote_counts(vote_counts)
+    if not dirty:
+        return 0
+
+    user_ids = {user_id for user_id, _, _ in dirty}
+    UserBadge = apps.get_model('gamification', 'UserBadge')
+    held = defaultdict(set)
+    for user_id, code in UserBadge.objects.filter(user_id__in=user_ids).values_list('user_id', 'badge__code'):
+        held[user_id].add(code)
+    _remember_awarded({user_id: held[user_id] for user_id in user_ids})
+
+    todo = []
+    skipped = defaultdict(int)
+    for user_id, code, subject_id in sorted(dirty, key=str):
+        if code in held[user_id]:
+            skipped[code] += 1
+        else:
+            todo.append((user_id, code, subject_id))
+
+    users = User.objects.in_bulk({user_id for user_id, _, _ in todo}) if todo else {}
+    subjects = _load_subjects(todo)
+    awarded = 0
+    timings = {}
+    for user_id, code, subject_id in todo:
+        rule = RULES[code]
+        user = users.get(user_id)
+        subject = subjects.get(rule.subject_model, {}).get(subject_id) if rule.subject_model else None
+        if user is None or (rule.subject_model and subject is None) or code in held[user_id]:
+            continue
+        rule_started = time.perf_counter()
+        try:
+            result = rule.check(user, subject)
+        except Exception:
+            logger.exception('Badge rule %s failed for user %s subject %s', code, user_id, subject_id)
+            result = None
+        elapsed = (time.perf_counter() - rule_started) * 1000
+        count, total, worst, won = timings.get(code, (0, 0.0, 0.0, 0))
+        timings[code] = (count + 1, total + elapsed, max(worst, elapsed), won + (1 if result else 0))
+        if result:
+            awarded += 1
+            held[user_id].add(code)
+            _remember_awarded({user_id: {code}}, complete=False)
+
+    with _timings_lock:
+        for code, count in skipped.items():
+            _timings[code].skipped += count
+        for code, (count, total, worst, won) in timings.items():
+            timing = _timings[code]
+            timing.evaluations += count
+            timing.total_ms += total
+            timing.max_ms = max(timing.max_ms, worst)
+            timing.awarded += won
+
+    logger.info(
+        'Evaluated %s badge check(s), skipped %s already awarded, %s awarded in %.1f ms',
+        sum(count for count, *_ in timings.values()),
+        sum(skipped.values()),
+        awarded,
+        (time.perf_counter() - started) * 1000,
+        extra={'rule_ms': {code: round(total, 3) for code, (_, total, _, _) in timings.items()}},
+    )
+    return awarded
@@ -0,0 +1,50 @@
+"""
+Management command to re-evaluate badge rules in batch and report per-rule timing.
+
+Usage: python manage.py evaluate_badges [--user-id ID ...] [--batch-size 500]
+"""
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+
+from content.models import Topic
+from gamification import engine
+from knowledge_paths.models import KnowledgePath
+
+USER_RULES = ('first_comment', 'community_voice', 'content_creator', 'quiz_master', 'knowledge_seeker')
+
+
+class Command(BaseCommand):
+    help = 'Re-evaluate badge rules for users (all by default) and print per-rule timing'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user-id', type=int, action='append', dest='user_ids', default=None,
+                            help='Only this user (repeatable).')
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        users = User.objects.order_by('id')
+        if options['user_ids']:
+            users = users.filter(pk__in=options['user_ids'])
+        user_ids = list(users.values_list('id', flat=True))
+        batch_size = max(1, options['batch_size'])
+
+        engine.reset_rule_timings()
+        awarded = 0
+        for start in range(0, len(user_ids), batch_size):
+            chunk = user_ids[start:start + batch_size]
+            pairs = [(user_id, rule, None) for user_id in chunk for rule in USER_RULES]
+            for topic_id, creator_id in Topic.objects.filter(creator_id__in=chunk).values_list('id', 'creator_id'):
+                pairs.append((creator_id, 'topic_curator', topic_id))
+                pairs.append((creator_id, 'topic_architect', topic_id))
+            for path_id, author_id in KnowledgePath.objects.filter(author_id__in=chunk).values_list('id', 'author_id'):
+                pairs.append((author_id, 'first_knowledge_path_created', path_id))
+            awarded += engine.evaluate(pairs=pairs)
+
+        self.stdout.write(f"{'rule':32} {'evals':>7} {'skipped':>8} {'awarded':>8} {'avg ms':>8} {'max ms':>8}")
+        for code, timing in engine.rule_timings().items():
+            self.stdout.write(
+                f"{code:32} {timing['evaluations']:>7} {timing['skipped']:>8} {timing['awarded']:>8} "
+                f"{timing['avg_ms']:>8.2f} {timing['max_ms']:>8.2f}"
+            )
+        self.stdout.write(self.style.SUCCESS(f'Evaluated {len(user_ids)} user(s); {awarded} badge(s) awarded.'))
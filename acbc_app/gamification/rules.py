@@ -151,10 +151,9 @@ def check_first_comment(user):
     if has_badge(user, 'first_comment'):
         return None
 
+    # Evaluated after commit, possibly once for several comments: any comment qualifies.
     Comment = apps.get_model('comments', 'Comment')
-    comment_count = Comment.objects.filter(author=user).count()
-    
-    if comment_count == 1:
+    if Comment.objects.filter(author=user).exists():
         return award_badge(user, 'first_comment')
     return None
 
@@ -1,15 +1,15 @@
 """
 Django signals for automatic badge awarding.
 
-These signals listen to various model events and trigger badge eligibility checks.
-All signals verify that badges haven't been awarded previously to avoid duplicates.
+These signals listen to various model events and mark the badge rules they may
+affect (gamification.engine); the checks run in batch after the transaction commits.
+Rules verify that badges haven't been awarded previously to avoid duplicates.
 """
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from django.contrib.contenttypes.models import ContentType
 
-from . import rules
+from . import engine, rules
 from utils.logging_utils import gamification_logger, log_error
 
 
@@ -17,7 +17,7 @@ from utils.logging_utils import gamification_logger, log_error
 def check_node_completion_badges(sender, instance, created, **kwargs):
     """
     Check badges when a node is completed:
-    - Knowledge Seeker: 20+ nodes completed
+    - Knowledge Seeker: 20+ nodes completed (deferred)
     - First Explorer: First KnowledgePath completed
     """
     try:
@@ -28,7 +28,7 @@ def check_node_completion_badges(sender, instance, created, **kwargs):
         knowledge_path = instance.knowledge_path
 
         # Check Knowledge Seeker badge (accumulated)
-        rules.check_knowledge_seeker(user)
+        engine.mark_dirty(user.id, 'knowledge_seeker')
 
         # Check if KnowledgePath is completed (notify only on this write event,
         # not from progress/read helpers that also call is_knowledge_path_completed)
@@ -51,16 +51,15 @@ def check_comment_badges(sender, instance, created, **kwargs):
         if not created:
             return
 
-        user = instance.author
-        rules.check_first_comment(user)
+        engine.mark_dirty(instance.author_id, 'first_comment')
     except Exception as e:
-        log_error(e, f"Error in check_comment_badges for user {instance.author.id}", instance.author.id)
+        log_error(e, f"Error in check_comment_badges for user {instance.author_id}", instance.author_id)
 
 
 @receiver(post_save, sender='votes.VoteCount')
 def check_vote_count_badges(sender, instance, created, **kwargs):
     """
-    Check badges when VoteCount is updated:
+    Mark the badges a VoteCount change can affect (resolved in batch after commit):
     - Valued Contributor: Comment with 5+ votes
     - Content Curator: Content with 10+ votes
     - Community Voice: 20+ votes accumulated on comments
@@ -69,39 +68,7 @@ def check_vote_count_badges(sender, instance, created, **kwargs):
     - Arquitecto de Temas: Topic with 10+ contents with votes, 50+ total votes, 5+ distinct voters
     """
     try:
-        content_object = instance.content_object
-        if not content_object:
-            return
-
-        # Check topic-related badges if VoteCount has a topic
-        if instance.topic:
-            topic = instance.topic
-            if topic.creator:
-                # Check both topic badges
-                rules.check_topic_curator(topic.creator, topic)
-                rules.check_topic_architect(topic.creator, topic)
-
-        # Determine the model type
-        from comments.models import Comment
-        from content.models import Content
-
-        if isinstance(content_object, Comment):
-            user = content_object.author
-            # Check Valued Contributor (first highly rated comment)
-            if instance.vote_count >= 5:
-                rules.check_first_highly_rated_comment(user, content_object)
-            # Check Community Voice (accumulated votes on comments)
-            rules.check_community_voice(user)
-
-        elif isinstance(content_object, Content):
-            user = content_object.uploaded_by
-            if not user:
-                return
-            # Check Content Curator (first highly rated content)
-            if instance.vote_count >= 10:
-                rules.check_first_highly_rated_content(user, content_object)
-            # Check Creator (3 contents with 5+ votes)
-            rules.check_content_creator(user)
+        engine.mark_vote_count_changed(instance.pk)
     except Exception as e:
         log_error(e, f"Error in check_vote_count_badges", None)
 
@@ -117,13 +84,7 @@ def check_knowledge_path_creation_badge(sender, instance, created, **kwargs):
             return
 
         knowledge_path = instance.knowledge_path
-        user = knowledge_path.author
-        if not user:
-            return
-
-        # Check if this KnowledgePath now has 2+ nodes
-        if knowledge_path.nodes.count() >= 2:
-            rules.check_first_knowledge_path_created(user, knowledge_path)
+        engine.mark_dirty(knowledge_path.author_id, 'first_knowledge_path_created', knowledge_path.id)
     except Exception as e:
         log_error(e, f"Error in check_knowledge_path_creation_badge", None)
 
@@ -132,7 +93,7 @@ def check_knowledge_path_creation_badge(sender, instance, created, **kwargs):
 def check_quiz_badges(sender, instance, created, **kwargs):
     """
     Check badges when a quiz attempt scores 100:
-    - Quiz Master: 5 quizzes with perfect score
+    - Quiz Master: 5 quizzes with perfect score (deferred)
 
     Also notifies the knowledge-path author when a perfect score is what
     finishes the path (all nodes were already marked complete).
@@ -142,7 +103,7 @@ def check_quiz_badges(sender, instance, created, **kwargs):
             return
 
         user = instance.user
-        rules.check_quiz_master(user)
+        engine.mark_dirty(user.id, 'quiz_master')
 
         quiz = instance.quiz
         node = getattr(quiz, 'node', None)
@@ -152,4 +113,9 @@ def check_quiz_badges(sender, instance, created, **kwargs):
             )
             notify_if_knowledge_path_completed(user, node.knowledge_path)
     except Exception as e:
-        log_error(e, f"Error in check_quiz_badges for user {instance.user.id}", instance.user.id)
\ No newline at end of file
+        log_error(e, f"Error in check_quiz_badges for user {instance.user.id}", instance.user.id)
+
+
+@receiver(post_delete, sender='gamification.UserBadge')
+def forget_deleted_badge(sender, instance, **kwargs):
+    engine.forget_awarded(instance.user_id)
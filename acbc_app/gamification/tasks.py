@@ -0,0 +1,10 @@
+"""Background job handlers for badge checks (see jobs.queue)."""
+from jobs.registry import job_task
+
+from . import engine
+
+
+@job_task('gamification.evaluate_badges', queue='badges')
+def evaluate_badges(pairs=(), vote_counts=()):
+    """One committed transaction's badge marks (gamification.engine)."""
+    engine.evaluate(pairs=[tuple(pair) for pair in pairs], vote_counts=vote_counts)
@@ -9,20 +9,25 @@ Tests cover:
 - Serializers
 """
 
-from django.test import TestCase, TransactionTestCase
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
 from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
 
 from .models import Badge, UserBadge, BadgeCategory
-from . import rules
+from . import engine, rules
 from profiles.models import Profile, UserNodeCompletion
 from comments.models import Comment
 from content.models import Content, Topic
 from knowledge_paths.models import KnowledgePath, Node
 from votes.models import VoteCount, Vote
 from quizzes.models import Quiz, UserQuizAttempt
+from jobs.models import Job
+from jobs.worker import drain
 
 
 class BadgeModelTests(TestCase):
@@ -1297,6 +1302,79 @@ class BadgeSignalsTests(TransactionTestCase):
         self.assertFalse(rules.has_badge(self.user, 'quiz_master'))
 
 
+@override_settings(JOBS_EAGER=False)
+class BadgeEngineTests(TestCase):
+    """Deferred, coalesced evaluation (gamification.engine)"""
+
+    def setUp(self):
+        engine.reset_awarded_cache()
+        engine.reset_rule_timings()
+        self.user = User.objects.create_user(username='engineuser', password='testpass123')
+        self.creator = User.objects.create_user(username='topiccreator', password='testpass123')
+        for code, points in (('first_comment', 10), ('first_highly_rated_comment', 30), ('community_voice', 45)):
+            Badge.objects.create(code=code, name=code, description=code, points_value=points)
+        self.content = Content.objects.create(uploaded_by=self.creator, media_type='TEXT', original_title='C')
+        self.topic = Topic.objects.create(title='Topic', creator=self.creator)
+        self.comment_ct = ContentType.objects.get_for_model(Comment)
+
+    def _comment(self):
+        return Comment.objects.create(
+            author=self.user,
+            body='Comment',
+            content_type=ContentType.objects.get_for_model(Content),
+            object_id=self.content.id,
+        )
+
+    def test_marks_in_one_transaction_become_one_job(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            comment = self._comment()
+            self._comment()
+            vote_count = VoteCount.objects.create(
+                content_type=self.comment_ct, object_id=comment.id, topic=self.topic, vote_count=5,
+            )
+            vote_count.save()
+            self.assertFalse(rules.has_badge(self.user, 'first_comment'))
+
+        job = Job.objects.get(task='gamification.evaluate_badges')
+        self.assertEqual(job.kwargs['pairs'], [[self.user.id, 'first_comment', None]])
+        self.assertEqual(job.kwargs['vote_counts'], [vote_count.id])
+
+        drain(['badges'])
+        self.assertTrue(rules.has_badge(self.user, 'first_comment'))
+        self.assertTrue(rules.has_badge(self.user, 'first_highly_rated_comment'))
+        self.assertEqual(engine.rule_timings()['first_comment']['awarded'], 1)
+
+    def test_already_awarded_badges_are_skipped(self):
+        rules.award_badge(self.user, 'first_comment')
+        with self.captureOnCommitCallbacks(execute=True):
+            engine.mark_dirty(self.user.id, 'first_comment')
+        self.assertFalse(Job.objects.exists())
+
+        engine.evaluate(pairs=[(self.user.id, 'first_comment', None)])
+        timing = engine.rule_timings()['first_comment']
+        self.assertEqual(timing['skipped'], 1)
+        self.assertEqual(timing['evaluations'], 0)
+
+    def test_expand_vote_counts(self):
+        comment = self._comment()
+        vote_count = VoteCount.objects.create(
+            content_type=self.comment_ct, object_id=comment.id, topic=self.topic, vote_count=5,
+        )
+        self.assertEqual(engine.expand_vote_counts([vote_count.id]), {
+            (self.creator.id, 'topic_curator', self.topic.id),
+            (self.creator.id, 'topic_architect', self.topic.id),
+            (self.user.id, 'first_highly_rated_comment', comment.id),
+            (self.user.id, 'community_voice', None),
+        })
+
+    def test_evaluate_badges_command(self):
+        self._comment()
+        out = StringIO()
+        call_command('evaluate_badges', user_ids=[self.user.id], stdout=out)
+        self.assertTrue(rules.has_badge(self.user, 'first_comment'))
+        self.assertIn('first_comment', out.getvalue())
+
+
 class BadgeAPITests(APITestCase):
     """Test suite for badge API endpoints"""
 
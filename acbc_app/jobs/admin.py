@@ -0,0 +1,32 @@
+from django.contrib import admin, messages
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from jobs.models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'task', 'queue', 'status', 'priority', 'attempts', 'max_attempts', 'run_after', 'finished_at']
+    list_filter = ['status', 'queue', 'task']
+    search_fields = ['task', 'idempotency_key', 'last_error']
+    readonly_fields = ['attempts', 'locked_by', 'locked_at', 'last_error', 'created_at', 'updated_at', 'finished_at']
+    ordering = ['-id']
+    actions = ['retry_jobs']
+
+    @admin.action(description='Retry selected failed jobs now')
+    def retry_jobs(self, request, queryset):
+        retried = 0
+        for job in queryset.filter(status=Job.STATUS_FAILED):
+            job.status = Job.STATUS_QUEUED
+            job.attempts = 0
+            job.run_after = timezone.now()
+            job.finished_at = None
+            try:
+                with transaction.atomic():
+                    job.save(update_fields=['status', 'attempts', 'run_after', 'finished_at', 'updated_at'])
+            except IntegrityError:
+                # Another job with the same idempotency key is already queued.
+                continue
+            retried += 1
+        self.message_user(request, f'{retried} job(s) requeued.', messages.SUCCESS)
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.worker import Worker, configured_queues
+
+
+class Command(BaseCommand):
+    help = (
+        'Run background jobs (thumbnails, notifications, badges, admin emails, anchor '
+        'refreshes) from the database queue. Concurrency per queue comes from JOBS_QUEUES.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--queues',
+            default='',
+            help='Comma-separated queues, optionally queue=concurrency (default: all in JOBS_QUEUES).',
+        )
+        parser.add_argument(
+            '--burst',
+            action='store_true',
+            help='Exit once every queue is empty instead of polling.',
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=None,
+            help='Seconds between polls of an empty queue (default: JOBS_POLL_INTERVAL).',
+        )
+
+    def handle(self, *args, **options):
+        configured = configured_queues()
+        queues = {}
+        for item in filter(None, (part.strip() for part in options['queues'].split(','))):
+            name, _, concurrency = item.partition('=')
+            try:
+                queues[name] = int(concurrency) if concurrency else configured.get(name, 1)
+            except ValueError:
+                raise CommandError(f'Invalid concurrency in "{item}".')
+        worker = Worker(queues or configured, burst=options['burst'], poll_interval=options['sleep'])
+        self.stdout.write(f'Worker {worker.name} on {worker.queues}')
+        processed = worker.run()
+        self.stdout.write(self.style.SUCCESS(f'Processed {processed} job(s).'))
@@ -0,0 +1,64 @@
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    One unit of deferred work for the database-backed queue (see jobs.queue).
+
+    A worker (`python manage.py run_worker`) claims queued rows whose run_after has
+    passed, highest priority first, and calls the handler registered under task
+    with kwargs. Failed attempts are retried with exponential backoff until
+    max_attempts, then the job stays 'failed' for inspection in the admin.
+    """
+
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_SUCCEEDED, 'Succeeded'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    task = models.CharField(max_length=200, help_text='Registered handler name, e.g. content.topic_thumbnail.')
+    queue = models.CharField(max_length=64, default='default')
+    kwargs = models.JSONField(default=dict, blank=True)
+    priority = models.SmallIntegerField(default=0, help_text='Higher runs first.')
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    idempotency_key = models.CharField(
+        max_length=255,
+        blank=True,
+        null=True,
+        help_text='At most one queued job per key; enqueueing again returns the queued one.',
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['status', 'queue', '-priority', 'run_after'],
+                name='jobs_job_claim_idx',
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['idempotency_key'],
+                condition=Q(status='queued'),
+                name='jobs_job_queued_key_uniq',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.task} #{self.pk} ({self.status})"
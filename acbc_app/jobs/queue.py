@@ -0,0 +1,189 @@
+"""
+Database-backed job queue: enqueue side effects from requests, run them in a worker.
+
+    from jobs.queue import enqueue_on_commit
+    enqueue_on_commit('content.topic_thumbnail', topic_id=topic.pk,
+                      idempotency_key=f'topic-thumbnail:{topic.pk}')
+
+- enqueue_on_commit() inserts the job after the surrounding transaction commits, so
+  the worker never sees a job for rows that were rolled back.
+- idempotency_key: while a job with that key is still queued, enqueueing again
+  returns it instead of adding a duplicate (a partial unique constraint backs this).
+- Handlers are registered with jobs.registry.job_task in <app>/tasks.py; each
+  declares its default queue and priority.
+- With JOBS_EAGER (tests, single-process development) handlers run inline instead;
+  failures are logged, never raised, like the best-effort code they replace.
+
+Workers (`python manage.py run_worker`) claim jobs with SELECT ... FOR UPDATE SKIP
+LOCKED where the database supports it and a conditional UPDATE otherwise, so several
+worker processes can share a queue.
+"""
+import logging
+import os
+import socket
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.registry import get_task
+
+logger = logging.getLogger('academia_blockchain.jobs')
+
+DEFAULT_MAX_ATTEMPTS = 5
+_ENQUEUE_OPTIONS = {'queue', 'priority', 'idempotency_key', 'run_after', 'max_attempts'}
+
+
+def jobs_eager():
+    return bool(getattr(settings, 'JOBS_EAGER', False))
+
+
+def _run_eager(task, kwargs):
+    try:
+        get_task(task).func(**kwargs)
+    except Exception:
+        logger.exception('Eager job %s failed kwargs=%s', task, kwargs)
+
+
+def enqueue(task, *, queue=None, priority=None, idempotency_key=None, run_after=None,
+            max_attempts=None, **kwargs):
+    """Insert a job now (or run it inline under JOBS_EAGER). Returns the Job, or None when eager."""
+    spec = get_task(task)
+    if jobs_eager():
+        _run_eager(task, kwargs)
+        return None
+
+    fields = {
+        'task': task,
+        'queue': queue or spec.queue,
+        'priority': spec.priority if priority is None else priority,
+        'kwargs': kwargs,
+        'idempotency_key': idempotency_key or None,
+        'run_after': run_after or timezone.now(),
+        'max_attempts': (
+            max_attempts or spec.max_attempts
+            or getattr(settings, 'JOBS_MAX_ATTEMPTS', DEFAULT_MAX_ATTEMPTS)
+        ),
+    }
+    if not idempotency_key:
+        return Job.objects.create(**fields)
+    try:
+        with transaction.atomic():
+            return Job.objects.create(**fields)
+    except IntegrityError:
+        existing = Job.objects.filter(idempotency_key=idempotency_key, status=Job.STATUS_QUEUED).first()
+        if existing is None:
+            # The queued job was claimed in between; this one is still needed.
+            return Job.objects.create(**fields)
+        return existing
+
+
+def enqueue_on_commit(task, **options):
+    """enqueue() once the current transaction commits (immediately outside one)."""
+    get_task(task)  # Fail fast on typos, inside the request.
+    if jobs_eager():
+        _run_eager(task, {k: v for k, v in options.items() if k not in _ENQUEUE_OPTIONS})
+        return
+    transaction.on_commit(lambda: enqueue(task, **options))
+
+
+def worker_name():
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def claim_job(queues, worker=None):
+    """Lock and mark running the next due job in queues; None when there is none."""
+    now = timezone.now()
+    candidates = (
+        Job.objects.filter(status=Job.STATUS_QUEUED, queue__in=queues, run_after__lte=now)
+        .order_by('-priority', 'run_after', 'id')
+    )
+    skip_locked = connection.features.has_select_for_update_skip_locked
+    with transaction.atomic():
+        if skip_locked:
+            candidates = candidates.select_for_update(skip_locked=True)
+        for job_id in candidates.values_list('id', flat=True)[:5]:
+            claimed = Job.objects.filter(pk=job_id, status=Job.STATUS_QUEUED).update(
+                status=Job.STATUS_RUNNING,
+                locked_by=worker or worker_name(),
+                locked_at=now,
+                attempts=F('attempts') + 1,
+                updated_at=now,
+            )
+            if claimed:
+                return Job.objects.get(pk=job_id)
+    return None
+
+
+def retry_delay(attempts):
+    """Exponential backoff: JOBS_RETRY_BACKOFF * 2**(attempts-1), capped at JOBS_RETRY_BACKOFF_MAX."""
+    base = float(getattr(settings, 'JOBS_RETRY_BACKOFF', 10))
+    cap = float(getattr(settings, 'JOBS_RETRY_BACKOFF_MAX', 3600))
+    return timedelta(seconds=min(cap, base * (2 ** max(0, attempts - 1))))
+
+
+def run_job(job):
+    """Run a claimed job and record the outcome. Returns True on success."""
+    try:
+        get_task(job.task).func(**(job.kwargs or {}))
+    except Exception:
+        error = traceback.format_exc()
+        now = timezone.now()
+        if job.attempts < job.max_attempts:
+            job.status = Job.STATUS_QUEUED
+            job.run_after = now + retry_delay(job.attempts)
+            logger.warning('Job %s %s failed (attempt %s/%s); retrying at %s',
+                           job.pk, job.task, job.attempts, job.max_attempts, job.run_after)
+        else:
+            job.status = Job.STATUS_FAILED
+            job.finished_at = now
+            logger.error('Job %s %s failed permanently after %s attempts',
+                         job.pk, job.task, job.attempts)
+        job.last_error = error[-4000:]
+        job.locked_by = ''
+        job.locked_at = None
+        try:
+            job.save(update_fields=['status', 'run_after', 'finished_at', 'last_error',
+                                    'locked_by', 'locked_at', 'updated_at'])
+        except IntegrityError:
+            # A newer job with the same idempotency key is already queued; it covers this retry.
+            Job.objects.filter(pk=job.pk).update(
+                status=Job.STATUS_SUCCEEDED, finished_at=now, last_error=job.last_error,
+                locked_by='', locked_at=None,
+            )
+        return False
+
+    job.status = Job.STATUS_SUCCEEDED
+    job.finished_at = timezone.now()
+    job.locked_by = ''
+    job.locked_at = None
+    job.last_error = ''
+    job.save(update_fields=['status', 'finished_at', 'locked_by', 'locked_at', 'last_error', 'updated_at'])
+    return True
+
+
+def requeue_stale_jobs(queues=None):
+    """Put back jobs left 'running' longer than JOBS_LOCK_TIMEOUT (crashed worker). Returns count."""
+    timeout = int(getattr(settings, 'JOBS_LOCK_TIMEOUT', 600))
+    stale = Job.objects.filter(
+        status=Job.STATUS_RUNNING,
+        locked_at__lt=timezone.now() - timedelta(seconds=timeout),
+    )
+    if queues:
+        stale = stale.filter(queue__in=queues)
+    requeued = 0
+    for job in stale:
+        job.status = Job.STATUS_QUEUED if job.attempts < job.max_attempts else Job.STATUS_FAILED
+        job.locked_by = ''
+        job.locked_at = None
+        job.last_error = 'Worker lock expired.'
+        try:
+            job.save(update_fields=['status', 'locked_by', 'locked_at', 'last_error', 'updated_at'])
+        except IntegrityError:
+            Job.objects.filter(pk=job.pk).update(status=Job.STATUS_SUCCEEDED, finished_at=timezone.now())
+        requeued += 1
+    return requeued
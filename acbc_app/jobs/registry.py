@@ -0,0 +1,38 @@
+"""Job handler registry: @job_task('app.name', queue=..., priority=...) on a function of kwargs."""
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+@dataclass(frozen=True)
+class TaskSpec:
+    name: str
+    func: Callable
+    queue: str = 'default'
+    priority: int = 0
+    max_attempts: Optional[int] = None
+
+
+_TASKS: dict[str, TaskSpec] = {}
+
+
+class UnknownTask(LookupError):
+    """No handler is registered under this name."""
+
+
+def job_task(name, *, queue='default', priority=0, max_attempts=None):
+    """Register func as the handler for jobs named name; kwargs must be JSON-serializable."""
+    def decorator(func):
+        _TASKS[name] = TaskSpec(name, func, queue, priority, max_attempts)
+        return func
+    return decorator
+
+
+def get_task(name) -> TaskSpec:
+    try:
+        return _TASKS[name]
+    except KeyError:
+        raise UnknownTask(name) from None
+
+
+def registered_tasks() -> dict[str, TaskSpec]:
+    return dict(_TASKS)
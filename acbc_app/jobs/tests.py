@@ -0,0 +1,140 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.queue import claim_job, enqueue, enqueue_on_commit, requeue_stale_jobs, retry_delay, run_job
+from jobs.registry import UnknownTask, job_task
+from jobs.worker import drain
+
+CALLS = []
+
+
+@job_task('jobs.tests.record', queue='tests')
+def record(value):
+    CALLS.append(value)
+
+
+@job_task('jobs.tests.fail', queue='tests', max_attempts=2)
+def fail():
+    raise RuntimeError('boom')
+
+
+@override_settings(JOBS_EAGER=False, JOBS_RETRY_BACKOFF=10, JOBS_RETRY_BACKOFF_MAX=3600)
+class JobQueueTests(TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def test_enqueue_uses_task_defaults(self):
+        job = enqueue('jobs.tests.record', value=1)
+        self.assertEqual(job.queue, 'tests')
+        self.assertEqual(job.status, Job.STATUS_QUEUED)
+        self.assertEqual(job.kwargs, {'value': 1})
+
+    def test_unknown_task_raises(self):
+        with self.assertRaises(UnknownTask):
+            enqueue('jobs.tests.missing')
+
+    def test_idempotency_key_returns_queued_job(self):
+        first = enqueue('jobs.tests.record', value=1, idempotency_key='k')
+        second = enqueue('jobs.tests.record', value=2, idempotency_key='k')
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(Job.objects.count(), 1)
+
+        # Once the job has run, the same key queues new work.
+        run_job(claim_job(['tests']))
+        third = enqueue('jobs.tests.record', value=3, idempotency_key='k')
+        self.assertNotEqual(third.pk, first.pk)
+
+    def test_claim_orders_by_priority_and_skips_future_jobs(self):
+        low = enqueue('jobs.tests.record', value='low')
+        high = enqueue('jobs.tests.record', value='high', priority=5)
+        enqueue('jobs.tests.record', value='later', run_after=timezone.now() + timedelta(hours=1))
+
+        self.assertEqual(claim_job(['tests']).pk, high.pk)
+        self.assertEqual(claim_job(['tests']).pk, low.pk)
+        self.assertIsNone(claim_job(['tests']))
+        self.assertIsNone(claim_job(['default']))
+
+    def test_run_job_success(self):
+        enqueue('jobs.tests.record', value=7)
+        job = claim_job(['tests'])
+        self.assertEqual(job.status, Job.STATUS_RUNNING)
+        self.assertEqual(job.attempts, 1)
+
+        self.assertTrue(run_job(job))
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.STATUS_SUCCEEDED)
+        self.assertIsNotNone(job.finished_at)
+        self.assertEqual(CALLS, [7])
+
+    def test_failure_retries_with_backoff_then_fails(self):
+        enqueue('jobs.tests.fail')
+        job = claim_job(['tests'])
+        before = timezone.now()
+        self.assertFalse(run_job(job))
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.STATUS_QUEUED)
+        self.assertGreaterEqual(job.run_after, before + timedelta(seconds=10))
+        self.assertIn('boom', job.last_error)
+
+        Job.objects.filter(pk=job.pk).update(run_after=timezone.now())
+        job = claim_job(['tests'])
+        self.assertFalse(run_job(job))
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.STATUS_FAILED)
+        self.assertEqual(job.attempts, 2)
+
+    def test_retry_delay_is_exponential_and_capped(self):
+        self.assertEqual(retry_delay(1), timedelta(seconds=10))
+        self.assertEqual(retry_delay(3), timedelta(seconds=40))
+        self.assertEqual(retry_delay(20), timedelta(seconds=3600))
+
+    def test_enqueue_on_commit_waits_for_commit(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            enqueue_on_commit('jobs.tests.record', value=1)
+            self.assertEqual(Job.objects.count(), 0)
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_requeue_stale_running_jobs(self):
+        enqueue('jobs.tests.record', value=1)
+        job = claim_job(['tests'])
+        Job.objects.filter(pk=job.pk).update(locked_at=timezone.now() - timedelta(hours=1))
+
+        self.assertEqual(requeue_stale_jobs(['tests']), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.STATUS_QUEUED)
+
+    def test_drain_runs_due_jobs(self):
+        for value in range(3):
+            enqueue('jobs.tests.record', value=value)
+        self.assertEqual(drain(['tests'], limit=1), 1)
+        self.assertEqual(drain(['tests']), 2)
+        self.assertEqual(sorted(CALLS), [0, 1, 2])
+
+    @override_settings(JOBS_QUEUES={'default': 2, 'media': 1})
+    @patch('jobs.management.commands.run_worker.Worker')
+    def test_run_worker_queue_option(self, mock_worker):
+        mock_worker.return_value.run.return_value = 0
+        call_command('run_worker', queues='media,tests=3', burst=True, stdout=StringIO())
+        args, kwargs = mock_worker.call_args
+        self.assertEqual(args[0], {'media': 1, 'tests': 3})
+        self.assertTrue(kwargs['burst'])
+
+
+class EagerJobTests(TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    @override_settings(JOBS_EAGER=True)
+    def test_eager_runs_inline_and_swallows_errors(self):
+        enqueue_on_commit('jobs.tests.record', value=1, idempotency_key='k')
+        enqueue('jobs.tests.fail')
+        self.assertEqual(CALLS, [1])
+        self.assertEqual(Job.objects.count(), 0)
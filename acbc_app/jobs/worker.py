@@ -0,0 +1,91 @@
+"""
+Job worker loop: one thread pool per queue, sized by JOBS_QUEUES (queue -> concurrency).
+
+Each thread claims and runs jobs from its queue until the queue is empty, then sleeps
+JOBS_POLL_INTERVAL seconds. In burst mode the worker stops once every queue is drained.
+"""
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+from jobs.queue import claim_job, requeue_stale_jobs, run_job, worker_name
+
+logger = logging.getLogger('academia_blockchain.jobs.worker')
+
+DEFAULT_QUEUES = {'default': 1}
+
+
+def configured_queues():
+    return dict(getattr(settings, 'JOBS_QUEUES', None) or DEFAULT_QUEUES)
+
+
+def drain(queues, worker=None, limit=None):
+    """Run due jobs from queues in this thread until none are left (or limit). Returns count run."""
+    ran = 0
+    while limit is None or ran < limit:
+        job = claim_job(queues, worker=worker)
+        if job is None:
+            break
+        run_job(job)
+        ran += 1
+    return ran
+
+
+class Worker:
+    def __init__(self, queues=None, *, burst=False, poll_interval=None):
+        self.queues = queues or configured_queues()
+        self.burst = burst
+        self.poll_interval = float(
+            getattr(settings, 'JOBS_POLL_INTERVAL', 2) if poll_interval is None else poll_interval
+        )
+        self.name = worker_name()
+        self.stopping = threading.Event()
+        self.processed = 0
+        self._count_lock = threading.Lock()
+
+    def _loop(self, queue, index):
+        worker = f'{self.name}:{queue}:{index}'
+        try:
+            while not self.stopping.is_set():
+                close_old_connections()
+                try:
+                    ran = drain([queue], worker=worker)
+                except Exception:
+                    logger.exception('Worker %s crashed claiming from %s', worker, queue)
+                    ran = 0
+                with self._count_lock:
+                    self.processed += ran
+                if self.burst and ran == 0:
+                    return
+                if ran == 0:
+                    self.stopping.wait(self.poll_interval)
+        finally:
+            connection.close()
+
+    def run(self):
+        requeued = requeue_stale_jobs(list(self.queues))
+        if requeued:
+            logger.warning('Requeued %s job(s) with expired worker locks', requeued)
+        threads = [
+            threading.Thread(target=self._loop, args=(queue, index), name=f'jobs-{queue}-{index}', daemon=True)
+            for queue, concurrency in self.queues.items()
+            for index in range(max(1, int(concurrency)))
+        ]
+        logger.info('Worker %s started: %s', self.name, self.queues)
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(timeout=1)
+        except KeyboardInterrupt:
+            self.stop()
+            for thread in threads:
+                thread.join()
+        return self.processed
+
+    def stop(self):
+        self.stopping.set()
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class KnowledgePathsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'knowledge_paths'
+
+    def ready(self):
+        from knowledge_paths.response_cache import connect_response_cache_signals
+
+        connect_response_cache_signals()
+        import knowledge_paths.signals  # noqa
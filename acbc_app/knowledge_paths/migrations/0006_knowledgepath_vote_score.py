@@ -0,0 +1,41 @@
+# Generated by Django 5.0 on 2026-10-17 01:13
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_vote_scores(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    KnowledgePath = apps.get_model('knowledge_paths', 'KnowledgePath')
+    VoteCount = apps.get_model('votes', 'VoteCount')
+    content_type = ContentType.objects.filter(app_label='knowledge_paths', model='knowledgepath').first()
+    if content_type is None:
+        return
+    totals = VoteCount.objects.filter(
+        content_type=content_type, object_id=OuterRef('pk'), topic__isnull=True,
+    ).order_by('pk').values('vote_count')[:1]
+    KnowledgePath.objects.update(vote_score=Coalesce(Subquery(totals, output_field=IntegerField()), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('knowledge_paths', '0005_sell_knowledge_paths'),
+        ('votes', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='knowledgepath',
+            name='vote_score',
+            field=models.IntegerField(default=0, help_text='Copy of the topic-less VoteCount total, kept in sync by knowledge_paths.signals.'),
+        ),
+        migrations.RunPython(backfill_vote_scores, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='knowledgepath',
+            index=models.Index(fields=['is_visible', '-vote_score', '-created_at', '-id'], name='kp_visible_vote_score_idx'),
+        ),
+    ]
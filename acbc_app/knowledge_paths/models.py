@@ -65,9 +65,20 @@ class KnowledgePath(models.Model):
         null=True,
         help_text="Price in USD. 0 or null means the path is free.",
     )
+    vote_score = models.IntegerField(
+        default=0,
+        help_text="Copy of the topic-less VoteCount total, kept in sync by knowledge_paths.signals.",
+    )
 
     class Meta:
         app_label = 'knowledge_paths'
+        indexes = [
+            # Public listing order (knowledge_paths.path_listing).
+            models.Index(
+                fields=['is_visible', '-vote_score', '-created_at', '-id'],
+                name='kp_visible_vote_score_idx',
+            ),
+        ]
 
     @property
     def is_paid_path(self):
@@ -76,13 +87,7 @@ class KnowledgePath(models.Model):
     @property
     def vote_count(self):
         """Get the current vote count"""
-        VoteCount = apps.get_model('votes', 'VoteCount')
-        content_type = ContentType.objects.get_for_model(self)
-        vote_count = VoteCount.objects.filter(
-            content_type=content_type,
-            object_id=self.id
-        ).first()
-        return vote_count.vote_count if vote_count else 0
+        return self.vote_score
 
     def get_user_vote(self, user):
         """Get the user's vote status"""
@@ -0,0 +1,86 @@
+"""
+Public knowledge path listing: ordered and paginated in SQL on the denormalized
+vote_score, with the requesting user's votes loaded for the current page only.
+
+Order is (-vote_score, -created_at, -id), served by kp_visible_vote_score_idx. The
+cursor holds those three values of the last path on the page, so page N costs the
+same as page 1. Numbered pages (?page=) stay available for the paginated grid.
+"""
+import base64
+import json
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+from knowledge_paths.models import KnowledgePath
+
+PATH_ORDERING = ('-vote_score', '-created_at', '-id')
+
+
+class InvalidPathCursor(ValueError):
+    """The cursor query parameter could not be decoded."""
+
+
+def visible_paths():
+    """Visible paths in listing order. Hidden paths stay hidden even to their authors."""
+    return KnowledgePath.objects.select_related('author').filter(is_visible=True).order_by(*PATH_ORDERING)
+
+
+def encode_path_cursor(path):
+    payload = [path.vote_score, path.created_at.isoformat(), path.pk]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_path_cursor(value):
+    try:
+        score, created_at, pk = json.loads(base64.urlsafe_b64decode(value.encode()))
+        created_at = parse_datetime(created_at)
+        if created_at is None:
+            raise ValueError('bad date')
+        return int(score), created_at, int(pk)
+    except (TypeError, ValueError, UnicodeError) as exc:
+        raise InvalidPathCursor(str(exc)) from exc
+
+
+def _after_cursor(cursor):
+    score, created_at, pk = cursor
+    return (
+        Q(vote_score__lt=score)
+        | Q(vote_score=score, created_at__lt=created_at)
+        | Q(vote_score=score, created_at=created_at, pk__lt=pk)
+    )
+
+
+def path_page(queryset, *, cursor=None, page_size):
+    """(paths, next_cursor) for one keyset page of queryset (already in PATH_ORDERING)."""
+    if cursor:
+        queryset = queryset.filter(_after_cursor(decode_path_cursor(cursor)))
+    paths = list(queryset[:page_size + 1])
+    next_cursor = encode_path_cursor(paths[page_size - 1]) if len(paths) > page_size else None
+    return paths[:page_size], next_cursor
+
+
+def attach_votes(paths, user):
+    """
+    Set _vote_count and _user_vote (read by KnowledgePathListSerializer) on a page of
+    paths: the count comes from vote_score, the user's votes from one query over the
+    page's ids.
+    """
+    paths = list(paths)
+    user_votes = {}
+    if paths and user is not None and user.is_authenticated:
+        from votes.models import Vote
+
+        user_votes = dict(
+            Vote.objects.filter(
+                content_type=ContentType.objects.get_for_model(KnowledgePath),
+                user_id=user.id,
+                object_id__in=[path.id for path in paths],
+                topic__isnull=True,
+            ).values_list('object_id', 'value')
+        )
+    for path in paths:
+        path._vote_count = path.vote_score
+        path._user_vote = user_votes.get(path.id, 0)
+    return paths
@@ -0,0 +1,48 @@
+"""Cache tag for the public knowledge path listing and the signals that bump it."""
+import logging
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import post_delete, post_save
+
+from utils.shared_cache import invalidate_tags_on_commit
+
+logger = logging.getLogger('academia_blockchain.knowledge_paths.response_cache')
+
+KNOWLEDGE_PATHS_TAG = 'knowledge_paths'
+
+
+def knowledge_path_changed(sender, instance, **kwargs):
+    """KnowledgePath or Node saved/deleted (nodes decide can_be_visible)."""
+    invalidate_tags_on_commit(KNOWLEDGE_PATHS_TAG)
+
+
+def vote_count_changed(sender, instance, **kwargs):
+    try:
+        from knowledge_paths.models import KnowledgePath
+
+        if instance.content_type_id == ContentType.objects.get_for_model(KnowledgePath).id:
+            invalidate_tags_on_commit(KNOWLEDGE_PATHS_TAG)
+    except Exception:
+        logger.exception('Failed to invalidate knowledge path cache on vote count change')
+
+
+def connect_response_cache_signals():
+    from knowledge_paths.models import KnowledgePath, Node
+    from votes.models import VoteCount
+
+    for signal, name in ((post_save, 'save'), (post_delete, 'delete')):
+        signal.connect(
+            knowledge_path_changed,
+            sender=KnowledgePath,
+            dispatch_uid=f'response_cache_knowledge_path_{name}',
+        )
+        signal.connect(
+            knowledge_path_changed,
+            sender=Node,
+            dispatch_uid=f'response_cache_knowledge_path_node_{name}',
+        )
+        signal.connect(
+            vote_count_changed,
+            sender=VoteCount,
+            dispatch_uid=f'response_cache_knowledge_path_vote_count_{name}',
+        )
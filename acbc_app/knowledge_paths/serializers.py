@@ -5,12 +5,12 @@ from content.models import FileDetails, ContentProfile
 from content.utils import build_media_url
 from content.image_utils import (
     validate_cover_image_size,
-    generate_knowledge_path_image_preview,
+    schedule_knowledge_path_image_preview,
     delete_knowledge_path_image_preview,
 )
 from profiles.models import UserNodeCompletion
 from knowledge_paths.services.access_service import get_user_purchase, user_has_path_access
-from knowledge_paths.services.node_user_activity_service import is_node_available_for_user, is_node_completed_by_user, get_knowledge_path_progress
+from knowledge_paths.services.progress_service import progress_for
 from quizzes.serializers import QuizSerializer
 
 
@@ -53,52 +53,55 @@ class NodeSerializer(serializers.ModelSerializer):
                  'club_schedule_locked', 'content_profile_id', 'quizzes']
         read_only_fields = ['id', 'order', 'content_profile_id', 'knowledge_path', 'media_type']
 
-    def get_is_available(self, obj):
+    def _progress(self, obj):
+        """The requesting user's PathProgress for obj's path, shared across the response."""
         request = self.context.get('request')
         if not request or not request.user.is_authenticated:
-            return False
-        return is_node_available_for_user(
-            obj,
+            return None
+        return progress_for(
+            self.context,
             request.user,
+            obj.knowledge_path,
             book_club=self.context.get('book_club'),
         )
 
+    def _node_progress(self, obj):
+        progress = self._progress(obj)
+        return progress.node(obj.id) if progress else None
+
+    def get_is_available(self, obj):
+        state = self._node_progress(obj)
+        return bool(state and state.is_available)
+
     def get_club_opens_at(self, obj):
-        club = self.context.get('book_club')
-        request = self.context.get('request')
-        if not club or not request or not request.user.is_authenticated:
+        state = self._node_progress(obj)
+        if not self.context.get('book_club') or state is None:
             return None
-        from book_clubs.services import is_node_released_for_club
-
-        _, opens_at = is_node_released_for_club(obj, club, request.user)
-        return opens_at
+        return state.opens_at
 
     def get_club_schedule_locked(self, obj):
-        club = self.context.get('book_club')
-        request = self.context.get('request')
-        if not club or not request or not request.user.is_authenticated:
+        state = self._node_progress(obj)
+        if not self.context.get('book_club') or state is None:
             return False
-        from book_clubs.services import is_node_released_for_club
-
-        released, _ = is_node_released_for_club(obj, club, request.user)
-        return not released
+        return not state.released
 
     def get_is_completed(self, obj):
-        request = self.context.get('request')
-        if not request or not request.user.is_authenticated:
-            return False
-        is_completed = is_node_completed_by_user(obj, request.user)
-        return is_completed
+        state = self._node_progress(obj)
+        return bool(state and state.is_completed)
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
-        request = self.context.get('request')
-        user = request.user if request else None
-        if not user_has_path_access(
-            user,
-            instance.knowledge_path,
-            book_club=self.context.get('book_club'),
-        ):
+        progress = self._progress(instance)
+        if progress is not None:
+            has_access = progress.has_access
+        else:
+            request = self.context.get('request')
+            has_access = user_has_path_access(
+                request.user if request else None,
+                instance.knowledge_path,
+                book_club=self.context.get('book_club'),
+            )
+        if not has_access:
             # Do not leak quiz answers or content IDs behind the paywall.
             data['quizzes'] = []
             data['content_profile_id'] = None
@@ -162,19 +165,12 @@ class KnowledgePathSerializer(serializers.ModelSerializer):
         if not request or not request.user.is_authenticated:
             return None
             
-        # Use the service function to get detailed progress
-        progress_data = get_knowledge_path_progress(
+        return progress_for(
+            self.context,
             request.user,
             obj,
             book_club=self.context.get('book_club'),
-        )
-        
-        return {
-            'completed_nodes': progress_data['completed_nodes'],
-            'total_nodes': progress_data['total_nodes'],
-            'percentage': progress_data['completion_percentage'],
-            'is_completed': progress_data['is_completed']
-        }
+        ).summary()
 
     def get_vote_count(self, obj):
         return obj.vote_count
@@ -237,7 +233,7 @@ class KnowledgePathCreateSerializer(serializers.ModelSerializer):
         instance = super().create(validated_data)
         instance.refresh_from_db()
         if instance.image:
-            generate_knowledge_path_image_preview(instance)
+            schedule_knowledge_path_image_preview(instance)
         return instance
 
     def update(self, instance, validated_data):
@@ -277,7 +273,7 @@ class KnowledgePathCreateSerializer(serializers.ModelSerializer):
         instance.save()
 
         if image_updated and instance.image:
-            generate_knowledge_path_image_preview(instance)
+            schedule_knowledge_path_image_preview(instance)
 
         return instance
 
@@ -375,7 +371,7 @@ class KnowledgePathListSerializer(serializers.ModelSerializer):
         return obj.can_be_visible()
 
     def get_vote_count(self, obj):
-        return getattr(obj, '_vote_count', 0)
+        return getattr(obj, '_vote_count', obj.vote_score)
 
     def get_user_vote(self, obj):
         request = self.context.get('request')
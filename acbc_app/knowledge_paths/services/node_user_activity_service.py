@@ -1,9 +1,7 @@
 from profiles.models import UserNodeCompletion
-from knowledge_paths.models import Node, KnowledgePath
-from knowledge_paths.services.access_service import user_has_path_access
 from quizzes.models import UserQuizAttempt
+from knowledge_paths.services.progress_service import PathProgress
 from django.utils import timezone
-from django.db.models import Count
 import logging
 from utils.notification_utils import notify_knowledge_path_completion
 
@@ -41,41 +39,9 @@ def is_node_available_for_user(node, user, book_club=None):
     Returns:
         bool: True if the node is available, False otherwise.
     """
-    # Staff managing a club can preview all missions. Path authors retain the
-    # existing unrestricted behavior outside a club context.
-    if book_club and book_club.user_can_manage(user):
-        return True
-    if book_club is None and node.knowledge_path.author == user:
-        return True
-
-    if not user_has_path_access(user, node.knowledge_path, book_club=book_club):
-        return False
-
-    if book_club:
-        from book_clubs.services import is_node_released_for_club
-
-        released, _ = is_node_released_for_club(node, book_club, user)
-        if not released:
-            return False
-
-    # Get the preceding node
-    preceding_node = node.get_preceding_node()
-
-    # If there is no preceding node, assume the current node is the first and is available
-    if preceding_node is None:
-        return True
-
-    # Check if the preceding node is completed
-    if not is_node_completed_by_user(preceding_node, user):
-        return False
-
-    # Check if all quizzes for the preceding node are completed
-    quizzes = preceding_node.quizzes.all()
-    for quiz in quizzes:
-        if not has_completed_quiz(user, quiz):
-            return False
-
-    return True
+    progress = PathProgress(user, node.knowledge_path, book_club=book_club)
+    state = progress.node(node.id)
+    return bool(state and state.is_available)
 
 
 def is_node_completed_by_user(node, user):
@@ -130,29 +96,7 @@ def is_knowledge_path_completed(user, knowledge_path):
     Returns:
         bool: True if the path is completed, False otherwise
     """
-    # Get all nodes in the path
-    total_nodes = knowledge_path.nodes.count()
-    if total_nodes == 0:
-        return False
-    
-    # Get completed nodes
-    completed_nodes = UserNodeCompletion.objects.filter(
-        user=user,
-        knowledge_path=knowledge_path,
-        is_completed=True
-    ).count()
-
-    # If not all nodes are completed, return False early
-    if completed_nodes != total_nodes:
-        return False
-
-    # Check all quizzes in the path
-    for node in knowledge_path.nodes.all():
-        quiz = node.quizzes.first()
-        if quiz and not has_completed_quiz(user, quiz):
-            return False
-
-    return True
+    return PathProgress(user, knowledge_path).is_completed
 
 
 def notify_if_knowledge_path_completed(user, knowledge_path):
@@ -189,60 +133,4 @@ def get_knowledge_path_progress(user, knowledge_path, book_club=None):
             - nodes_progress: List of node progress details
             - is_completed: Whether the entire path is completed
     """
-    nodes = knowledge_path.nodes.all().order_by('order')
-    total_nodes = nodes.count()
-    
-    # Get all completed nodes for this user and path
-    completed_nodes = UserNodeCompletion.objects.filter(
-        user=user,
-        knowledge_path=knowledge_path,
-        is_completed=True
-    ).count()
-
-    # Get detailed progress for each node
-    nodes_progress = []
-    for node in nodes:
-        quiz = node.quizzes.first()
-        node_data = {
-            'node_id': node.id,
-            'title': node.title,
-            'is_completed': is_node_completed_by_user(node, user),
-            'is_available': is_node_available_for_user(node, user, book_club=book_club),
-            'order': node.order
-        }
-        if book_club:
-            from book_clubs.services import is_node_released_for_club
-
-            released, opens_at = is_node_released_for_club(node, book_club, user)
-            node_data.update({
-                'club_schedule_locked': not released,
-                'club_opens_at': opens_at,
-            })
-        
-        if quiz:
-            best_attempt = UserQuizAttempt.objects.filter(
-                user=user,
-                quiz=quiz
-            ).order_by('-score').first()
-            
-            node_data.update({
-                'has_quiz': True,
-                'quiz_title': quiz.title,
-                'best_score': best_attempt.score if best_attempt else 0,
-                'quiz_passed': has_completed_quiz(user, quiz)
-            })
-        else:
-            node_data.update({
-                'has_quiz': False,
-                'quiz_passed': True  # Nodes without quizzes are considered "passed"
-            })
-            
-        nodes_progress.append(node_data)
-
-    return {
-        'total_nodes': total_nodes,
-        'completed_nodes': completed_nodes,
-        'completion_percentage': (completed_nodes / total_nodes * 100) if total_nodes > 0 else 0,
-        'nodes_progress': nodes_progress,
-        'is_completed': is_knowledge_path_completed(user, knowledge_path)
-    } 
\ No newline at end of file
+    return PathProgress(user, knowledge_path, book_club=book_club).as_dict()
@@ -0,0 +1,240 @@
+"""
+Knowledge path progress for one user in a fixed number of queries.
+
+PathProgress loads the path's nodes, the user's completions, the nodes' quizzes and
+the user's best attempt per quiz (one query each, plus the paid-access check and, in
+a book club, the club's release calendar), then works out completion, quiz status,
+club release and availability for every node in one pass in node order.
+
+get_knowledge_path_progress, NodeSerializer, QuizSerializer and the book club hub
+all read from it; progress_for() shares one instance per serializer context so a
+path detail response computes progress once, not once per node.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+from knowledge_paths.services.access_service import user_has_path_access
+from profiles.models import UserNodeCompletion
+from quizzes.models import Quiz, UserQuizAttempt
+
+PASSING_SCORE = 100
+
+
+@dataclass
+class NodeProgress:
+    node: object
+    is_completed: bool
+    is_available: bool
+    released: bool = True
+    opens_at: Optional[datetime] = None
+    quiz: Optional[Quiz] = None  # first quiz of the node, if any
+    best_score: int = 0
+    quiz_passed: bool = True  # all quizzes of the node passed (nodes without quizzes pass)
+
+
+def _is_authenticated(user):
+    return user is not None and getattr(user, 'is_authenticated', False)
+
+
+class PathProgress:
+    """One user's progress through one knowledge path (optionally inside a book club)."""
+
+    def __init__(self, user, knowledge_path, book_club=None):
+        self.user = user
+        self.knowledge_path = knowledge_path
+        self.book_club = book_club
+        self.nodes = list(knowledge_path.nodes.order_by('order'))
+        self._load()
+        self._states = {}
+        self._now = timezone.now()
+        self._walk()
+
+    def _load(self):
+        node_ids = [node.id for node in self.nodes]
+        authenticated = _is_authenticated(self.user)
+
+        self.completed_ids = set()
+        if authenticated:
+            self.completed_ids = set(
+                UserNodeCompletion.objects.filter(
+                    user=self.user,
+                    knowledge_path=self.knowledge_path,
+                    is_completed=True,
+                ).values_list('node_id', flat=True)
+            )
+
+        self.quizzes_by_node = {}
+        for quiz in Quiz.objects.filter(node_id__in=node_ids).order_by('id'):
+            self.quizzes_by_node.setdefault(quiz.node_id, []).append(quiz)
+
+        self.best_scores = {}
+        self.passed_quiz_ids = set()
+        quiz_ids = [quiz.id for quizzes in self.quizzes_by_node.values() for quiz in quizzes]
+        if authenticated and quiz_ids:
+            attempts = (
+                UserQuizAttempt.objects.filter(user=self.user, quiz_id__in=quiz_ids)
+                .values('quiz_id')
+                .annotate(best=Max('score'), perfect=Count('id', filter=Q(score=PASSING_SCORE)))
+            )
+            for row in attempts:
+                self.best_scores[row['quiz_id']] = row['best'] or 0
+                if row['perfect']:
+                    self.passed_quiz_ids.add(row['quiz_id'])
+
+        self.calendar = None
+        if self.book_club is not None and not self.manages_club:
+            from book_clubs.services import ReleaseCalendar
+
+            self.calendar = ReleaseCalendar(self.book_club, node_ids=node_ids)
+
+    @property
+    def manages_club(self):
+        return self.book_club is not None and self.book_club.user_can_manage(self.user)
+
+    @property
+    def is_author(self):
+        return _is_authenticated(self.user) and self.knowledge_path.author_id == self.user.id
+
+    @property
+    def has_access(self):
+        if not hasattr(self, '_has_access'):
+            self._has_access = user_has_path_access(self.user, self.knowledge_path, book_club=self.book_club)
+        return self._has_access
+
+    def _release(self, node, preceding):
+        """(released, opens_at), as book_clubs.services.is_node_released_for_club."""
+        if self.calendar is None:
+            return True, None
+        return self.calendar.release(node.id, is_first=preceding is None, now=self._now)
+
+    def _walk(self):
+        unrestricted = self.manages_club or (self.book_club is None and self.is_author)
+        preceding = None
+        for node in self.nodes:
+            quizzes = self.quizzes_by_node.get(node.id, [])
+            released, opens_at = self._release(node, preceding)
+            if unrestricted:
+                available = True
+            elif not self.has_access or not released:
+                available = False
+            elif preceding is None:
+                available = True
+            else:
+                available = preceding.is_completed and preceding.quiz_passed
+
+            state = NodeProgress(
+                node=node,
+                is_completed=node.id in self.completed_ids,
+                is_available=available,
+                released=released,
+                opens_at=opens_at,
+                quiz=quizzes[0] if quizzes else None,
+                best_score=self.best_scores.get(quizzes[0].id, 0) if quizzes else 0,
+                quiz_passed=all(quiz.id in self.passed_quiz_ids for quiz in quizzes),
+            )
+            self._states[node.id] = state
+            preceding = state
+
+    def node(self, node_id):
+        """NodeProgress for node_id, or None if the node is not part of the loaded path."""
+        return self._states.get(node_id)
+
+    def quiz_passed(self, quiz_id):
+        return quiz_id in self.passed_quiz_ids
+
+    @property
+    def total_nodes(self):
+        return len(self.nodes)
+
+    @property
+    def completed_nodes(self):
+        return len(self.completed_ids & set(self._states))
+
+    @property
+    def percentage(self):
+        return (self.completed_nodes / self.total_nodes * 100) if self.total_nodes else 0
+
+    @property
+    def is_completed(self):
+        """All nodes completed and each node's first quiz passed."""
+        if not self.nodes:
+            return False
+        return all(
+            state.is_completed and (state.quiz is None or state.quiz.id in self.passed_quiz_ids)
+            for state in self._states.values()
+        )
+
+    def summary(self):
+        return {
+            'completed_nodes': self.completed_nodes,
+            'total_nodes': self.total_nodes,
+            'percentage': self.percentage,
+            'is_completed': self.is_completed,
+        }
+
+    def as_dict(self):
+        """The get_knowledge_path_progress() payload."""
+        nodes_progress = []
+        for node in self.nodes:
+            state = self._states[node.id]
+            node_data = {
+                'node_id': node.id,
+                'title': node.title,
+                'is_completed': state.is_completed,
+                'is_available': state.is_available,
+                'order': node.order,
+            }
+            if self.book_club:
+                node_data.update({
+                    'club_schedule_locked': not state.released,
+                    'club_opens_at': state.opens_at,
+                })
+            if state.quiz:
+                node_data.update({
+                    'has_quiz': True,
+                    'quiz_title': state.quiz.title,
+                    'best_score': state.best_score,
+                    'quiz_passed': state.quiz.id in self.passed_quiz_ids,
+                })
+            else:
+                node_data.update({
+                    'has_quiz': False,
+                    'quiz_passed': True,  # Nodes without quizzes are considered "passed"
+                })
+            nodes_progress.append(node_data)
+
+        return {
+            'total_nodes': self.total_nodes,
+            'completed_nodes': self.completed_nodes,
+            'completion_percentage': self.percentage,
+            'nodes_progress': nodes_progress,
+            'is_completed': self.is_completed,
+        }
+
+
+def _context_key(knowledge_path_id, user, book_club):
+    return knowledge_path_id, getattr(user, 'pk', None), getattr(book_club, 'pk', None)
+
+
+def progress_for(context, user, knowledge_path, book_club=None):
+    """PathProgress for (user, path, club), computed once per serializer context."""
+    if context is None:
+        return PathProgress(user, knowledge_path, book_club)
+    cache = context.setdefault('_path_progress', {})
+    key = _context_key(knowledge_path.pk, user, book_club)
+    if key not in cache:
+        cache[key] = PathProgress(user, knowledge_path, book_club)
+    return cache[key]
+
+
+def cached_progress(context, node_id, user):
+    """A PathProgress already computed in context that covers node_id for user, else None."""
+    user_id = getattr(user, 'pk', None)
+    for (_, progress_user_id, _), progress in (context or {}).get('_path_progress', {}).items():
+        if progress_user_id == user_id and progress.node(node_id) is not None:
+            return progress
+    return None
@@ -0,0 +1,54 @@
+"""
+Keep KnowledgePath.vote_score equal to the path's topic-less VoteCount.
+
+The public listing orders and keyset-paginates on vote_score in SQL, so it has to
+follow every VoteCount write: votes (votes.services.apply_vote_count_delta sends
+post_save after its atomic delta), recounts and deletes. Bulk repairs that skip
+signals call sync_knowledge_path_vote_scores() afterwards.
+"""
+import logging
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from knowledge_paths.models import KnowledgePath
+
+logger = logging.getLogger('academia_blockchain.knowledge_paths.signals')
+
+
+def _is_path_total(vote_count):
+    return (
+        vote_count.topic_id is None
+        and vote_count.content_type_id == ContentType.objects.get_for_model(KnowledgePath).id
+    )
+
+
+@receiver(post_save, sender='votes.VoteCount')
+def sync_vote_score_on_save(sender, instance, **kwargs):
+    if _is_path_total(instance):
+        KnowledgePath.objects.filter(pk=instance.object_id).update(vote_score=instance.vote_count)
+
+
+@receiver(post_delete, sender='votes.VoteCount')
+def sync_vote_score_on_delete(sender, instance, **kwargs):
+    if _is_path_total(instance):
+        KnowledgePath.objects.filter(pk=instance.object_id).update(vote_score=0)
+
+
+def sync_knowledge_path_vote_scores():
+    """Rewrite every vote_score from VoteCount with one UPDATE; returns the rows updated."""
+    from votes.models import VoteCount
+
+    totals = VoteCount.objects.filter(
+        content_type=ContentType.objects.get_for_model(KnowledgePath),
+        object_id=OuterRef('pk'),
+        topic__isnull=True,
+    ).order_by('pk').values('vote_count')[:1]
+    updated = KnowledgePath.objects.update(
+        vote_score=Coalesce(Subquery(totals, output_field=IntegerField()), 0),
+    )
+    logger.info('Knowledge path vote scores synced', extra={'paths': updated})
+    return updated
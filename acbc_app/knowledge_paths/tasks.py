@@ -0,0 +1,12 @@
+"""Background job handlers for the knowledge_paths app (see jobs.queue)."""
+from content.image_utils import generate_knowledge_path_image_preview
+from jobs.registry import job_task
+from knowledge_paths.models import KnowledgePath
+
+
+@job_task('knowledge_paths.image_preview', queue='media')
+def knowledge_path_image_preview(knowledge_path_id):
+    knowledge_path = KnowledgePath.objects.filter(pk=knowledge_path_id).first()
+    if knowledge_path is None or not knowledge_path.image:
+        return
+    generate_knowledge_path_image_preview(knowledge_path)
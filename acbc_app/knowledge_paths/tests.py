@@ -1,4 +1,8 @@
-from django.test import TestCase
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
@@ -6,7 +10,11 @@ from django.contrib.auth.models import User
 from knowledge_paths.models import KnowledgePath, Node
 from content.models import Content, ContentProfile
 from profiles.models import UserNodeCompletion
+from quizzes.models import Quiz, UserQuizAttempt
+from knowledge_paths.services.node_user_activity_service import get_knowledge_path_progress
 from django.utils import timezone
+from utils.shared_cache import reset_shared_cache
+from votes.models import VoteCount
 
 class KnowledgePathModelTests(TestCase):
     """Test suite for KnowledgePath model"""
@@ -145,6 +153,38 @@ class KnowledgePathAPITests(APITestCase):
         self.knowledge_path.refresh_from_db()
         self.assertEqual(self.knowledge_path.title, 'Updated Path')
 
+@override_settings(SHARED_CACHE_ENABLED=True)
+class KnowledgePathListCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        reset_shared_cache()
+        self.user = User.objects.create_user(username='kpcache', password='testpass123')
+        self.path = KnowledgePath.objects.create(title='Ruta', author=self.user, is_visible=True)
+        self.url = reverse('knowledge_paths:knowledge-path-list')
+
+    def test_anonymous_list_is_cached_until_paths_or_votes_change(self):
+        self.assertEqual(self.client.get(self.url).data['count'], 1)
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+        KnowledgePath.objects.create(title='Nueva', author=self.user, is_visible=True)
+        self.assertEqual(self.client.get(self.url).data['count'], 2)
+
+        VoteCount.objects.create(
+            content_type=ContentType.objects.get_for_model(KnowledgePath),
+            object_id=self.path.id,
+            vote_count=3,
+        )
+        first = self.client.get(self.url).data['results'][0]
+        self.assertEqual((first['id'], first['vote_count']), (self.path.id, 3))
+
+    def test_authenticated_list_is_not_shared(self):
+        self.client.get(self.url)
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self.client.get(self.url).data['results'][0]['user_vote'], 0)
+        self.assertGreater(len(self.client.get(self.url).data['results']), 0)
+
+
 class NodeAPITests(APITestCase):
     """Test suite for Node API endpoints"""
     
@@ -204,3 +244,127 @@ class NodeAPITests(APITestCase):
         ).first()
         self.assertIsNotNone(completion)
         self.assertIsNotNone(completion.completed_at)
+
+
+class KnowledgePathListOrderingTests(APITestCase):
+    """Listing ordered by the denormalized vote_score in SQL, with keyset pages."""
+
+    def setUp(self):
+        self.author = User.objects.create_user(username='kpauthor', password='pw')
+        self.voter = User.objects.create_user(username='kpvoter', password='pw')
+        self.url = reverse('knowledge_paths:knowledge-path-list')
+        self.paths = [
+            KnowledgePath.objects.create(title=f'Ruta {i}', author=self.author, is_visible=True)
+            for i in range(5)
+        ]
+
+    def _vote(self, user, path, action='upvote'):
+        self.client.force_authenticate(user=user)
+        response = self.client.post(
+            reverse('votes:knowledge-path-vote', args=[path.id]), {'action': action}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_votes_update_score_and_order(self):
+        self._vote(self.voter, self.paths[0])
+        self._vote(self.author, self.paths[0])
+        self._vote(self.voter, self.paths[2])
+        self.paths[0].refresh_from_db()
+        self.assertEqual(self.paths[0].vote_score, 2)
+
+        data = self.client.get(self.url).data
+        self.assertEqual([row['id'] for row in data['results'][:2]], [self.paths[0].id, self.paths[2].id])
+        self.assertEqual(data['results'][0]['user_vote'], 1)
+
+        self._vote(self.author, self.paths[0], 'remove')
+        self.paths[0].refresh_from_db()
+        self.assertEqual(self.paths[0].vote_score, 1)
+
+    def test_cursor_pages_cover_listing_once(self):
+        self._vote(self.voter, self.paths[3])
+        seen, cursor = [], ''
+        while True:
+            response = self.client.get(self.url, {'cursor': cursor, 'page_size': 2})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen += [row['id'] for row in response.data['results']]
+            cursor = response.data['next_cursor']
+            if not cursor:
+                break
+        expected = [self.paths[3].id] + [path.id for path in reversed(self.paths) if path is not self.paths[3]]
+        self.assertEqual(seen, expected)
+        self.assertEqual(self.client.get(self.url, {'cursor': 'nope'}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_page_query_count_does_not_grow_with_paths(self):
+        # Fill a whole page first: the list serializer still costs a few queries per row.
+        for i in range(10):
+            KnowledgePath.objects.create(title=f'Base {i}', author=self.author, is_visible=True)
+        self.client.force_authenticate(user=self.voter)
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(self.url)
+        for i in range(20):
+            KnowledgePath.objects.create(title=f'Extra {i}', author=self.author, is_visible=True)
+        with CaptureQueriesContext(connection) as large:
+            self.client.get(self.url)
+        self.assertEqual(len(large), len(small))
+
+
+class KnowledgePathProgressTests(TestCase):
+    """Progress engine: availability chain and constant query count."""
+
+    def setUp(self):
+        self.author = User.objects.create_user(username='author', password='pw')
+        self.learner = User.objects.create_user(username='learner', password='pw')
+        self.knowledge_path = KnowledgePath.objects.create(
+            title='Progress Path', description='d', author=self.author, is_visible=True
+        )
+
+    def _add_nodes(self, count, with_quiz=True):
+        nodes = []
+        for _ in range(count):
+            node = Node.objects.create(knowledge_path=self.knowledge_path, title='Node', media_type='TEXT')
+            if with_quiz:
+                Quiz.objects.create(node=node, title=f'Quiz {node.id}')
+            nodes.append(node)
+        return nodes
+
+    def _complete(self, node):
+        UserNodeCompletion.objects.create(
+            user=self.learner, knowledge_path=self.knowledge_path, node=node,
+            is_completed=True, completed_at=timezone.now(),
+        )
+
+    def test_next_node_requires_completion_and_passed_quiz(self):
+        first, second, third = self._add_nodes(3)
+        self._complete(first)
+        UserQuizAttempt.objects.create(user=self.learner, quiz=first.quizzes.get(), score=60)
+
+        progress = get_knowledge_path_progress(self.learner, self.knowledge_path)
+        availability = [node['is_available'] for node in progress['nodes_progress']]
+        self.assertEqual(availability, [True, False, False])
+        self.assertEqual(progress['nodes_progress'][0]['best_score'], 60)
+        self.assertFalse(progress['nodes_progress'][0]['quiz_passed'])
+
+        UserQuizAttempt.objects.create(user=self.learner, quiz=first.quizzes.get(), score=100)
+        progress = get_knowledge_path_progress(self.learner, self.knowledge_path)
+        availability = [node['is_available'] for node in progress['nodes_progress']]
+        self.assertEqual(availability, [True, True, False])
+        self.assertEqual(progress['completed_nodes'], 1)
+        self.assertFalse(progress['is_completed'])
+
+        for node in (second, third):
+            self._complete(node)
+            UserQuizAttempt.objects.create(user=self.learner, quiz=node.quizzes.get(), score=100)
+        self.assertTrue(get_knowledge_path_progress(self.learner, self.knowledge_path)['is_completed'])
+
+    def test_query_count_does_not_grow_with_nodes(self):
+        def count_queries():
+            with CaptureQueriesContext(connection) as queries:
+                get_knowledge_path_progress(self.learner, self.knowledge_path)
+            return len(queries)
+
+        for node in self._add_nodes(2):
+            self._complete(node)
+        small = count_queries()
+        for node in self._add_nodes(6):
+            self._complete(node)
+        self.assertEqual(count_queries(), small)
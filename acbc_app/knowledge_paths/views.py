@@ -21,16 +21,23 @@ from content.models import Content, ContentProfile
 from django.db import IntegrityError, transaction
 from django.db import models
 from django.utils import timezone
-from knowledge_paths.services.access_service import user_has_path_access
 from knowledge_paths.services.node_user_activity_service import mark_node_as_completed, get_knowledge_path_progress, is_node_available_for_user
+from knowledge_paths.services.progress_service import progress_for
 from payments.services import get_or_create_path_purchase
-from django.contrib.contenttypes.models import ContentType
 from django.db.models import Prefetch
-from votes.models import VoteCount, Vote
 from profiles.models import UserNodeCompletion
-from book_clubs.services import resolve_book_club_context, is_node_released_for_club
+from book_clubs.services import resolve_book_club_context
 import json
 import logging
+from knowledge_paths.path_listing import (
+    InvalidPathCursor,
+    attach_votes,
+    encode_path_cursor,
+    path_page,
+    visible_paths,
+)
+from knowledge_paths.response_cache import KNOWLEDGE_PATHS_TAG
+from utils.shared_cache import cached_response_data
 from utils.logging_utils import knowledge_paths_logger, log_error, log_business_event, log_performance_metric
 
 
@@ -99,70 +106,14 @@ class KnowledgePathListView(APIView):
                 'user_id': request.user.id if request.user.is_authenticated else None,
                 'is_authenticated': request.user.is_authenticated,
             })
-            
-            # Get the content type for KnowledgePath
-            content_type = ContentType.objects.get_for_model(KnowledgePath)
-            
-            # Get all vote counts in a single query
-            vote_counts = {
-                vc.object_id: vc.vote_count 
-                for vc in VoteCount.objects.filter(
-                    content_type=content_type
-                )
-            }
-            
-            # Get user votes in a single query only if user is authenticated
-            user_votes = {}
-            if request.user and request.user.is_authenticated:
-                user_votes = {
-                    v.object_id: v.value 
-                    for v in Vote.objects.filter(
-                        content_type=content_type,
-                        user_id=request.user.id
-                    )
-                }
-            
-            # Get knowledge paths and annotate with vote count.
-            # Only show visible paths to everyone - hidden paths should stay hidden even to authors.
-            #
-            # NOTE: We sort in Python by `_vote_count` (computed from VoteCount) before paginating,
-            # so the "top voted" items appear first.
-            knowledge_paths = list(
-                KnowledgePath.objects.select_related('author').filter(
-                    is_visible=True
-                ).order_by('-created_at')
-            )
-            
-            # Add vote data to each knowledge path
-            for path in knowledge_paths:
-                path._vote_count = vote_counts.get(path.id, 0)
-                path._user_vote = user_votes.get(path.id, 0)
 
-            # Sort by vote count (descending). Tie-break with creation date (newest first).
-            knowledge_paths.sort(
-                key=lambda p: (p._vote_count or 0, p.created_at),
-                reverse=True
+            # Anonymous visitors share one cached page (no user_vote to personalize).
+            data = cached_response_data(
+                request, lambda: self.build_page(request), tags=(KNOWLEDGE_PATHS_TAG,),
             )
-            
-            # Initialize paginator
-            paginator = self.pagination_class()
-            paginated_paths = paginator.paginate_queryset(knowledge_paths, request)
-            
-            # Serialize the paginated data with request context
-            serializer = KnowledgePathListSerializer(
-                paginated_paths, 
-                many=True, 
-                context={'request': request}
-            )
-            
-            knowledge_paths_logger.debug("Knowledge path list retrieved successfully", extra={
-                'user_id': request.user.id if request.user.is_authenticated else None,
-                'total_count': len(knowledge_paths),
-                'paginated_count': len(paginated_paths),
-            })
-            
-            # Return paginated response
-            return paginator.get_paginated_response(serializer.data)
+            return Response(data)
+        except InvalidPathCursor:
+            return Response({'error': 'Cursor inválido.'}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             log_error(e, "Error retrieving knowledge path list", request.user.id if request.user.is_authenticated else None)
             return Response(
@@ -170,6 +121,43 @@ class KnowledgePathListView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def build_page(self, request):
+        # Ordered by vote_score in SQL (knowledge_paths.path_listing); ?cursor= selects
+        # keyset pages, otherwise numbered pages as before.
+        paginator = self.pagination_class()
+        queryset = visible_paths()
+
+        if 'cursor' in request.query_params:
+            page_size = paginator.get_page_size(request)
+            paths, next_cursor = path_page(
+                queryset, cursor=request.query_params.get('cursor'), page_size=page_size,
+            )
+            serializer = KnowledgePathListSerializer(
+                attach_votes(paths, request.user), many=True, context={'request': request},
+            )
+            return {'results': serializer.data, 'next_cursor': next_cursor, 'page_size': page_size}
+
+        paginated_paths = attach_votes(paginator.paginate_queryset(queryset, request), request.user)
+
+        # Serialize the paginated data with request context
+        serializer = KnowledgePathListSerializer(
+            paginated_paths, 
+            many=True, 
+            context={'request': request}
+        )
+
+        knowledge_paths_logger.debug("Knowledge path list retrieved successfully", extra={
+            'user_id': request.user.id if request.user.is_authenticated else None,
+            'total_count': paginator.page.paginator.count,
+            'paginated_count': len(paginated_paths),
+        })
+
+        data = paginator.get_paginated_response(serializer.data).data
+        data['next_cursor'] = (
+            encode_path_cursor(paginated_paths[-1]) if paginator.page.has_next() else None
+        )
+        return data
+
 
 class UserKnowledgePathsView(APIView):
     permission_classes = [IsAuthenticated]
@@ -182,39 +170,14 @@ class UserKnowledgePathsView(APIView):
                 'username': request.user.username,
             })
             
-            # Get the content type for KnowledgePath
-            content_type = ContentType.objects.get_for_model(KnowledgePath)
-            
-            # Get all vote counts in a single query
-            vote_counts = {
-                vc.object_id: vc.vote_count 
-                for vc in VoteCount.objects.filter(
-                    content_type=content_type
-                )
-            }
-            
-            # Get user votes in a single query
-            user_votes = {
-                v.object_id: v.value 
-                for v in Vote.objects.filter(
-                    content_type=content_type,
-                    user_id=request.user.id
-                )
-            }
-            
             # Get knowledge paths created by the authenticated user (both visible and hidden)
             knowledge_paths = KnowledgePath.objects.select_related('author').filter(
                 author=request.user
             ).order_by('-created_at')
             
-            # Add vote data to each knowledge path
-            for path in knowledge_paths:
-                path._vote_count = vote_counts.get(path.id, 0)
-                path._user_vote = user_votes.get(path.id, 0)
-            
-            # Initialize paginator
+            # Initialize paginator; vote data is attached to the current page only
             paginator = self.pagination_class()
-            paginated_paths = paginator.paginate_queryset(knowledge_paths, request)
+            paginated_paths = attach_votes(paginator.paginate_queryset(knowledge_paths, request), request.user)
             
             # Serialize the paginated data with request context
             serializer = KnowledgePathListSerializer(
@@ -225,7 +188,7 @@ class UserKnowledgePathsView(APIView):
             
             knowledge_paths_logger.debug("User knowledge paths retrieved successfully", extra={
                 'user_id': request.user.id,
-                'total_count': len(knowledge_paths),
+                'total_count': paginator.page.paginator.count,
                 'paginated_count': len(paginated_paths),
             })
             
@@ -277,7 +240,7 @@ class UserEngagedKnowledgePathsView(APIView):
             
             knowledge_paths_logger.debug("User engaged knowledge paths retrieved successfully", extra={
                 'user_id': request.user.id,
-                'total_count': len(knowledge_paths),
+                'total_count': paginator.page.paginator.count,
                 'paginated_count': len(paginated_paths),
                 'engaged_path_count': len(engaged_path_ids),
             })
@@ -305,42 +268,15 @@ class UserKnowledgePathsByUserIdView(APIView):
                 'target_user_id': user_id,
             })
             
-            # Get the content type for KnowledgePath
-            content_type = ContentType.objects.get_for_model(KnowledgePath)
-            
-            # Get all vote counts in a single query
-            vote_counts = {
-                vc.object_id: vc.vote_count 
-                for vc in VoteCount.objects.filter(
-                    content_type=content_type
-                )
-            }
-            
-            # Get user votes in a single query only if user is authenticated
-            user_votes = {}
-            if request.user and request.user.is_authenticated:
-                user_votes = {
-                    v.object_id: v.value 
-                    for v in Vote.objects.filter(
-                        content_type=content_type,
-                        user_id=request.user.id
-                    )
-                }
-            
             # Get knowledge paths created by the specified user (only visible ones for other users)
             knowledge_paths = KnowledgePath.objects.select_related('author').filter(
                 author_id=user_id,
                 is_visible=True
             ).order_by('-created_at')
             
-            # Add vote data to each knowledge path
-            for path in knowledge_paths:
-                path._vote_count = vote_counts.get(path.id, 0)
-                path._user_vote = user_votes.get(path.id, 0)
-            
-            # Initialize paginator
+            # Initialize paginator; vote data is attached to the current page only
             paginator = self.pagination_class()
-            paginated_paths = paginator.paginate_queryset(knowledge_paths, request)
+            paginated_paths = attach_votes(paginator.paginate_queryset(knowledge_paths, request), request.user)
             
             # Serialize the paginated data with request context
             serializer = KnowledgePathListSerializer(
@@ -352,7 +288,7 @@ class UserKnowledgePathsByUserIdView(APIView):
             knowledge_paths_logger.debug("User knowledge paths by user ID retrieved successfully", extra={
                 'requesting_user_id': request.user.id if request.user.is_authenticated else None,
                 'target_user_id': user_id,
-                'total_count': len(knowledge_paths),
+                'total_count': paginator.page.paginator.count,
                 'paginated_count': len(paginated_paths),
             })
             
@@ -725,7 +661,10 @@ class NodeDetailView(APIView):
                 request.user,
                 request.query_params.get('club'),
             )
-            if not user_has_path_access(request.user, knowledge_path, book_club=book_club):
+            # Computed once here and reused by NodeSerializer through the context.
+            context = {'request': request, 'book_club': book_club}
+            progress = progress_for(context, request.user, knowledge_path, book_club=book_club)
+            if not progress.has_access:
                 return Response(
                     {
                         'detail': 'Este camino requiere pago para acceder a los nodos.',
@@ -734,23 +673,18 @@ class NodeDetailView(APIView):
                     },
                     status=status.HTTP_403_FORBIDDEN,
                 )
-            if book_club:
-                released, opens_at = is_node_released_for_club(
-                    node, book_club, request.user
+            state = progress.node(node.id)
+            if book_club and not state.released:
+                return Response(
+                    {
+                        'detail': 'Esta misión todavía no ha sido desbloqueada para el club.',
+                        'code': 'club_mission_not_released',
+                        'opens_at': state.opens_at,
+                    },
+                    status=status.HTTP_403_FORBIDDEN,
                 )
-                if not released:
-                    return Response(
-                        {
-                            'detail': 'Esta misión todavía no ha sido desbloqueada para el club.',
-                            'code': 'club_mission_not_released',
-                            'opens_at': opens_at,
-                        },
-                        status=status.HTTP_403_FORBIDDEN,
-                    )
-            serializer = NodeSerializer(
-                node,
-                context={'request': request, 'book_club': book_club},
-            )
+            node.knowledge_path = knowledge_path
+            serializer = NodeSerializer(node, context=context)
             
             knowledge_paths_logger.debug("Node detail retrieved", extra={
                 'user_id': request.user.id if request.user.is_authenticated else None,
@@ -0,0 +1,60 @@
+"""
+Delete read notifications older than the retention period, in batches.
+
+Usage: python manage.py purge_notifications [--days 30] [--batch-size 1000] [--dry-run]
+
+Run daily (cron / scheduler); the notifications endpoint no longer cleans up on read.
+The NotificationKey dedup rows of the deleted notifications go with them, as do keys
+older than the retention period whose notification is already gone.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from notifications.models import Notification
+
+from profiles.models import NotificationKey
+
+
+class Command(BaseCommand):
+    help = 'Delete read notifications older than NOTIFICATION_RETENTION_DAYS'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None,
+                            help='Retention in days (default: NOTIFICATION_RETENTION_DAYS).')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--dry-run', action='store_true', help='Only count what would be deleted.')
+
+    def handle(self, *args, **options):
+        days = options['days'] if options['days'] is not None else getattr(settings, 'NOTIFICATION_RETENTION_DAYS', 30)
+        batch_size = max(1, options['batch_size'])
+        cutoff = timezone.now() - timedelta(days=days)
+        expired = Notification.objects.filter(unread=False, timestamp__lt=cutoff)
+        orphan_keys = NotificationKey.objects.filter(notification__isnull=True, created_at__lt=cutoff)
+
+        if options['dry_run']:
+            self.stdout.write(f'{expired.count()} read notification(s) older than {days} day(s) would be deleted.')
+            self.stdout.write(f'{orphan_keys.count()} orphaned notification key(s) would be deleted.')
+            return
+
+        deleted = 0
+        while True:
+            ids = list(expired.order_by('id').values_list('id', flat=True)[:batch_size])
+            if not ids:
+                break
+            # Keys first: the FK is SET_NULL, so deleting the notification would orphan them.
+            NotificationKey.objects.filter(notification_id__in=ids).delete()
+            Notification.objects.filter(pk__in=ids).delete()
+            deleted += len(ids)
+
+        orphans_deleted = 0
+        while True:
+            ids = list(orphan_keys.order_by('id').values_list('id', flat=True)[:batch_size])
+            if not ids:
+                break
+            NotificationKey.objects.filter(pk__in=ids).delete()
+            orphans_deleted += len(ids)
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} read notification(s) older than {days} day(s).'))
+        if orphans_deleted:
+            self.stdout.write(self.style.SUCCESS(f'Deleted {orphans_deleted} orphaned notification key(s).'))
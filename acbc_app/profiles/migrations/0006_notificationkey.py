@@ -0,0 +1,35 @@
+# Generated by Django 5.0 on 2026-10-17 00:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('profiles', '0005_profile_country'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        migrations.swappable_dependency(settings.NOTIFICATIONS_NOTIFICATION_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('verb_key', models.CharField(max_length=255)),
+                ('object_id', models.CharField(max_length=255)),
+                ('token', models.CharField(blank=True, max_length=32)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('notification', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.NOTIFICATIONS_NOTIFICATION_MODEL)),
+                ('object_content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype')),
+                ('recipient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notification_keys', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='notificationkey',
+            constraint=models.UniqueConstraint(fields=('recipient', 'verb_key', 'object_content_type', 'object_id'), name='profiles_notification_key_unique'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0006_notificationkey'),
+    ]
+
+    operations = [
+        # Keyset pages of GET /profiles/notifications/ (profiles.notification_listing).
+        migrations.RunSQL(
+            sql=(
+                'CREATE INDEX IF NOT EXISTS notifications_recipient_timestamp_idx '
+                'ON notifications_notification (recipient_id, timestamp DESC, id DESC);'
+            ),
+            reverse_sql='DROP INDEX IF EXISTS notifications_recipient_timestamp_idx;',
+        ),
+    ]
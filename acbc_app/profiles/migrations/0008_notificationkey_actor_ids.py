@@ -0,0 +1,18 @@
+# Generated by Django 5.0 on 2026-10-17 03:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0007_notification_inbox_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationkey',
+            name='actor_ids',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
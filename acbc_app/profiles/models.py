@@ -4,7 +4,9 @@ from django.core.validators import URLValidator, FileExtensionValidator
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
+from notifications.models import Notification
 
 from knowledge_paths.models import Node, KnowledgePath
 from quizzes.models import Quiz
@@ -179,4 +181,38 @@ class NewsletterSubscription(models.Model):
         ordering = ['-created_at']
 
     def __str__(self):
-        return self.email
\ No newline at end of file
+        return self.email
+
+
+class NotificationKey(models.Model):
+    """
+    Dedup key for notifications: one row per (recipient, verb key, object).
+
+    utils.notification_batch inserts these with bulk_create(ignore_conflicts=True), so
+    the unique constraint decides which event creates the notification, also under
+    concurrent requests. notification points at the latest notification for the key
+    (digests fold later events into it while it is unread); actor_ids lists every actor
+    a digest key has counted, across all its notifications.
+    """
+
+    recipient = models.ForeignKey(User, on_delete=models.CASCADE, related_name='notification_keys')
+    verb_key = models.CharField(max_length=255)
+    object_content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE, related_name='+')
+    object_id = models.CharField(max_length=255)
+    notification = models.ForeignKey(
+        Notification, on_delete=models.SET_NULL, null=True, blank=True, related_name='+'
+    )
+    token = models.CharField(max_length=32, blank=True)
+    actor_ids = models.JSONField(default=list, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['recipient', 'verb_key', 'object_content_type', 'object_id'],
+                name='profiles_notification_key_unique',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.recipient_id} {self.verb_key} {self.object_content_type_id}:{self.object_id}"
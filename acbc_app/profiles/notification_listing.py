@@ -0,0 +1,75 @@
+"""
+Notification inbox: keyset pages with their generic relations loaded in batch.
+
+Order is (-timestamp, -id); the cursor holds both values of the last notification
+on the page, so any page costs one indexed range scan. Actors, targets and action
+objects of the page are loaded one query per content type (utils.generic_relations),
+plus the objects the comments among them are attached to, which reply links need.
+
+Old read notifications are removed by the purge_notifications command, not here.
+"""
+import base64
+import json
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from notifications.models import Notification
+
+from comments.models import Comment
+from content.models import ContentProfile
+from utils.generic_relations import prefetch_generic
+
+NOTIFICATION_ORDERING = ('-timestamp', '-id')
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidNotificationCursor(ValueError):
+    """The cursor query parameter could not be decoded."""
+
+
+def encode_notification_cursor(notification):
+    payload = [notification.timestamp.isoformat(), notification.pk]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_notification_cursor(value):
+    try:
+        timestamp, pk = json.loads(base64.urlsafe_b64decode(value.encode()))
+        timestamp = parse_datetime(timestamp)
+        if timestamp is None:
+            raise ValueError('bad date')
+        return timestamp, int(pk)
+    except (TypeError, ValueError, UnicodeError) as exc:
+        raise InvalidNotificationCursor(str(exc)) from exc
+
+
+def _after_cursor(cursor):
+    timestamp, pk = cursor
+    return Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, pk__lt=pk)
+
+
+def prefetch_notification_relations(notifications):
+    """Load actor, target and action_object of notifications, one query per content type."""
+    # display_title falls back to the content's title.
+    querysets = {ContentProfile: ContentProfile.objects.select_related('content')}
+    loaded = prefetch_generic(notifications, 'actor', 'target', 'action_object', querysets=querysets)
+    comments = [obj for obj in loaded.values() if isinstance(obj, Comment)]
+    if comments:
+        prefetch_generic(comments, 'content_object', querysets=querysets)
+    return notifications
+
+
+def notification_page(user, *, unread_only=True, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+    """(notifications, next_cursor) for one page of user's inbox, relations prefetched."""
+    queryset = Notification.objects.filter(recipient=user).order_by(*NOTIFICATION_ORDERING)
+    if unread_only:
+        queryset = queryset.filter(unread=True)
+    if cursor:
+        queryset = queryset.filter(_after_cursor(decode_notification_cursor(cursor)))
+
+    notifications = list(queryset[:page_size + 1])
+    next_cursor = (
+        encode_notification_cursor(notifications[page_size - 1]) if len(notifications) > page_size else None
+    )
+    return prefetch_notification_relations(notifications[:page_size]), next_cursor
@@ -2,6 +2,7 @@ from rest_framework import serializers
 import logging
 
 from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
 from dj_rest_auth.serializers import PasswordResetSerializer as DefaultPasswordResetSerializer
 
 from content.utils import build_media_url
@@ -251,8 +252,8 @@ class NotificationSerializer(serializers.ModelSerializer):
         return obj.actor.id if obj.actor else None
 
     def get_content_type(self, obj):
-        if obj.action_object_content_type:
-            return obj.action_object_content_type.model
+        if obj.action_object_content_type_id:
+            return ContentType.objects.get_for_id(obj.action_object_content_type_id).model
         return None
 
     def get_target(self, obj):
@@ -371,8 +372,8 @@ class NotificationSerializer(serializers.ModelSerializer):
             return None
 
         model_name = None
-        if getattr(comment, 'content_type', None):
-            model_name = comment.content_type.model
+        if getattr(comment, 'content_type_id', None):
+            model_name = ContentType.objects.get_for_id(comment.content_type_id).model
         else:
             model_name = content_object.__class__.__name__.lower()
 
@@ -399,17 +400,15 @@ class NotificationSerializer(serializers.ModelSerializer):
             # Certificate request notifications link to the certificates section
             if self._verb_in(verb, CERTIFICATE_REQUEST_VERB_KEYS):
                 request = self.context.get('request')
-                recipient = obj.recipient
-                if request and request.user.is_authenticated and request.user.id == recipient.id:
+                if request and request.user.is_authenticated and request.user.id == obj.recipient_id:
                     return '/profiles/my_profile?section=certificates&tab=requests'
-                return f'/profiles/user_profile/{recipient.id}?section=certificates&tab=requests' if recipient else None
+                return f'/profiles/user_profile/{obj.recipient_id}?section=certificates&tab=requests'
 
             if self._verb_in(verb, CERTIFICATE_DECISION_VERB_KEYS):
                 request = self.context.get('request')
-                recipient = obj.recipient
-                if request and request.user.is_authenticated and request.user.id == recipient.id:
+                if request and request.user.is_authenticated and request.user.id == obj.recipient_id:
                     return '/profiles/my_profile?section=certificates'
-                return f'/profiles/user_profile/{recipient.id}?section=certificates' if recipient else None
+                return f'/profiles/user_profile/{obj.recipient_id}?section=certificates'
 
             if self._verb_in(verb, KNOWLEDGE_PATH_VERB_KEYS) and obj.target:
                 return f'/knowledge_path/{obj.target.id}' if hasattr(obj.target, 'id') else None
@@ -432,11 +431,9 @@ class NotificationSerializer(serializers.ModelSerializer):
             # For topic moderator invitations and related actions
             if self._verb_in(verb, MODERATOR_ACTION_VERB_KEYS):
                 request = self.context.get('request')
-                recipient = obj.recipient
-
-                if request and request.user.is_authenticated and request.user.id == recipient.id:
+                if request and request.user.is_authenticated and request.user.id == obj.recipient_id:
                     return '/profiles/my_profile?section=topics'
-                return f'/profiles/user_profile/{recipient.id}?section=topics' if recipient else None
+                return f'/profiles/user_profile/{obj.recipient_id}?section=topics'
 
             if self._verb_in(verb, TOPIC_MODERATION_VERB_KEYS) and obj.target:
                 return f'/content/topics/{obj.target.id}/edit?tab=suggestions' if hasattr(obj.target, 'id') else None
@@ -452,8 +449,8 @@ class NotificationSerializer(serializers.ModelSerializer):
 
             if self._verb_in(verb, TOPIC_REQUEST_DECISION_VERB_KEYS):
                 topic_id = None
-                if obj.target and obj.target_content_type:
-                    model_name = obj.target_content_type.model
+                if obj.target and obj.target_content_type_id:
+                    model_name = ContentType.objects.get_for_id(obj.target_content_type_id).model
                     if model_name == 'topic':
                         topic_id = obj.target.id
                     elif model_name == 'topiccreationrequest' and getattr(obj.target, 'topic_id', None):
@@ -0,0 +1,42 @@
+"""Background job handlers for the profiles app (see jobs.queue)."""
+import logging
+
+from jobs.registry import job_task
+from profiles.email_service import EmailService, EmailServiceError
+from profiles.models import Suggestion
+
+logger = logging.getLogger('academia_blockchain.profiles.tasks')
+
+
+def _send_to_admins(**kwargs):
+    results = EmailService.send_to_admins(**kwargs)
+    # Partial failures are not retried: that would email the admins who already got it.
+    if results and results['failed'] and not results['sent']:
+        raise EmailServiceError(f"Admin email failed for {len(results['failed'])} recipient(s)")
+    return results
+
+
+@job_task('profiles.admin_email', queue='notifications')
+def admin_email(subject, template_name, context, tags=None):
+    """EmailService.send_to_admins() with a JSON-serializable template context."""
+    _send_to_admins(subject=subject, template_name=template_name, context=context, tags=tags)
+
+
+@job_task('profiles.suggestion_admin_email', queue='notifications')
+def suggestion_admin_email(suggestion_id):
+    suggestion = Suggestion.objects.select_related('user').filter(pk=suggestion_id).first()
+    if suggestion is None:
+        return
+    _send_to_admins(
+        subject=f"Nueva sugerencia de {suggestion.user.username}",
+        template_name='suggestion_notification',
+        context={
+            'user': suggestion.user,
+            'suggestion': suggestion,
+        },
+        tags=['suggestion', 'notification', 'admin'],
+    )
+    logger.info(
+        "Suggestion notification email dispatched to administrators for suggestion id=%s",
+        suggestion.id,
+    )
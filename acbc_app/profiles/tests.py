@@ -1,9 +1,16 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth.models import User
 from django.urls import reverse
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
-from profiles.models import Profile, CryptoCurrency, AcceptedCrypto, ContactMethod, UserNodeCompletion, Suggestion
+from profiles.models import (
+    Profile, CryptoCurrency, AcceptedCrypto, ContactMethod, UserNodeCompletion, Suggestion, NotificationKey,
+)
 from notifications.models import Notification
 from knowledge_paths.models import KnowledgePath, Node
 from certificates.models import CertificateRequest, Certificate, CertificateTemplate
@@ -936,21 +943,108 @@ class NotificationTests(APITestCase):
         self.notification1.refresh_from_db()
         self.assertFalse(self.notification1.unread)
 
-    def test_automatic_cleanup(self):
-        """Test automatic cleanup of old notifications"""
-        url = reverse('profiles:notifications')
-        response = self.client.get(url)
-        
+    def test_listing_does_not_delete_and_purge_command_does(self):
+        """Retention runs in purge_notifications, not on every list request"""
+        response = self.client.get(reverse('profiles:notifications'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        
-        # Verify old notification is cleaned up
+        self.assertTrue(Notification.objects.filter(id=self.old_notification.id).exists())
+
+        call_command('purge_notifications', stdout=StringIO())
+
         self.assertFalse(Notification.objects.filter(id=self.old_notification.id).exists())
-        
-        # Verify other notifications still exist
         self.assertTrue(Notification.objects.filter(id=self.notification1.id).exists())
         self.assertTrue(Notification.objects.filter(id=self.notification2.id).exists())
         self.assertTrue(Notification.objects.filter(id=self.read_notification.id).exists())
 
+    def test_purge_command_deletes_notification_keys(self):
+        def key(object_id, notification=None):
+            return NotificationKey.objects.create(
+                recipient=self.user,
+                verb_key='test',
+                object_content_type=self.user_content_type,
+                object_id=str(object_id),
+                notification=notification,
+            )
+
+        old_key = key(1, self.old_notification)
+        live_key = key(2, self.notification1)
+        old_orphan = key(3)
+        NotificationKey.objects.filter(pk=old_orphan.pk).update(created_at=timezone.now() - timedelta(days=31))
+        recent_orphan = key(4)
+
+        call_command('purge_notifications', stdout=StringIO())
+
+        remaining = set(NotificationKey.objects.values_list('id', flat=True))
+        self.assertEqual(remaining, {live_key.id, recent_orphan.id})
+        self.assertNotIn(old_key.id, remaining)
+
+    def test_notifications_cursor_pages(self):
+        url = reverse('profiles:notifications')
+        seen = []
+        cursor = None
+        while True:
+            params = {'show_all': 'true', 'page_size': 1}
+            if cursor:
+                params['cursor'] = cursor
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen += [n['id'] for n in response.data['notifications']]
+            cursor = response.data['next_cursor']
+            if not cursor:
+                break
+        expected = list(
+            Notification.objects.filter(recipient=self.user).order_by('-timestamp', '-id').values_list('id', flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+        response = self.client.get(url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_notifications_page_query_count_is_constant(self):
+        """Generic relations are loaded per content type, not per notification"""
+        owner = User.objects.create_user(username='inbox_owner', password='testpass123')
+        profile = ContentProfile.objects.create(
+            content=Content.objects.create(original_title='Inbox', uploaded_by=owner),
+            user=owner,
+            title='Inbox',
+        )
+        profile_ct = ContentType.objects.get_for_model(ContentProfile)
+        comment_ct = ContentType.objects.get_for_model(Comment)
+        parent = Comment.objects.create(author=owner, body='Parent', content_type=profile_ct, object_id=profile.id)
+
+        def add_replies(count):
+            for index in range(count):
+                replier = User.objects.create_user(username=f'replier_{owner.id}_{Comment.objects.count()}')
+                reply = Comment.objects.create(
+                    author=replier, body=f'Reply {index}', content_type=profile_ct,
+                    object_id=profile.id, parent=parent,
+                )
+                Notification.objects.create(
+                    recipient=owner,
+                    actor_content_type=self.user_content_type,
+                    actor_object_id=replier.id,
+                    verb='respondió a',
+                    action_object_content_type=comment_ct,
+                    action_object_object_id=reply.id,
+                    target_content_type=comment_ct,
+                    target_object_id=parent.id,
+                )
+
+        def page_queries():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(reverse('profiles:notifications'))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(queries), response.data['notifications']
+
+        self.client.force_authenticate(user=owner)
+        add_replies(2)
+        few, _ = page_queries()
+        add_replies(6)
+        many, notifications = page_queries()
+        self.assertEqual(few, many)
+        self.assertEqual(len(notifications), 8)
+        self.assertEqual(notifications[0]['target_url'], f'/content/{profile.content_id}/library')
+
     def test_notification_permissions(self):
         """Test that users can only access their own notifications"""
         # Create another user
@@ -34,6 +34,7 @@ import json
 from profiles.serializers import UserSerializer, ProfileSerializer, UserRegistrationSerializer, NotificationSerializer, CryptoCurrencySerializer, AcceptedCryptoSerializer, SuggestionSerializer, ChangePasswordSerializer
 from profiles.models import Profile, CryptoCurrency, AcceptedCrypto, Suggestion, NewsletterSubscription
 from profiles.email_service import EmailService, EmailServiceError
+from jobs.queue import enqueue_on_commit
 from allauth.socialaccount.providers.google.views import GoogleOAuth2Adapter
 from allauth.socialaccount.providers.oauth2.client import OAuth2Client
 from dj_rest_auth.registration.views import SocialLoginView
@@ -41,13 +42,18 @@ from allauth.socialaccount.providers.google.provider import GoogleProvider
 from allauth.socialaccount.models import SocialApp, SocialToken
 from allauth.socialaccount.models import SocialAccount
 from notifications.models import Notification
+from profiles.notification_listing import (
+    DEFAULT_PAGE_SIZE as NOTIFICATIONS_PAGE_SIZE,
+    MAX_PAGE_SIZE as NOTIFICATIONS_MAX_PAGE_SIZE,
+    InvalidNotificationCursor,
+    notification_page,
+)
 from utils.notification_cache import (
     get_cached_unread_count,
     invalidate_unread_count,
     set_cached_unread_count,
 )
 from django.db import connection
-from django.db.models import Count
 
 logger = logging.getLogger(__name__)
 
@@ -113,24 +119,19 @@ NEWSLETTER_SOURCE_LABELS = {
 
 
 def _notify_admins_newsletter_subscription(email: str, source: str = '') -> None:
-    """Notify administrators about a new newsletter subscription."""
+    """Queue an email to administrators about a new newsletter subscription."""
     source_label = NEWSLETTER_SOURCE_LABELS.get(source) or (source or 'No especificada')
-    try:
-        EmailService.send_to_admins(
-            subject='Nueva suscripción a la newsletter',
-            template_name='newsletter_subscription',
-            context={
-                'subscriber_email': email,
-                'source_label': source_label,
-            },
-            tags=['newsletter', 'subscription'],
-        )
-    except EmailServiceError as e:
-        logger.error(
-            'Error sending newsletter subscription notification email: %s',
-            str(e),
-            exc_info=True,
-        )
+    enqueue_on_commit(
+        'profiles.admin_email',
+        subject='Nueva suscripción a la newsletter',
+        template_name='newsletter_subscription',
+        context={
+            'subscriber_email': email,
+            'source_label': source_label,
+        },
+        tags=['newsletter', 'subscription'],
+        idempotency_key=f'newsletter-admin-email:{email.lower()}',
+    )
 
 
 @require_http_methods(["GET", "POST"])
@@ -1222,68 +1223,36 @@ class UserNotificationsView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        logger.info(f"Fetching user notifications for user {request.user.username}")
-        
-        # Get show_all parameter from query string
+        """
+        One keyset page of the user's notifications, newest first.
+
+        Query params: show_all (true to include read ones; default unread only),
+        cursor (next_cursor of the previous page), page_size (default 20, max 100).
+        """
         show_all = request.query_params.get('show_all', 'false').lower() == 'true'
-        
-        # Clean up old notifications first
-        from django.utils import timezone
-        from datetime import timedelta
-        
-        cutoff_date = timezone.now() - timedelta(days=30)
-        deleted_count = Notification.objects.filter(
-            recipient=request.user,
-            unread=False,
-            timestamp__lt=cutoff_date
-        ).delete()[0]
-        
-        logger.debug(f"Cleaned up {deleted_count} old notifications for user {request.user.username}")
-        if deleted_count:
-            invalidate_unread_count(request.user.id)
-        
-        # Get notifications for the user
-        notifications = Notification.objects.filter(recipient=request.user)
-        
-        # If not showing all, only get unread notifications
-        if not show_all:
-            notifications = notifications.filter(unread=True)
-        
-        # Print the actual SQL query
-        logger.debug(f"SQL Query for notifications for user {request.user.username}:")
-        logger.debug(notifications.query)
-        
-        # Print the count
-        count = notifications.count()
-        logger.info(f"Found {count} notifications for user {request.user.username}")
-        
-        # Log some details about the notifications
-        for notification in notifications:
-            logger.debug(f"\nNotification ID: {notification.id} for user {request.user.username}")
-            logger.debug(f"Verb: {notification.verb}")
-            logger.debug(f"Actor: {notification.actor}")
-            logger.debug(f"Action Object: {notification.action_object}")
-            logger.debug(f"Target: {notification.target}")
-            logger.debug(f"Unread: {notification.unread}")
-            logger.debug(f"Timestamp: {notification.timestamp}")
-            logger.debug("---")
-        
-        # Get notification counts by type
-        notification_types = notifications.values('verb').annotate(count=Count('id'))
-        logger.debug("\nNotification types and counts for user {request.user.username}:")
-        for nt in notification_types:
-            logger.debug(f"{nt['verb']}: {nt['count']}")
-        
-        # Serialize the notifications
-        notification_data = NotificationSerializer(notifications, many=True, context={'request': request}).data
-        
-        logger.debug("\nSerialized data being sent for user {request.user.username}:")
-        logger.debug(notification_data)
-        
-        logger.info("=== End Fetching Notifications ===")
+        try:
+            page_size = int(request.query_params.get('page_size', NOTIFICATIONS_PAGE_SIZE))
+        except (TypeError, ValueError):
+            page_size = NOTIFICATIONS_PAGE_SIZE
+        page_size = max(1, min(page_size, NOTIFICATIONS_MAX_PAGE_SIZE))
+        cursor = request.query_params.get('cursor') or None
+
+        try:
+            notifications, next_cursor = notification_page(
+                request.user, unread_only=not show_all, cursor=cursor, page_size=page_size,
+            )
+        except InvalidNotificationCursor:
+            return Response({'error': 'Cursor inválido.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        logger.debug("Fetched notifications page", extra={
+            'user_id': request.user.id,
+            'count': len(notifications),
+            'show_all': show_all,
+        })
         return Response({
-            'notifications': notification_data,
-            'cleaned_up_count': deleted_count
+            'notifications': NotificationSerializer(notifications, many=True, context={'request': request}).data,
+            'next_cursor': next_cursor,
+            'page_size': page_size,
         })
 
     def post(self, request, notification_id=None):
@@ -1324,11 +1293,7 @@ class UserNotificationsView(APIView):
                     recipient=request.user,
                     unread=True
                 )
-                count = unread_notifications.count()
-                logger.debug(f"Found {count} unread notifications for user {request.user.username}")
-                
-                # Mark all as read
-                unread_notifications.mark_all_as_read()
+                count = unread_notifications.mark_all_as_read()
                 invalidate_unread_count(request.user.id)
                 logger.debug(f"Successfully marked {count} notifications as read for user {request.user.username}")
                 
@@ -1559,44 +1524,19 @@ class SuggestionCreateView(APIView):
     
     def _send_email_to_admins(self, suggestion, user, request=None):
         """
-        Send email notification to administrators about the new suggestion.
-        Uses EmailService with HTML templates for professional email delivery.
-        
+        Queue the email notification to administrators about the new suggestion
+        (profiles.suggestion_admin_email, sent by the job worker after commit).
+
         Args:
             suggestion: Suggestion model instance
             user: User model instance who created the suggestion
             request: HttpRequest object (optional, for getting site URL)
         """
-        from profiles.email_service import EmailService, EmailServiceError
-
-        try:
-            EmailService.send_to_admins(
-                subject=f"Nueva sugerencia de {user.username}",
-                template_name='suggestion_notification',
-                context={
-                    'user': user,
-                    'suggestion': suggestion,
-                },
-                tags=['suggestion', 'notification', 'admin'],
-            )
-
-            logger.info(
-                "Suggestion notification email dispatched to administrators for suggestion id=%s",
-                suggestion.id,
-            )
-                
-        except EmailServiceError as e:
-            # Log error but don't fail the request
-            logger.error(
-                f"Error sending suggestion notification email: {str(e)}",
-                exc_info=True
-            )
-        except Exception as e:
-            # Catch any other unexpected errors
-            logger.error(
-                f"Unexpected error sending suggestion notification email: {str(e)}",
-                exc_info=True
-            )
+        enqueue_on_commit(
+            'profiles.suggestion_admin_email',
+            suggestion_id=suggestion.id,
+            idempotency_key=f'suggestion-admin-email:{suggestion.id}',
+        )
 
 
 class ChangePasswordView(APIView):
@@ -3,6 +3,7 @@ import logging
 from .models import Quiz, Question, Option, UserQuizAttempt, Answer
 from content.utils import build_media_url
 from knowledge_paths.services.node_user_activity_service import has_completed_quiz
+from knowledge_paths.services.progress_service import cached_progress
 
 # Get logger for quizzes serializers
 logger = logging.getLogger('academia_blockchain.quizzes.serializers')
@@ -106,6 +107,10 @@ class QuizSerializer(serializers.ModelSerializer):
     def get_is_completed(self, obj):
         request = self.context.get('request')
         if request and request.user.is_authenticated:
+            # Nested under a node, the path's progress already knows the quiz results.
+            progress = cached_progress(self.context, obj.node_id, request.user)
+            if progress is not None:
+                return progress.quiz_passed(obj.id)
             return has_completed_quiz(request.user, obj)
         return False
 
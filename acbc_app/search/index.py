@@ -0,0 +1,209 @@
+"""
+Search index maintenance and lookup.
+
+Every searchable object (visible content profiles, topics, knowledge paths) has one
+SearchDocument row, kept in sync by search.signals and rebuilt in bulk by the
+``rebuild_search_index`` management command.
+
+Lookups return object ids ordered by relevance:
+- PostgreSQL: full-text match on the generated ``search_vector`` (Spanish stemming,
+  GIN index), substring match on ``search_text`` and trigram similarity on ``title``
+  (pg_trgm GIN indexes) for typo tolerance; ranked by ts_rank_cd + similarity.
+- Other backends (SQLite in tests): every query term must appear in ``search_text``;
+  ranked by title prefix/substring match.
+Ties are broken by ``sort_date`` (newest first) in both cases.
+"""
+import logging
+import re
+import unicodedata
+
+from django.db import connection
+from django.db.models import BooleanField, Case, F, FloatField, IntegerField, Q, Value, When
+from django.db.models.expressions import RawSQL
+
+from search.models import SearchDocument
+
+logger = logging.getLogger('academia_blockchain.search.index')
+
+SEARCH_CONFIG = 'spanish'
+INDEX_BATCH_SIZE = 500
+
+# Knowledge path search has never filtered on is_visible; keep that behavior.
+UNFILTERED_KINDS = (SearchDocument.KIND_KNOWLEDGE_PATH,)
+DOCUMENT_ORDERING = (
+    '-rank',
+    F('sort_date').desc(nulls_last=True),
+    'kind',
+    '-object_id',
+)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_text(value):
+    """Lowercase, strip accents and collapse whitespace ("Educación " -> "educacion")."""
+    if not value:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', str(value))
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _WHITESPACE_RE.sub(' ', stripped.lower()).strip()
+
+
+def _join(*parts):
+    return normalize_text(' '.join(p for p in parts if p))
+
+
+def _document_fields(title, body_parts, is_public, sort_date):
+    title = normalize_text(title)
+    body = _join(*body_parts)
+    return {
+        'title': title,
+        'body': body,
+        'search_text': _join(title, body),
+        'is_public': bool(is_public),
+        'sort_date': sort_date,
+    }
+
+
+def content_profile_document(profile):
+    """Field values for a ContentProfile row (profile overrides + original content metadata)."""
+    content = profile.content
+    return _document_fields(
+        profile.title or content.original_title,
+        [profile.author, content.original_title, content.original_author],
+        profile.is_visible,
+        profile.updated_at,
+    )
+
+
+def topic_document(topic):
+    return _document_fields(topic.title, [topic.description], topic.is_public, topic.created_at)
+
+
+def knowledge_path_document(path):
+    return _document_fields(path.title, [path.description], path.is_visible, path.created_at)
+
+
+def _upsert(kind, object_id, fields):
+    SearchDocument.objects.update_or_create(kind=kind, object_id=object_id, defaults=fields)
+
+
+def index_content_profile(profile):
+    _upsert(SearchDocument.KIND_CONTENT, profile.pk, content_profile_document(profile))
+
+
+def index_content_profiles_for_content(content):
+    """Refresh documents of every profile of content (original title/author changed)."""
+    for profile in content.profiles.select_related('content'):
+        index_content_profile(profile)
+
+
+def index_topic(topic):
+    _upsert(SearchDocument.KIND_TOPIC, topic.pk, topic_document(topic))
+
+
+def index_knowledge_path(path):
+    _upsert(SearchDocument.KIND_KNOWLEDGE_PATH, path.pk, knowledge_path_document(path))
+
+
+def remove_document(kind, object_id):
+    SearchDocument.objects.filter(kind=kind, object_id=object_id).delete()
+
+
+def _indexed_sources():
+    from content.models import ContentProfile, Topic
+    from knowledge_paths.models import KnowledgePath
+
+    return {
+        SearchDocument.KIND_CONTENT: (
+            ContentProfile.objects.select_related('content'),
+            content_profile_document,
+        ),
+        SearchDocument.KIND_TOPIC: (Topic.objects.all(), topic_document),
+        SearchDocument.KIND_KNOWLEDGE_PATH: (KnowledgePath.objects.all(), knowledge_path_document),
+    }
+
+
+def rebuild_index(kinds=None, batch_size=INDEX_BATCH_SIZE):
+    """
+    Drop and recreate SearchDocument rows for the given kinds (default: all).
+    Returns {kind: documents_written}.
+    """
+    written = {}
+    for kind, (queryset, build) in _indexed_sources().items():
+        if kinds and kind not in kinds:
+            continue
+        SearchDocument.objects.filter(kind=kind).delete()
+        batch = []
+        count = 0
+        for obj in queryset.order_by('pk').iterator(chunk_size=batch_size):
+            batch.append(SearchDocument(kind=kind, object_id=obj.pk, **build(obj)))
+            if len(batch) >= batch_size:
+                SearchDocument.objects.bulk_create(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            SearchDocument.objects.bulk_create(batch)
+            count += len(batch)
+        written[kind] = count
+        logger.info('Rebuilt search index', extra={'kind': kind, 'documents': count})
+    return written
+
+
+def _postgres_matches(queryset, needle):
+    tsquery = f"websearch_to_tsquery('{SEARCH_CONFIG}', %s)"
+    return queryset.filter(
+        Q(RawSQL(f'search_vector @@ {tsquery}', [needle], output_field=BooleanField()))
+        | Q(search_text__contains=needle)
+        | Q(RawSQL('title %% %s', [needle], output_field=BooleanField()))
+    ).annotate(
+        rank=RawSQL(
+            f'ts_rank_cd(search_vector, {tsquery}, 32) + similarity(title, %s)',
+            [needle, needle],
+            output_field=FloatField(),
+        ),
+    )
+
+
+def _fallback_matches(queryset, needle):
+    for term in needle.split(' '):
+        queryset = queryset.filter(search_text__contains=term)
+    return queryset.annotate(
+        rank=Case(
+            When(title=needle, then=Value(3)),
+            When(title__startswith=needle, then=Value(2)),
+            When(title__contains=needle, then=Value(1)),
+            default=Value(0),
+            output_field=IntegerField(),
+        ),
+    )
+
+
+def _visible(queryset):
+    """Hidden content profiles and private topics never match; knowledge paths always do."""
+    return queryset.filter(
+        Q(kind__in=UNFILTERED_KINDS) | Q(is_public=True)
+    )
+
+
+def search_documents(query, kinds=None):
+    """
+    SearchDocument queryset matching query (optionally limited to kinds), annotated with
+    rank and ordered by relevance. The ordering is total so it can be keyset-paginated.
+    """
+    needle = normalize_text(query)
+    queryset = _visible(SearchDocument.objects.all())
+    if kinds is not None:
+        queryset = queryset.filter(kind__in=kinds)
+    if not needle:
+        return queryset.none()
+    if connection.vendor == 'postgresql':
+        queryset = _postgres_matches(queryset, needle)
+    else:
+        queryset = _fallback_matches(queryset, needle)
+    return queryset.order_by(*DOCUMENT_ORDERING)
+
+
+def search_object_ids(kind, query):
+    """Ranked object ids of one kind matching query."""
+    return list(search_documents(query, kinds=[kind]).values_list('object_id', flat=True))
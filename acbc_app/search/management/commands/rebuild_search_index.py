@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from search.index import rebuild_index
+from search.models import SearchDocument
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuild the search index (SearchDocument rows) for content profiles, topics and '
+        'knowledge paths. Signals keep it in sync; run this to repair drift or after bulk imports.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--kind',
+            action='append',
+            choices=[kind for kind, _label in SearchDocument.KIND_CHOICES],
+            help='Only rebuild this document kind (repeatable; default: all kinds).',
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_index(kinds=options.get('kind'))
+        for kind, count in written.items():
+            self.stdout.write(self.style.SUCCESS(f'Indexed {count} {kind} document(s).'))
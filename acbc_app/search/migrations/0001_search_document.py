@@ -0,0 +1,108 @@
+# Generated by Django 5.0 on 2026-10-16 23:20
+
+from django.db import migrations, models
+
+
+def add_postgres_search_columns(apps, schema_editor):
+    """
+    PostgreSQL only: generated tsvector column (Spanish stemming, title weighted A,
+    body weighted B) with a GIN index, and pg_trgm GIN indexes for substring and
+    typo-tolerant title matching. Text is already unaccented by search.index.
+    """
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+    table = 'search_searchdocument'
+    with connection.cursor() as cursor:
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        cursor.execute(
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS ("
+            f"setweight(to_tsvector('spanish', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('spanish', coalesce(body, '')), 'B')"
+            f") STORED"
+        )
+        cursor.execute(
+            f'CREATE INDEX IF NOT EXISTS search_doc_vector_gin '
+            f'ON {table} USING gin (search_vector)'
+        )
+        cursor.execute(
+            f'CREATE INDEX IF NOT EXISTS search_doc_text_trgm '
+            f'ON {table} USING gin (search_text gin_trgm_ops)'
+        )
+        cursor.execute(
+            f'CREATE INDEX IF NOT EXISTS search_doc_title_trgm '
+            f'ON {table} USING gin (title gin_trgm_ops)'
+        )
+
+
+def drop_postgres_search_columns(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('DROP INDEX IF EXISTS search_doc_title_trgm')
+        cursor.execute('DROP INDEX IF EXISTS search_doc_text_trgm')
+        cursor.execute('DROP INDEX IF EXISTS search_doc_vector_gin')
+        cursor.execute('ALTER TABLE search_searchdocument DROP COLUMN IF EXISTS search_vector')
+
+
+def backfill_search_documents(apps, schema_editor):
+    from search.index import (
+        content_profile_document,
+        knowledge_path_document,
+        topic_document,
+    )
+
+    SearchDocument = apps.get_model('search', 'SearchDocument')
+    sources = [
+        ('content', apps.get_model('content', 'ContentProfile').objects.select_related('content'),
+         content_profile_document),
+        ('topic', apps.get_model('content', 'Topic').objects.all(), topic_document),
+        ('knowledge_path', apps.get_model('knowledge_paths', 'KnowledgePath').objects.all(),
+         knowledge_path_document),
+    ]
+    for kind, queryset, build in sources:
+        batch = []
+        for obj in queryset.order_by('pk').iterator(chunk_size=500):
+            batch.append(SearchDocument(kind=kind, object_id=obj.pk, **build(obj)))
+            if len(batch) >= 500:
+                SearchDocument.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            SearchDocument.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('content', '0032_transcript_anchor_default_signet'),
+        ('knowledge_paths', '0005_sell_knowledge_paths'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('content', 'Content profile'), ('topic', 'Topic'), ('knowledge_path', 'Knowledge path')], max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('title', models.TextField(blank=True, default='')),
+                ('body', models.TextField(blank=True, default='')),
+                ('search_text', models.TextField(blank=True, default='', help_text='Normalized title + body, used for substring and trigram matching.')),
+                ('is_public', models.BooleanField(default=True)),
+                ('sort_date', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['kind', 'is_public', '-sort_date'], name='search_doc_kind_public_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='searchdocument',
+            constraint=models.UniqueConstraint(fields=('kind', 'object_id'), name='search_document_kind_object_uniq'),
+        ),
+        migrations.RunPython(add_postgres_search_columns, drop_postgres_search_columns),
+        migrations.RunPython(backfill_search_documents, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,51 @@
 from django.db import models
 
-# Create your models here.
+
+class SearchDocument(models.Model):
+    """
+    Denormalized search index row for one searchable object.
+
+    Text is stored already lowercased and unaccented (see search.index.normalize_text)
+    so the same normalization applies on PostgreSQL and SQLite. On PostgreSQL the
+    migration adds a generated ``search_vector`` tsvector column (Spanish stemming)
+    with a GIN index, plus pg_trgm GIN indexes on ``title`` and ``search_text``;
+    those columns are not part of the Django model state.
+    """
+
+    KIND_CONTENT = 'content'
+    KIND_TOPIC = 'topic'
+    KIND_KNOWLEDGE_PATH = 'knowledge_path'
+    KIND_CHOICES = [
+        (KIND_CONTENT, 'Content profile'),
+        (KIND_TOPIC, 'Topic'),
+        (KIND_KNOWLEDGE_PATH, 'Knowledge path'),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    title = models.TextField(blank=True, default='')
+    body = models.TextField(blank=True, default='')
+    search_text = models.TextField(
+        blank=True,
+        default='',
+        help_text='Normalized title + body, used for substring and trigram matching.',
+    )
+    is_public = models.BooleanField(default=True)
+    sort_date = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['kind', 'object_id'],
+                name='search_document_kind_object_uniq',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['kind', 'is_public', '-sort_date'],
+                name='search_doc_kind_public_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.kind}:{self.object_id}'
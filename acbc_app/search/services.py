@@ -1,157 +1,160 @@
+import base64
+import json
 import logging
-from django.db.models import Q
-from django.contrib.auth.models import User
-from content.models import Content, Topic, ContentProfile
+from dataclasses import dataclass, field
+
+from django.db.models import Count, Q
+from django.utils.dateparse import parse_datetime
+
+from content.models import ContentProfile, Topic
 from knowledge_paths.models import KnowledgePath
-from profiles.models import Profile
-from content.serializers import SimpleContentProfileSerializer
-from .serializers import (
-    SearchResultSerializer, 
-    ContentSearchSerializer, 
-    TopicSearchSerializer, 
-    KnowledgePathSearchSerializer
-)
+from search.index import search_documents
+from search.models import SearchDocument
 
 logger = logging.getLogger(__name__)
 
-def perform_search(query, search_type='all'):
-    """
-    Perform a search across different models based on the query and search type.
-    
-    Args:
-        query (str): The search query
-        search_type (str): The type of content to search for ('all', 'content', 'topics', 'knowledge_paths')
-        
-    Returns:
-        list: A list of serialized search results
-    """
-    logger.info(f"Performing search - Query: '{query}', Type: {search_type}")
-    
-    results = []
-    
-    # Normalize the search type
-    search_type = search_type.lower()
-    
-    try:
-        # Search in content
-        if search_type in ['all', 'content']:
-            logger.debug(f"Searching content for query: '{query}'")
-            content_results = search_content(query)
-            logger.debug(f"Content search returned {len(content_results)} results")
-            results.extend(content_results)
-        
-        # Search in topics
-        if search_type in ['all', 'topics']:
-            logger.debug(f"Searching topics for query: '{query}'")
-            topic_results = search_topics(query)
-            logger.debug(f"Topic search returned {len(topic_results)} results")
-            results.extend(topic_results)
-        
-        # Search in knowledge paths
-        if search_type in ['all', 'knowledge_paths']:
-            logger.debug(f"Searching knowledge paths for query: '{query}'")
-            knowledge_path_results = search_knowledge_paths(query)
-            logger.debug(f"Knowledge path search returned {len(knowledge_path_results)} results")
-            results.extend(knowledge_path_results)
-        
-        logger.info(f"Search completed - Query: '{query}', Type: {search_type}, Total results: {len(results)}")
-        return results
-        
-    except Exception as e:
-        logger.error(f"Error performing search for query '{query}' with type '{search_type}': {str(e)}", exc_info=True)
-        raise
+# Public `type` values accepted by SearchView and the document kinds they cover.
+SEARCH_TYPE_KINDS = {
+    'content': [SearchDocument.KIND_CONTENT],
+    'topics': [SearchDocument.KIND_TOPIC],
+    'knowledge_paths': [SearchDocument.KIND_KNOWLEDGE_PATH],
+}
+SEARCH_TYPE_KINDS['all'] = [kind for kinds in SEARCH_TYPE_KINDS.values() for kind in kinds]
+KIND_SEARCH_TYPES = {
+    SearchDocument.KIND_CONTENT: 'content',
+    SearchDocument.KIND_TOPIC: 'topics',
+    SearchDocument.KIND_KNOWLEDGE_PATH: 'knowledge_paths',
+}
 
-def search_content(query):
-    """
-    Search for content items through visible ContentProfiles with optimized queries.
-    This function searches in both ContentProfile model's customized fields AND
-    the original Content fields, and only returns results from visible profiles.
-    Returns ContentProfile objects that can be serialized with SimpleContentProfileSerializer.
-    """
-    logger.debug(f"Searching content profiles for query: '{query}'")
-    
-    try:
-        # Base query for ContentProfiles - only search visible ones
-        # Search in both ContentProfile fields AND original Content fields
-        profile_query = (
-            Q(title__icontains=query) | 
-            Q(author__icontains=query) |
-            Q(content__original_title__icontains=query) |
-            Q(content__original_author__icontains=query)
-        ) & Q(is_visible=True)
-        
-        # Search in ContentProfile model with optimized query
-        content_profiles = ContentProfile.objects.filter(profile_query).select_related(
-            'content', 'content__file_details'
-        ).order_by('-updated_at')
-        
-        logger.debug(f"Content search query executed - Found {content_profiles.count()} visible profiles")
-        return content_profiles
-        
-    except Exception as e:
-        logger.error(f"Error searching content for query '{query}': {str(e)}", exc_info=True)
-        raise
 
-def search_topics(query):
-    """
-    Search for topics with optimized queries.
-    """
-    logger.debug(f"Searching topics for query: '{query}'")
-    
+class InvalidCursor(ValueError):
+    """The cursor query parameter could not be decoded."""
+
+
+@dataclass
+class SearchPage:
+    """One page of the merged, ranked result stream."""
+    items: list = field(default_factory=list)  # (kind, object) in rank order
+    counts: dict = field(default_factory=dict)  # matches per public search type
+    next_cursor: str = None
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+
+def encode_cursor(document):
+    """Opaque cursor pointing just after document in DOCUMENT_ORDERING."""
+    payload = [
+        document.rank,
+        document.sort_date.isoformat() if document.sort_date else None,
+        document.kind,
+        document.object_id,
+    ]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(value):
     try:
-        topic_query = Q(title__icontains=query) | Q(description__icontains=query)
-        topics = Topic.objects.filter(topic_query, is_public=True).only(
+        rank, sort_date, kind, object_id = json.loads(base64.urlsafe_b64decode(value.encode()))
+        if sort_date is not None:
+            sort_date = parse_datetime(sort_date)
+            if sort_date is None:
+                raise ValueError('bad date')
+        return float(rank), sort_date, str(kind), int(object_id)
+    except (TypeError, ValueError, UnicodeError) as exc:
+        raise InvalidCursor(str(exc)) from exc
+
+
+def _after_cursor(cursor):
+    """Q for documents strictly after cursor in DOCUMENT_ORDERING (rank, sort_date desc nulls last, kind, -object_id)."""
+    rank, sort_date, kind, object_id = cursor
+    same_date = Q(kind__gt=kind) | Q(kind=kind, object_id__lt=object_id)
+    if sort_date is None:
+        after_date = Q(sort_date__isnull=True) & same_date
+    else:
+        after_date = (
+            Q(sort_date__lt=sort_date)
+            | Q(sort_date__isnull=True)
+            | (Q(sort_date=sort_date) & same_date)
+        )
+    return Q(rank__lt=rank) | (Q(rank=rank) & after_date)
+
+
+def search_counts(documents):
+    """Matches per public search type in one grouped query."""
+    counts = {search_type: 0 for search_type in KIND_SEARCH_TYPES.values()}
+    rows = documents.order_by().values('kind').annotate(total=Count('id'))
+    for row in rows:
+        counts[KIND_SEARCH_TYPES[row['kind']]] = row['total']
+    return counts
+
+
+def _load_objects(documents):
+    """Resolve a page of documents to (kind, object) pairs; one query per kind present."""
+    ids_by_kind = {}
+    for document in documents:
+        ids_by_kind.setdefault(document.kind, []).append(document.object_id)
+
+    loaders = {
+        SearchDocument.KIND_CONTENT: ContentProfile.objects.select_related(
+            'content', 'content__file_details'
+        ),
+        SearchDocument.KIND_TOPIC: Topic.objects.only('id', 'title', 'description', 'created_at'),
+        SearchDocument.KIND_KNOWLEDGE_PATH: KnowledgePath.objects.only(
             'id', 'title', 'description', 'created_at'
-        ).order_by('-created_at')
-        
-        logger.debug(f"Topic search query executed - Found {topics.count()} topics")
-        
-        results = []
-        for topic in topics:
-            # Convert to simplified search result format
-            result = {
-                'id': topic.id,
-                'title': topic.title,
-                'description': topic.description,
-                'type': 'topic'
-            }
-            results.append(result)
-        
-        logger.debug(f"Topic search completed - Query: '{query}', Results: {len(results)}")
-        return results
-        
-    except Exception as e:
-        logger.error(f"Error searching topics for query '{query}': {str(e)}", exc_info=True)
-        raise
+        ),
+    }
+    objects = {
+        kind: loaders[kind].in_bulk(ids) for kind, ids in ids_by_kind.items()
+    }
+    # Skip documents whose object vanished between the two queries.
+    return [
+        (document.kind, objects[document.kind][document.object_id])
+        for document in documents
+        if document.object_id in objects[document.kind]
+    ]
 
-def search_knowledge_paths(query):
+
+def search_page(query, search_type='all', page_size=10, page=1, cursor=None):
     """
-    Search for knowledge paths with optimized queries.
+    Fetch one page of the merged ranked stream for query.
+
+    Only the requested page of SearchDocument rows is read (LIMIT page_size + 1), then
+    resolved to model objects with one in_bulk() per kind on the page. Pass either a
+    1-based page number or a cursor from a previous page's next_cursor (keyset, no OFFSET).
     """
-    logger.debug(f"Searching knowledge paths for query: '{query}'")
-    
+    search_type = (search_type or 'all').lower()
+    kinds = SEARCH_TYPE_KINDS.get(search_type, [])
+    logger.info(f"Performing search - Query: '{query}', Type: {search_type}")
+
     try:
-        path_query = Q(title__icontains=query) | Q(description__icontains=query)
-        paths = KnowledgePath.objects.filter(path_query).only(
-            'id', 'title', 'description', 'created_at'
-        ).order_by('-created_at')
-        
-        logger.debug(f"Knowledge path search query executed - Found {paths.count()} paths")
-        
-        results = []
-        for path in paths:
-            # Convert to simplified search result format
-            result = {
-                'id': path.id,
-                'title': path.title,
-                'description': path.description,
-                'type': 'knowledge_path'
-            }
-            results.append(result)
-        
-        logger.debug(f"Knowledge path search completed - Query: '{query}', Results: {len(results)}")
-        return results
-        
+        documents = search_documents(query, kinds=kinds)
+        counts = search_counts(documents)
+
+        page_documents = documents.only('kind', 'object_id', 'sort_date')
+        if cursor is not None:
+            page_documents = page_documents.filter(_after_cursor(decode_cursor(cursor)))
+            offset = 0
+        else:
+            offset = (page - 1) * page_size
+        page_documents = list(page_documents[offset:offset + page_size + 1])
+
+        has_more = len(page_documents) > page_size
+        page_documents = page_documents[:page_size]
+        result = SearchPage(
+            items=_load_objects(page_documents),
+            counts=counts,
+            next_cursor=encode_cursor(page_documents[-1]) if has_more else None,
+        )
+        logger.info(
+            f"Search completed - Query: '{query}', Type: {search_type}, "
+            f"Total results: {result.total}, Page results: {len(result.items)}"
+        )
+        return result
+
+    except InvalidCursor:
+        raise
     except Exception as e:
-        logger.error(f"Error searching knowledge paths for query '{query}': {str(e)}", exc_info=True)
-        raise 
\ No newline at end of file
+        logger.error(f"Error performing search for query '{query}' with type '{search_type}': {str(e)}", exc_info=True)
+        raise
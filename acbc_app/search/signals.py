@@ -0,0 +1,98 @@
+"""
+Keep SearchDocument rows in sync with the indexed models.
+Full rebuild is only via the rebuild_search_index management command.
+"""
+import logging
+
+from django.db.models.signals import post_delete, post_save
+
+from search import index
+from search.models import SearchDocument
+
+logger = logging.getLogger('academia_blockchain.search.index')
+
+# Fields that feed each document; saves limited to other fields skip reindexing.
+CONTENT_PROFILE_FIELDS = {'title', 'author', 'is_visible', 'content', 'updated_at'}
+CONTENT_FIELDS = {'original_title', 'original_author'}
+TOPIC_FIELDS = {'title', 'description', 'is_public'}
+KNOWLEDGE_PATH_FIELDS = {'title', 'description', 'is_visible'}
+
+
+def _touches(update_fields, indexed_fields):
+    return update_fields is None or bool(set(update_fields) & indexed_fields)
+
+
+def content_profile_saved(sender, instance, update_fields=None, **kwargs):
+    if not _touches(update_fields, CONTENT_PROFILE_FIELDS):
+        return
+    try:
+        index.index_content_profile(instance)
+    except Exception:
+        logger.exception('Failed to index content profile', extra={'profile_id': instance.pk})
+
+
+def content_saved(sender, instance, created, update_fields=None, **kwargs):
+    if created or not _touches(update_fields, CONTENT_FIELDS):
+        # A new Content has no profiles yet; they index themselves on save.
+        return
+    try:
+        index.index_content_profiles_for_content(instance)
+    except Exception:
+        logger.exception('Failed to reindex profiles of content', extra={'content_id': instance.pk})
+
+
+def topic_saved(sender, instance, update_fields=None, **kwargs):
+    if not _touches(update_fields, TOPIC_FIELDS):
+        return
+    try:
+        index.index_topic(instance)
+    except Exception:
+        logger.exception('Failed to index topic', extra={'topic_id': instance.pk})
+
+
+def knowledge_path_saved(sender, instance, update_fields=None, **kwargs):
+    if not _touches(update_fields, KNOWLEDGE_PATH_FIELDS):
+        return
+    try:
+        index.index_knowledge_path(instance)
+    except Exception:
+        logger.exception('Failed to index knowledge path', extra={'knowledge_path_id': instance.pk})
+
+
+def _remove_on_delete(kind):
+    def handler(sender, instance, **kwargs):
+        try:
+            index.remove_document(kind, instance.pk)
+        except Exception:
+            logger.exception('Failed to remove search document', extra={'kind': kind})
+    return handler
+
+
+remove_content_profile = _remove_on_delete(SearchDocument.KIND_CONTENT)
+remove_topic = _remove_on_delete(SearchDocument.KIND_TOPIC)
+remove_knowledge_path = _remove_on_delete(SearchDocument.KIND_KNOWLEDGE_PATH)
+
+
+def connect_search_index_signals():
+    from content.models import Content, ContentProfile, Topic
+    from knowledge_paths.models import KnowledgePath
+
+    post_save.connect(
+        content_profile_saved, sender=ContentProfile,
+        dispatch_uid='search_content_profile_saved',
+    )
+    post_delete.connect(
+        remove_content_profile, sender=ContentProfile,
+        dispatch_uid='search_content_profile_deleted',
+    )
+    post_save.connect(content_saved, sender=Content, dispatch_uid='search_content_saved')
+    post_save.connect(topic_saved, sender=Topic, dispatch_uid='search_topic_saved')
+    post_delete.connect(remove_topic, sender=Topic, dispatch_uid='search_topic_deleted')
+    post_save.connect(
+        knowledge_path_saved, sender=KnowledgePath,
+        dispatch_uid='search_knowledge_path_saved',
+    )
+    post_delete.connect(
+        remove_knowledge_path, sender=KnowledgePath,
+        dispatch_uid='search_knowledge_path_deleted',
+    )
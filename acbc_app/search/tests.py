@@ -1,9 +1,19 @@
-from django.test import TestCase
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
-from content.models import Content, ContentProfile, Topic
+from content.models import Content, ContentProfile, ContentTranscript, Topic
+from content.transcript_utils import locate_text_in_segments
 from knowledge_paths.models import KnowledgePath
+from search.index import search_object_ids
+from search.models import SearchDocument
+from search.transcripts import reciprocal_rank_fusion, search_transcripts
+from utils.vector_fakes import FakeOpenAIClient, FakeQdrantClient
 
 # Create your tests here.
 
@@ -77,3 +87,224 @@ class SearchAPITests(APITestCase):
         self.assertGreater(response.data['count'], 10)
         self.assertEqual(response.data['current_page'], 1)
         self.assertGreaterEqual(response.data['total_pages'], 2)
+
+
+class SearchIndexTests(APITestCase):
+    def setUp(self):
+        self.content = Content.objects.create(
+            original_title="Educación Financiera", original_author="Ana", media_type="TEXT"
+        )
+        self.profile = ContentProfile.objects.create(
+            content=self.content, title="Educación Financiera", author="Ana", is_visible=True
+        )
+        self.topic = Topic.objects.create(title="Economía", description="Mercados y dinero")
+
+    def test_documents_follow_model_changes(self):
+        doc = SearchDocument.objects.get(kind=SearchDocument.KIND_CONTENT, object_id=self.profile.id)
+        self.assertEqual(doc.title, "educacion financiera")
+        self.assertIn("ana", doc.search_text)
+
+        self.content.original_author = "Beatriz"
+        self.content.save()
+        doc.refresh_from_db()
+        self.assertIn("beatriz", doc.search_text)
+
+        self.profile.is_visible = False
+        self.profile.save()
+        doc.refresh_from_db()
+        self.assertFalse(doc.is_public)
+
+        self.topic.delete()
+        self.assertFalse(
+            SearchDocument.objects.filter(kind=SearchDocument.KIND_TOPIC, object_id=self.topic.id).exists()
+        )
+
+    def test_accent_insensitive_search(self):
+        url = reverse('search:search')
+        response = self.client.get(url, {'q': 'EDUCACION', 'type': 'content'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([r['profile_id'] for r in response.data['results']], [self.profile.id])
+
+        response = self.client.get(url, {'q': 'economía', 'type': 'topics'})
+        self.assertEqual([r['id'] for r in response.data['results']], [self.topic.id])
+
+    def test_title_matches_rank_first(self):
+        other = Topic.objects.create(title="Historia", description="Economía antigua")
+        ids = search_object_ids(SearchDocument.KIND_TOPIC, 'economia')
+        self.assertEqual(ids, [self.topic.id, other.id])
+
+    def test_rebuild_search_index_command(self):
+        SearchDocument.objects.all().delete()
+        out = StringIO()
+        call_command('rebuild_search_index', stdout=out)
+        self.assertTrue(
+            SearchDocument.objects.filter(kind=SearchDocument.KIND_CONTENT, object_id=self.profile.id).exists()
+        )
+        self.assertTrue(
+            SearchDocument.objects.filter(kind=SearchDocument.KIND_TOPIC, object_id=self.topic.id).exists()
+        )
+        self.assertIn('Indexed', out.getvalue())
+
+
+class SearchPaginationTests(APITestCase):
+    def setUp(self):
+        for i in range(7):
+            content = Content.objects.create(original_title=f"Bitcoin Libro {i}", media_type="TEXT")
+            ContentProfile.objects.create(content=content, title=f"Bitcoin Libro {i}", is_visible=True)
+        for i in range(5):
+            Topic.objects.create(title=f"Bitcoin Tema {i}", description="Extra")
+        Topic.objects.create(title="Bitcoin Privado", is_public=False)
+        for i in range(3):
+            KnowledgePath.objects.create(title=f"Ruta {i}", description="Aprender bitcoin")
+        self.url = reverse('search:search')
+
+    def test_counts_per_type(self):
+        response = self.client.get(self.url, {'q': 'bitcoin', 'page_size': 4})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['counts'],
+            {'content': 7, 'topics': 5, 'knowledge_paths': 3},
+        )
+        self.assertEqual(response.data['count'], 15)
+        self.assertEqual(response.data['total_pages'], 4)
+        self.assertEqual(len(response.data['results']), 4)
+
+    def test_cursor_walks_merged_stream_once(self):
+        seen = []
+        params = {'q': 'bitcoin', 'page_size': 4}
+        while True:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend((r['type'], r.get('profile_id') or r['id']) for r in response.data['results'])
+            if not response.data['next_cursor']:
+                break
+            params = {'q': 'bitcoin', 'page_size': 4, 'cursor': response.data['next_cursor']}
+        self.assertEqual(len(seen), 15)
+        self.assertEqual(len(set(seen)), 15)
+        # Title matches outrank description-only matches (knowledge paths).
+        self.assertEqual({kind for kind, _ in seen[-3:]}, {'knowledge_path'})
+
+    def test_page_numbers_match_cursor_pages(self):
+        first = self.client.get(self.url, {'q': 'bitcoin', 'page_size': 5})
+        by_cursor = self.client.get(
+            self.url, {'q': 'bitcoin', 'page_size': 5, 'cursor': first.data['next_cursor']}
+        )
+        by_page = self.client.get(self.url, {'q': 'bitcoin', 'page_size': 5, 'page': 2})
+        self.assertEqual(by_cursor.data['results'], by_page.data['results'])
+        self.assertEqual(by_page.data['current_page'], 2)
+
+    def test_only_requested_page_is_loaded(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, {'q': 'bitcoin', 'type': 'topics', 'page_size': 2})
+        self.assertEqual(len(response.data['results']), 2)
+        topic_queries = [q['sql'] for q in ctx.captured_queries if 'content_topic' in q['sql']]
+        self.assertEqual(len(topic_queries), 1)
+        self.assertIn('LIMIT 3', ' '.join(
+            q['sql'] for q in ctx.captured_queries if 'search_searchdocument' in q['sql']
+        ))
+
+    def test_invalid_cursor_and_page(self):
+        response = self.client.get(self.url, {'q': 'bitcoin', 'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {'q': 'bitcoin', 'page': 99})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+SRT_MINING = """1
+00:00:00,000 --> 00:00:04,000
+Hoy hablamos de bitcoin y su historia.
+
+2
+00:00:04,000 --> 00:00:09,500
+La prueba de trabajo protege la red con mineria.
+
+3
+00:00:09,500 --> 00:00:14,000
+Los mineros compiten por encontrar bloques validos.
+
+4
+00:00:14,000 --> 00:00:18,000
+Gracias por ver este video.
+"""
+
+
+class TranscriptSearchTests(APITestCase):
+    def setUp(self):
+        self.topic = Topic.objects.create(title="Bitcoin", description="Todo sobre bitcoin")
+        self.video = Content.objects.create(original_title="Curso de consenso", media_type="VIDEO")
+        self.video.topics.add(self.topic)
+        self.profile = ContentProfile.objects.create(
+            content=self.video, title="Curso de consenso", is_visible=True
+        )
+        ContentTranscript.objects.create(
+            content=self.video,
+            processed_plain="La prueba de trabajo protege la red con mineria. "
+                            "Los mineros compiten por encontrar bloques validos.",
+            source_subtitles=SRT_MINING,
+        )
+        self.hidden = Content.objects.create(original_title="Borrador", media_type="VIDEO")
+        ContentProfile.objects.create(content=self.hidden, title="Borrador", is_visible=False)
+        ContentTranscript.objects.create(
+            content=self.hidden,
+            processed_plain="Mineros y prueba de trabajo en un borrador privado.",
+        )
+        self.lexical = Content.objects.create(original_title="Mineria para principiantes", media_type="TEXT")
+        self.lexical_profile = ContentProfile.objects.create(
+            content=self.lexical, title="Mineria para principiantes", is_visible=True
+        )
+
+        self.openai = FakeOpenAIClient()
+        self.qdrant = FakeQdrantClient.from_transcripts(
+            ContentTranscript.objects.select_related('content'), self.openai
+        )
+        self.url = reverse('search:search')
+
+    def test_semantic_hits_are_timestamped_and_visible_only(self):
+        hits = search_transcripts(
+            'mineros compiten bloques', openai_client=self.openai, qdrant_client=self.qdrant
+        )
+        self.assertEqual(self.openai.embed_calls, 1)
+        self.assertEqual(self.qdrant.search_calls[0]['topic_id'], None)
+        self.assertEqual([hit['content_id'] for hit in hits], [self.video.id])
+        self.assertEqual(hits[0]['profile_id'], self.profile.id)
+        self.assertEqual(hits[0]['start_ms'], 4000)
+        self.assertEqual(hits[0]['end_ms'], 14000)
+
+    def test_locate_text_in_segments_falls_back_to_best_cue(self):
+        segments = ContentTranscript.objects.get(content=self.video).segments
+        location = locate_text_in_segments('gracias por ver', segments)
+        self.assertEqual(location['start_ms'], 14000)
+        self.assertIsNone(locate_text_in_segments('', segments))
+
+    def test_reciprocal_rank_fusion(self):
+        fused = reciprocal_rank_fusion([['a', 'b', 'c'], ['b', 'd']])
+        self.assertEqual([key for key, _score in fused][:2], ['b', 'a'])
+        self.assertAlmostEqual(dict(fused)['b'], 1 / 62 + 1 / 61)
+
+    @override_settings(VECTOR_CLIENTS_FAKE=True)
+    def test_hybrid_endpoint_fuses_lexical_and_vector_rankings(self):
+        response = self.client.get(self.url, {'q': 'mineria', 'type': 'hybrid'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        profile_ids = [r['profile_id'] for r in response.data['results']]
+        self.assertCountEqual(profile_ids, [self.lexical_profile.id, self.profile.id])
+        video_result = next(r for r in response.data['results'] if r['profile_id'] == self.profile.id)
+        self.assertEqual(video_result['transcript_hits'][0]['start_ms'], 4000)
+        self.assertEqual(response.data['counts'], {'content': 2, 'transcripts': 1})
+
+    @override_settings(VECTOR_CLIENTS_FAKE=True)
+    def test_transcripts_endpoint(self):
+        response = self.client.get(self.url, {'q': 'prueba de trabajo', 'type': 'transcripts'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['type'], 'transcript')
+        self.assertEqual(response.data['results'][0]['content_id'], self.video.id)
+
+    @override_settings(VECTOR_CLIENTS_FAKE=False, OPENAI_API_KEY='', QDRANT_URL='')
+    def test_transcripts_unavailable_without_vector_config(self):
+        response = self.client.get(self.url, {'q': 'mineria', 'type': 'transcripts'})
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        # Hybrid degrades to the lexical ranking.
+        response = self.client.get(self.url, {'q': 'mineria', 'type': 'hybrid'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [r['profile_id'] for r in response.data['results']], [self.lexical_profile.id]
+        )
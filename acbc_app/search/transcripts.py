@@ -0,0 +1,222 @@
+"""
+Transcript search for SearchView: semantic (type=transcripts) and hybrid (type=hybrid).
+
+The query is embedded once with OpenAIClient.embed and matched against the topic
+chunk collection with QdrantClient.search (no topic filter). Hits are mapped back to
+timed cues in ContentTranscript.segments. Hybrid mode fuses the lexical content
+ranking from the search index with the vector ranking by reciprocal rank fusion.
+
+Only contents with a visible ContentProfile are returned, same as lexical search.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from django.conf import settings
+
+from content.models import ContentProfile, ContentTranscript
+from content.topic_chat import topic_chat_ready
+from content.transcript_utils import locate_text_in_segments
+from search.index import search_documents
+from search.models import SearchDocument
+from utils.openai_client import OpenAIClient, OpenAIClientError
+from utils.qdrant_client import QdrantClient, QdrantClientError
+from utils.vector_fakes import FakeOpenAIClient, FakeQdrantClient, fake_vector_clients_enabled
+
+logger = logging.getLogger(__name__)
+
+RRF_K = 60
+HITS_PER_CONTENT = 3
+EXCERPT_CHARS = 400
+
+
+class TranscriptSearchError(RuntimeError):
+    """Vector search is not configured or an upstream call failed."""
+
+    def __init__(self, message: str, *, status_code: int = 503):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass
+class HybridResult:
+    """One content in the fused ranking with its best transcript hits."""
+    profile: ContentProfile
+    score: float
+    hits: list = field(default_factory=list)
+
+
+def _candidate_limit() -> int:
+    try:
+        return max(1, min(int(getattr(settings, 'SEARCH_TRANSCRIPT_CANDIDATES', 32)), 64))
+    except (TypeError, ValueError):
+        return 32
+
+
+def get_vector_clients(openai_client=None, qdrant_client=None):
+    """Clients to use: explicit ones, in-memory fakes (VECTOR_CLIENTS_FAKE) or the real ones."""
+    if openai_client is not None and qdrant_client is not None:
+        return openai_client, qdrant_client
+    if fake_vector_clients_enabled():
+        embedder = FakeOpenAIClient()
+        transcripts = ContentTranscript.objects.select_related('content')
+        return embedder, FakeQdrantClient.from_transcripts(transcripts, embedder)
+    ready, reason = topic_chat_ready()
+    if not ready:
+        raise TranscriptSearchError(reason, status_code=503)
+    return openai_client or OpenAIClient(), qdrant_client or QdrantClient()
+
+
+def _visible_profiles(content_ids) -> dict[int, ContentProfile]:
+    """First visible profile per content (what lexical search would show for it)."""
+    profiles: dict[int, ContentProfile] = {}
+    queryset = (
+        ContentProfile.objects.filter(content_id__in=set(content_ids), is_visible=True)
+        .select_related('content', 'content__file_details')
+        .order_by('content_id', 'pk')
+    )
+    for profile in queryset:
+        profiles.setdefault(profile.content_id, profile)
+    return profiles
+
+
+def _int_or_none(value) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _vector_hits(query: str, openai, qdrant, limit: int) -> list[dict[str, Any]]:
+    """Embed query once, search every topic, keep one hit per (content, chunk)."""
+    try:
+        vector = openai.embed(query)
+    except OpenAIClientError as exc:
+        logger.exception('Transcript search embed failed')
+        raise TranscriptSearchError(
+            f'No se pudo generar el embedding de la búsqueda: {exc}', status_code=502,
+        ) from exc
+    try:
+        # Chunks are stored once per topic, so over-fetch before de-duplicating.
+        raw_hits = qdrant.search(vector, limit=limit * 2)
+    except QdrantClientError as exc:
+        logger.exception('Transcript search Qdrant query failed')
+        raise TranscriptSearchError(f'No se pudo buscar en Qdrant: {exc}', status_code=502) from exc
+
+    hits = []
+    seen = set()
+    for hit in raw_hits:
+        payload = hit.get('payload') or {}
+        content_id = _int_or_none(payload.get('content_id'))
+        chunk_index = _int_or_none(payload.get('chunk_index'))
+        if content_id is None or (content_id, chunk_index) in seen:
+            continue
+        seen.add((content_id, chunk_index))
+        try:
+            score = float(hit.get('score') or 0.0)
+        except (TypeError, ValueError):
+            score = 0.0
+        hits.append({
+            'content_id': content_id,
+            'chunk_index': chunk_index,
+            'score': score,
+            'text': (payload.get('text') or '').strip(),
+        })
+    return hits[:limit]
+
+
+def _timed_hits(hits, profiles) -> list[dict[str, Any]]:
+    """Public transcript hits (visible contents only) with start/end from segments."""
+    hits = [hit for hit in hits if hit['content_id'] in profiles]
+    segments_by_content = dict(
+        ContentTranscript.objects.filter(content_id__in={hit['content_id'] for hit in hits})
+        .values_list('content_id', 'segments')
+    )
+    results = []
+    for hit in hits:
+        profile = profiles[hit['content_id']]
+        location = locate_text_in_segments(
+            hit['text'], segments_by_content.get(hit['content_id']) or []
+        ) or {}
+        text = hit['text']
+        results.append({
+            'type': 'transcript',
+            'content_id': hit['content_id'],
+            'profile_id': profile.id,
+            'title': profile.title or profile.content.original_title or '',
+            'chunk_index': hit['chunk_index'],
+            'score': round(hit['score'], 4),
+            'excerpt': text[:EXCERPT_CHARS] + ('…' if len(text) > EXCERPT_CHARS else ''),
+            'start_ms': location.get('start_ms'),
+            'end_ms': location.get('end_ms'),
+            'segment_index': location.get('segment_index'),
+            'transcript_url': f"/content/{hit['content_id']}/transcript?context=library",
+        })
+    return results
+
+
+def search_transcripts(query: str, *, openai_client=None, qdrant_client=None) -> list[dict[str, Any]]:
+    """Semantic transcript hits for query, best first."""
+    openai, qdrant = get_vector_clients(openai_client, qdrant_client)
+    hits = _vector_hits(query, openai, qdrant, _candidate_limit())
+    return _timed_hits(hits, _visible_profiles(hit['content_id'] for hit in hits))
+
+
+def reciprocal_rank_fusion(rankings, k: int = RRF_K) -> list[tuple[Any, float]]:
+    """Fuse ranked key lists: score(key) = sum(1 / (k + rank)). Ties keep first-seen order."""
+    scores: dict[Any, float] = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, start=1):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+def hybrid_search(query: str, *, openai_client=None, qdrant_client=None) -> list[HybridResult]:
+    """
+    Contents ranked by RRF over the lexical index and transcript vectors.
+    If vector search is unavailable the lexical ranking is returned on its own.
+    """
+    limit = _candidate_limit()
+    profile_ids = list(
+        search_documents(query, kinds=[SearchDocument.KIND_CONTENT])
+        .values_list('object_id', flat=True)[:limit]
+    )
+    lexical_profiles = ContentProfile.objects.select_related(
+        'content', 'content__file_details'
+    ).in_bulk(profile_ids)
+    profiles: dict[int, ContentProfile] = {}
+    lexical_ranking = []
+    for profile_id in profile_ids:
+        profile = lexical_profiles.get(profile_id)
+        if profile is not None and profile.content_id not in profiles:
+            profiles[profile.content_id] = profile
+            lexical_ranking.append(profile.content_id)
+
+    try:
+        openai, qdrant = get_vector_clients(openai_client, qdrant_client)
+        hits = _vector_hits(query, openai, qdrant, limit)
+    except TranscriptSearchError as exc:
+        logger.warning('Hybrid search falling back to lexical ranking: %s', exc)
+        hits = []
+
+    missing = {hit['content_id'] for hit in hits} - set(profiles)
+    if missing:
+        profiles.update(_visible_profiles(missing))
+    timed_hits = _timed_hits(hits, profiles)
+
+    hits_by_content: dict[int, list] = {}
+    vector_ranking = []
+    for hit in timed_hits:
+        content_hits = hits_by_content.setdefault(hit['content_id'], [])
+        if not content_hits:
+            vector_ranking.append(hit['content_id'])
+        if len(content_hits) < HITS_PER_CONTENT:
+            content_hits.append(hit)
+
+    return [
+        HybridResult(profile=profiles[content_id], score=score, hits=hits_by_content.get(content_id, []))
+        for content_id, score in reciprocal_rank_fusion([lexical_ranking, vector_ranking])
+    ]
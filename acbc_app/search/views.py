@@ -1,29 +1,53 @@
 import logging
-from django.shortcuts import render
+import math
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny
-from rest_framework.pagination import PageNumberPagination
 from content.serializers import SimpleContentProfileSerializer
-from .services import perform_search
+from .models import SearchDocument
+from .services import InvalidCursor, search_page
+from .transcripts import TranscriptSearchError, hybrid_search, search_transcripts
 
 logger = logging.getLogger(__name__)
 
+# Search types answered from transcript vectors instead of the lexical index alone.
+TRANSCRIPT_SEARCH_TYPES = ('transcripts', 'hybrid')
+
+
+def serialize_content_profile_result(profile, request):
+    """Search result payload for a ContentProfile (content type)."""
+    serialized_data = SimpleContentProfileSerializer(profile, context={'request': request}).data
+    # Add type information for frontend routing
+    serialized_data['type'] = 'content'
+    serialized_data['source'] = 'profile'
+    serialized_data['profile_id'] = profile.id
+    return serialized_data
+
 # Create your views here.
 
-class SearchPagination(PageNumberPagination):
+class SearchPagination:
+    """Page size handling for SearchView; paging itself happens in the database."""
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 100
 
-    def get_paginated_response(self, data):
-        return Response({
-            'count': self.page.paginator.count,
-            'current_page': self.page.number,
-            'total_pages': self.page.paginator.num_pages,
-            'results': data
-        })
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        if size < 1:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_page_number(self, request):
+        try:
+            number = int(request.query_params.get('page', 1))
+        except (TypeError, ValueError):
+            return None
+        return number if number >= 1 else None
+
 
 class SearchView(APIView):
     """
@@ -38,12 +62,23 @@ class SearchView(APIView):
         
         Query parameters:
         - q: The search query (required)
-        - type: The type of content to search for ('all', 'content', 'topics', 'knowledge_paths') (optional, default: 'all')
+        - type: The type of content to search for ('all', 'content', 'topics', 'knowledge_paths',
+          'transcripts', 'hybrid') (optional, default: 'all')
         - page: The page number (optional, default: 1)
+        - cursor: Opaque next_cursor from a previous response; takes precedence over page (optional)
         - page_size: The number of results per page (optional, default: 10)
+
+        Results from all types are merged into one relevance-ranked stream; `counts`
+        reports matches per type and `count` their total.
+
+        `transcripts` returns timestamped transcript passages matched by meaning;
+        `hybrid` returns contents ranked by fusing the lexical and transcript rankings,
+        each with its best `transcript_hits`. Both work over a bounded candidate set
+        and only support page numbers.
         """
         query = request.query_params.get('q', '')
         search_type = request.query_params.get('type', 'all')
+        cursor = request.query_params.get('cursor') or None
         user = request.user.username if request.user.is_authenticated else 'anonymous'
         
         logger.info(f"Search request - Query: '{query}', Type: {search_type}, User: {user}")
@@ -55,42 +90,108 @@ class SearchView(APIView):
                 {"error": "Search query is required"}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
+
+        paginator = self.pagination_class()
+        page_size = paginator.get_page_size(request)
+        page_number = paginator.get_page_number(request)
+        if page_number is None and cursor is None:
+            return Response({"detail": "Invalid page."}, status=status.HTTP_404_NOT_FOUND)
         
+        if search_type.lower() in TRANSCRIPT_SEARCH_TYPES:
+            return self.transcript_search_response(
+                request, query, search_type.lower(), page_size, page_number or 1, user,
+            )
+
         try:
-            # Get search results
             logger.debug(f"Performing search for query '{query}' with type '{search_type}'")
-            results = perform_search(query, search_type)
-            logger.debug(f"Search returned {len(results)} results")
-            
-            # Serialize results based on type
-            serialized_results = []
-            
-            for result in results:
-                if hasattr(result, 'content'):  # This is a ContentProfile object
-                    # Serialize content profiles using SimpleContentProfileSerializer
-                    serializer = SimpleContentProfileSerializer(result, context={'request': request})
-                    serialized_data = serializer.data
-                    # Add type information for frontend routing
-                    serialized_data['type'] = 'content'
-                    serialized_data['source'] = 'profile'
-                    serialized_data['profile_id'] = result.id
-                    serialized_results.append(serialized_data)
-                else:
-                    # Handle other result types (topics, knowledge paths)
-                    serialized_results.append(result)
-            
-            logger.debug(f"Serialized {len(serialized_results)} search results")
-            
-            # Paginate the results
-            paginator = self.pagination_class()
-            page = paginator.paginate_queryset(serialized_results, request)
-            
-            # Return paginated response
-            logger.info(f"Search completed successfully - Query: '{query}', Type: {search_type}, Results: {len(serialized_results)}, User: {user}")
-            return paginator.get_paginated_response(page)
+            page = search_page(
+                query,
+                search_type,
+                page_size=page_size,
+                page=page_number or 1,
+                cursor=cursor,
+            )
+        except InvalidCursor:
+            logger.warning(f"Search request failed - invalid cursor from user {user}")
+            return Response({"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             logger.error(f"Error performing search for query '{query}' with type '{search_type}' for user {user}: {str(e)}", exc_info=True)
             return Response(
                 {"error": str(e)}, 
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+        total_pages = max(1, math.ceil(page.total / page_size))
+        if cursor is None and page_number > total_pages:
+            return Response({"detail": "Invalid page."}, status=status.HTTP_404_NOT_FOUND)
+
+        # Serialize only the requested page
+        serialized_results = []
+        for kind, result in page.items:
+            if kind == SearchDocument.KIND_CONTENT:
+                serialized_results.append(serialize_content_profile_result(result, request))
+            else:
+                # Topics and knowledge paths use the simplified search result format
+                serialized_results.append({
+                    'id': result.id,
+                    'title': result.title,
+                    'description': result.description,
+                    'type': kind,
+                })
+
+        logger.info(f"Search completed successfully - Query: '{query}', Type: {search_type}, Results: {page.total}, User: {user}")
+        return Response({
+            'count': page.total,
+            'current_page': page_number if cursor is None else None,
+            'total_pages': total_pages,
+            'counts': page.counts,
+            'next_cursor': page.next_cursor,
+            'results': serialized_results,
+        })
+
+    def transcript_search_response(self, request, query, search_type, page_size, page_number, user):
+        try:
+            if search_type == 'transcripts':
+                entries = search_transcripts(query)
+                counts = {'transcripts': len(entries)}
+            else:
+                entries = hybrid_search(query)
+                counts = {
+                    'content': len(entries),
+                    'transcripts': sum(1 for entry in entries if entry.hits),
+                }
+        except TranscriptSearchError as exc:
+            logger.warning(f"Transcript search unavailable for user {user}: {exc}")
+            return Response({"error": str(exc)}, status=exc.status_code)
+        except Exception as e:
+            logger.error(f"Error performing {search_type} search for query '{query}' for user {user}: {str(e)}", exc_info=True)
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        total_pages = max(1, math.ceil(len(entries) / page_size))
+        if page_number > total_pages:
+            return Response({"detail": "Invalid page."}, status=status.HTTP_404_NOT_FOUND)
+        start = (page_number - 1) * page_size
+        page_entries = entries[start:start + page_size]
+
+        if search_type == 'transcripts':
+            serialized_results = page_entries
+        else:
+            serialized_results = []
+            for entry in page_entries:
+                serialized_data = serialize_content_profile_result(entry.profile, request)
+                serialized_data['score'] = round(entry.score, 6)
+                serialized_data['transcript_hits'] = entry.hits
+                serialized_results.append(serialized_data)
+
+        logger.info(f"Search completed successfully - Query: '{query}', Type: {search_type}, Results: {len(entries)}, User: {user}")
+        return Response({
+            'count': len(entries),
+            'current_page': page_number,
+            'total_pages': total_pages,
+            'counts': counts,
+            'next_cursor': None,
+            'results': serialized_results,
+        })
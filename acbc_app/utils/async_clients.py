@@ -0,0 +1,397 @@
+"""asyncio counterparts of OpenAIClient / QdrantClient (httpx.AsyncClient).
+
+Same settings, payloads and error types as the requests-based clients, so the async
+topic chat pipeline can overlap upstream calls. httpx is imported lazily; without it
+the constructors raise the usual client errors. Transport failures (connect errors,
+timeouts, broken streams) are raised as OpenAIClientError / QdrantClientError.
+
+Requests follow the same upstream policy as the requests-based clients
+(utils.http_session): they go through the upstream's shared circuit breaker and
+per-endpoint counters, and are retried with the same backoff on connection errors and
+429, and on 5xx only where POSTs are replayable (Qdrant).
+
+The sync views run the pipeline through async_to_sync, which gives every request a
+fresh event loop, and httpx connections cannot outlive the loop that opened them. The
+httpx.AsyncClient instances therefore live on one long-lived background loop per
+process (ClientLoop): each call is sent to that loop and awaited from the caller's,
+so keep-alive pools are reused across requests. The loop starts on first use and
+close_client_loop() (registered with atexit) closes the clients and stops it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Optional
+
+from django.conf import settings
+
+from utils.http_session import UpstreamCircuitOpen, get_http_session
+from utils.openai_client import OPENAI_API_BASE, OpenAIClientError, chat_request_body
+from utils.qdrant_client import QdrantClientError
+
+logger = logging.getLogger(__name__)
+
+_STREAM_END = object()
+
+
+def _httpx():
+    try:
+        import httpx
+    except ImportError:
+        return None
+    return httpx
+
+
+def _transport_errors() -> tuple:
+    httpx = _httpx()
+    return (httpx.HTTPError,) if httpx else ()
+
+
+def _connect_errors() -> tuple:
+    """Failures before the request reached the upstream, safe to replay."""
+    httpx = _httpx()
+    return (httpx.ConnectError, httpx.ConnectTimeout) if httpx else ()
+
+
+def _error_detail(response) -> Any:
+    try:
+        return response.json()
+    except Exception:
+        return (response.text or '').strip()[:800]
+
+
+class ClientLoop:
+    """A background event loop thread owning the process's pooled httpx.AsyncClients."""
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.loop = asyncio.new_event_loop()
+        self.clients: dict[tuple, Any] = {}
+        self.thread = threading.Thread(target=self.loop.run_forever, name='async-http-clients', daemon=True)
+        self.thread.start()
+
+    def _client(self, key: tuple, factory: Callable[[], Any]):
+        # Only called on self.loop, so no lock is needed.
+        client = self.clients.get(key)
+        if client is None:
+            client = self.clients[key] = factory()
+        return client
+
+    async def call(self, key: tuple, factory: Callable[[], Any], operation):
+        """Await operation(client) on the client loop; cancelling the caller cancels it."""
+
+        async def run():
+            return await operation(self._client(key, factory))
+
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(run(), self.loop))
+
+    async def stream(self, key: tuple, factory: Callable[[], Any], operation) -> AsyncIterator[Any]:
+        """Iterate operation(client), an async iterator running on the client loop."""
+        caller = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def put(item):
+            caller.call_soon_threadsafe(queue.put_nowait, item)
+
+        async def produce():
+            try:
+                async for item in operation(self._client(key, factory)):
+                    put((item, None))
+            except Exception as exc:
+                put((None, exc))
+            else:
+                put((_STREAM_END, None))
+
+        future = asyncio.run_coroutine_threadsafe(produce(), self.loop)
+        try:
+            while True:
+                item, exc = await queue.get()
+                if exc is not None:
+                    raise exc
+                if item is _STREAM_END:
+                    return
+                yield item
+        finally:
+            future.cancel()
+
+    def close(self, timeout: float = 5.0) -> None:
+        async def aclose_all():
+            for client in self.clients.values():
+                await client.aclose()
+            self.clients.clear()
+
+        try:
+            asyncio.run_coroutine_threadsafe(aclose_all(), self.loop).result(timeout)
+        except Exception:
+            logger.warning('Could not close pooled async HTTP clients', exc_info=True)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout)
+        if not self.loop.is_running():
+            self.loop.close()
+
+
+_client_loop: Optional[ClientLoop] = None
+_client_loop_lock = threading.Lock()
+
+
+def get_client_loop() -> ClientLoop:
+    """The process's ClientLoop, started on first use (and again in a forked worker)."""
+    global _client_loop
+    current = _client_loop
+    if current is not None and current.pid == os.getpid():
+        return current
+    with _client_loop_lock:
+        if _client_loop is None or _client_loop.pid != os.getpid():
+            _client_loop = ClientLoop()
+        return _client_loop
+
+
+def close_client_loop() -> None:
+    """Close the pooled clients and stop the background loop (process exit, tests)."""
+    global _client_loop
+    with _client_loop_lock:
+        current, _client_loop = _client_loop, None
+    if current is not None and current.pid == os.getpid():
+        current.close()
+
+
+atexit.register(close_client_loop)
+
+
+class _PooledClient:
+    """Runs requests on an explicit httpx client, or on the shared one in ClientLoop."""
+
+    error_class: type = OpenAIClientError
+    upstream: str = 'openai'
+
+    def __init__(self, *, key: tuple, base_url: str, timeout: float, client=None):
+        self.timeout = timeout
+        self.client = client
+        self._key = key
+        self._base_url = base_url
+        if client is None and _httpx() is None:
+            raise self.error_class('httpx no está instalado: pip install httpx')
+
+    def _new_client(self):
+        return _httpx().AsyncClient(base_url=self._base_url, timeout=self.timeout)
+
+    async def _call(self, operation):
+        if self.client is not None:
+            return await operation(self.client)
+        return await get_client_loop().call(self._key, self._new_client, operation)
+
+    def _stream(self, operation) -> AsyncIterator[Any]:
+        if self.client is not None:
+            return operation(self.client)
+        return get_client_loop().stream(self._key, self._new_client, operation)
+
+    async def _send(self, client, method: str, path: str, *, stream: bool = False, **kwargs):
+        """
+        Send one request under the upstream's breaker, counters and retry policy and
+        return the last response (open when stream=True; the caller closes it).
+        """
+        session = get_http_session(self.upstream)
+        url = f'{self._base_url}{path}'
+        attempt = 0
+        while True:
+            try:
+                session.before_request(method, url)
+            except UpstreamCircuitOpen as exc:
+                raise self.error_class(str(exc)) from exc
+            started = time.perf_counter()
+            status_code = None
+            try:
+                request = client.build_request(method, path, timeout=self.timeout, **kwargs)
+                response = await client.send(request, stream=stream)
+                status_code = response.status_code
+            except _connect_errors():
+                delay = session.retry_delay(method, None, attempt)
+                if delay is None:
+                    raise
+                response = None
+            finally:
+                session.after_request(method, url, status_code, (time.perf_counter() - started) * 1000)
+            if response is not None:
+                delay = session.retry_delay(method, status_code, attempt, response.headers.get('Retry-After'))
+                if delay is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _post(self, path: str, headers: dict[str, str], body: dict[str, Any]) -> Any:
+        async def post(client):
+            response = await self._send(client, 'POST', path, headers=headers, json=body)
+            if response.status_code >= 400:
+                detail = _error_detail(response)
+                raise self.error_class(
+                    f'POST {path} → {response.status_code}: {detail}',
+                    status_code=response.status_code,
+                    body=detail,
+                )
+            return response.json()
+
+        try:
+            return await self._call(post)
+        except _transport_errors() as exc:
+            raise self.error_class(f'POST {path} → {exc}') from exc
+        except ValueError as exc:
+            raise self.error_class(f'POST {path} devolvió JSON inválido: {exc}') from exc
+
+    async def aclose(self) -> None:
+        """Close an explicitly passed client; pooled ones are closed by close_client_loop()."""
+        if self.client is not None:
+            await self.client.aclose()
+
+
+class AsyncOpenAIClient(_PooledClient):
+    """Embeddings + chat (blocking and streamed) over the pooled httpx.AsyncClient."""
+
+    error_class = OpenAIClientError
+
+    def __init__(self, *, api_key: Optional[str] = None, timeout: float = 60.0, client=None):
+        self.api_key = (api_key or getattr(settings, 'OPENAI_API_KEY', '') or '').strip()
+        if not self.api_key:
+            raise OpenAIClientError('OpenAI no configurado. Define OPENAI_API_KEY en acbc_app/.env')
+        super().__init__(key=('openai', OPENAI_API_BASE), base_url=OPENAI_API_BASE, timeout=timeout, client=client)
+
+    def _headers(self) -> dict[str, str]:
+        return {
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json',
+        }
+
+    async def embed(self, text: str, *, model: Optional[str] = None) -> list[float]:
+        model_name = model or getattr(settings, 'OPENAI_EMBEDDING_MODEL', '') or 'text-embedding-3-large'
+        data = await self._post('/embeddings', self._headers(), {'model': model_name, 'input': text})
+        items = (data or {}).get('data') or []
+        embedding = items[0].get('embedding') if items else None
+        if not isinstance(embedding, list) or not embedding:
+            raise OpenAIClientError('OpenAI embeddings no devolvió vectores.')
+        return list(embedding)
+
+    async def chat(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        model: Optional[str] = None,
+        temperature: float = 0.2,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        body = chat_request_body(messages, model=model, temperature=temperature, max_tokens=max_tokens)
+        data = await self._post('/chat/completions', self._headers(), body)
+        choices = (data or {}).get('choices') or []
+        content = ((choices[0].get('message') or {}).get('content') or '').strip() if choices else ''
+        if not content:
+            raise OpenAIClientError('OpenAI chat devolvió una respuesta vacía.')
+        return content
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        model: Optional[str] = None,
+        temperature: float = 0.2,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        body = chat_request_body(messages, model=model, temperature=temperature, max_tokens=max_tokens)
+        body['stream'] = True
+        path = '/chat/completions'
+        headers = self._headers()
+
+        async def deltas(client):
+            response = await self._send(client, 'POST', path, stream=True, headers=headers, json=body)
+            try:
+                if response.status_code >= 400:
+                    await response.aread()
+                    detail = _error_detail(response)
+                    raise OpenAIClientError(
+                        f'POST {path} → {response.status_code}: {detail}',
+                        status_code=response.status_code,
+                        body=detail,
+                    )
+                async for line in response.aiter_lines():
+                    if not line.startswith('data:'):
+                        continue
+                    data = line[len('data:'):].strip()
+                    if data == '[DONE]':
+                        break
+                    try:
+                        chunk = json.loads(data)
+                    except ValueError as exc:
+                        raise OpenAIClientError(
+                            f'OpenAI chat stream devolvió un chunk inválido: {data[:200]}'
+                        ) from exc
+                    for choice in chunk.get('choices') or []:
+                        delta = (choice.get('delta') or {}).get('content')
+                        if delta:
+                            yield delta
+            finally:
+                await response.aclose()
+
+        try:
+            async for delta in self._stream(deltas):
+                yield delta
+        except _transport_errors() as exc:
+            raise OpenAIClientError(f'POST {path} (stream) → {exc}') from exc
+
+
+class AsyncQdrantClient(_PooledClient):
+    """Vector search against Qdrant over the pooled httpx.AsyncClient."""
+
+    error_class = QdrantClientError
+    upstream = 'qdrant'
+
+    def __init__(
+        self,
+        *,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        collection: Optional[str] = None,
+        timeout: float = 30.0,
+        client=None,
+    ):
+        self.base_url = (url or getattr(settings, 'QDRANT_URL', '') or '').strip().rstrip('/')
+        self.api_key = (api_key or getattr(settings, 'QDRANT_API_KEY', '') or '').strip()
+        self.collection = (
+            collection
+            or getattr(settings, 'QDRANT_COLLECTION', '')
+            or 'sophia_acbc_topic_chunks'
+        ).strip()
+        if not self.base_url or not self.api_key:
+            raise QdrantClientError(
+                'Qdrant no configurado. Define QDRANT_URL y QDRANT_API_KEY en acbc_app/.env'
+            )
+        self._headers = {
+            'api-key': self.api_key,
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+        }
+        super().__init__(key=('qdrant', self.base_url), base_url=self.base_url, timeout=timeout, client=client)
+
+    async def search(
+        self,
+        vector: list[float],
+        *,
+        topic_id: Optional[int] = None,
+        limit: int = 8,
+        with_payload: bool = True,
+        with_vector: bool = False,
+    ) -> list[dict[str, Any]]:
+        body: dict[str, Any] = {
+            'vector': vector,
+            'limit': max(1, min(int(limit), 64)),
+            'with_payload': with_payload,
+            'with_vector': with_vector,
+        }
+        if topic_id is not None:
+            body['filter'] = {'must': [{'key': 'topic_id', 'match': {'value': int(topic_id)}}]}
+        path = f'/collections/{self.collection}/points/search'
+        data = await self._post(path, self._headers, body)
+        return list((data or {}).get('result') or [])
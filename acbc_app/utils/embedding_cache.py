@@ -0,0 +1,172 @@
+"""Bounded cache of query embeddings, keyed by (model, normalized text hash).
+
+Layer 1 is an in-process LRU with a TTL; layer 2 is an optional Django cache alias
+shared between workers (TOPIC_CHAT_EMBEDDING_CACHE_ALIAS). Repeated questions, even
+with different casing, spacing or surrounding punctuation, skip OpenAIClient.embed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_TTL_SECONDS = 3600
+_EDGE_PUNCTUATION = '¿?¡!.,;: \t\n'
+
+
+def normalize_query_text(text: str) -> str:
+    """Canonical form used for the cache key: NFC, casefolded, single spaces, no edge punctuation."""
+    normalized = unicodedata.normalize('NFC', text or '').casefold()
+    return ' '.join(normalized.split()).strip(_EDGE_PUNCTUATION)
+
+
+def embedding_model_name(model: Optional[str] = None) -> str:
+    return model or getattr(settings, 'OPENAI_EMBEDDING_MODEL', '') or 'text-embedding-3-large'
+
+
+def embedding_cache_key(text: str, model: Optional[str] = None) -> str:
+    digest = hashlib.sha256(
+        f'{embedding_model_name(model)}\x00{normalize_query_text(text)}'.encode('utf-8')
+    ).hexdigest()
+    return f'embedding:{digest}'
+
+
+class EmbeddingCache:
+    """Thread-safe LRU of vectors with TTL, optional shared backend and hit/miss counters."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: int = DEFAULT_TTL_SECONDS,
+        shared_alias: str = '',
+    ):
+        self.max_entries = max(0, int(max_entries))
+        self.ttl = max(0, int(ttl))
+        self.shared_alias = shared_alias or ''
+        self._entries: OrderedDict[str, tuple[float, list[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl > 0
+
+    def _shared(self):
+        return caches[self.shared_alias] if self.shared_alias else None
+
+    def _get_local(self, key: str) -> Optional[list[float]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, vector = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return vector
+
+    def _set_local(self, key: str, vector: list[float]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, text: str, model: Optional[str] = None) -> Optional[list[float]]:
+        if not self.enabled:
+            return None
+        key = embedding_cache_key(text, model)
+        vector = self._get_local(key)
+        if vector is not None:
+            self.hits += 1
+            return vector
+        shared = self._shared()
+        if shared is not None:
+            try:
+                vector = shared.get(key)
+            except Exception:
+                logger.warning('Shared embedding cache read failed', exc_info=True)
+                vector = None
+            if vector is not None:
+                self.shared_hits += 1
+                self._set_local(key, vector)
+                return vector
+        self.misses += 1
+        return None
+
+    def set(self, text: str, vector: list[float], model: Optional[str] = None) -> None:
+        if not self.enabled:
+            return
+        key = embedding_cache_key(text, model)
+        self._set_local(key, vector)
+        shared = self._shared()
+        if shared is not None:
+            try:
+                shared.set(key, vector, self.ttl)
+            except Exception:
+                logger.warning('Shared embedding cache write failed', exc_info=True)
+
+    def embed(self, client, text: str, *, model: Optional[str] = None) -> list[float]:
+        """client.embed(text) unless an equivalent text was embedded with the same model recently."""
+        vector = self.get(text, model)
+        if vector is not None:
+            return vector
+        vector = client.embed(text, model=model) if model else client.embed(text)
+        self.set(text, vector, model)
+        return vector
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        self.hits = self.shared_hits = self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            size = len(self._entries)
+        return {
+            'hits': self.hits,
+            'shared_hits': self.shared_hits,
+            'misses': self.misses,
+            'size': size,
+            'max_entries': self.max_entries,
+            'ttl': self.ttl,
+        }
+
+
+_default_cache: Optional[EmbeddingCache] = None
+_default_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Process-wide cache configured from TOPIC_CHAT_EMBEDDING_CACHE_* settings."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = EmbeddingCache(
+                max_entries=getattr(settings, 'TOPIC_CHAT_EMBEDDING_CACHE_SIZE', DEFAULT_MAX_ENTRIES),
+                ttl=getattr(settings, 'TOPIC_CHAT_EMBEDDING_CACHE_TTL', DEFAULT_TTL_SECONDS),
+                shared_alias=getattr(settings, 'TOPIC_CHAT_EMBEDDING_CACHE_ALIAS', ''),
+            )
+        return _default_cache
+
+
+def reset_embedding_cache() -> None:
+    """Drop the process-wide cache so the next call re-reads settings (tests, reconfiguration)."""
+    global _default_cache
+    with _default_lock:
+        _default_cache = None
@@ -0,0 +1,75 @@
+"""
+Batch loading for GenericForeignKey values.
+
+Reading a GenericForeignKey on a list of rows costs one query per row and field.
+prefetch_generic() loads the related objects grouped by content type (one in_bulk
+per model) and stores each one in the field's cache, so reading obj.<field>
+afterwards costs no query. Unlike prefetch_related(), the instances may point at
+models that do not share attributes, and a second level (e.g. the object a
+comment is attached to) can be loaded from the returned objects.
+"""
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+
+
+def _generic_fields(model, field_names):
+    return [model._meta.get_field(name) for name in field_names]
+
+
+def _reference(instance, field):
+    """(content_type_id, raw pk) the generic field of instance points at, or None."""
+    content_type_id = getattr(instance, instance._meta.get_field(field.ct_field).attname)
+    object_id = getattr(instance, field.fk_field)
+    if not content_type_id or object_id in (None, ''):
+        return None
+    return content_type_id, object_id
+
+
+def _to_pk(content_type_id, raw_id):
+    model = ContentType.objects.get_for_id(content_type_id).model_class()
+    if model is None:
+        return None
+    try:
+        return model._meta.pk.to_python(raw_id)
+    except ValidationError:
+        return None
+
+
+def prefetch_generic(instances, *field_names, querysets=None):
+    """
+    Resolve the GenericForeignKeys field_names on instances, one query per content type.
+
+    querysets optionally maps a model class to the queryset it is loaded from
+    (select_related, only, ...). Returns the loaded objects as
+    {(content_type_id, pk): object}. References to missing rows resolve to None.
+    """
+    instances = [instance for instance in instances if instance is not None]
+    fields_by_model = {}
+    wanted = defaultdict(set)
+    for instance in instances:
+        model = type(instance)
+        if model not in fields_by_model:
+            fields_by_model[model] = _generic_fields(model, field_names)
+        for field in fields_by_model[model]:
+            reference = _reference(instance, field)
+            if reference:
+                wanted[reference[0]].add(reference[1])
+
+    loaded = {}
+    for content_type_id, raw_ids in wanted.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        if model is None:
+            continue
+        ids = {_to_pk(content_type_id, raw_id) for raw_id in raw_ids} - {None}
+        queryset = (querysets or {}).get(model, model._base_manager)
+        for pk, obj in queryset.in_bulk(ids).items():
+            loaded[(content_type_id, pk)] = obj
+
+    for instance in instances:
+        for field in fields_by_model[type(instance)]:
+            reference = _reference(instance, field)
+            if reference:
+                field.set_cached_value(instance, loaded.get((reference[0], _to_pk(*reference))))
+    return loaded
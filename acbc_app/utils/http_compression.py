@@ -0,0 +1,86 @@
+"""Per-view response compression negotiated from Accept-Encoding.
+
+There is no GZipMiddleware in this project; views with large, public JSON bodies
+(transcripts) mix in CompressedResponseMixin instead. Brotli is used when the
+``brotli`` package is installed and the client accepts ``br``, gzip otherwise.
+Bodies shorter than RESPONSE_COMPRESSION_MIN_BYTES are sent as is.
+"""
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def accepted_encodings(header):
+    """{coding: q} from an Accept-Encoding header value."""
+    accepted = {}
+    for part in (header or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def negotiate_encoding(header):
+    """'br', 'gzip' or None for the best coding both sides support."""
+    accepted = accepted_encodings(header)
+    wildcard = accepted.get('*', 0.0)
+    available = ['br', 'gzip'] if _brotli() else ['gzip']
+    best, best_q = None, 0.0
+    for coding in available:
+        q = accepted.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress_response(request, response):
+    """Compress a rendered response in place when the client accepts it."""
+    if (
+        response.streaming
+        or response.status_code != 200
+        or response.has_header('Content-Encoding')
+    ):
+        return response
+    patch_vary_headers(response, ('Accept-Encoding',))
+    if len(response.content) < getattr(settings, 'RESPONSE_COMPRESSION_MIN_BYTES', 1024):
+        return response
+    coding = negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+    if coding == 'br':
+        body = _brotli().compress(response.content)
+    elif coding == 'gzip':
+        body = compress_string(response.content)
+    else:
+        return response
+    if len(body) >= len(response.content):
+        return response
+    response.content = body
+    response['Content-Length'] = str(len(body))
+    response['Content-Encoding'] = coding
+    return response
+
+
+class CompressedResponseMixin:
+    """APIView mixin: render the response and compress it for the client."""
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if hasattr(response, 'render') and not response.is_rendered:
+            response.render()
+        return compress_response(request, response)
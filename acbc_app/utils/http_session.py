@@ -0,0 +1,290 @@
+"""Process-wide pooled HTTP sessions for upstream APIs (OpenAI, Qdrant).
+
+get_http_session(upstream) returns one shared requests.Session per upstream with:
+- keep-alive connection pools sized by UPSTREAM_HTTP_POOL_SIZE;
+- bounded exponential-backoff retries (urllib3 Retry, honouring Retry-After) on
+  connection errors and 429 for every request, and on 5xx only for idempotent methods
+  or upstreams whose POSTs are read-only (REPLAYABLE_POST_UPSTREAMS): a chat completion
+  that failed after reaching OpenAI is never sent twice;
+- a circuit breaker that fails fast with UpstreamCircuitOpen after
+  UPSTREAM_CIRCUIT_FAILURES consecutive failures (connection errors and 5xx; a 429 only
+  backs off), for UPSTREAM_CIRCUIT_RESET seconds;
+- per-endpoint request/error/latency counters (http_metrics_snapshot()).
+
+requests.Session is safe to share across threads for plain request() calls; the
+circuit breaker and counters take their own lock. The httpx clients of
+utils.async_clients apply the same policy through before_request(), retry_delay() and
+after_request(), so both transports share one breaker and one set of counters.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+FAILURE_STATUSES = (500, 502, 503, 504)
+RATE_LIMITED = 429
+# Upstreams whose POST endpoints only read (Qdrant search/count/scroll) and are safe to replay.
+REPLAYABLE_POST_UPSTREAMS = ('qdrant',)
+
+_sessions: dict[str, 'UpstreamSession'] = {}
+_sessions_lock = threading.Lock()
+
+
+def _setting(name: str, default):
+    value = getattr(settings, name, default)
+    try:
+        return type(default)(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class UpstreamCircuitOpen(requests.ConnectionError):
+    """Raised without contacting the upstream while its circuit is open."""
+
+
+class UpstreamRetry(Retry):
+    """Retry that also replays non-idempotent requests on 429: the upstream refused them unprocessed."""
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code == RATE_LIMITED and not self._is_method_retryable(method):
+            return bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class CircuitBreaker:
+    """Closed → open after N consecutive failures → half-open (one probe) after reset_after."""
+
+    def __init__(self, *, failure_threshold: int = 5, reset_after: float = 30.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_after:
+            return 'half_open'
+        return 'open'
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == 'closed':
+                return True
+            if state == 'half_open' and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_neutral(self) -> None:
+        """The upstream answered but asked us to slow down: leave the state as it is."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._probing = False
+
+
+class EndpointMetrics:
+    """Counters for one (method, path) of an upstream."""
+
+    __slots__ = ('requests', 'errors', 'rejected', 'total_ms', 'max_ms', 'statuses')
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.rejected = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.statuses: dict[int, int] = {}
+
+    def as_dict(self) -> dict[str, Any]:
+        completed = self.requests - self.rejected
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'rejected': self.rejected,
+            'avg_ms': round(self.total_ms / completed, 1) if completed else 0.0,
+            'max_ms': round(self.max_ms, 1),
+            'statuses': dict(self.statuses),
+        }
+
+
+class UpstreamSession(requests.Session):
+    """requests.Session with retries, a circuit breaker and per-endpoint counters."""
+
+    def __init__(
+        self,
+        upstream: str,
+        *,
+        pool_size: int = 10,
+        retries: int = 3,
+        backoff: float = 0.5,
+        breaker: Optional[CircuitBreaker] = None,
+        replay_posts: bool = False,
+    ):
+        super().__init__()
+        self.upstream = upstream
+        self.breaker = breaker or CircuitBreaker()
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self._metrics_lock = threading.Lock()
+        self.retry = UpstreamRetry(
+            total=retries,
+            connect=retries,
+            read=0,
+            status=retries,
+            backoff_factor=backoff,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=None if replay_posts else Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=self.retry)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def _endpoint(self, method: str, url: str) -> EndpointMetrics:
+        key = f'{method.upper()} {urlsplit(url).path or "/"}'
+        metrics = self.endpoints.get(key)
+        if metrics is None:
+            metrics = self.endpoints.setdefault(key, EndpointMetrics())
+        return metrics
+
+    def before_request(self, method: str, url: str) -> None:
+        """Raise UpstreamCircuitOpen (and count the rejection) while the circuit is open."""
+        if self.breaker.allow():
+            return
+        metrics = self._endpoint(method, url)
+        with self._metrics_lock:
+            metrics.requests += 1
+            metrics.rejected += 1
+        raise UpstreamCircuitOpen(
+            f'{self.upstream}: circuito abierto tras {self.breaker.failures} fallos consecutivos'
+        )
+
+    def after_request(self, method: str, url: str, status_code: Optional[int], elapsed_ms: float) -> None:
+        """Feed one attempt (status_code None: no response) to the breaker and counters."""
+        metrics = self._endpoint(method, url)
+        failed = status_code is None or status_code in FAILURE_STATUSES
+        if failed:
+            self.breaker.record_failure()
+            logger.warning(
+                'Upstream %s %s %s failed status=%s ms=%.0f breaker=%s',
+                self.upstream, method, url, status_code, elapsed_ms, self.breaker.state,
+            )
+        elif status_code == RATE_LIMITED:
+            self.breaker.record_neutral()
+            logger.warning('Upstream %s %s %s rate limited ms=%.0f', self.upstream, method, url, elapsed_ms)
+        else:
+            self.breaker.record_success()
+        with self._metrics_lock:
+            metrics.requests += 1
+            metrics.total_ms += elapsed_ms
+            metrics.max_ms = max(metrics.max_ms, elapsed_ms)
+            if failed or status_code >= 400:
+                metrics.errors += 1
+            if status_code is not None:
+                metrics.statuses[status_code] = metrics.statuses.get(status_code, 0) + 1
+
+    def retry_delay(
+        self, method: str, status_code: Optional[int], attempt: int, retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        """
+        Seconds to wait before replaying attempt (0-based) under this session's retry
+        policy, or None to give up. status_code None means the connection could not be
+        opened, which is safe to replay for any method.
+        """
+        retry = self.retry
+        if status_code is None:
+            if attempt >= retry.connect:
+                return None
+        elif attempt >= retry.status or not retry.is_retry(method, status_code, bool(retry_after)):
+            return None
+        if retry_after and retry.respect_retry_after_header:
+            try:
+                return float(retry.parse_retry_after(retry_after))
+            except Exception:
+                pass
+        return min(retry.backoff_factor * (2 ** attempt), retry.backoff_max)
+
+    def request(self, method, url, *args, **kwargs):
+        self.before_request(method, url)
+        started = time.perf_counter()
+        status_code = None
+        try:
+            response = super().request(method, url, *args, **kwargs)
+            status_code = response.status_code
+            return response
+        finally:
+            self.after_request(method, url, status_code, (time.perf_counter() - started) * 1000)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._metrics_lock:
+            endpoints = {key: metrics.as_dict() for key, metrics in sorted(self.endpoints.items())}
+        return {
+            'circuit': self.breaker.state,
+            'consecutive_failures': self.breaker.failures,
+            'endpoints': endpoints,
+        }
+
+
+def get_http_session(upstream: str) -> UpstreamSession:
+    """Shared UpstreamSession for upstream (e.g. 'openai', 'qdrant'), created on first use."""
+    session = _sessions.get(upstream)
+    if session is not None:
+        return session
+    with _sessions_lock:
+        session = _sessions.get(upstream)
+        if session is None:
+            session = UpstreamSession(
+                upstream,
+                pool_size=_setting('UPSTREAM_HTTP_POOL_SIZE', 10),
+                retries=_setting('UPSTREAM_HTTP_RETRIES', 3),
+                backoff=_setting('UPSTREAM_HTTP_BACKOFF', 0.5),
+                breaker=CircuitBreaker(
+                    failure_threshold=_setting('UPSTREAM_CIRCUIT_FAILURES', 5),
+                    reset_after=_setting('UPSTREAM_CIRCUIT_RESET', 30.0),
+                ),
+                replay_posts=upstream in REPLAYABLE_POST_UPSTREAMS,
+            )
+            _sessions[upstream] = session
+    return session
+
+
+def http_metrics_snapshot() -> dict[str, Any]:
+    """Circuit state and per-endpoint counters for every upstream used by this process."""
+    return {name: session.snapshot() for name, session in sorted(_sessions.items())}
+
+
+def reset_http_sessions() -> None:
+    """Close and forget the shared sessions (tests, settings changes)."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
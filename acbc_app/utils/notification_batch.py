@@ -0,0 +1,216 @@
+"""
+Batch notification delivery.
+
+send_notifications(events) creates the notifications for many NotificationEvents in a
+few queries. Each event has a key (recipient, verb key, object) stored as a
+profiles.NotificationKey row; the rows are inserted with bulk_create(ignore_conflicts=True)
+and only events whose key was new get a notification, created with one more
+bulk_create. The unique constraint replaces per-notification filter().exists() checks
+and also holds when two requests race.
+
+Digest events fold repeated activity on the same object into the recipient's unread
+notification: 50 upvotes on one content are one notification whose description counts
+the voters. Once that notification has been read, the next new actor starts a fresh
+one; the key keeps every actor it has counted (NotificationKey.actor_ids), so an actor
+already counted is never notified twice.
+
+bulk_create skips post_save, so the unread-count caches of all recipients are
+invalidated here, in one cache call.
+"""
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.utils import timezone
+from notifications.models import Notification
+
+from utils.db_encoding import prepare_text_for_db, verb_key
+from utils.notification_cache import invalidate_unread_counts
+
+logger = logging.getLogger('academia_blockchain.notifications')
+
+# Actor ids kept on a digest notification's data; the full history is on the key.
+DIGEST_MAX_ACTOR_IDS = 200
+
+
+@dataclass
+class NotificationEvent:
+    """
+    One notification to deliver.
+
+    key_object is what makes the event unique for its recipient and verb (defaults to
+    target). digest(actor, count) returns the description once count > 1 distinct
+    actors are folded into the notification; events without it are plain.
+    """
+    recipient_id: int
+    actor: models.Model
+    verb: str
+    description: str = ''
+    target: Optional[models.Model] = None
+    action_object: Optional[models.Model] = None
+    key_object: Optional[models.Model] = None
+    digest: Optional[Callable[[models.Model, int], str]] = None
+
+    @property
+    def subject(self):
+        return self.key_object if self.key_object is not None else self.target
+
+
+def _identity(event):
+    subject = event.subject
+    return (
+        event.recipient_id,
+        verb_key(event.verb),
+        ContentType.objects.get_for_model(subject).id,
+        str(subject.pk),
+    )
+
+
+def _generic(prefix, obj):
+    if obj is None:
+        return {}
+    return {
+        f'{prefix}_content_type': ContentType.objects.get_for_model(obj),
+        f'{prefix}_object_id': obj.pk,
+    }
+
+
+def _build(event, actor, description, data=None):
+    return Notification(
+        recipient_id=event.recipient_id,
+        verb=prepare_text_for_db(event.verb),
+        description=prepare_text_for_db(description) if description else description,
+        data=data,
+        **_generic('actor', actor),
+        **_generic('target', event.target),
+        **_generic('action_object', event.action_object),
+    )
+
+
+def _digest_state(notification):
+    """(count, actor ids) recorded on a digest notification."""
+    data = notification.data if isinstance(notification.data, dict) else {}
+    actor_ids = list(data.get('actor_ids') or [])
+    if not actor_ids and str(notification.actor_object_id).isdigit():
+        actor_ids = [int(notification.actor_object_id)]
+    return max(int(data.get('count') or 0), len(actor_ids)), actor_ids
+
+
+def _digest_description(event, actor, count):
+    return event.digest(actor, count) if count > 1 else event.description
+
+
+def _new_actors(group, known_ids=()):
+    seen = set(known_ids)
+    actors = []
+    for event in group:
+        if event.actor.pk not in seen:
+            seen.add(event.actor.pk)
+            actors.append(event)
+    return actors
+
+
+def send_notifications(events):
+    """
+    Deliver events, skipping keys that were already notified and folding digest events
+    into unread notifications. Returns the number of notifications created or updated.
+    """
+    NotificationKey = apps.get_model('profiles', 'NotificationKey')
+
+    # Events sharing a key in this batch: the first is delivered, digests count them all.
+    groups = {}
+    for event in events:
+        if event.recipient_id and event.subject is not None and event.actor is not None:
+            groups.setdefault(_identity(event), []).append(event)
+    if not groups:
+        return 0
+
+    token = uuid.uuid4().hex
+    to_create = []  # (key, notification)
+    to_update = []
+    digest_keys = []
+    with transaction.atomic():
+        NotificationKey.objects.bulk_create(
+            [
+                NotificationKey(
+                    recipient_id=recipient_id,
+                    verb_key=key,
+                    object_content_type_id=content_type_id,
+                    object_id=object_id,
+                    token=token,
+                )
+                for recipient_id, key, content_type_id, object_id in groups
+            ],
+            ignore_conflicts=True,
+        )
+        keys = {
+            (key.recipient_id, key.verb_key, key.object_content_type_id, key.object_id): key
+            for key in NotificationKey.objects.select_for_update(of=('self',))
+            .select_related('notification')
+            .filter(
+                recipient_id__in={identity[0] for identity in groups},
+                verb_key__in={identity[1] for identity in groups},
+                object_id__in={identity[3] for identity in groups},
+            )
+        }
+
+        now = timezone.now()
+        for identity, group in groups.items():
+            key = keys.get(identity)
+            first = group[0]
+            if key is None or (key.token != token and not first.digest):
+                continue
+            if not first.digest:
+                to_create.append((key, _build(first, first.actor, first.description)))
+                continue
+
+            notification = key.notification if key.token != token else None
+            count, actor_ids = _digest_state(notification) if notification else (0, [])
+            # Keys written before actor_ids existed only know their latest notification.
+            history = list(key.actor_ids or [])
+            fresh = _new_actors(group, {*history, *actor_ids})
+            if not fresh:
+                continue
+            latest = fresh[-1]
+            counted = dict.fromkeys([*actor_ids, *(event.actor.pk for event in fresh)])
+            key.actor_ids = history + [actor_id for actor_id in counted if actor_id not in set(history)]
+            digest_keys.append(key)
+            if notification is not None and notification.unread and not notification.deleted:
+                count += len(fresh)
+                actor_ids = (actor_ids + [event.actor.pk for event in fresh])[-DIGEST_MAX_ACTOR_IDS:]
+                notification.actor_content_type = ContentType.objects.get_for_model(latest.actor)
+                notification.actor_object_id = latest.actor.pk
+                notification.description = prepare_text_for_db(_digest_description(latest, latest.actor, count))
+                notification.timestamp = now
+                notification.data = {'count': count, 'actor_ids': actor_ids}
+                to_update.append(notification)
+            else:
+                count = len(fresh)
+                data = {'count': count, 'actor_ids': [event.actor.pk for event in fresh][-DIGEST_MAX_ACTOR_IDS:]}
+                description = _digest_description(latest, latest.actor, count)
+                to_create.append((key, _build(latest, latest.actor, description, data)))
+
+        if to_create:
+            created = Notification.objects.bulk_create([notification for _, notification in to_create])
+            for (key, _), notification in zip(to_create, created):
+                key.notification = notification
+        changed_keys = {key.pk: key for key, _ in to_create}
+        changed_keys.update((key.pk, key) for key in digest_keys)
+        if changed_keys:
+            NotificationKey.objects.bulk_update(list(changed_keys.values()), ['notification', 'actor_ids'])
+        if to_update:
+            Notification.objects.bulk_update(
+                to_update, ['actor_content_type', 'actor_object_id', 'description', 'timestamp', 'data']
+            )
+
+    invalidate_unread_counts(notification.recipient_id for _, notification in to_create)
+    logger.info('Delivered notification batch', extra={
+        'events': sum(len(group) for group in groups.values()),
+        'notifications_created': len(to_create),
+        'notifications_digested': len(to_update),
+    })
+    return len(to_create) + len(to_update)
@@ -18,3 +18,10 @@ def set_cached_unread_count(user_id: int, count: int) -> None:
 
 def invalidate_unread_count(user_id: int) -> None:
     cache.delete(unread_count_cache_key(user_id))
+
+
+def invalidate_unread_counts(user_ids) -> None:
+    """Invalidate many users' cached counts in one cache round trip."""
+    keys = [unread_count_cache_key(user_id) for user_id in set(user_ids) if user_id]
+    if keys:
+        cache.delete_many(keys)
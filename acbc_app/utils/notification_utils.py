@@ -16,6 +16,8 @@ from content.models import (
 import traceback
 import logging
 
+from utils.notification_batch import NotificationEvent, send_notifications
+
 # Get logger for notifications
 logger = logging.getLogger('academia_blockchain.notifications')
 
@@ -30,6 +32,25 @@ def create_notification(**kwargs):
     return Notification.objects.create(**kwargs)
 
 
+def notify_later(handler, instance):
+    """
+    Run handler(instance) in the job worker once the current transaction commits.
+
+    handler is one of the notify_* functions of this module that take a single model
+    instance; the job stores its name and the instance's model label and pk.
+    """
+    from jobs.queue import enqueue_on_commit
+
+    label = instance._meta.label_lower
+    enqueue_on_commit(
+        'utils.notify',
+        handler=handler.__name__,
+        model=label,
+        pk=instance.pk,
+        idempotency_key=f'notify:{handler.__name__}:{label}:{instance.pk}',
+    )
+
+
 def matching_verb_q(verb):
     """
     Build a Q filter that matches a verb whether stored with accents or
@@ -47,90 +68,33 @@ def notify_comment_reply(comment):
     """
     Create a notification when someone replies to a comment.
     """
+    if not comment.parent:
+        logger.info("No parent comment found - skipping notification", extra={
+            'comment_id': comment.id,
+        })
+        return
+
     logger.info("Creating comment reply notification", extra={
         'comment_id': comment.id,
-        'author_id': comment.author.id,
-        'author_username': comment.author.username,
-        'parent_comment_id': comment.parent.id if comment.parent else None,
-        'parent_author_id': comment.parent.author.id if comment.parent else None,
-        'parent_author_username': comment.parent.author.username if comment.parent else None,
+        'author_id': comment.author_id,
+        'parent_comment_id': comment.parent_id,
     })
-    
-    if comment.parent:
-        try:
-            # Get content types for debugging
-            comment_ct = ContentType.objects.get_for_model(comment)
-            parent_ct = ContentType.objects.get_for_model(comment.parent)
-            logger.debug(f"Content types - Comment: {comment_ct}, Parent: {parent_ct}")
-            
-            # Check if notification already exists
-            existing_notifications = Notification.objects.filter(
-                recipient=comment.parent.author,
-                actor_content_type=ContentType.objects.get_for_model(comment.author),
-                actor_object_id=comment.author.id,
-                verb='respondió a',
-                action_object_content_type=comment_ct,
-                action_object_object_id=comment.id,
-                target_content_type=parent_ct,
-                target_object_id=comment.parent.id
-            )
-            logger.debug(f"Existing notifications count: {existing_notifications.count()}")
-            
-            if existing_notifications.exists():
-                logger.info("Notification already exists - skipping creation", extra={
-                    'comment_id': comment.id,
-                    'parent_comment_id': comment.parent.id,
-                })
-                return
-            
-            # Create the notification directly
-            notification = create_notification(
-                recipient=comment.parent.author,
-                actor_content_type=ContentType.objects.get_for_model(comment.author),
-                actor_object_id=comment.author.id,
-                verb='respondió a',
-                action_object_content_type=comment_ct,
-                action_object_object_id=comment.id,
-                target_content_type=parent_ct,
-                target_object_id=comment.parent.id,
-                description=f'{comment.author.username} respondió a tu comentario'
-            )
-            logger.info("Comment reply notification created successfully", extra={
-                'notification_id': notification.id,
-                'comment_id': comment.id,
-                'recipient_id': notification.recipient.id,
-                'actor_id': notification.actor.id,
-                'target_id': notification.target_object_id,
-            })
-            
-            # Verify the notification was created
-            if notification:
-                logger.debug("Notification verification successful", extra={
-                    'notification_id': notification.id,
-                    'recipient': notification.recipient.username,
-                    'actor': notification.actor.username,
-                    'verb': notification.verb,
-                    'timestamp': notification.timestamp.isoformat(),
-                    'unread': notification.unread,
-                    'target_content_type': str(notification.target_content_type),
-                    'target_object_id': notification.target_object_id,
-                })
-            else:
-                logger.warning("Notification not found in database after creation", extra={
-                    'comment_id': comment.id,
-                    'parent_comment_id': comment.parent.id,
-                })
-                
-        except Exception as e:
-            logger.error(f"Error creating comment reply notification: {str(e)}", extra={
-                'comment_id': comment.id,
-                'parent_comment_id': comment.parent.id if comment.parent else None,
-                'author_id': comment.author.id,
-            }, exc_info=True)
-    else:
-        logger.info("No parent comment found - skipping notification", extra={
+    try:
+        send_notifications([NotificationEvent(
+            recipient_id=comment.parent.author_id,
+            actor=comment.author,
+            verb='respondió a',
+            action_object=comment,
+            target=comment.parent,
+            key_object=comment,
+            description=f'{comment.author.username} respondió a tu comentario',
+        )])
+    except Exception as e:
+        logger.error(f"Error creating comment reply notification: {str(e)}", extra={
             'comment_id': comment.id,
-        })
+            'parent_comment_id': comment.parent_id,
+            'author_id': comment.author_id,
+        }, exc_info=True)
 
 def notify_knowledge_path_comment(comment):
     """
@@ -140,110 +104,44 @@ def notify_knowledge_path_comment(comment):
     Args:
         comment: The Comment instance that was created
     """
-    logger.info("Creating knowledge path comment notification", extra={
-        'comment_id': comment.id,
-        'author_id': comment.author.id,
-        'author_username': comment.author.username,
-        'parent_comment_id': comment.parent.id if comment.parent else None,
-    })
-    
     # Only notify for top-level comments (not replies)
-    if comment.parent:
+    if comment.parent_id:
         logger.info("Comment is a reply - skipping notification", extra={
             'comment_id': comment.id,
-            'parent_comment_id': comment.parent.id,
+            'parent_comment_id': comment.parent_id,
         })
         return
         
     try:
-        # Verify this is a knowledge path comment
-        if not isinstance(comment.content_object, KnowledgePath):
+        knowledge_path = comment.content_object
+        if not isinstance(knowledge_path, KnowledgePath):
             logger.info("Comment is not on a knowledge path - skipping notification", extra={
                 'comment_id': comment.id,
-                'content_object_type': type(comment.content_object).__name__,
+                'content_object_type': type(knowledge_path).__name__,
             })
             return
-            
-        knowledge_path = comment.content_object
-        logger.debug(f"Knowledge path details - ID: {knowledge_path.id}, Title: {knowledge_path.title}, Author: {knowledge_path.author.username}")
-        
+
         # Don't notify if user comments on their own knowledge path
-        if comment.author == knowledge_path.author:
+        if comment.author_id == knowledge_path.author_id:
             logger.info("User is commenting on their own knowledge path - skipping notification", extra={
                 'comment_id': comment.id,
                 'knowledge_path_id': knowledge_path.id,
-                'author_id': comment.author.id,
-            })
-            return
-            
-        # Get content types for debugging
-        comment_ct = ContentType.objects.get_for_model(comment)
-        knowledge_path_ct = ContentType.objects.get_for_model(knowledge_path)
-        logger.debug(f"Content types - Comment: {comment_ct}, Knowledge Path: {knowledge_path_ct}")
-        
-        # Check if notification already exists
-        existing_notifications = Notification.objects.filter(
-            recipient=knowledge_path.author,
-            actor_content_type=ContentType.objects.get_for_model(comment.author),
-            actor_object_id=comment.author.id,
-            verb='comentó en tu camino de conocimiento',
-            action_object_content_type=comment_ct,
-            action_object_object_id=comment.id,
-            target_content_type=knowledge_path_ct,
-            target_object_id=knowledge_path.id
-        )
-        logger.debug(f"Existing notifications count: {existing_notifications.count()}")
-        
-        if existing_notifications.exists():
-            logger.info("Notification already exists - skipping creation", extra={
-                'comment_id': comment.id,
-                'knowledge_path_id': knowledge_path.id,
             })
             return
-        
-        # Create the notification directly
-        notification = create_notification(
-            recipient=knowledge_path.author,
-            actor_content_type=ContentType.objects.get_for_model(comment.author),
-            actor_object_id=comment.author.id,
+
+        send_notifications([NotificationEvent(
+            recipient_id=knowledge_path.author_id,
+            actor=comment.author,
             verb='comentó en tu camino de conocimiento',
-            action_object_content_type=comment_ct,
-            action_object_object_id=comment.id,
-            target_content_type=knowledge_path_ct,
-            target_object_id=knowledge_path.id,
-            description=f'{comment.author.username} comentó en tu camino de conocimiento "{knowledge_path.title}": {comment.body[:50]}...'
-        )
-        logger.info("Knowledge path comment notification created successfully", extra={
-            'notification_id': notification.id,
-            'comment_id': comment.id,
-            'knowledge_path_id': knowledge_path.id,
-            'recipient_id': notification.recipient.id,
-            'actor_id': notification.actor.id,
-        })
-        
-        # Verify the notification was created
-        if notification:
-            logger.debug("Notification verification successful", extra={
-                'notification_id': notification.id,
-                'recipient': notification.recipient.username,
-                'actor': notification.actor.username,
-                'verb': notification.verb,
-                'timestamp': notification.timestamp.isoformat(),
-                'unread': notification.unread,
-                'target_content_type': str(notification.target_content_type),
-                'target_object_id': notification.target_object_id,
-            })
-        else:
-            logger.warning("Notification not found in database after creation", extra={
-                'comment_id': comment.id,
-                'knowledge_path_id': knowledge_path.id,
-            })
-            
+            action_object=comment,
+            target=knowledge_path,
+            key_object=comment,
+            description=f'{comment.author.username} comentó en tu camino de conocimiento "{knowledge_path.title}": {comment.body[:50]}...',
+        )])
     except Exception as e:
         logger.error(f"Error creating knowledge path comment notification: {str(e)}", extra={
             'comment_id': comment.id,
-            'knowledge_path_id': knowledge_path.id if 'knowledge_path' in locals() else None,
-            'author_id': comment.author.id,
+            'author_id': comment.author_id,
         }, exc_info=True)
 
 def notify_content_comment(comment):
@@ -254,110 +152,44 @@ def notify_content_comment(comment):
     Args:
         comment: The Comment instance that was created
     """
-    logger.info("Creating content comment notification", extra={
-        'comment_id': comment.id,
-        'author_id': comment.author.id,
-        'author_username': comment.author.username,
-        'parent_comment_id': comment.parent.id if comment.parent else None,
-    })
-    
     # Only notify for top-level comments (not replies)
-    if comment.parent:
+    if comment.parent_id:
         logger.info("Comment is a reply - skipping notification", extra={
             'comment_id': comment.id,
-            'parent_comment_id': comment.parent.id,
+            'parent_comment_id': comment.parent_id,
         })
         return
         
     try:
-        # Verify this is a content comment
-        if not isinstance(comment.content_object, ContentProfile):
+        content_profile = comment.content_object
+        if not isinstance(content_profile, ContentProfile):
             logger.info("Comment is not on a content - skipping notification", extra={
                 'comment_id': comment.id,
-                'content_object_type': type(comment.content_object).__name__,
+                'content_object_type': type(content_profile).__name__,
             })
             return
-            
-        content_profile = comment.content_object
-        logger.debug(f"Content profile details - ID: {content_profile.id}, Title: {content_profile.display_title}, Owner: {content_profile.user.username}")
-        
+
         # Don't notify if user comments on their own content
-        if comment.author == content_profile.user:
+        if comment.author_id == content_profile.user_id:
             logger.info("User is commenting on their own content - skipping notification", extra={
                 'comment_id': comment.id,
                 'content_profile_id': content_profile.id,
-                'author_id': comment.author.id,
-            })
-            return
-            
-        # Get content types for debugging
-        comment_ct = ContentType.objects.get_for_model(comment)
-        content_profile_ct = ContentType.objects.get_for_model(content_profile)
-        logger.debug(f"Content types - Comment: {comment_ct}, Content Profile: {content_profile_ct}")
-        
-        # Check if notification already exists
-        existing_notifications = Notification.objects.filter(
-            recipient=content_profile.user,
-            actor_content_type=ContentType.objects.get_for_model(comment.author),
-            actor_object_id=comment.author.id,
-            verb='comentó en tu contenido',
-            action_object_content_type=comment_ct,
-            action_object_object_id=comment.id,
-            target_content_type=content_profile_ct,
-            target_object_id=content_profile.id
-        )
-        logger.debug(f"Existing notifications count: {existing_notifications.count()}")
-        
-        if existing_notifications.exists():
-            logger.info("Notification already exists - skipping creation", extra={
-                'comment_id': comment.id,
-                'content_profile_id': content_profile.id,
             })
             return
-        
-        # Create the notification directly
-        notification = create_notification(
-            recipient=content_profile.user,
-            actor_content_type=ContentType.objects.get_for_model(comment.author),
-            actor_object_id=comment.author.id,
+
+        send_notifications([NotificationEvent(
+            recipient_id=content_profile.user_id,
+            actor=comment.author,
             verb='comentó en tu contenido',
-            action_object_content_type=comment_ct,
-            action_object_object_id=comment.id,
-            target_content_type=content_profile_ct,
-            target_object_id=content_profile.id,
-            description=f'{comment.author.username} comentó en tu contenido "{content_profile.display_title}": {comment.body[:50]}...'
-        )
-        logger.info("Content comment notification created successfully", extra={
-            'notification_id': notification.id,
-            'comment_id': comment.id,
-            'content_profile_id': content_profile.id,
-            'recipient_id': notification.recipient.id,
-            'actor_id': notification.actor.id,
-        })
-        
-        # Verify the notification was created
-        if notification:
-            logger.debug("Notification verification successful", extra={
-                'notification_id': notification.id,
-                'recipient': notification.recipient.username,
-                'actor': notification.actor.username,
-                'verb': notification.verb,
-                'timestamp': notification.timestamp.isoformat(),
-                'unread': notification.unread,
-                'target_content_type': str(notification.target_content_type),
-                'target_object_id': notification.target_object_id,
-            })
-        else:
-            logger.warning("Notification not found in database after creation", extra={
-                'comment_id': comment.id,
-                'content_profile_id': content_profile.id,
-            })
-            
+            action_object=comment,
+            target=content_profile,
+            key_object=comment,
+            description=f'{comment.author.username} comentó en tu contenido "{content_profile.display_title}": {comment.body[:50]}...',
+        )])
     except Exception as e:
         logger.error(f"Error creating content comment notification: {str(e)}", extra={
             'comment_id': comment.id,
-            'content_profile_id': content_profile.id if 'content_profile' in locals() else None,
-            'author_id': comment.author.id,
+            'author_id': comment.author_id,
         }, exc_info=True)
 
 def notify_knowledge_path_completion(user, knowledge_path):
@@ -408,7 +240,6 @@ def notify_knowledge_path_completion(user, knowledge_path):
         target_content_type=knowledge_path_ct,
         target_object_id=knowledge_path.id
     )
-    logger.debug(f"Existing notifications count: {existing_notifications.count()}")
     
     if existing_notifications.exists():
         logger.info("Notification already exists - skipping creation", extra={
@@ -431,27 +262,10 @@ def notify_knowledge_path_completion(user, knowledge_path):
         'notification_id': notification.id,
         'user_id': user.id,
         'knowledge_path_id': knowledge_path.id,
-        'recipient_id': notification.recipient.id,
-        'actor_id': notification.actor.id,
+        'recipient_id': notification.recipient_id,
+        'actor_id': notification.actor_object_id,
     })
     
-    # Verify the notification was created
-    if notification:
-        logger.debug("Notification verification successful", extra={
-            'notification_id': notification.id,
-            'recipient': notification.recipient.username,
-            'actor': notification.actor.username,
-            'verb': notification.verb,
-            'timestamp': notification.timestamp.isoformat(),
-            'unread': notification.unread,
-            'target_content_type': str(notification.target_content_type),
-            'target_object_id': notification.target_object_id,
-        })
-    else:
-        logger.warning("Notification not found in database after creation", extra={
-            'user_id': user.id,
-            'knowledge_path_id': knowledge_path.id,
-        })
 
 def _certificate_request_context(certificate_request, actor=None):
     """
@@ -704,222 +518,79 @@ def notify_certificate_rejection(certificate_request, actor=None):
     })
 
 
+def _and_others(count):
+    others = count - 1
+    return '1 persona más' if others == 1 else f'{others} personas más'
+
+
 def notify_content_upvote(vote):
     """
     Create a notification when someone upvotes content.
-    Notifies the content owner (uploaded_by user).
+    Notifies the content owner (uploaded_by user); upvotes on the same content are
+    digested into one unread notification ("X y 3 personas más votaron ...").
     
     Args:
         vote: The Vote instance that was created/updated
     """
-    logger.info("Creating content upvote notification", extra={
-        'vote_id': vote.id,
-        'voter_id': vote.user.id,
-        'voter_username': vote.user.username,
-        'content_type': vote.content_type.model,
-        'object_id': vote.object_id,
-    })
-    
     try:
-        # Get the content object
         content = vote.content_object
-        if not content:
-            logger.info("Content object not found - skipping notification", extra={
+        if not content or not content.uploaded_by_id or content.uploaded_by_id == vote.user_id:
+            logger.info("Content upvote needs no notification (missing, ownerless or own content)", extra={
                 'vote_id': vote.id,
+                'object_id': vote.object_id,
             })
             return
-            
-        logger.debug(f"Content details - ID: {content.id}, Title: {content.original_title}, Owner: {content.uploaded_by.username if content.uploaded_by else 'None'}")
-        
-        # Don't notify if user upvotes their own content
-        if vote.user == content.uploaded_by:
-            logger.info("User is upvoting their own content - skipping notification", extra={
-                'vote_id': vote.id,
-                'content_id': content.id,
-                'voter_id': vote.user.id,
-            })
-            return
-            
-        # Don't notify if content has no owner
-        if not content.uploaded_by:
-            logger.info("Content has no owner - skipping notification", extra={
-                'vote_id': vote.id,
-                'content_id': content.id,
-            })
-            return
-            
-        # Get content types for debugging
-        voter_ct = ContentType.objects.get_for_model(vote.user)
-        content_ct = ContentType.objects.get_for_model(content)
-        logger.debug(f"Content types - Voter: {voter_ct}, Content: {content_ct}")
-        
-        # Check if notification already exists for this specific vote
-        existing_notifications = Notification.objects.filter(
-            recipient=content.uploaded_by,
-            actor_content_type=voter_ct,
-            actor_object_id=vote.user.id,
-            verb='votó positivamente tu contenido',
-            target_content_type=content_ct,
-            target_object_id=content.id
-        )
-        logger.debug(f"Existing notifications count: {existing_notifications.count()}")
-        
-        if existing_notifications.exists():
-            logger.info("Notification already exists - skipping creation", extra={
-                'vote_id': vote.id,
-                'content_id': content.id,
-            })
-            return
-        
-        # Create the notification
-        notification = create_notification(
-            recipient=content.uploaded_by,
-            actor_content_type=voter_ct,
-            actor_object_id=vote.user.id,
+
+        title = content.original_title
+        send_notifications([NotificationEvent(
+            recipient_id=content.uploaded_by_id,
+            actor=vote.user,
             verb='votó positivamente tu contenido',
-            target_content_type=content_ct,
-            target_object_id=content.id,
-            description=f'{vote.user.username} votó positivamente tu contenido "{content.original_title}"'
-        )
-        logger.info("Content upvote notification created successfully", extra={
-            'notification_id': notification.id,
-            'vote_id': vote.id,
-            'content_id': content.id,
-            'recipient_id': notification.recipient.id,
-            'actor_id': notification.actor.id,
-        })
-        
-        # Verify the notification was created
-        if notification:
-            logger.debug("Notification verification successful", extra={
-                'notification_id': notification.id,
-                'recipient': notification.recipient.username,
-                'actor': notification.actor.username,
-                'verb': notification.verb,
-                'timestamp': notification.timestamp.isoformat(),
-                'unread': notification.unread,
-                'target': str(notification.target),
-            })
-        else:
-            logger.warning("Notification not found in database after creation", extra={
-                'vote_id': vote.id,
-                'content_id': content.id,
-            })
-            
+            target=content,
+            description=f'{vote.user.username} votó positivamente tu contenido "{title}"',
+            digest=lambda actor, count: (
+                f'{actor.username} y {_and_others(count)} votaron positivamente tu contenido "{title}"'
+            ),
+        )])
     except Exception as e:
         logger.error(f"Error creating content upvote notification: {str(e)}", extra={
             'vote_id': vote.id,
-            'content_id': content.id if 'content' in locals() else None,
-            'voter_id': vote.user.id,
+            'voter_id': vote.user_id,
         }, exc_info=True)
 
 def notify_knowledge_path_upvote(vote):
     """
     Create a notification when someone upvotes a knowledge path.
-    Notifies the knowledge path author.
+    Notifies the knowledge path author; upvotes on the same path are digested into
+    one unread notification.
     
     Args:
         vote: The Vote instance that was created/updated
     """
-    logger.info("Creating knowledge path upvote notification", extra={
-        'vote_id': vote.id,
-        'voter_id': vote.user.id,
-        'voter_username': vote.user.username,
-        'content_type': vote.content_type.model,
-        'object_id': vote.object_id,
-    })
-    
     try:
-        # Get the knowledge path object
         knowledge_path = vote.content_object
-        if not knowledge_path:
-            logger.info("Knowledge path object not found - skipping notification", extra={
+        if not knowledge_path or not knowledge_path.author_id or knowledge_path.author_id == vote.user_id:
+            logger.info("Knowledge path upvote needs no notification (missing, authorless or own path)", extra={
                 'vote_id': vote.id,
+                'object_id': vote.object_id,
             })
             return
-            
-        logger.debug(f"Knowledge path details - ID: {knowledge_path.id}, Title: {knowledge_path.title}, Author: {knowledge_path.author.username if knowledge_path.author else 'None'}")
-        
-        # Don't notify if user upvotes their own knowledge path
-        if vote.user == knowledge_path.author:
-            logger.info("User is upvoting their own knowledge path - skipping notification", extra={
-                'vote_id': vote.id,
-                'knowledge_path_id': knowledge_path.id,
-                'voter_id': vote.user.id,
-            })
-            return
-            
-        # Don't notify if knowledge path has no author
-        if not knowledge_path.author:
-            logger.info("Knowledge path has no author - skipping notification", extra={
-                'vote_id': vote.id,
-                'knowledge_path_id': knowledge_path.id,
-            })
-            return
-            
-        # Get content types for debugging
-        voter_ct = ContentType.objects.get_for_model(vote.user)
-        knowledge_path_ct = ContentType.objects.get_for_model(knowledge_path)
-        logger.debug(f"Content types - Voter: {voter_ct}, Knowledge Path: {knowledge_path_ct}")
-        
-        # Check if notification already exists for this specific vote
-        existing_notifications = Notification.objects.filter(
-            recipient=knowledge_path.author,
-            actor_content_type=voter_ct,
-            actor_object_id=vote.user.id,
-            verb='votó positivamente tu camino de conocimiento',
-            target_content_type=knowledge_path_ct,
-            target_object_id=knowledge_path.id
-        )
-        logger.debug(f"Existing notifications count: {existing_notifications.count()}")
-        
-        if existing_notifications.exists():
-            logger.info("Notification already exists - skipping creation", extra={
-                'vote_id': vote.id,
-                'knowledge_path_id': knowledge_path.id,
-            })
-            return
-        
-        # Create the notification
-        notification = create_notification(
-            recipient=knowledge_path.author,
-            actor_content_type=voter_ct,
-            actor_object_id=vote.user.id,
+
+        title = knowledge_path.title
+        send_notifications([NotificationEvent(
+            recipient_id=knowledge_path.author_id,
+            actor=vote.user,
             verb='votó positivamente tu camino de conocimiento',
-            target_content_type=knowledge_path_ct,
-            target_object_id=knowledge_path.id,
-            description=f'{vote.user.username} votó positivamente tu camino de conocimiento "{knowledge_path.title}"'
-        )
-        logger.info("Knowledge path upvote notification created successfully", extra={
-            'notification_id': notification.id,
-            'vote_id': vote.id,
-            'knowledge_path_id': knowledge_path.id,
-            'recipient_id': notification.recipient.id,
-            'actor_id': notification.actor.id,
-        })
-        
-        # Verify the notification was created
-        if notification:
-            logger.debug("Notification verification successful", extra={
-                'notification_id': notification.id,
-                'recipient': notification.recipient.username,
-                'actor': notification.actor.username,
-                'verb': notification.verb,
-                'timestamp': notification.timestamp.isoformat(),
-                'unread': notification.unread,
-                'target': str(notification.target),
-            })
-        else:
-            logger.warning("Notification not found in database after creation", extra={
-                'vote_id': vote.id,
-                'knowledge_path_id': knowledge_path.id,
-            })
-            
+            target=knowledge_path,
+            description=f'{vote.user.username} votó positivamente tu camino de conocimiento "{title}"',
+            digest=lambda actor, count: (
+                f'{actor.username} y {_and_others(count)} votaron positivamente tu camino de conocimiento "{title}"'
+            ),
+        )])
     except Exception as e:
         logger.error(f"Error creating knowledge path upvote notification: {str(e)}", extra={
             'vote_id': vote.id,
-            'knowledge_path_id': knowledge_path.id if 'knowledge_path' in locals() else None,
-            'voter_id': vote.user.id,
+            'voter_id': vote.user_id,
         }, exc_info=True)
 
 def notify_event_registration(registration):
@@ -972,7 +643,6 @@ def notify_event_registration(registration):
             target_content_type=event_ct,
             target_object_id=registration.event.id
         )
-        logger.debug(f"Existing notifications count: {existing_notifications.count()}")
         
         if existing_notifications.exists():
             logger.info("Notification already exists - skipping creation", extra={
@@ -995,27 +665,10 @@ def notify_event_registration(registration):
             'notification_id': notification.id,
             'registration_id': registration.id,
             'event_id': registration.event.id,
-            'recipient_id': notification.recipient.id,
-            'actor_id': notification.actor.id,
+            'recipient_id': notification.recipient_id,
+            'actor_id': notification.actor_object_id,
         })
         
-        # Verify the notification was created
-        if notification:
-            logger.debug("Notification verification successful", extra={
-                'notification_id': notification.id,
-                'recipient': notification.recipient.username,
-                'actor': notification.actor.username,
-                'verb': notification.verb,
-                'timestamp': notification.timestamp.isoformat(),
-                'unread': notification.unread,
-                'target_content_type': str(notification.target_content_type),
-                'target_object_id': notification.target_object_id,
-            })
-        else:
-            logger.warning("Notification not found in database after creation", extra={
-                'registration_id': registration.id,
-                'event_id': registration.event.id,
-            })
             
     except Exception as e:
         logger.error(f"Error creating event registration notification: {str(e)}", extra={
@@ -1074,7 +727,6 @@ def notify_payment_accepted(registration):
             target_content_type=event_ct,
             target_object_id=registration.event.id
         )
-        logger.debug(f"Existing notifications count: {existing_notifications.count()}")
         
         if existing_notifications.exists():
             logger.info("Notification already exists - skipping creation", extra={
@@ -1097,27 +749,10 @@ def notify_payment_accepted(registration):
             'notification_id': notification.id,
             'registration_id': registration.id,
             'event_id': registration.event.id,
-            'recipient_id': notification.recipient.id,
-            'actor_id': notification.actor.id,
+            'recipient_id': notification.recipient_id,
+            'actor_id': notification.actor_object_id,
         })
         
-        # Verify the notification was created
-        if notification:
-            logger.debug("Notification verification successful", extra={
-                'notification_id': notification.id,
-                'recipient': notification.recipient.username,
-                'actor': notification.actor.username,
-                'verb': notification.verb,
-                'timestamp': notification.timestamp.isoformat(),
-                'unread': notification.unread,
-                'target_content_type': str(notification.target_content_type),
-                'target_object_id': notification.target_object_id,
-            })
-        else:
-            logger.warning("Notification not found in database after creation", extra={
-                'registration_id': registration.id,
-                'event_id': registration.event.id,
-            })
             
     except Exception as e:
         logger.error(f"Error creating payment accepted notification: {str(e)}", extra={
@@ -1176,7 +811,6 @@ def notify_certificate_sent(registration):
             target_content_type=event_ct,
             target_object_id=registration.event.id
         )
-        logger.debug(f"Existing notifications count: {existing_notifications.count()}")
         
         if existing_notifications.exists():
             logger.info("Notification already exists - skipping creation", extra={
@@ -1199,27 +833,10 @@ def notify_certificate_sent(registration):
             'notification_id': notification.id,
             'registration_id': registration.id,
             'event_id': registration.event.id,
-            'recipient_id': notification.recipient.id,
-            'actor_id': notification.actor.id,
+            'recipient_id': notification.recipient_id,
+            'actor_id': notification.actor_object_id,
         })
         
-        # Verify the notification was created
-        if notification:
-            logger.debug("Notification verification successful", extra={
-                'notification_id': notification.id,
-                'recipient': notification.recipient.username,
-                'actor': notification.actor.username,
-                'verb': notification.verb,
-                'timestamp': notification.timestamp.isoformat(),
-                'unread': notification.unread,
-                'target_content_type': str(notification.target_content_type),
-                'target_object_id': notification.target_object_id,
-            })
-        else:
-            logger.warning("Notification not found in database after creation", extra={
-                'registration_id': registration.id,
-                'event_id': registration.event.id,
-            })
             
     except Exception as e:
         logger.error(f"Error creating certificate sent notification: {str(e)}", extra={
@@ -1269,7 +886,6 @@ def notify_topic_moderator_invitation(invitation):
             target_content_type=topic_ct,
             target_object_id=invitation.topic.id
         )
-        logger.debug(f"Existing notifications count: {existing_notifications.count()}")
         
         if existing_notifications.exists():
             logger.info("Notification already exists - skipping creation", extra={
@@ -1297,27 +913,10 @@ def notify_topic_moderator_invitation(invitation):
             'notification_id': notification.id,
             'invitation_id': invitation.id,
             'topic_id': invitation.topic.id,
-            'recipient_id': notification.recipient.id,
-            'actor_id': notification.actor.id,
+            'recipient_id': notification.recipient_id,
+            'actor_id': notification.actor_object_id,
         })
         
-        # Verify the notification was created
-        if notification:
-            logger.debug("Notification verification successful", extra={
-                'notification_id': notification.id,
-                'recipient': notification.recipient.username,
-                'actor': notification.actor.username,
-                'verb': notification.verb,
-                'timestamp': notification.timestamp.isoformat(),
-                'unread': notification.unread,
-                'target_content_type': str(notification.target_content_type),
-                'target_object_id': notification.target_object_id,
-            })
-        else:
-            logger.warning("Notification not found in database after creation", extra={
-                'invitation_id': invitation.id,
-                'topic_id': invitation.topic.id,
-            })
             
     except Exception as e:
         logger.error(f"Error creating topic moderator invitation notification: {str(e)}", extra={
@@ -1375,7 +974,6 @@ def notify_topic_moderator_invitation_accepted(invitation):
             target_content_type=topic_ct,
             target_object_id=invitation.topic.id
         )
-        logger.debug(f"Existing notifications count: {existing_notifications.count()}")
         
         if existing_notifications.exists():
             logger.info("Notification already exists - skipping creation", extra={
@@ -1398,27 +996,10 @@ def notify_topic_moderator_invitation_accepted(invitation):
             'notification_id': notification.id,
             'invitation_id': invitation.id,
             'topic_id': invitation.topic.id,
-            'recipient_id': notification.recipient.id,
-            'actor_id': notification.actor.id,
+            'recipient_id': notification.recipient_id,
+            'actor_id': notification.actor_object_id,
         })
         
-        # Verify the notification was created
-        if notification:
-            logger.debug("Notification verification successful", extra={
-                'notification_id': notification.id,
-                'recipient': notification.recipient.username,
-                'actor': notification.actor.username,
-                'verb': notification.verb,
-                'timestamp': notification.timestamp.isoformat(),
-                'unread': notification.unread,
-                'target_content_type': str(notification.target_content_type),
-                'target_object_id': notification.target_object_id,
-            })
-        else:
-            logger.warning("Notification not found in database after creation", extra={
-                'invitation_id': invitation.id,
-                'topic_id': invitation.topic.id,
-            })
             
     except Exception as e:
         logger.error(f"Error creating topic moderator invitation accepted notification: {str(e)}", extra={
@@ -1476,7 +1057,6 @@ def notify_topic_moderator_invitation_declined(invitation):
             target_content_type=topic_ct,
             target_object_id=invitation.topic.id
         )
-        logger.debug(f"Existing notifications count: {existing_notifications.count()}")
         
         if existing_notifications.exists():
             logger.info("Notification already exists - skipping creation", extra={
@@ -1499,27 +1079,10 @@ def notify_topic_moderator_invitation_declined(invitation):
             'notification_id': notification.id,
             'invitation_id': invitation.id,
             'topic_id': invitation.topic.id,
-            'recipient_id': notification.recipient.id,
-            'actor_id': notification.actor.id,
+            'recipient_id': notification.recipient_id,
+            'actor_id': notification.actor_object_id,
         })
         
-        # Verify the notification was created
-        if notification:
-            logger.debug("Notification verification successful", extra={
-                'notification_id': notification.id,
-                'recipient': notification.recipient.username,
-                'actor': notification.actor.username,
-                'verb': notification.verb,
-                'timestamp': notification.timestamp.isoformat(),
-                'unread': notification.unread,
-                'target_content_type': str(notification.target_content_type),
-                'target_object_id': notification.target_object_id,
-            })
-        else:
-            logger.warning("Notification not found in database after creation", extra={
-                'invitation_id': invitation.id,
-                'topic_id': invitation.topic.id,
-            })
             
     except Exception as e:
         logger.error(f"Error creating topic moderator invitation declined notification: {str(e)}", extra={
@@ -1592,7 +1155,6 @@ def notify_topic_moderator_removed(topic, removed_user, removed_by):
             target_object_id=topic.id,
             timestamp__gte=recent_cutoff
         )
-        logger.debug(f"Existing notifications count: {existing_notifications.count()}")
         
         if existing_notifications.exists():
             logger.info("Recent notification already exists - skipping creation", extra={
@@ -1615,27 +1177,10 @@ def notify_topic_moderator_removed(topic, removed_user, removed_by):
             'notification_id': notification.id,
             'topic_id': topic.id,
             'removed_user_id': removed_user.id,
-            'recipient_id': notification.recipient.id,
-            'actor_id': notification.actor.id,
+            'recipient_id': notification.recipient_id,
+            'actor_id': notification.actor_object_id,
         })
         
-        # Verify the notification was created
-        if notification:
-            logger.debug("Notification verification successful", extra={
-                'notification_id': notification.id,
-                'recipient': notification.recipient.username,
-                'actor': notification.actor.username,
-                'verb': notification.verb,
-                'timestamp': notification.timestamp.isoformat(),
-                'unread': notification.unread,
-                'target_content_type': str(notification.target_content_type),
-                'target_object_id': notification.target_object_id,
-            })
-        else:
-            logger.warning("Notification not found in database after creation", extra={
-                'topic_id': topic.id,
-                'removed_user_id': removed_user.id,
-            })
             
     except Exception as e:
         logger.error(f"Error creating topic moderator removed notification: {str(e)}", extra={
@@ -1644,6 +1189,15 @@ def notify_topic_moderator_removed(topic, removed_user, removed_by):
             'removed_by_id': removed_by.id if removed_by else None,
         }, exc_info=True)
 
+def _topic_moderator_ids(topic, exclude_id=None):
+    """Ids of the topic's moderators and creator, minus exclude_id."""
+    recipient_ids = set(topic.moderators.values_list('id', flat=True))
+    if topic.creator_id:
+        recipient_ids.add(topic.creator_id)
+    recipient_ids.discard(exclude_id)
+    return sorted(recipient_ids)
+
+
 def notify_content_suggestion_created(suggestion):
     """
     Create notifications when a user suggests content for a topic.
@@ -1654,79 +1208,34 @@ def notify_content_suggestion_created(suggestion):
     """
     logger.info("Creating content suggestion notification", extra={
         'suggestion_id': suggestion.id,
-        'topic_id': suggestion.topic.id,
-        'topic_title': suggestion.topic.title,
-        'content_id': suggestion.content.id,
-        'suggested_by_id': suggestion.suggested_by.id,
-        'suggested_by_username': suggestion.suggested_by.username,
+        'topic_id': suggestion.topic_id,
+        'content_id': suggestion.content_id,
+        'suggested_by_id': suggestion.suggested_by_id,
     })
     
     try:
-        # Get all moderators of the topic (including creator)
-        moderators = list(suggestion.topic.moderators.all())
-        if suggestion.topic.creator and suggestion.topic.creator not in moderators:
-            moderators.append(suggestion.topic.creator)
-        
-        # Get content types
-        suggested_by_ct = ContentType.objects.get_for_model(suggestion.suggested_by)
-        topic_ct = ContentType.objects.get_for_model(suggestion.topic)
-        
-        notifications_created = 0
-        
-        for moderator in moderators:
-            # Don't notify the user who made the suggestion
-            if moderator.id == suggestion.suggested_by.id:
-                continue
-            
-            # Check if notification already exists
-            existing_notifications = Notification.objects.filter(
-                recipient=moderator,
-                actor_content_type=suggested_by_ct,
-                actor_object_id=suggestion.suggested_by.id,
-                verb='sugirió contenido para',
-                target_content_type=topic_ct,
-                target_object_id=suggestion.topic.id
-            )
-            
-            if existing_notifications.exists():
-                logger.info("Notification already exists - skipping creation", extra={
-                    'suggestion_id': suggestion.id,
-                    'moderator_id': moderator.id,
-                })
-                continue
-            
-            # Build description
-            description = f'{suggestion.suggested_by.username} sugirió contenido para el tema "{suggestion.topic.title}"'
-            if suggestion.message:
-                description += f': {suggestion.message[:100]}'
-            
-            # Create the notification
-            notification = create_notification(
-                recipient=moderator,
-                actor_content_type=suggested_by_ct,
-                actor_object_id=suggestion.suggested_by.id,
+        description = f'{suggestion.suggested_by.username} sugirió contenido para el tema "{suggestion.topic.title}"'
+        if suggestion.message:
+            description += f': {suggestion.message[:100]}'
+
+        notifications_created = send_notifications([
+            NotificationEvent(
+                recipient_id=moderator_id,
+                actor=suggestion.suggested_by,
                 verb='sugirió contenido para',
-                target_content_type=topic_ct,
-                target_object_id=suggestion.topic.id,
-                description=description
+                target=suggestion.topic,
+                key_object=suggestion,
+                description=description,
             )
-            notifications_created += 1
-            logger.info("Content suggestion notification created successfully", extra={
-                'notification_id': notification.id,
-                'suggestion_id': suggestion.id,
-                'moderator_id': moderator.id,
-            })
-        
+            for moderator_id in _topic_moderator_ids(suggestion.topic, exclude_id=suggestion.suggested_by_id)
+        ])
         logger.info(f"Created {notifications_created} notifications for content suggestion", extra={
             'suggestion_id': suggestion.id,
-            'total_moderators': len(moderators),
-            'notifications_created': notifications_created,
         })
-            
     except Exception as e:
         logger.error(f"Error creating content suggestion notification: {str(e)}", extra={
             'suggestion_id': suggestion.id if suggestion else None,
-            'topic_id': suggestion.topic.id if suggestion else None,
+            'topic_id': suggestion.topic_id if suggestion else None,
         }, exc_info=True)
 
 def notify_content_suggestion_accepted(suggestion):
@@ -1792,8 +1301,8 @@ def notify_content_suggestion_accepted(suggestion):
         logger.info("Content suggestion accepted notification created successfully", extra={
             'notification_id': notification.id,
             'suggestion_id': suggestion.id,
-            'recipient_id': notification.recipient.id,
-            'actor_id': notification.actor.id,
+            'recipient_id': notification.recipient_id,
+            'actor_id': notification.actor_object_id,
         })
             
     except Exception as e:
@@ -1870,8 +1379,8 @@ def notify_content_suggestion_rejected(suggestion):
         logger.info("Content suggestion rejected notification created successfully", extra={
             'notification_id': notification.id,
             'suggestion_id': suggestion.id,
-            'recipient_id': notification.recipient.id,
-            'actor_id': notification.actor.id,
+            'recipient_id': notification.recipient_id,
+            'actor_id': notification.actor_object_id,
         })
             
     except Exception as e:
@@ -1885,52 +1394,29 @@ def notify_timeline_entry_suggestion_created(suggestion):
     """Notify topic moderators when a user suggests a timeline entry."""
     logger.info("Creating timeline entry suggestion notification", extra={
         'suggestion_id': suggestion.id,
-        'topic_id': suggestion.topic.id,
+        'topic_id': suggestion.topic_id,
         'suggested_by_id': suggestion.suggested_by_id,
     })
 
     try:
-        moderators = list(suggestion.topic.moderators.all())
-        if suggestion.topic.creator and suggestion.topic.creator not in moderators:
-            moderators.append(suggestion.topic.creator)
-
-        suggested_by_ct = ContentType.objects.get_for_model(suggestion.suggested_by)
-        topic_ct = ContentType.objects.get_for_model(suggestion.topic)
-        notifications_created = 0
-
-        for moderator in moderators:
-            if moderator.id == suggestion.suggested_by.id:
-                continue
-
-            existing_notifications = Notification.objects.filter(
-                recipient=moderator,
-                actor_content_type=suggested_by_ct,
-                actor_object_id=suggestion.suggested_by.id,
-                verb='sugirió una entrada en la línea de tiempo para',
-                target_content_type=topic_ct,
-                target_object_id=suggestion.topic.id,
-            )
-            if existing_notifications.exists():
-                continue
-
-            description = (
-                f'{suggestion.suggested_by.username} sugirió una entrada en la línea de tiempo '
-                f'para el tema "{suggestion.topic.title}": {suggestion.title[:80]}'
-            )
-            if suggestion.message:
-                description += f' — {suggestion.message[:100]}'
+        description = (
+            f'{suggestion.suggested_by.username} sugirió una entrada en la línea de tiempo '
+            f'para el tema "{suggestion.topic.title}": {suggestion.title[:80]}'
+        )
+        if suggestion.message:
+            description += f' — {suggestion.message[:100]}'
 
-            create_notification(
-                recipient=moderator,
-                actor_content_type=suggested_by_ct,
-                actor_object_id=suggestion.suggested_by.id,
+        notifications_created = send_notifications([
+            NotificationEvent(
+                recipient_id=moderator_id,
+                actor=suggestion.suggested_by,
                 verb='sugirió una entrada en la línea de tiempo para',
-                target_content_type=topic_ct,
-                target_object_id=suggestion.topic.id,
+                target=suggestion.topic,
+                key_object=suggestion,
                 description=description,
             )
-            notifications_created += 1
-
+            for moderator_id in _topic_moderator_ids(suggestion.topic, exclude_id=suggestion.suggested_by_id)
+        ])
         logger.info(
             f"Created {notifications_created} notifications for timeline entry suggestion",
             extra={'suggestion_id': suggestion.id},
@@ -2031,51 +1517,27 @@ def notify_timeline_entry_content_suggestion_created(suggestion):
     """Notify topic moderators when a user suggests linking content to a timeline entry."""
     logger.info("Creating timeline entry content suggestion notification", extra={
         'suggestion_id': suggestion.id,
-        'topic_id': suggestion.topic.id,
+        'topic_id': suggestion.topic_id,
         'entry_id': suggestion.entry_id,
         'suggested_by_id': suggestion.suggested_by_id,
     })
 
     try:
-        moderators = list(suggestion.topic.moderators.all())
-        if suggestion.topic.creator and suggestion.topic.creator not in moderators:
-            moderators.append(suggestion.topic.creator)
-
-        suggested_by_ct = ContentType.objects.get_for_model(suggestion.suggested_by)
-        topic_ct = ContentType.objects.get_for_model(suggestion.topic)
-        notifications_created = 0
-
-        for moderator in moderators:
-            if moderator.id == suggestion.suggested_by.id:
-                continue
-
-            existing_notifications = Notification.objects.filter(
-                recipient=moderator,
-                actor_content_type=suggested_by_ct,
-                actor_object_id=suggestion.suggested_by.id,
-                verb='sugirió vincular contenido a una entrada de la línea de tiempo en',
-                target_content_type=topic_ct,
-                target_object_id=suggestion.topic.id,
-            )
-            if existing_notifications.exists():
-                continue
-
-            description = (
-                f'{suggestion.suggested_by.username} sugirió vincular contenido a la entrada '
-                f'"{suggestion.entry.title}" en "{suggestion.topic.title}"'
-            )
-
-            create_notification(
-                recipient=moderator,
-                actor_content_type=suggested_by_ct,
-                actor_object_id=suggestion.suggested_by.id,
+        description = (
+            f'{suggestion.suggested_by.username} sugirió vincular contenido a la entrada '
+            f'"{suggestion.entry.title}" en "{suggestion.topic.title}"'
+        )
+        notifications_created = send_notifications([
+            NotificationEvent(
+                recipient_id=moderator_id,
+                actor=suggestion.suggested_by,
                 verb='sugirió vincular contenido a una entrada de la línea de tiempo en',
-                target_content_type=topic_ct,
-                target_object_id=suggestion.topic.id,
+                target=suggestion.topic,
+                key_object=suggestion,
                 description=description,
             )
-            notifications_created += 1
-
+            for moderator_id in _topic_moderator_ids(suggestion.topic, exclude_id=suggestion.suggested_by_id)
+        ])
         logger.info(
             f"Created {notifications_created} notifications for timeline entry content suggestion",
             extra={'suggestion_id': suggestion.id},
@@ -2270,29 +1732,26 @@ def notify_topic_creation_request_created(creation_request):
     })
 
     try:
-        requester_ct = ContentType.objects.get_for_model(creation_request.requested_by)
-        request_ct = ContentType.objects.get_for_model(creation_request)
-        staff_users = User.objects.filter(is_staff=True, is_active=True)
-
-        for staff_user in staff_users:
-            if staff_user.id == creation_request.requested_by_id:
-                continue
-
-            description = (
-                f'{creation_request.requested_by.username} solicitó crear el tema '
-                f'"{creation_request.proposed_title}"'
-            )
-            create_notification(
-                recipient=staff_user,
-                actor_content_type=requester_ct,
-                actor_object_id=creation_request.requested_by.id,
+        description = (
+            f'{creation_request.requested_by.username} solicitó crear el tema '
+            f'"{creation_request.proposed_title}"'
+        )
+        staff_ids = (
+            User.objects.filter(is_staff=True, is_active=True)
+            .exclude(pk=creation_request.requested_by_id)
+            .values_list('id', flat=True)
+        )
+        send_notifications([
+            NotificationEvent(
+                recipient_id=staff_id,
+                actor=creation_request.requested_by,
                 verb='solicitó crear un tema',
-                action_object_content_type=request_ct,
-                action_object_object_id=creation_request.id,
-                target_content_type=request_ct,
-                target_object_id=creation_request.id,
+                action_object=creation_request,
+                target=creation_request,
                 description=description,
             )
+            for staff_id in staff_ids
+        ])
     except Exception as e:
         logger.error(
             f"Error creating topic creation request notifications: {str(e)}",
@@ -2304,8 +1763,9 @@ def notify_topic_creation_request_created(creation_request):
 
 
 def _send_topic_creation_request_email_to_admins(creation_request):
-    """Email all administrators about a new topic creation request."""
-    from profiles.email_service import EmailService, EmailServiceError
+    """Queue an email to all administrators about a new topic creation request."""
+    from jobs.queue import enqueue_on_commit
+    from profiles.email_service import EmailService
 
     requester = creation_request.requested_by
     brand = EmailService.get_brand_context()
@@ -2313,7 +1773,8 @@ def _send_topic_creation_request_email_to_admins(creation_request):
     description = creation_request.proposed_description or 'Sin descripción.'
 
     try:
-        EmailService.send_to_admins(
+        enqueue_on_commit(
+            'profiles.admin_email',
             subject=f'Nueva solicitud de tema: {creation_request.proposed_title}',
             template_name='topic_creation_request',
             context={
@@ -2324,20 +1785,11 @@ def _send_topic_creation_request_email_to_admins(creation_request):
                 'dashboard_url': dashboard_url,
             },
             tags=['topic-creation-request', 'admin', 'notification'],
-        )
-        logger.info(
-            'Topic creation request email dispatched to administrators',
-            extra={'request_id': creation_request.id},
-        )
-    except EmailServiceError as e:
-        logger.error(
-            f'Error sending topic creation request admin email: {str(e)}',
-            extra={'request_id': getattr(creation_request, 'id', None)},
-            exc_info=True,
+            idempotency_key=f'topic-creation-request-admin-email:{creation_request.id}',
         )
     except Exception as e:
         logger.error(
-            f'Unexpected error sending topic creation request admin email: {str(e)}',
+            f'Error queueing topic creation request admin email: {str(e)}',
             extra={'request_id': getattr(creation_request, 'id', None)},
             exc_info=True,
         )
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import json
 import logging
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import requests
 from django.conf import settings
 
+from utils.http_session import get_http_session
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 60.0
@@ -25,6 +28,29 @@ def openai_configured() -> bool:
     return bool((getattr(settings, 'OPENAI_API_KEY', '') or '').strip())
 
 
+def chat_request_body(
+    messages: list[dict[str, str]],
+    *,
+    model: Optional[str],
+    temperature: float,
+    max_tokens: Optional[int],
+) -> dict[str, Any]:
+    """JSON body for POST /chat/completions (shared with utils.async_clients)."""
+    model_name = (
+        model
+        or getattr(settings, 'OPENAI_CHAT_MODEL', '')
+        or 'gpt-4o-mini'
+    )
+    body: dict[str, Any] = {
+        'model': model_name,
+        'messages': messages,
+        'temperature': temperature,
+    }
+    if max_tokens is not None:
+        body['max_tokens'] = max_tokens
+    return body
+
+
 class OpenAIClient:
     def __init__(
         self,
@@ -35,7 +61,7 @@ class OpenAIClient:
     ):
         self.api_key = (api_key or getattr(settings, 'OPENAI_API_KEY', '') or '').strip()
         self.timeout = timeout
-        self.session = session or requests.Session()
+        self.session = session or get_http_session('openai')
         if not self.api_key:
             raise OpenAIClientError(
                 'OpenAI no configurado. Define OPENAI_API_KEY en acbc_app/.env'
@@ -47,28 +73,39 @@ class OpenAIClient:
             'Content-Type': 'application/json',
         }
 
-    def _request(self, method: str, path: str, json_body: dict[str, Any]) -> Any:
-        url = f'{OPENAI_API_BASE}{path}'
-        response = self.session.request(
-            method,
-            url,
-            headers=self._headers(),
-            json=json_body,
-            timeout=self.timeout,
-        )
-        if response.status_code >= 400:
-            detail: Any
-            try:
-                detail = response.json()
-            except Exception:
-                detail = (response.text or '').strip()[:800]
-            raise OpenAIClientError(
-                f'{method} {path} → {response.status_code}: {detail}',
-                status_code=response.status_code,
-                body=detail,
+    def _send(self, method: str, path: str, json_body: dict[str, Any], **kwargs):
+        try:
+            return self.session.request(
+                method,
+                f'{OPENAI_API_BASE}{path}',
+                headers=self._headers(),
+                json=json_body,
+                timeout=self.timeout,
+                **kwargs,
             )
+        except requests.RequestException as exc:
+            raise OpenAIClientError(f'{method} {path} → {exc}') from exc
+
+    def _request(self, method: str, path: str, json_body: dict[str, Any]) -> Any:
+        response = self._send(method, path, json_body)
+        self._raise_for_status(method, path, response)
         return response.json()
 
+    @staticmethod
+    def _raise_for_status(method: str, path: str, response) -> None:
+        if response.status_code < 400:
+            return
+        detail: Any
+        try:
+            detail = response.json()
+        except Exception:
+            detail = (response.text or '').strip()[:800]
+        raise OpenAIClientError(
+            f'{method} {path} → {response.status_code}: {detail}',
+            status_code=response.status_code,
+            body=detail,
+        )
+
     def embed(
         self,
         text: str,
@@ -104,18 +141,9 @@ class OpenAIClient:
         temperature: float = 0.2,
         max_tokens: Optional[int] = None,
     ) -> str:
-        model_name = (
-            model
-            or getattr(settings, 'OPENAI_CHAT_MODEL', '')
-            or 'gpt-4o-mini'
+        body = chat_request_body(
+            messages, model=model, temperature=temperature, max_tokens=max_tokens,
         )
-        body: dict[str, Any] = {
-            'model': model_name,
-            'messages': messages,
-            'temperature': temperature,
-        }
-        if max_tokens is not None:
-            body['max_tokens'] = max_tokens
         data = self._request('POST', '/chat/completions', body)
         choices = (data or {}).get('choices') or []
         if not choices:
@@ -125,3 +153,40 @@ class OpenAIClient:
         if not content:
             raise OpenAIClientError('OpenAI chat devolvió una respuesta vacía.')
         return content
+
+    def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        model: Optional[str] = None,
+        temperature: float = 0.2,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Yield answer text deltas as OpenAI streams them (stream=true, SSE chunks)."""
+        body = chat_request_body(
+            messages, model=model, temperature=temperature, max_tokens=max_tokens,
+        )
+        body['stream'] = True
+        path = '/chat/completions'
+        response = self._send('POST', path, body, stream=True)
+        try:
+            self._raise_for_status('POST', path, response)
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith('data:'):
+                    continue
+                data = line[len('data:'):].strip()
+                if data == '[DONE]':
+                    break
+                try:
+                    chunk = json.loads(data)
+                except ValueError as exc:
+                    raise OpenAIClientError(f'OpenAI chat stream devolvió un chunk inválido: {data[:200]}') from exc
+                for choice in chunk.get('choices') or []:
+                    delta = (choice.get('delta') or {}).get('content')
+                    if delta:
+                        yield delta
+        except requests.RequestException as exc:
+            # ChunkedEncodingError / ReadTimeout once the body has started.
+            raise OpenAIClientError(f'POST {path} (stream) → {exc}') from exc
+        finally:
+            response.close()
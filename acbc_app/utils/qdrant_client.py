@@ -13,6 +13,8 @@ from typing import Any, Optional
 import requests
 from django.conf import settings
 
+from utils.http_session import get_http_session
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 30.0
@@ -54,7 +56,7 @@ class QdrantClient:
             or 'sophia_acbc_topic_chunks'
         ).strip()
         self.timeout = timeout
-        self.session = session or requests.Session()
+        self.session = session or get_http_session('qdrant')
         if not self.base_url or not self.api_key:
             raise QdrantClientError(
                 'Qdrant no configurado. Define QDRANT_URL y QDRANT_API_KEY en acbc_app/.env'
@@ -67,6 +69,18 @@ class QdrantClient:
             'Accept': 'application/json',
         }
 
+    def _send(self, method: str, path: str, json_body: Optional[dict[str, Any]] = None):
+        try:
+            return self.session.request(
+                method,
+                f'{self.base_url}{path}',
+                headers=self._headers(),
+                json=json_body,
+                timeout=self.timeout,
+            )
+        except requests.RequestException as exc:
+            raise QdrantClientError(f'{method} {path} → {exc}') from exc
+
     def _request(
         self,
         method: str,
@@ -74,14 +88,7 @@ class QdrantClient:
         *,
         json_body: Optional[dict[str, Any]] = None,
     ) -> Any:
-        url = f'{self.base_url}{path}'
-        response = self.session.request(
-            method,
-            url,
-            headers=self._headers(),
-            json=json_body,
-            timeout=self.timeout,
-        )
+        response = self._send(method, path, json_body)
         if response.status_code >= 400:
             detail: Any
             try:
@@ -111,11 +118,7 @@ class QdrantClient:
         }
 
     def collection_exists(self) -> bool:
-        response = self.session.get(
-            f'{self.base_url}/collections/{self.collection}',
-            headers=self._headers(),
-            timeout=self.timeout,
-        )
+        response = self._send('GET', f'/collections/{self.collection}')
         if response.status_code == 200:
             return True
         if response.status_code == 404:
@@ -182,11 +185,13 @@ class QdrantClient:
         topic_id: Optional[int] = None,
         limit: int = 8,
         with_payload: bool = True,
+        with_vector: bool = False,
     ) -> list[dict[str, Any]]:
         body: dict[str, Any] = {
             'vector': vector,
             'limit': max(1, min(int(limit), 64)),
             'with_payload': with_payload,
+            'with_vector': with_vector,
         }
         if topic_id is not None:
             body['filter'] = {
@@ -0,0 +1,237 @@
+"""Two-level response cache with versioned tag invalidation.
+
+L2 is a Django cache alias shared by every worker (SHARED_CACHE_ALIAS, Redis in
+production via REDIS_URL; LocMemCache when unset, which is shared within one process
+and is what tests use). L1 is a small in-process LRU in front of it.
+
+Every cached value is stored under a key that embeds the current version of each of
+its tags (e.g. 'topics', 'topic:12'). invalidate_tags() bumps those versions in L2, so
+all workers stop reading the old entries at once; nothing has to be deleted and L1
+never serves a stale value because tag versions are always read from L2.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+TAG_PREFIX = 'cachetag:'
+DEFAULT_TIMEOUT = 300
+_MISSING = object()
+
+
+class SharedCache:
+    """get_or_set() over L1 (process LRU) + L2 (shared Django cache) keyed by tag versions."""
+
+    def __init__(
+        self,
+        *,
+        alias: str = 'default',
+        l1_max_entries: int = 256,
+        l1_ttl: float = 30.0,
+        timeout: int = DEFAULT_TIMEOUT,
+    ):
+        self.alias = alias
+        self.l1_max_entries = max(0, int(l1_max_entries))
+        self.l1_ttl = max(0.0, float(l1_ttl))
+        self.timeout = timeout
+        self._l1: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+
+    @property
+    def l2(self):
+        return caches[self.alias]
+
+    def tag_versions(self, tags: Iterable[str]) -> dict[str, Any]:
+        keys = [f'{TAG_PREFIX}{tag}' for tag in sorted(set(tags))]
+        versions = self.l2.get_many(keys)
+        for key in keys:
+            if key not in versions:
+                # A fresh, never-reused version: an evicted tag must not resurrect old entries.
+                self.l2.add(key, time.time_ns(), None)
+                versions[key] = self.l2.get(key)
+        return versions
+
+    def _versioned_key(self, key: str, tags: Iterable[str]) -> str:
+        versions = self.tag_versions(tags)
+        stamp = ','.join(f'{k}={v}' for k, v in sorted(versions.items()))
+        digest = hashlib.sha1(f'{key}|{stamp}'.encode('utf-8')).hexdigest()
+        return f'shared:{digest}'
+
+    def _l1_get(self, key: str):
+        if not self.l1_max_entries:
+            return _MISSING
+        with self._lock:
+            entry = self._l1.get(key)
+            if entry is None:
+                return _MISSING
+            if entry[0] < time.monotonic():
+                del self._l1[key]
+                return _MISSING
+            self._l1.move_to_end(key)
+            return entry[1]
+
+    def _l1_set(self, key: str, value: Any) -> None:
+        if not self.l1_max_entries:
+            return
+        with self._lock:
+            self._l1[key] = (time.monotonic() + self.l1_ttl, value)
+            self._l1.move_to_end(key)
+            while len(self._l1) > self.l1_max_entries:
+                self._l1.popitem(last=False)
+
+    def get_or_set(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        *,
+        tags: Iterable[str] = (),
+        timeout: Optional[int] = None,
+    ) -> Any:
+        """Cached value for key under the current tag versions, computing it on a miss."""
+        try:
+            versioned = self._versioned_key(key, tags)
+        except Exception:
+            logger.exception('Shared cache unavailable; computing %s directly', key)
+            return compute()
+
+        value = self._l1_get(versioned)
+        if value is not _MISSING:
+            self.l1_hits += 1
+            return value
+        try:
+            value = self.l2.get(versioned, _MISSING)
+        except Exception:
+            logger.exception('Shared cache read failed for %s', key)
+            value = _MISSING
+        if value is not _MISSING:
+            self.l2_hits += 1
+            self._l1_set(versioned, value)
+            return value
+
+        self.misses += 1
+        value = compute()
+        try:
+            self.l2.set(versioned, value, self.timeout if timeout is None else timeout)
+        except Exception:
+            logger.exception('Shared cache write failed for %s', key)
+        self._l1_set(versioned, value)
+        return value
+
+    def invalidate(self, *tags: str) -> None:
+        for tag in set(tags):
+            key = f'{TAG_PREFIX}{tag}'
+            try:
+                self.l2.incr(key)
+            except ValueError:
+                self.l2.set(key, time.time_ns(), None)
+
+    def clear_local(self) -> None:
+        with self._lock:
+            self._l1.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'l1_entries': len(self._l1),
+            'l1_hits': self.l1_hits,
+            'l2_hits': self.l2_hits,
+            'misses': self.misses,
+        }
+
+
+_shared_cache: Optional[SharedCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache() -> SharedCache:
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = SharedCache(
+                    alias=getattr(settings, 'SHARED_CACHE_ALIAS', 'default') or 'default',
+                    l1_max_entries=getattr(settings, 'SHARED_CACHE_L1_SIZE', 256),
+                    l1_ttl=getattr(settings, 'SHARED_CACHE_L1_TTL', 30),
+                    timeout=getattr(settings, 'SHARED_CACHE_TIMEOUT', DEFAULT_TIMEOUT),
+                )
+    return _shared_cache
+
+
+def reset_shared_cache() -> None:
+    """Drop the process singleton (tests, settings changes)."""
+    global _shared_cache
+    with _shared_cache_lock:
+        _shared_cache = None
+
+
+def shared_cache_enabled() -> bool:
+    return bool(getattr(settings, 'SHARED_CACHE_ENABLED', True))
+
+
+def invalidate_tags(*tags: str) -> None:
+    """Bump tag versions; safe to call from signal handlers (errors are logged, not raised)."""
+    tags = tuple(tag for tag in tags if tag)
+    if not tags:
+        return
+    try:
+        get_shared_cache().invalidate(*tags)
+    except Exception:
+        logger.exception('Failed to invalidate cache tags %s', tags)
+
+
+def invalidate_tags_on_commit(*tags: str) -> None:
+    """
+    invalidate_tags() now and again after the surrounding transaction commits, so a
+    reader that cached pre-commit data under the new versions is evicted too.
+    """
+    invalidate_tags(*tags)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: invalidate_tags(*tags))
+
+
+def cached_value(key: str, compute: Callable[[], Any], *, tags: Iterable[str], timeout: Optional[int] = None):
+    """get_or_set() on the shared cache, or compute() when response caching is disabled."""
+    if not shared_cache_enabled():
+        return compute()
+    return get_shared_cache().get_or_set(key, compute, tags=tags, timeout=timeout)
+
+
+def request_cache_key(request, *parts: Any) -> str:
+    """Key for a public response: host (absolute media URLs), path and sorted query params."""
+    query = sorted(request.GET.lists())
+    return '|'.join(
+        [request.scheme, request.get_host(), request.path, repr(query)] + [str(part) for part in parts]
+    )
+
+
+def cached_response_data(
+    request,
+    compute: Callable[[], Any],
+    *,
+    tags: Iterable[str],
+    timeout: Optional[int] = None,
+    public: bool = False,
+):
+    """
+    Cached payload for a GET. Only anonymous requests share it unless public=True
+    (the payload has nothing user-specific); compute() must return picklable data.
+    """
+    user = getattr(request, 'user', None)
+    if not shared_cache_enabled() or (not public and user is not None and user.is_authenticated):
+        return compute()
+    return get_shared_cache().get_or_set(
+        request_cache_key(request), compute, tags=tags, timeout=timeout,
+    )
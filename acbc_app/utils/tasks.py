@@ -0,0 +1,23 @@
+"""Background job handlers for utils (see jobs.queue)."""
+import logging
+
+from django.apps import apps
+
+from jobs.registry import job_task
+
+logger = logging.getLogger('academia_blockchain.notifications')
+
+
+@job_task('utils.notify', queue='notifications')
+def notify(handler, model, pk):
+    """notification_utils.<handler>(instance) for a notify_later() job."""
+    from utils import notification_utils
+
+    if not handler.startswith('notify_') or not hasattr(notification_utils, handler):
+        raise ValueError(f'Unknown notification handler {handler!r}')
+    instance = apps.get_model(model)._default_manager.filter(pk=pk).first()
+    if instance is None:
+        # Deleted before the worker ran (e.g. a vote undone): nothing to notify about.
+        logger.info('Skipping %s: %s %s no longer exists', handler, model, pk)
+        return
+    getattr(notification_utils, handler)(instance)
@@ -0,0 +1,111 @@
+import httpx
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase, override_settings
+
+from utils.async_clients import AsyncOpenAIClient, AsyncQdrantClient, close_client_loop, get_client_loop
+from utils.http_session import get_http_session, reset_http_sessions
+from utils.openai_client import OpenAIClientError
+from utils.qdrant_client import QdrantClientError
+
+
+def _mock_client_factory(handler, created):
+    def new_client(self):
+        created.append(self._key)
+        return httpx.AsyncClient(base_url=self._base_url, transport=httpx.MockTransport(handler))
+
+    return new_client
+
+
+@override_settings(UPSTREAM_HTTP_BACKOFF=0.0, UPSTREAM_CIRCUIT_FAILURES=3)
+class AsyncClientPoolTests(SimpleTestCase):
+    def setUp(self):
+        reset_http_sessions()
+
+    def tearDown(self):
+        close_client_loop()
+        reset_http_sessions()
+
+    def _patch_clients(self, handler):
+        created = []
+        for cls in (AsyncOpenAIClient, AsyncQdrantClient):
+            original = cls._new_client
+            cls._new_client = _mock_client_factory(handler, created)
+            self.addCleanup(setattr, cls, '_new_client', original)
+        return created
+
+    def test_requests_from_separate_event_loops_share_one_client(self):
+        created = self._patch_clients(
+            lambda request: httpx.Response(200, json={'data': [{'embedding': [0.1, 0.2]}]})
+        )
+        for _ in range(2):
+            # Each async_to_sync call runs on its own short-lived event loop.
+            vector = async_to_sync(AsyncOpenAIClient(api_key='test').embed)('hola')
+            self.assertEqual(vector, [0.1, 0.2])
+        self.assertEqual(len(created), 1)
+        self.assertEqual(len(get_client_loop().clients), 1)
+
+    def test_transport_errors_raise_client_errors(self):
+        def refuse(request):
+            raise httpx.ConnectError('connection refused', request=request)
+
+        self._patch_clients(refuse)
+        with self.assertRaises(OpenAIClientError):
+            async_to_sync(AsyncOpenAIClient(api_key='test').chat)([{'role': 'user', 'content': 'hola'}])
+        qdrant = AsyncQdrantClient(url='https://qdrant.example', api_key='test')
+        with self.assertRaises(QdrantClientError):
+            async_to_sync(qdrant.search)([0.1, 0.2])
+
+    def test_chat_stream_yields_deltas_and_rejects_invalid_chunks(self):
+        body = (
+            'data: {"choices": [{"delta": {"content": "Hola"}}]}\n\n'
+            'data: {"choices": [{"delta": {"content": " mundo"}}]}\n\n'
+            'data: [DONE]\n\n'
+        )
+        self._patch_clients(lambda request: httpx.Response(200, text=body))
+
+        async def collect():
+            client = AsyncOpenAIClient(api_key='test')
+            return [delta async for delta in client.chat_stream([{'role': 'user', 'content': 'hola'}])]
+
+        self.assertEqual(async_to_sync(collect)(), ['Hola', ' mundo'])
+
+        close_client_loop()
+        self._patch_clients(lambda request: httpx.Response(200, text='data: {no es json\n\n'))
+        with self.assertRaises(OpenAIClientError):
+            async_to_sync(collect)()
+
+    def test_rate_limited_posts_are_retried_and_counted(self):
+        statuses = [429, 200]
+
+        def handler(request):
+            return httpx.Response(statuses.pop(0), json={'data': [{'embedding': [0.3]}]})
+
+        self._patch_clients(handler)
+        self.assertEqual(async_to_sync(AsyncOpenAIClient(api_key='test').embed)('hola'), [0.3])
+        metrics = get_http_session('openai').snapshot()['endpoints']['POST /v1/embeddings']
+        self.assertEqual(metrics['statuses'], {429: 1, 200: 1})
+
+    def test_openai_5xx_is_not_replayed_and_opens_the_shared_circuit(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(503, json={'error': 'down'})
+
+        self._patch_clients(handler)
+        client = AsyncOpenAIClient(api_key='test')
+        for _ in range(3):
+            with self.assertRaises(OpenAIClientError):
+                async_to_sync(client.chat)([{'role': 'user', 'content': 'hola'}])
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(get_http_session('openai').breaker.state, 'open')
+
+        with self.assertRaises(OpenAIClientError):
+            async_to_sync(client.chat)([{'role': 'user', 'content': 'hola'}])
+        self.assertEqual(len(calls), 3)
+
+    def test_qdrant_5xx_is_replayed(self):
+        statuses = [502, 200]
+        self._patch_clients(lambda request: httpx.Response(statuses.pop(0), json={'result': [{'id': 1}]}))
+        qdrant = AsyncQdrantClient(url='https://qdrant.example', api_key='test')
+        self.assertEqual(async_to_sync(qdrant.search)([0.1]), [{'id': 1}])
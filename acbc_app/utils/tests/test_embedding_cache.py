@@ -0,0 +1,70 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from utils.embedding_cache import EmbeddingCache, embedding_cache_key, normalize_query_text
+from utils.vector_fakes import FakeOpenAIClient
+
+
+class EmbeddingCacheTests(SimpleTestCase):
+    def test_equivalent_questions_share_a_key(self):
+        self.assertEqual(normalize_query_text('  ¿Qué es   BITCOIN? '), 'qué es bitcoin')
+        self.assertEqual(
+            embedding_cache_key('¿Qué es Bitcoin?', 'm'),
+            embedding_cache_key('qué es bitcoin', 'm'),
+        )
+        self.assertNotEqual(
+            embedding_cache_key('qué es bitcoin', 'm'),
+            embedding_cache_key('qué es bitcoin', 'other-model'),
+        )
+
+    def test_repeated_question_skips_embed_call(self):
+        cache = EmbeddingCache(max_entries=8, ttl=60)
+        client = FakeOpenAIClient()
+        first = cache.embed(client, 'Que es la mineria?')
+        second = cache.embed(client, 'que es la MINERIA')
+        self.assertEqual(first, second)
+        self.assertEqual(client.embed_calls, 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_lru_eviction(self):
+        cache = EmbeddingCache(max_entries=2, ttl=60)
+        client = FakeOpenAIClient()
+        cache.embed(client, 'uno')
+        cache.embed(client, 'dos')
+        cache.embed(client, 'uno')  # refresh "uno"
+        cache.embed(client, 'tres')  # evicts "dos"
+        self.assertIsNotNone(cache.get('uno'))
+        self.assertIsNone(cache.get('dos'))
+        self.assertEqual(cache.stats()['size'], 2)
+
+    def test_ttl_expiry(self):
+        cache = EmbeddingCache(max_entries=2, ttl=10)
+        with patch('utils.embedding_cache.time.monotonic', return_value=100.0):
+            cache.set('hola', [1.0])
+        with patch('utils.embedding_cache.time.monotonic', return_value=109.0):
+            self.assertEqual(cache.get('hola'), [1.0])
+        with patch('utils.embedding_cache.time.monotonic', return_value=111.0):
+            self.assertIsNone(cache.get('hola'))
+
+    def test_disabled_when_size_zero(self):
+        cache = EmbeddingCache(max_entries=0, ttl=60)
+        client = FakeOpenAIClient()
+        cache.embed(client, 'hola')
+        cache.embed(client, 'hola')
+        self.assertEqual(client.embed_calls, 2)
+
+    @override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'emb-default'},
+        'shared': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'emb-shared'},
+    })
+    def test_shared_backend_serves_other_processes(self):
+        caches['shared'].clear()
+        writer = EmbeddingCache(max_entries=4, ttl=60, shared_alias='shared')
+        writer.set('hola', [0.5, 0.5])
+        reader = EmbeddingCache(max_entries=4, ttl=60, shared_alias='shared')
+        client = FakeOpenAIClient()
+        self.assertEqual(reader.embed(client, 'Hola'), [0.5, 0.5])
+        self.assertEqual(client.embed_calls, 0)
+        self.assertEqual(reader.shared_hits, 1)
@@ -0,0 +1,28 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from utils.http_compression import accepted_encodings, negotiate_encoding
+
+
+class NegotiateEncodingTests(SimpleTestCase):
+    def test_parses_quality_values(self):
+        self.assertEqual(
+            accepted_encodings('gzip;q=0.5, br, identity;q=0'),
+            {'gzip': 0.5, 'br': 1.0, 'identity': 0.0},
+        )
+
+    def test_prefers_brotli_when_installed(self):
+        with patch('utils.http_compression._brotli', return_value=object()):
+            self.assertEqual(negotiate_encoding('gzip, deflate, br'), 'br')
+            self.assertEqual(negotiate_encoding('gzip, br;q=0.1'), 'gzip')
+
+    def test_falls_back_to_gzip_without_brotli(self):
+        with patch('utils.http_compression._brotli', return_value=None):
+            self.assertEqual(negotiate_encoding('br, gzip'), 'gzip')
+            self.assertIsNone(negotiate_encoding('br'))
+            self.assertEqual(negotiate_encoding('*'), 'gzip')
+
+    def test_refused_or_missing_codings(self):
+        self.assertIsNone(negotiate_encoding(''))
+        self.assertIsNone(negotiate_encoding('gzip;q=0, br;q=0'))
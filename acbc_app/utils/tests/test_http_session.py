@@ -0,0 +1,153 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from utils.http_session import (
+    CircuitBreaker,
+    UpstreamCircuitOpen,
+    UpstreamSession,
+    get_http_session,
+    http_metrics_snapshot,
+    reset_http_sessions,
+)
+from utils.qdrant_client import QdrantClient, QdrantClientError
+
+
+class _Upstream(BaseHTTPRequestHandler):
+    statuses = []
+    hits = 0
+
+    def do_POST(self):
+        type(self).hits += 1
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        status = self.statuses.pop(0) if self.statuses else 200
+        body = b'{"result": []}'
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class UpstreamSessionTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _Upstream)
+        cls.url = f'http://127.0.0.1:{cls.server.server_port}'
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        _Upstream.statuses = []
+        _Upstream.hits = 0
+
+    def session(self, **kwargs):
+        kwargs.setdefault('backoff', 0)
+        session = UpstreamSession('test', **kwargs)
+        self.addCleanup(session.close)
+        return session
+
+    def test_retries_5xx_and_429_then_succeeds(self):
+        _Upstream.statuses = [503, 429]
+        response = self.session(retries=3, replay_posts=True).post(f'{self.url}/points/search', json={})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(_Upstream.hits, 3)
+
+    def test_post_is_not_replayed_after_5xx_but_is_after_429(self):
+        _Upstream.statuses = [502]
+        response = self.session(retries=3).post(f'{self.url}/chat/completions', json={})
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(_Upstream.hits, 1)
+
+        _Upstream.hits = 0
+        _Upstream.statuses = [429, 429]
+        response = self.session(retries=3).post(f'{self.url}/chat/completions', json={})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(_Upstream.hits, 3)
+
+    def test_rate_limiting_does_not_open_the_circuit(self):
+        session = self.session(retries=0, breaker=CircuitBreaker(failure_threshold=2, reset_after=60))
+        _Upstream.statuses = [429, 429, 429]
+        for _ in range(3):
+            self.assertEqual(session.post(f'{self.url}/embeddings', json={}).status_code, 429)
+        self.assertEqual(session.breaker.state, 'closed')
+        self.assertEqual(session.breaker.failures, 0)
+
+    def test_retries_are_bounded_and_last_response_returned(self):
+        _Upstream.statuses = [500, 500, 500, 500]
+        response = self.session(retries=2, replay_posts=True).post(f'{self.url}/points/search', json={})
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(_Upstream.hits, 3)
+
+    def test_circuit_opens_after_consecutive_failures_and_half_opens(self):
+        session = self.session(retries=0, breaker=CircuitBreaker(failure_threshold=2, reset_after=60))
+        _Upstream.statuses = [502, 502]
+        session.post(f'{self.url}/embeddings', json={})
+        session.post(f'{self.url}/embeddings', json={})
+        with self.assertRaises(UpstreamCircuitOpen):
+            session.post(f'{self.url}/embeddings', json={})
+        self.assertEqual(_Upstream.hits, 2)
+
+        session.breaker.reset_after = 0
+        self.assertEqual(session.post(f'{self.url}/embeddings', json={}).status_code, 200)
+        self.assertEqual(session.breaker.state, 'closed')
+
+    def test_counts_requests_errors_and_latency_per_endpoint(self):
+        session = self.session(retries=0)
+        _Upstream.statuses = [200, 404]
+        session.post(f'{self.url}/embeddings', json={})
+        session.post(f'{self.url}/embeddings', json={})
+        session.post(f'{self.url}/chat/completions', json={})
+        endpoints = session.snapshot()['endpoints']
+        self.assertEqual(endpoints['POST /embeddings']['requests'], 2)
+        self.assertEqual(endpoints['POST /embeddings']['errors'], 1)
+        self.assertEqual(endpoints['POST /embeddings']['statuses'], {200: 1, 404: 1})
+        self.assertEqual(endpoints['POST /chat/completions']['requests'], 1)
+        self.assertGreater(endpoints['POST /chat/completions']['max_ms'], 0)
+
+    def test_client_wraps_open_circuit_as_client_error(self):
+        session = self.session(retries=0, breaker=CircuitBreaker(failure_threshold=1, reset_after=60))
+        client = QdrantClient(url=self.url, api_key='key', collection='c', session=session)
+        _Upstream.statuses = [500]
+        with self.assertRaises(QdrantClientError):
+            client.search([0.1], topic_id=1)
+        with self.assertRaises(QdrantClientError) as ctx:
+            client.search([0.1], topic_id=1)
+        self.assertIn('circuito abierto', str(ctx.exception))
+
+
+class SharedSessionTests(TestCase):
+    def setUp(self):
+        reset_http_sessions()
+        self.addCleanup(reset_http_sessions)
+
+    @override_settings(OPENAI_API_KEY='test', QDRANT_URL='https://q.example', QDRANT_API_KEY='k')
+    def test_clients_share_one_session_per_upstream(self):
+        from utils.openai_client import OpenAIClient
+
+        self.assertIs(OpenAIClient().session, OpenAIClient().session)
+        self.assertIs(QdrantClient().session, get_http_session('qdrant'))
+        self.assertIsNot(OpenAIClient().session, QdrantClient().session)
+        self.assertEqual(sorted(http_metrics_snapshot()), ['openai', 'qdrant'])
+
+    def test_metrics_endpoint_is_staff_only(self):
+        get_http_session('openai')
+        client = APIClient()
+        client.force_authenticate(User.objects.create_user('viewer', password='x'))
+        self.assertEqual(client.get('/health/upstreams/').status_code, 403)
+        client.force_authenticate(User.objects.create_user('ops', password='x', is_staff=True))
+        response = client.get('/health/upstreams/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['openai']['circuit'], 'closed')
@@ -0,0 +1,87 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from notifications.models import Notification
+
+from content.models import Topic
+from profiles.models import NotificationKey
+from utils.notification_batch import NotificationEvent, send_notifications
+from utils.notification_cache import get_cached_unread_count, set_cached_unread_count
+
+
+class SendNotificationsTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner', password='x')
+        self.actors = [User.objects.create_user(username=f'actor{i}', password='x') for i in range(3)]
+        self.topic = Topic.objects.create(title='Bitcoin', creator=self.owner)
+
+    def _event(self, actor, recipient=None, **kwargs):
+        return NotificationEvent(
+            recipient_id=(recipient or self.owner).id,
+            actor=actor,
+            verb='votó positivamente tu tema',
+            target=self.topic,
+            description=f'{actor.username} votó positivamente tu tema',
+            **kwargs,
+        )
+
+    def _digest(self, actor):
+        return self._event(actor, digest=lambda latest, count: f'{latest.username} y otros {count - 1}')
+
+    def test_duplicate_key_creates_one_notification(self):
+        actor = self.actors[0]
+        self.assertEqual(send_notifications([self._event(actor), self._event(actor)]), 1)
+        self.assertEqual(send_notifications([self._event(actor)]), 0)
+        notification = Notification.objects.get(recipient=self.owner)
+        self.assertEqual(int(notification.actor_object_id), actor.id)
+        self.assertEqual(notification.description, 'actor0 votó positivamente tu tema')
+
+    def test_fan_out_is_constant_queries_and_invalidates_counts(self):
+        recipients = [User.objects.create_user(username=f'mod{i}', password='x') for i in range(12)]
+        for recipient in recipients:
+            set_cached_unread_count(recipient.id, 0)
+
+        with CaptureQueriesContext(connection) as small:
+            send_notifications([self._event(self.actors[0], recipient) for recipient in recipients[:2]])
+        with CaptureQueriesContext(connection) as large:
+            send_notifications([self._event(self.actors[1], recipient) for recipient in recipients[2:]])
+
+        self.assertEqual(len(small), len(large))
+        self.assertEqual(Notification.objects.filter(recipient__in=recipients).count(), 12)
+        self.assertIsNone(get_cached_unread_count(recipients[-1].id))
+
+    def test_digest_folds_actors_into_unread_notification(self):
+        send_notifications([self._digest(self.actors[0])])
+        send_notifications([self._digest(self.actors[1]), self._digest(self.actors[2])])
+        send_notifications([self._digest(self.actors[1])])  # already counted
+
+        notification = Notification.objects.get(recipient=self.owner)
+        self.assertEqual(notification.description, 'actor2 y otros 2')
+        self.assertEqual(notification.data['count'], 3)
+        self.assertEqual(int(notification.actor_object_id), self.actors[2].id)
+
+    def test_digest_starts_new_notification_after_read(self):
+        send_notifications([self._digest(self.actors[0])])
+        Notification.objects.filter(recipient=self.owner).update(unread=False)
+
+        send_notifications([self._digest(self.actors[0])])
+        self.assertEqual(Notification.objects.filter(recipient=self.owner).count(), 1)
+
+        send_notifications([self._digest(self.actors[1])])
+        latest = Notification.objects.filter(recipient=self.owner, unread=True).get()
+        self.assertEqual(latest.description, 'actor1 votó positivamente tu tema')
+
+    def test_digest_never_renotifies_actor_counted_before_a_read(self):
+        send_notifications([self._digest(self.actors[0])])
+        Notification.objects.filter(recipient=self.owner).update(unread=False)
+        send_notifications([self._digest(self.actors[1])])
+        Notification.objects.filter(recipient=self.owner).update(unread=False)
+
+        self.assertEqual(send_notifications([self._digest(self.actors[0])]), 0)
+        self.assertFalse(Notification.objects.filter(recipient=self.owner, unread=True).exists())
+
+        send_notifications([self._digest(self.actors[2])])
+        latest = Notification.objects.filter(recipient=self.owner, unread=True).get()
+        self.assertEqual(latest.data['count'], 1)
+        self.assertEqual(NotificationKey.objects.get(recipient=self.owner).actor_ids, [a.id for a in self.actors])
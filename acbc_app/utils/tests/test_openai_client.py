@@ -0,0 +1,55 @@
+from django.test import SimpleTestCase
+
+from utils.openai_client import OpenAIClient, OpenAIClientError
+
+
+class _StreamResponse:
+    def __init__(self, lines, status_code=200):
+        self.lines = lines
+        self.status_code = status_code
+        self.text = ''
+        self.closed = False
+
+    def json(self):
+        return {'error': 'boom'}
+
+    def iter_lines(self, decode_unicode=False):
+        return iter(self.lines)
+
+    def close(self):
+        self.closed = True
+
+
+class _Session:
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.response
+
+
+class OpenAIClientStreamTests(SimpleTestCase):
+    def test_chat_stream_yields_deltas_until_done(self):
+        response = _StreamResponse([
+            'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+            '',
+            'data: {"choices": [{"delta": {"content": "Hola"}}]}',
+            ': keep-alive',
+            'data: {"choices": [{"delta": {"content": " mundo"}}]}',
+            'data: [DONE]',
+            'data: {"choices": [{"delta": {"content": "ignorado"}}]}',
+        ])
+        session = _Session(response)
+        client = OpenAIClient(api_key='test', session=session)
+        self.assertEqual(list(client.chat_stream([{'role': 'user', 'content': 'hola'}])), ['Hola', ' mundo'])
+        self.assertTrue(session.calls[0][2]['stream'])
+        self.assertTrue(session.calls[0][2]['json']['stream'])
+        self.assertTrue(response.closed)
+
+    def test_chat_stream_raises_on_http_error(self):
+        client = OpenAIClient(api_key='test', session=_Session(_StreamResponse([], status_code=429)))
+        with self.assertRaises(OpenAIClientError) as ctx:
+            list(client.chat_stream([{'role': 'user', 'content': 'hola'}]))
+        self.assertEqual(ctx.exception.status_code, 429)
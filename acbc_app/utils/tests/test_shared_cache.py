@@ -0,0 +1,53 @@
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from utils.shared_cache import SharedCache
+
+LOCMEM = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'shared-cache-tests'},
+}
+
+
+@override_settings(CACHES=LOCMEM)
+class SharedCacheTests(SimpleTestCase):
+    def setUp(self):
+        caches['default'].clear()
+        self.calls = 0
+
+    def compute(self):
+        self.calls += 1
+        return {'n': self.calls}
+
+    def test_l1_then_l2_hits(self):
+        worker_a = SharedCache()
+        worker_b = SharedCache()
+        self.assertEqual(worker_a.get_or_set('k', self.compute, tags=['topics']), {'n': 1})
+        self.assertEqual(worker_a.get_or_set('k', self.compute, tags=['topics']), {'n': 1})
+        self.assertEqual(worker_b.get_or_set('k', self.compute, tags=['topics']), {'n': 1})
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(worker_a.stats()['l1_hits'], 1)
+        self.assertEqual(worker_b.stats()['l2_hits'], 1)
+
+    def test_invalidation_in_one_worker_is_seen_by_the_others(self):
+        worker_a = SharedCache()
+        worker_b = SharedCache()
+        worker_a.get_or_set('k', self.compute, tags=['topics', 'topic:1'])
+        worker_b.get_or_set('k', self.compute, tags=['topics', 'topic:1'])
+        worker_b.invalidate('topic:1')
+        # worker_a still holds the old value in L1, but under the old tag version.
+        self.assertEqual(worker_a.get_or_set('k', self.compute, tags=['topics', 'topic:1']), {'n': 2})
+        self.assertEqual(worker_a.get_or_set('other', self.compute, tags=['topics']), {'n': 3})
+        worker_a.invalidate('topic:2')
+        self.assertEqual(worker_a.get_or_set('other', self.compute, tags=['topics']), {'n': 3})
+
+    def test_evicted_tag_version_does_not_revive_old_entries(self):
+        cache = SharedCache(l1_max_entries=0)
+        cache.get_or_set('k', self.compute, tags=['topics'])
+        caches['default'].delete('cachetag:topics')
+        self.assertEqual(cache.get_or_set('k', self.compute, tags=['topics']), {'n': 2})
+
+    def test_l1_is_bounded(self):
+        cache = SharedCache(l1_max_entries=2)
+        for key in 'abc':
+            cache.get_or_set(key, self.compute)
+        self.assertEqual(cache.stats()['l1_entries'], 2)
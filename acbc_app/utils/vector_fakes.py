@@ -0,0 +1,182 @@
+"""In-process stand-ins for OpenAIClient and QdrantClient (tests / offline development).
+
+FakeOpenAIClient embeds text as a hashed bag of words, so texts sharing words get
+similar vectors. FakeQdrantClient keeps points in memory and ranks them by cosine
+similarity. Both expose the subset of the real clients' API used by the app.
+Enable them for local runs with VECTOR_CLIENTS_FAKE=1.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+import re
+import unicodedata
+from typing import Any, Iterable, Optional
+
+from django.conf import settings
+
+FAKE_VECTOR_SIZE = 256
+_WORD = re.compile(r'\w+', re.UNICODE)
+
+
+def fake_vector_clients_enabled() -> bool:
+    return bool(getattr(settings, 'VECTOR_CLIENTS_FAKE', False))
+
+
+def _words(text: str) -> list[str]:
+    folded = unicodedata.normalize('NFKD', (text or '').lower())
+    folded = ''.join(ch for ch in folded if not unicodedata.combining(ch))
+    return [word for word in _WORD.findall(folded) if len(word) > 2]
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class FakeOpenAIClient:
+    """Deterministic embeddings and canned chat answers; counts calls."""
+
+    def __init__(self, *, dims: int = FAKE_VECTOR_SIZE, answer: str = 'Respuesta de prueba [1].'):
+        self.dims = dims
+        self.answer = answer
+        self.embed_calls = 0
+        self.chat_calls = 0
+
+    def embed(self, text: str, *, model: Optional[str] = None) -> list[float]:
+        self.embed_calls += 1
+        vector = [0.0] * self.dims
+        for word in _words(text):
+            bucket = int(hashlib.md5(word.encode('utf-8')).hexdigest(), 16) % self.dims
+            vector[bucket] += 1.0
+        return vector
+
+    def chat(self, messages: list[dict[str, str]], **kwargs) -> str:
+        self.chat_calls += 1
+        return self.answer
+
+    def chat_stream(self, messages: list[dict[str, str]], **kwargs):
+        """Yield the canned answer word by word, like OpenAI streamed deltas."""
+        self.chat_calls += 1
+        words = self.answer.split(' ')
+        for index, word in enumerate(words):
+            yield word if index == len(words) - 1 else f'{word} '
+
+
+class FakeQdrantClient:
+    """In-memory collection with the same search()/count_topic() shape as QdrantClient."""
+
+    def __init__(self, points: Optional[Iterable[dict[str, Any]]] = None, *, collection: str = 'fake'):
+        self.collection = collection
+        self.points: list[dict[str, Any]] = list(points or [])
+        self.search_calls: list[dict[str, Any]] = []
+
+    def upsert(self, vector: list[float], payload: dict[str, Any]) -> None:
+        self.points.append({'id': len(self.points) + 1, 'vector': vector, 'payload': dict(payload)})
+
+    def add_text(self, embedder: FakeOpenAIClient, text: str, **payload) -> None:
+        self.upsert(embedder.embed(text), {'text': text, **payload})
+
+    @classmethod
+    def from_transcripts(cls, transcripts, embedder: FakeOpenAIClient, *, chunk_words: int = 80):
+        """Index transcripts (ContentTranscript rows) the way the embed worker does: one point per chunk and topic."""
+        client = cls()
+        for transcript in transcripts:
+            words = (transcript.processed_plain or transcript.parsed_plain or '').split()
+            topic_ids = list(transcript.content.topics.values_list('id', flat=True)) or [None]
+            for chunk_index, start in enumerate(range(0, len(words), chunk_words)):
+                text = ' '.join(words[start:start + chunk_words])
+                for topic_id in topic_ids:
+                    client.add_text(
+                        embedder,
+                        text,
+                        topic_id=topic_id,
+                        content_id=transcript.content_id,
+                        chunk_index=chunk_index,
+                    )
+        embedder.embed_calls = 0
+        return client
+
+    def health(self) -> dict[str, Any]:
+        return {'ok': True, 'url': 'memory://', 'collection': self.collection,
+                'collection_exists': True, 'collections': [self.collection]}
+
+    def collection_exists(self) -> bool:
+        return True
+
+    def ensure_collection(self, **kwargs) -> bool:
+        return False
+
+    def _matches(self, point: dict[str, Any], topic_id: Optional[int]) -> bool:
+        return topic_id is None or point['payload'].get('topic_id') == int(topic_id)
+
+    def count_topic(self, topic_id: int) -> int:
+        return sum(1 for point in self.points if self._matches(point, topic_id))
+
+    def search(
+        self,
+        vector: list[float],
+        *,
+        topic_id: Optional[int] = None,
+        limit: int = 8,
+        with_payload: bool = True,
+        with_vector: bool = False,
+    ) -> list[dict[str, Any]]:
+        self.search_calls.append({'topic_id': topic_id, 'limit': limit})
+        scored = [
+            {'id': point['id'], 'score': _cosine(vector, point['vector']),
+             'payload': dict(point['payload']) if with_payload else None}
+            for point in self.points
+            if self._matches(point, topic_id)
+        ]
+        scored = [hit for hit in scored if hit['score'] > 0]
+        if with_vector:
+            vectors = {point['id']: point['vector'] for point in self.points}
+            for hit in scored:
+                hit['vector'] = list(vectors[hit['id']])
+        scored.sort(key=lambda hit: hit['score'], reverse=True)
+        return scored[: max(1, min(int(limit), 64))]
+
+
+class AsyncFakeOpenAIClient:
+    """Awaitable wrapper over FakeOpenAIClient; delay (seconds) simulates network latency."""
+
+    def __init__(self, fake: Optional[FakeOpenAIClient] = None, *, delay: float = 0.0,
+                 chat_answers: Optional[list[str]] = None):
+        self.fake = fake or FakeOpenAIClient()
+        self.delay = delay
+        self.chat_answers = list(chat_answers or [])
+        self.chat_messages: list[list[dict[str, str]]] = []
+
+    async def embed(self, text: str, *, model: Optional[str] = None) -> list[float]:
+        await asyncio.sleep(self.delay)
+        return self.fake.embed(text, model=model)
+
+    async def chat(self, messages: list[dict[str, str]], **kwargs) -> str:
+        await asyncio.sleep(self.delay)
+        self.chat_messages.append(messages)
+        if self.chat_answers:
+            self.fake.chat_calls += 1
+            return self.chat_answers.pop(0)
+        return self.fake.chat(messages, **kwargs)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class AsyncFakeQdrantClient:
+    """Awaitable wrapper over FakeQdrantClient."""
+
+    def __init__(self, fake: FakeQdrantClient, *, delay: float = 0.0):
+        self.fake = fake
+        self.delay = delay
+
+    async def search(self, vector: list[float], **kwargs) -> list[dict[str, Any]]:
+        await asyncio.sleep(self.delay)
+        return self.fake.search(vector, **kwargs)
+
+    async def aclose(self) -> None:
+        pass
@@ -0,0 +1,12 @@
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from utils.http_session import http_metrics_snapshot
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def upstream_metrics(request):
+    """Circuit state and per-endpoint latency/error counters of this worker's upstream sessions."""
+    return Response(http_metrics_snapshot())
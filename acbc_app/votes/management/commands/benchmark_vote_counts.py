@@ -0,0 +1,80 @@
+import time
+
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from content.models import Content
+from votes.models import Vote, VoteCount
+from votes.services import apply_vote_count_delta
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        'Time one vote-count update (incremental delta vs full recount) on an object '
+        'with growing numbers of votes. Everything runs in a transaction that is rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--votes',
+            type=int,
+            default=100_000,
+            help='Largest number of votes on the benchmark object (default: 100000).',
+        )
+        parser.add_argument(
+            '--samples',
+            type=int,
+            default=50,
+            help='Timed updates per size (default: 50).',
+        )
+
+    def _time_ms(self, func, samples):
+        started = time.perf_counter()
+        for _ in range(samples):
+            func()
+        return (time.perf_counter() - started) * 1000 / samples
+
+    def handle(self, *args, **options):
+        largest = max(1, options['votes'])
+        samples = max(1, options['samples'])
+        sizes = sorted({size for size in (1_000, 10_000, largest) if size <= largest})
+
+        try:
+            with transaction.atomic():
+                self._run(sizes, samples)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _run(self, sizes, samples):
+        owner = User.objects.create(username='vote-benchmark-owner')
+        content = Content.objects.create(uploaded_by=owner, media_type='TEXT', original_title='Vote benchmark')
+        content_type = ContentType.objects.get_for_model(Content)
+        vote_count = VoteCount.objects.create(content_type=content_type, object_id=content.id, vote_count=0)
+
+        self.stdout.write(f'{"votes":>10} {"delta ms":>10} {"recount ms":>11}')
+        created = 0
+        for size in sizes:
+            users = User.objects.bulk_create(
+                [User(username=f'vote-benchmark-{i}', password='!') for i in range(created, size)],
+                batch_size=5_000,
+            )
+            Vote.objects.bulk_create(
+                [Vote(user=user, content_type=content_type, object_id=content.id, value=1) for user in users],
+                batch_size=5_000,
+            )
+            created = size
+
+            def delta():
+                apply_vote_count_delta(content_type, content.id, None, 1)
+                apply_vote_count_delta(content_type, content.id, None, -1)
+
+            delta_ms = self._time_ms(delta, samples) / 2
+            recount_ms = self._time_ms(vote_count.update_vote_count, samples)
+            self.stdout.write(f'{size:>10} {delta_ms:>10.3f} {recount_ms:>11.3f}')
@@ -0,0 +1,51 @@
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+
+from content.response_cache import TOPICS_TAG
+from knowledge_paths.models import KnowledgePath
+from knowledge_paths.response_cache import KNOWLEDGE_PATHS_TAG
+from knowledge_paths.signals import sync_knowledge_path_vote_scores
+from utils.shared_cache import invalidate_tags
+from votes.services import reconcile_vote_counts
+
+
+class Command(BaseCommand):
+    help = (
+        'Repair VoteCount drift: recompute every total from Vote rows with one GROUP BY '
+        'query and bulk-update the rows that differ.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            default=None,
+            help='Limit to one voteable model as app_label.model (e.g. content.content).',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report drift without writing.',
+        )
+
+    def handle(self, *args, **options):
+        content_type = None
+        if options['model']:
+            try:
+                app_label, model = options['model'].lower().split('.')
+                content_type = ContentType.objects.get(app_label=app_label, model=model)
+            except (ValueError, ContentType.DoesNotExist):
+                raise CommandError(f"Unknown model {options['model']!r}; use app_label.model.")
+
+        dry_run = options['dry_run']
+        checked, fixed, created = reconcile_vote_counts(content_type=content_type, dry_run=dry_run)
+        if not dry_run and (content_type is None or content_type.model_class() is KnowledgePath):
+            # bulk_update skips the signal that copies totals to KnowledgePath.vote_score.
+            sync_knowledge_path_vote_scores()
+        if (fixed or created) and not dry_run:
+            # bulk_update skips post_save; drop cached listings that show vote counts.
+            invalidate_tags(TOPICS_TAG, KNOWLEDGE_PATHS_TAG)
+
+        prefix = 'DRY RUN - ' if dry_run else ''
+        self.stdout.write(self.style.SUCCESS(
+            f'{prefix}Checked {checked} VoteCount row(s): {fixed} drifted, {created} missing.'
+        ))
@@ -154,66 +154,31 @@ class VoteCount(models.Model):
         return f"{self.vote_count} votes for {self.content_object}{topic_str}"
 
     def update_vote_count(self, obj=None):
-        """Update vote count for the object, considering topic if specified"""
-        logger.debug("Updating vote count", extra={
-            'content_type': self.content_type.model,
-            'object_id': self.object_id,
-            'topic_id': self.topic.id if self.topic else None,
-        })
-        
-        if obj is None:
-            obj = self.content_object
-            logger.debug("Using content object", extra={'object_id': obj.id})
+        """
+        Recompute vote_count from the Vote rows with one SUM query.
 
-        # Calculate total votes using Vote model
+        Votes apply O(1) deltas (votes.services.apply_vote_count_delta); this full
+        recount is for new rows and repairs (manage.py reconcile_vote_counts).
+        """
         vote_query = Vote.objects.filter(
-            content_type=self.content_type,
+            content_type_id=self.content_type_id,
             object_id=self.object_id,
         )
-        
-        # If this is a topic-specific vote count, filter by topic
-        if self.topic:
-            vote_query = vote_query.filter(topic=self.topic)
-            logger.debug("Filtering votes for topic", extra={'topic_id': self.topic.id})
+        if self.topic_id:
+            vote_query = vote_query.filter(topic_id=self.topic_id)
         else:
             # For non-topic-specific votes, only count votes that are also non-topic-specific
             vote_query = vote_query.filter(topic__isnull=True)
-            logger.debug("Filtering for non-topic-specific votes")
 
-        # Get all votes with user information
-        votes = vote_query.select_related('user').values('user__username', 'value')
-        
-        # Log detailed vote information at debug level
-        for vote in votes:
-            vote_type = "upvote" if vote['value'] > 0 else "downvote" if vote['value'] < 0 else "no vote"
-            logger.debug("Vote details", extra={
-                'user': vote['user__username'],
-                'vote_value': vote['value'],
-                'vote_type': vote_type,
-            })
-        
-        # Get just the values for sum calculation
-        vote_values = [vote['value'] for vote in votes]
-        logger.debug("Vote count calculation", extra={
-            'vote_count': len(vote_values),
-            'vote_values': vote_values,
-        })
-        
-        # Calculate the sum
-        vote_sum = sum(vote_values)
-        logger.debug("Calculated vote sum", extra={'vote_sum': vote_sum})
-
-        # Update the vote count
         old_count = self.vote_count
-        self.vote_count = vote_sum
+        self.vote_count = vote_query.aggregate(total=Sum('value'))['total'] or 0
         self.save()
-        logger.info("Vote count updated", extra={
+        logger.debug("Vote count recomputed", extra={
             'old_count': old_count,
             'new_count': self.vote_count,
-            'content_type': self.content_type.model,
+            'content_type_id': self.content_type_id,
             'object_id': self.object_id,
         })
-        
         return self.vote_count
 
     @classmethod
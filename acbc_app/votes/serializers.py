@@ -0,0 +1,43 @@
+from django.db import models
+from rest_framework import serializers
+
+from votes.services import VoteContext
+
+
+class VoteContextListSerializer(serializers.ListSerializer):
+    """
+    List serializer that batch-loads votes for the whole page before rendering.
+
+    The child serializer (see VoteContextMixin) decides which objects to load;
+    the shared VoteContext lives in the root serializer context so nested
+    serializers read from it too.
+    """
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        self.child.prefetch_votes(items)
+        return super().to_representation(items)
+
+
+class VoteContextMixin:
+    """Read vote_count/user_vote from the request-wide VoteContext when loaded."""
+
+    def get_vote_context(self):
+        vote_context = self.context.get('vote_context')
+        if vote_context is None:
+            request = self.context.get('request')
+            vote_context = VoteContext(getattr(request, 'user', None))
+            self.context['vote_context'] = vote_context
+        return vote_context
+
+    def prefetch_votes(self, instances):
+        """Override to load the votes this serializer (and nested ones) will read."""
+        self.get_vote_context().load_objects(instances)
+
+    def cached_vote_count(self, obj, topic=None):
+        vote_context = self.context.get('vote_context')
+        return vote_context.vote_count(obj, topic) if vote_context is not None else None
+
+    def cached_user_vote(self, obj, topic=None):
+        vote_context = self.context.get('vote_context')
+        return vote_context.user_vote(obj, topic) if vote_context is not None else None
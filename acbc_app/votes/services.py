@@ -0,0 +1,174 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import router
+from django.db.models import F, Sum
+from django.db.models.signals import post_save
+
+from votes.models import Vote, VoteCount
+
+
+def _topic_id(topic):
+    if topic is None:
+        return None
+    return getattr(topic, 'pk', topic)
+
+
+class VoteContext:
+    """
+    Vote counts and the requesting user's votes for a page of objects.
+
+    Serializers read from this instead of calling get_vote_count()/get_user_vote()
+    per row. Each load() runs at most two queries (VoteCount + the user's Vote rows)
+    for every object of one model in one topic scope. Lookups for objects that were
+    never loaded return None so callers can fall back to the per-object query.
+    """
+
+    def __init__(self, user=None):
+        self.user = user if user is not None and user.is_authenticated else None
+        self._loaded = set()
+        self._counts = {}
+        self._user_votes = {}
+
+    @staticmethod
+    def _key(content_type_id, topic_id, object_id):
+        return (content_type_id, topic_id, object_id)
+
+    def load(self, model, object_ids, topic=None):
+        """Batch-load votes for object_ids of model (topic=None means topic-less votes)."""
+        content_type = ContentType.objects.get_for_model(model)
+        topic_id = _topic_id(topic)
+        pending = {
+            object_id for object_id in object_ids
+            if object_id is not None
+            and self._key(content_type.id, topic_id, object_id) not in self._loaded
+        }
+        if not pending:
+            return self
+
+        scope = {'topic_id': topic_id} if topic_id is not None else {'topic__isnull': True}
+
+        # Lowest pk wins, matching the .first() lookups on the models.
+        counts = (
+            VoteCount.objects.filter(content_type=content_type, object_id__in=pending, **scope)
+            .order_by('-pk')
+            .values_list('object_id', 'vote_count')
+        )
+        for object_id, vote_count in counts:
+            self._counts[self._key(content_type.id, topic_id, object_id)] = vote_count
+
+        if self.user is not None:
+            votes = (
+                Vote.objects.filter(
+                    user=self.user,
+                    content_type=content_type,
+                    object_id__in=pending,
+                    **scope,
+                )
+                .order_by('-pk')
+                .values_list('object_id', 'value')
+            )
+            for object_id, value in votes:
+                self._user_votes[self._key(content_type.id, topic_id, object_id)] = value
+
+        for object_id in pending:
+            self._loaded.add(self._key(content_type.id, topic_id, object_id))
+        return self
+
+    def load_objects(self, objects, topic=None):
+        """load() for a homogeneous list of model instances."""
+        objects = [obj for obj in objects if obj is not None]
+        if objects:
+            self.load(type(objects[0]), [obj.pk for obj in objects], topic=topic)
+        return self
+
+    def _lookup(self, store, obj, topic):
+        content_type = ContentType.objects.get_for_model(obj)
+        key = self._key(content_type.id, _topic_id(topic), obj.pk)
+        if key not in self._loaded:
+            return None
+        return store.get(key, 0)
+
+    def vote_count(self, obj, topic=None):
+        """Loaded vote count for obj, or None when obj was not part of a load()."""
+        return self._lookup(self._counts, obj, topic)
+
+    def user_vote(self, obj, topic=None):
+        """Loaded vote value of the user for obj (0 if none), or None when not loaded."""
+        if self.user is None:
+            return 0
+        return self._lookup(self._user_votes, obj, topic)
+
+
+def apply_vote_count_delta(content_type, object_id, topic=None, delta=0):
+    """
+    Add delta (new vote value - old value) to the VoteCount of one object in one topic
+    scope with a single UPDATE ... SET vote_count = vote_count + delta, and return the
+    row with its new count.
+
+    Cost does not depend on how many votes the object has, and concurrent votes cannot
+    overwrite each other. Call it inside the transaction that changes the Vote row.
+    post_save is sent for the row so badge checks and response caches still see it.
+    """
+    vote_count, _ = VoteCount.objects.get_or_create(
+        content_type=content_type,
+        object_id=object_id,
+        topic=topic,
+        defaults={'vote_count': 0},
+    )
+    if not delta:
+        return vote_count
+    VoteCount.objects.filter(pk=vote_count.pk).update(vote_count=F('vote_count') + delta)
+    vote_count.refresh_from_db(fields=['vote_count'])
+    post_save.send(
+        sender=VoteCount,
+        instance=vote_count,
+        created=False,
+        update_fields=frozenset({'vote_count'}),
+        raw=False,
+        using=router.db_for_write(VoteCount, instance=vote_count),
+    )
+    return vote_count
+
+
+def reconcile_vote_counts(content_type=None, dry_run=False):
+    """
+    Repair VoteCount drift against the Vote rows in bulk.
+
+    One GROUP BY over Vote gives the expected total per (content_type, object_id, topic);
+    rows that differ are rewritten with bulk_update and missing non-zero totals are
+    created. Returns (checked, fixed, created).
+    """
+    votes = Vote.objects.all()
+    counts = VoteCount.objects.all()
+    if content_type is not None:
+        votes = votes.filter(content_type=content_type)
+        counts = counts.filter(content_type=content_type)
+
+    expected = {
+        (row['content_type_id'], row['object_id'], row['topic_id']): row['total'] or 0
+        for row in votes.values('content_type_id', 'object_id', 'topic_id')
+        .annotate(total=Sum('value'))
+        .order_by()
+    }
+
+    checked = 0
+    drifted = []
+    seen = set()
+    for vote_count in counts.only('id', 'content_type_id', 'object_id', 'topic_id', 'vote_count').iterator():
+        checked += 1
+        key = (vote_count.content_type_id, vote_count.object_id, vote_count.topic_id)
+        seen.add(key)
+        total = expected.get(key, 0)
+        if vote_count.vote_count != total:
+            vote_count.vote_count = total
+            drifted.append(vote_count)
+
+    missing = [
+        VoteCount(content_type_id=ct_id, object_id=object_id, topic_id=topic_id, vote_count=total)
+        for (ct_id, object_id, topic_id), total in expected.items()
+        if total and (ct_id, object_id, topic_id) not in seen
+    ]
+
+    if not dry_run:
+        VoteCount.objects.bulk_update(drifted, ['vote_count'], batch_size=1000)
+        VoteCount.objects.bulk_create(missing, batch_size=1000)
+    return checked, len(drifted), len(missing)
@@ -7,13 +7,15 @@ from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
 from django.apps import apps
+from django.db import transaction
 import logging
 
 from comments.models import Comment
 from content.models import Topic, Content, Publication, ContentSuggestion
 from knowledge_paths.models import KnowledgePath
 from votes.models import Vote, VoteCount
-from utils.notification_utils import notify_content_upvote, notify_knowledge_path_upvote
+from votes.services import apply_vote_count_delta
+from utils.notification_utils import notify_content_upvote, notify_knowledge_path_upvote, notify_later
 import logging
 
 # Get logger for votes app
@@ -25,7 +27,7 @@ class BaseVoteView(APIView):
     permission_classes = [IsAuthenticated]
     model = None
 
-    def get_vote(self, user, obj, topic=None):
+    def get_vote(self, user, obj, topic=None, for_update=False):
         """Get the user's vote for an object, optionally filtered by topic."""
         # Check if user is authenticated
         if not user.is_authenticated:
@@ -33,7 +35,8 @@ class BaseVoteView(APIView):
             
         content_type = ContentType.objects.get_for_model(obj)
         try:
-            vote_query = Vote.objects.filter(
+            vote_query = Vote.objects.select_for_update() if for_update else Vote.objects
+            vote_query = vote_query.filter(
                 user=user,
                 content_type=content_type,
                 object_id=obj.id
@@ -63,48 +66,17 @@ class BaseVoteView(APIView):
         except VoteCount.DoesNotExist:
             return 0
 
-    def perform_vote_action(self, request, obj, action, topic=None):
-        """Perform a vote action (upvote, downvote, or remove vote)."""
-        logger.info(f"Vote action started: {action} on {type(obj).__name__} {obj.id}", extra={
-            'user_id': request.user.id,
-            'username': request.user.username,
-            'object_type': type(obj).__name__,
-            'object_id': obj.id,
-            'action': action,
-            'topic_id': topic.id if topic else None,
-        })
-        
-        user = request.user
-        
-        # Check if user is authenticated
-        if not user.is_authenticated:
-            logger.warning("Vote attempt by unauthenticated user", extra={
-                'object_type': type(obj).__name__,
-                'object_id': obj.id,
-                'action': action,
-            })
-            raise Exception("User must be authenticated to vote")
-        
-        content_type = ContentType.objects.get_for_model(obj)
-        
-        logger.debug(f"Processing vote: User={user.id}, Content type={content_type}, Object ID={obj.id}")
-        
-        # Get or create vote count with topic consideration
-        vote_count, created = VoteCount.objects.get_or_create(
-            content_type=content_type,
-            object_id=obj.id,
-            topic=topic,
-            defaults={'vote_count': 0}
-        )
-        
-        logger.debug(f"VoteCount - Created: {created}, Current count: {vote_count.vote_count}")
-        
-        # Get existing vote if any, considering topic
-        existing_vote = self.get_vote(user, obj, topic)
+    def _apply_vote_action(self, user, obj, content_type, action, topic=None):
+        """
+        Change the user's Vote row and apply the resulting delta to VoteCount.
+
+        Runs inside the caller's transaction with the Vote row locked, so the delta is
+        computed from the value it actually replaces. Returns (vote_count, created_vote).
+        """
+        existing_vote = self.get_vote(user, obj, topic, for_update=True)
         created_vote = None
-        
-        logger.debug(f"Existing vote: {existing_vote.value if existing_vote else 'None'}")
-        
+        delta = 0
+
         if action == 'upvote':
             logger.debug("Processing upvote...")
             if existing_vote:
@@ -117,7 +89,7 @@ class BaseVoteView(APIView):
                         'vote_id': existing_vote.id,
                     })
                     existing_vote.delete()
-                    vote_count.vote_count -= 1
+                    delta = -1
                 else:
                     # Change downvote to upvote
                     logger.info("Changing downvote to upvote", extra={
@@ -128,9 +100,9 @@ class BaseVoteView(APIView):
                         'old_value': existing_vote.value,
                         'new_value': 1,
                     })
+                    delta = 1 - existing_vote.value
                     existing_vote.value = 1
                     existing_vote.save()
-                    vote_count.vote_count += 2
                     created_vote = existing_vote
             else:
                 # Create new upvote
@@ -146,7 +118,7 @@ class BaseVoteView(APIView):
                     topic=topic,
                     value=1
                 )
-                vote_count.vote_count += 1
+                delta = 1
                 
         elif action == 'downvote':
             logger.debug("Processing downvote...")
@@ -160,7 +132,7 @@ class BaseVoteView(APIView):
                         'vote_id': existing_vote.id,
                     })
                     existing_vote.delete()
-                    vote_count.vote_count += 1
+                    delta = 1
                 else:
                     # Change upvote to downvote
                     logger.info("Changing upvote to downvote", extra={
@@ -171,9 +143,9 @@ class BaseVoteView(APIView):
                         'old_value': existing_vote.value,
                         'new_value': -1,
                     })
+                    delta = -1 - existing_vote.value
                     existing_vote.value = -1
                     existing_vote.save()
-                    vote_count.vote_count -= 2
             else:
                 # Create new downvote
                 logger.info("Creating new downvote", extra={
@@ -188,7 +160,7 @@ class BaseVoteView(APIView):
                     topic=topic,
                     value=-1
                 )
-                vote_count.vote_count -= 1
+                delta = -1
                 
         elif action == 'remove':
             logger.debug("Processing remove vote...")
@@ -200,32 +172,60 @@ class BaseVoteView(APIView):
                     'vote_id': existing_vote.id,
                     'vote_value': existing_vote.value,
                 })
-                vote_count.vote_count -= existing_vote.value
+                delta = -existing_vote.value
                 existing_vote.delete()
         
-        logger.debug(f"Final vote count before save: {vote_count.vote_count}")
-        vote_count.save()
-        logger.debug("VoteCount saved successfully")
+        vote_count = apply_vote_count_delta(content_type, obj.id, topic, delta)
+        return vote_count, created_vote
+
+    def perform_vote_action(self, request, obj, action, topic=None):
+        """Perform a vote action (upvote, downvote, or remove vote)."""
+        logger.info(f"Vote action started: {action} on {type(obj).__name__} {obj.id}", extra={
+            'user_id': request.user.id,
+            'username': request.user.username,
+            'object_type': type(obj).__name__,
+            'object_id': obj.id,
+            'action': action,
+            'topic_id': topic.id if topic else None,
+        })
+        
+        user = request.user
+        
+        # Check if user is authenticated
+        if not user.is_authenticated:
+            logger.warning("Vote attempt by unauthenticated user", extra={
+                'object_type': type(obj).__name__,
+                'object_id': obj.id,
+                'action': action,
+            })
+            raise Exception("User must be authenticated to vote")
+        
+        content_type = ContentType.objects.get_for_model(obj)
+        
+        logger.debug(f"Processing vote: User={user.id}, Content type={content_type}, Object ID={obj.id}")
+        
+        with transaction.atomic():
+            vote_count, created_vote = self._apply_vote_action(user, obj, content_type, action, topic)
         
         # Send notification for upvotes
         if created_vote and action == 'upvote':
             try:
                 # Check if this is a content upvote
                 if isinstance(obj, Content):
-                    logger.info("Sending content upvote notification", extra={
+                    logger.info("Queueing content upvote notification", extra={
                         'user_id': user.id,
                         'content_id': obj.id,
                         'vote_id': created_vote.id,
                     })
-                    notify_content_upvote(created_vote)
+                    notify_later(notify_content_upvote, created_vote)
                 # Check if this is a knowledge path upvote
                 elif isinstance(obj, KnowledgePath):
-                    logger.info("Sending knowledge path upvote notification", extra={
+                    logger.info("Queueing knowledge path upvote notification", extra={
                         'user_id': user.id,
                         'knowledge_path_id': obj.id,
                         'vote_id': created_vote.id,
                     })
-                    notify_knowledge_path_upvote(created_vote)
+                    notify_later(notify_knowledge_path_upvote, created_vote)
             except Exception as e:
                 logger.error(f"Error sending upvote notification: {str(e)}", extra={
                     'user_id': user.id,
@@ -412,14 +412,8 @@ class ContentVoteView(BaseGetVoteView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            logger.debug(f"Before vote - Vote count: {self.get_vote_count(content, topic)}")
-            logger.debug(f"Before vote - User vote: {self.get_vote(request.user, content, topic).value if self.get_vote(request.user, content, topic) else 'None'}")
-            
             vote_count = self.perform_vote_action(request, content, action, topic)
             
-            logger.debug(f"After vote - Vote count: {vote_count}")
-            logger.debug(f"After vote - User vote: {self.get_vote(request.user, content, topic).value if self.get_vote(request.user, content, topic) else 'None'}")
-            
             # Get the user's current vote after the action
             user_vote = self.get_vote(request.user, content, topic)
             
@@ -1,10 +1,21 @@
 import axiosInstance from './axiosConfig';
 
+// Comment lists are keyset pages: { results, next_cursor, page_size }, newest roots
+// first; pass next_cursor back as cursor to load older ones. Each comment inlines its
+// first replies; replies_next_cursor continues on the replies endpoint.
+const getCommentsPage = async (url, { cursor = null, pageSize = 20 } = {}) => {
+    const params = { page_size: pageSize };
+    if (cursor) params.cursor = cursor;
+    const response = await axiosInstance.get(url, { params });
+    return response.data;
+};
+
 const commentsApi = {
-    // Get comments for a topic
-    getTopicComments: async (topicId) => {
-        const response = await axiosInstance.get(`/comments/topic/${topicId}/`);
-        return response.data;
+    getCommentsPage,
+
+    // One page of comments for a topic
+    getTopicComments: async (topicId, options) => {
+        return getCommentsPage(`/comments/topic/${topicId}/`, options);
     },
 
     // Add comment to a topic
@@ -13,10 +24,9 @@ const commentsApi = {
         return response.data;
     },
 
-    // Get comments for a content within a topic
-    getContentComments: async (topicId, contentId) => {
-        const response = await axiosInstance.get(`/comments/topic/${topicId}/content/${contentId}/`);
-        return response.data;
+    // One page of comments for a content within a topic
+    getContentComments: async (topicId, contentId, options) => {
+        return getCommentsPage(`/comments/topic/${topicId}/content/${contentId}/`, options);
     },
 
     // Add comment to a content within a topic
@@ -25,11 +35,10 @@ const commentsApi = {
         return response.data;
     },
 
-    // Get replies for a comment
-    getCommentReplies: async (commentId) => {
+    // One page of replies after a comment's inlined ones (cursor: replies_next_cursor)
+    getCommentRepliesPage: async (commentId, cursor) => {
         try {
-            const response = await axiosInstance.get(`/comments/replies/${commentId}/`);
-            return response.data;
+            return await getCommentsPage(`/comments/replies/${commentId}/`, { cursor });
         } catch (error) {
             console.error('Error fetching comment replies:', error);
             throw error;
@@ -64,10 +73,9 @@ const commentsApi = {
         return response.data;
     },
 
-    getKnowledgePathComments: async (pathId) => {
+    getKnowledgePathComments: async (pathId, options) => {
         try {
-            const response = await axiosInstance.get(`/comments/knowledge-path/${pathId}/`);
-            return response.data;
+            return await getCommentsPage(`/comments/knowledge-path/${pathId}/`, options);
         } catch (error) {
             console.error('Error fetching knowledge path comments:', error);
             throw error.response?.data || error.message;
@@ -86,9 +94,8 @@ const commentsApi = {
         }
     },
 
-    getDiscussionQuestionComments: async (questionId) => {
-        const response = await axiosInstance.get(`/comments/discussion-question/${questionId}/`);
-        return response.data;
+    getDiscussionQuestionComments: async (questionId, options) => {
+        return getCommentsPage(`/comments/discussion-question/${questionId}/`, options);
     },
 
     addDiscussionQuestionComment: async (questionId, body) => {
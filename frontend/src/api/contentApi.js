@@ -291,6 +291,39 @@ const contentApi = {
     }
   },
 
+  /**
+   * Timed segments overlapping [fromMs, toMs), for loading the window around the playhead.
+   * Decodes the columnar payload into { segments: [{ index, start_ms, end_ms, text }], nextCursor, segmentCount }.
+   */
+  getTranscriptSegments: async (contentId, { fromMs, toMs, cursor, limit } = {}) => {
+    const params = {};
+    if (fromMs != null) params.from_ms = Math.max(0, Math.floor(fromMs));
+    if (toMs != null) params.to_ms = Math.max(0, Math.ceil(toMs));
+    if (cursor) params.cursor = cursor;
+    if (limit) params.limit = limit;
+    try {
+      const response = await axiosInstance.get(
+        `/content/content_details/${contentId}/transcript/segments/`,
+        { params },
+      );
+      const { segments: columns, next_cursor: nextCursor, segment_count: segmentCount } = response.data;
+      const offsets = columns.text_offsets;
+      const segments = columns.index.map((index, i) => ({
+        index,
+        start_ms: columns.start_ms[i],
+        end_ms: columns.end_ms[i],
+        text: columns.text.slice(offsets[i], offsets[i + 1]),
+      }));
+      return { segments, nextCursor, segmentCount };
+    } catch (error) {
+      if (error.response?.status === 404) {
+        return null;
+      }
+      console.error('Error fetching transcript segments:', error);
+      throw error;
+    }
+  },
+
   getTranscriptAnchor: async (contentId) => {
     const response = await axiosInstance.get(
       `/content/content_details/${contentId}/transcript/anchor/`,
@@ -637,10 +670,32 @@ const contentApi = {
     }
   },
 
-  getTopics: async () => {
+  // One keyset page of public topics: { results, next_cursor, page_size }.
+  getTopicsPage: async ({ cursor = null, pageSize = 24, fields = null } = {}) => {
     try {
-      const response = await axiosInstance.get('/content/topics/');
+      const params = { page_size: pageSize };
+      if (cursor) params.cursor = cursor;
+      if (fields) params.fields = fields.join(',');
+      const response = await axiosInstance.get('/content/topics/', { params });
       return response.data;
+    } catch (error) {
+      console.error('Error fetching topics page:', error);
+      throw error;
+    }
+  },
+
+  // All public topics (follows next_cursor until the last page). Only for callers that
+  // need the complete list (pickers, client-side filters); listings page with getTopicsPage.
+  getTopics: async () => {
+    try {
+      const topics = [];
+      let cursor = null;
+      do {
+        const page = await contentApi.getTopicsPage({ cursor, pageSize: 100 });
+        topics.push(...page.results);
+        cursor = page.next_cursor;
+      } while (cursor);
+      return topics;
     } catch (error) {
       console.error('Error fetching topics:', error);
       throw error;
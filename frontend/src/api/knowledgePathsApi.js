@@ -145,6 +145,23 @@ const knowledgePathsApi = {
     }
   },
 
+  // Keyset page of the public listing: { results, next_cursor, page_size }.
+  getKnowledgePathsPage: async ({ cursor = '', pageSize = 9 } = {}) => {
+    try {
+      const response = await axiosInstance.get('/knowledge_paths/', {
+        params: {
+          cursor,
+          page_size: pageSize
+        }
+      });
+
+      return response.data;
+    } catch (error) {
+      console.error('Error fetching knowledge paths page:', error);
+      throw error;
+    }
+  },
+
   getUserKnowledgePaths: async (page = 1, pageSize = 9) => {
     try {
       const response = await axiosInstance.get('/knowledge_paths/my/', {
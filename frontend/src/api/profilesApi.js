@@ -165,16 +165,16 @@ const socialLogin = async (credential) => {
   }
 };
 
-const getNotifications = async (showAll = false) => {
-
+// One keyset page of notifications: { notifications, next_cursor, page_size }.
+const getNotificationsPage = async ({ showAll = false, cursor = null, pageSize = 20 } = {}) => {
   try {
-
-    const url = showAll ? '/profiles/notifications/?show_all=true' : '/profiles/notifications/';
-    const response = await axiosInstance.get(url);
-
-    return response.data.notifications;
+    const params = { page_size: pageSize };
+    if (showAll) params.show_all = 'true';
+    if (cursor) params.cursor = cursor;
+    const response = await axiosInstance.get('/profiles/notifications/', { params });
+    return response.data;
   } catch (error) {
-    console.error('Error in getNotifications:', error);
+    console.error('Error in getNotificationsPage:', error);
     throw error;
   }
 };
@@ -335,7 +335,7 @@ export {
   completeFromInvite,
   refreshToken,
   socialLogin,
-  getNotifications,
+  getNotificationsPage,
   getUnreadNotificationsCount,
   markNotificationAsRead,
   markAllNotificationsAsRead,
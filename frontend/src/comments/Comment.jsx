@@ -196,6 +196,30 @@ const addReplyToComment = (comments, parentId, newReply) => {
     });
 };
 
+// Helper function to append a page of loaded replies, skipping ones already shown
+const appendRepliesPage = (comments, parentId, page) => {
+    return comments.map(comment => {
+        if (comment.id === parentId) {
+            const shown = new Set((comment.replies || []).map(reply => reply.id));
+            return {
+                ...comment,
+                replies: [
+                    ...(comment.replies || []),
+                    ...(page.results || []).filter(reply => !shown.has(reply.id)),
+                ],
+                replies_next_cursor: page.next_cursor,
+            };
+        }
+        if (comment.replies) {
+            return {
+                ...comment,
+                replies: appendRepliesPage(comment.replies, parentId, page)
+            };
+        }
+        return comment;
+    });
+};
+
 export const Comment = ({
     comment,
     depth = 0,
@@ -207,11 +231,13 @@ export const Comment = ({
     const [isReplying, setIsReplying] = useState(false);
     const [error, setError] = useState(null);
     const [showReplies, setShowReplies] = useState(true);
+    const [loadingReplies, setLoadingReplies] = useState(false);
     const { authState } = useContext(AuthContext);
 
     const canReply = depth < MAX_DEPTH;
     const isAuthor = authState?.user?.id === comment.author;
     const hasReplies = comment.replies && comment.replies.length > 0;
+    const replyCount = Math.max(comment.reply_count || 0, comment.replies?.length || 0);
 
     const handleMenuOpen = (event) => setAnchorEl(event.currentTarget);
     const handleMenuClose = () => setAnchorEl(null);
@@ -269,6 +295,18 @@ export const Comment = ({
         }
     };
 
+    const handleLoadMoreReplies = async () => {
+        setLoadingReplies(true);
+        try {
+            const page = await commentsApi.getCommentRepliesPage(comment.id, comment.replies_next_cursor);
+            setAllComments(prevComments => appendRepliesPage(prevComments, comment.id, page));
+        } catch (err) {
+            setError('Error al cargar más respuestas. Por favor, inténtelo de nuevo.');
+        } finally {
+            setLoadingReplies(false);
+        }
+    };
+
     const handleEditComment = async (editedBody, { setError: setFormError, setGeneralError }) => {
         if (editedBody === comment.body) {
             return true;
@@ -406,7 +444,7 @@ export const Comment = ({
                                 onClick={() => setShowReplies(!showReplies)}
                                 sx={{ ml: 'auto' }}
                             >
-                                {showReplies ? 'Ocultar Respuestas' : `Mostrar ${comment.replies.length} ${comment.replies.length === 1 ? 'Respuesta' : 'Respuestas'}`}
+                                {showReplies ? 'Ocultar Respuestas' : `Mostrar ${replyCount} ${replyCount === 1 ? 'Respuesta' : 'Respuestas'}`}
                             </Button>
                         )}
                     </Box>
@@ -440,6 +478,16 @@ export const Comment = ({
                             setAllComments={setAllComments}
                         />
                     ))}
+                    {comment.replies_next_cursor && (
+                        <Button
+                            size="small"
+                            onClick={handleLoadMoreReplies}
+                            disabled={loadingReplies}
+                            sx={{ ml: (depth + 1) * 4 }}
+                        >
+                            {loadingReplies ? 'Cargando...' : 'Cargar más respuestas'}
+                        </Button>
+                    )}
                 </Box>
             )}
 
@@ -42,7 +42,9 @@ const CommentSection = ({
     lockedEmptyLabel = null,
 }) => {
     const [comments, setComments] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null);
     const [loading, setLoading] = useState(true);
+    const [loadingMore, setLoadingMore] = useState(false);
     const [error, setError] = useState(null);
     const [generalError, setGeneralError] = useState('');
     const { authState } = useContext(AuthContext);
@@ -61,40 +63,61 @@ const CommentSection = ({
     useEffect(() => {
         if (hideComments) {
             setComments([]);
+            setNextCursor(null);
             setLoading(false);
             return;
         }
         loadComments();
     }, [topicId, contentId, knowledgePathId, discussionQuestionId, hideComments]);
 
+    // One page of root comments (newest first) for this section's context.
+    const fetchCommentsPage = (cursor = null) => {
+        const options = { cursor };
+        if (discussionQuestionId) {
+            return commentsApi.getDiscussionQuestionComments(discussionQuestionId, options);
+        } else if (knowledgePathId) {
+            return commentsApi.getKnowledgePathComments(knowledgePathId, options);
+        } else if (contentId) {
+            return commentsApi.getContentComments(topicId, contentId, options);
+        } else if (topicId) {
+            return commentsApi.getTopicComments(topicId, options);
+        }
+        throw new Error('No valid comment context provided');
+    };
+
     const loadComments = async () => {
         try {
             setLoading(true);
-            let fetchedComments;
-
-            if (discussionQuestionId) {
-                fetchedComments = await commentsApi.getDiscussionQuestionComments(discussionQuestionId);
-            } else if (knowledgePathId) {
-                fetchedComments = await commentsApi.getKnowledgePathComments(knowledgePathId);
-            } else if (contentId) {
-                fetchedComments = await commentsApi.getContentComments(topicId, contentId);
-            } else if (topicId) {
-                fetchedComments = await commentsApi.getTopicComments(topicId);
-            } else {
-                throw new Error('No valid comment context provided');
-            }
-
-            setComments(fetchedComments);
+            const page = await fetchCommentsPage();
+            setComments(page?.results || []);
+            setNextCursor(page?.next_cursor || null);
         } catch (err) {
             if (err.response?.status !== 404) {
                 setError('Error al cargar los comentarios');
             }
             setComments([]);
+            setNextCursor(null);
         } finally {
             setLoading(false);
         }
     };
 
+    const loadOlderComments = async () => {
+        try {
+            setLoadingMore(true);
+            const page = await fetchCommentsPage(nextCursor);
+            setComments(prevComments => {
+                const shown = new Set(prevComments.map(comment => comment.id));
+                return [...prevComments, ...(page?.results || []).filter(comment => !shown.has(comment.id))];
+            });
+            setNextCursor(page?.next_cursor || null);
+        } catch {
+            setError('Error al cargar más comentarios');
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     const notifyMutate = async () => {
         if (typeof onAfterMutate === 'function') {
             await onAfterMutate();
@@ -251,6 +274,11 @@ const CommentSection = ({
                             onDeleteComment={handleDeleteComment}
                         />
                     ))}
+                    {nextCursor && (
+                        <Button size="small" onClick={loadOlderComments} disabled={loadingMore}>
+                            {loadingMore ? 'Cargando...' : 'Cargar comentarios anteriores'}
+                        </Button>
+                    )}
                 </Box>
             ) : (
                 <Typography color="text.secondary">{emptyLabel}</Typography>
@@ -7,11 +7,13 @@ import { mockAuthValue } from '../../test/formTestUtils';
 
 const mockAddCommentReply = vi.fn();
 const mockUpdateComment = vi.fn();
+const mockGetCommentRepliesPage = vi.fn();
 
 vi.mock('../../api/commentsApi', () => ({
   default: {
     addCommentReply: (...args) => mockAddCommentReply(...args),
     updateComment: (...args) => mockUpdateComment(...args),
+    getCommentRepliesPage: (...args) => mockGetCommentRepliesPage(...args),
     deleteComment: vi.fn(),
   },
 }));
@@ -154,3 +156,47 @@ describe('Comment edit form', () => {
     ).toBeInTheDocument();
   });
 });
+
+describe('Comment load more replies', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  const reply = (id) => ({ ...baseComment, id, author: 999, body: `Respuesta ${id}` });
+
+  it('loads the next page of replies with replies_next_cursor', async () => {
+    const user = userEvent.setup();
+    const setAllComments = vi.fn();
+    const comment = {
+      ...baseComment,
+      replies: [reply(2)],
+      reply_count: 3,
+      replies_next_cursor: 'cursor-1',
+    };
+    mockGetCommentRepliesPage.mockResolvedValue({
+      results: [reply(2), reply(3), reply(4)],
+      next_cursor: null,
+    });
+    render(
+      <AuthContext.Provider value={mockAuthValue}>
+        <Comment comment={comment} depth={0} allComments={[comment]} setAllComments={setAllComments} />
+      </AuthContext.Provider>,
+    );
+
+    await user.click(screen.getByRole('button', { name: /cargar más respuestas/i }));
+
+    await waitFor(() => {
+      expect(mockGetCommentRepliesPage).toHaveBeenCalledWith(1, 'cursor-1');
+    });
+    await waitFor(() => expect(setAllComments).toHaveBeenCalled());
+    const [updated] = setAllComments.mock.calls[0][0]([comment]);
+    expect(updated.replies.map((r) => r.id)).toEqual([2, 3, 4]);
+    expect(updated.replies_next_cursor).toBeNull();
+  });
+
+  it('hides the action when every reply is shown', () => {
+    renderComment({ ...baseComment, replies: [reply(2)], reply_count: 1, replies_next_cursor: null });
+
+    expect(screen.queryByRole('button', { name: /cargar más respuestas/i })).not.toBeInTheDocument();
+  });
+});
@@ -18,15 +18,19 @@ vi.mock('../../api/commentsApi', () => ({
     deleteComment: vi.fn(),
     updateComment: vi.fn(),
     addCommentReply: vi.fn(),
-    getDiscussionQuestionComments: vi.fn().mockResolvedValue([]),
+    getDiscussionQuestionComments: vi.fn().mockResolvedValue({ results: [], next_cursor: null }),
     addDiscussionQuestionComment: vi.fn(),
   },
 }));
 
+vi.mock('../../votes/VoteComponent', () => ({
+  default: () => <div data-testid="vote-component" />,
+}));
+
 describe('CommentSection form', () => {
   beforeEach(() => {
     vi.clearAllMocks();
-    mockGetTopicComments.mockResolvedValue([]);
+    mockGetTopicComments.mockResolvedValue({ results: [], next_cursor: null });
   });
 
   it('shows a validation error on empty submit and does not call the API', async () => {
@@ -81,3 +85,41 @@ describe('CommentSection form', () => {
     ).toBeInTheDocument();
   });
 });
+
+describe('CommentSection pagination', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  const rootComment = (id) => ({
+    id,
+    body: `Comentario ${id}`,
+    author: 999,
+    author_name: 'otro',
+    created_at: new Date().toISOString(),
+    updated_at: new Date().toISOString(),
+    is_edited: false,
+    replies: [],
+    reply_count: 0,
+    is_active: true,
+  });
+
+  it('loads older root comments on demand with next_cursor', async () => {
+    const user = userEvent.setup();
+    mockGetTopicComments
+      .mockResolvedValueOnce({ results: [rootComment(2)], next_cursor: 'older' })
+      .mockResolvedValueOnce({ results: [rootComment(1)], next_cursor: null });
+    renderWithProviders(<CommentSection topicId={5} />);
+
+    expect(await screen.findByText('Comentario 2')).toBeInTheDocument();
+    expect(mockGetTopicComments).toHaveBeenCalledWith(5, { cursor: null });
+
+    await user.click(screen.getByRole('button', { name: /cargar comentarios anteriores/i }));
+
+    expect(await screen.findByText('Comentario 1')).toBeInTheDocument();
+    expect(mockGetTopicComments).toHaveBeenLastCalledWith(5, { cursor: 'older' });
+    expect(
+      screen.queryByRole('button', { name: /cargar comentarios anteriores/i }),
+    ).not.toBeInTheDocument();
+  });
+});
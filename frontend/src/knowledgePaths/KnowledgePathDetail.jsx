@@ -37,7 +37,6 @@ import {
 } from '@mui/icons-material';
 import knowledgePathsApi from '../api/knowledgePathsApi';
 import certificatesApi from '../api/certificatesApi';
-import commentsApi from '../api/commentsApi';
 import { AuthContext } from '../context/AuthContext';
 import useAuthErrorHandler, { AUTH_ERROR_STRATEGY } from '../hooks/useAuthErrorHandler';
 import CommentSection from '../comments/CommentSection';
@@ -66,8 +65,6 @@ const KnowledgePathDetail = () => {
   const [error, setError] = useState(null);
   const [errorDetails, setErrorDetails] = useState(null);
   const [isCreator, setIsCreator] = useState(false);
-  const [comments, setComments] = useState([]);
-  const [newComment, setNewComment] = useState('');
   const [hasCompleted, setHasCompleted] = useState(false);
   const [requestingCertificate, setRequestingCertificate] = useState(false);
   const [certificateRequested, setCertificateRequested] = useState(false);
@@ -95,13 +92,6 @@ const KnowledgePathDetail = () => {
       }
 
       if (data.progress?.is_completed) {
-        try {
-          const commentsData = await commentsApi.getKnowledgePathComments(pathId);
-          if (!cancelled) setComments(commentsData);
-        } catch (error) {
-          console.error('Error fetching knowledge path comments:', error);
-        }
-
         try {
           const statusData = await certificatesApi.getCertificateRequestStatus(pathId);
           if (!cancelled) setCertificateStatus(statusData);
@@ -147,19 +137,6 @@ const KnowledgePathDetail = () => {
     };
   }, [pathId, clubSlug, user?.username, authState.isAuthenticated, authState.user, handleAuthError, getErrorMessage]);
 
-  const handleAddComment = async (e) => {
-    e.preventDefault();
-    if (!newComment.trim()) return;
-
-    try {
-      const response = await commentsApi.addKnowledgePathComment(pathId, newComment);
-      setComments([...comments, response]);
-      setNewComment('');
-    } catch (err) {
-      console.error('Failed to add comment:', err);
-    }
-  };
-
   const handleOpenModal = () => {
     setIsModalOpen(true);
   };
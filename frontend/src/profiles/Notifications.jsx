@@ -11,7 +11,10 @@ const Notifications = ({
   unreadCount = 0,
   onMarkAsRead = () => {},
   onMarkAllAsRead = () => {},
-  onRefresh = () => {}
+  onRefresh = () => {},
+  hasMore = false,
+  loadingMore = false,
+  onLoadMore = () => {}
 }) => {
 
   const TOPIC_SUGGESTION_VERBS = [
@@ -251,6 +254,13 @@ const Notifications = ({
         })}
         </Stack>
       }
+      {!loading && !error && hasMore &&
+      <Box sx={{ display: 'flex', justifyContent: 'center', mt: 2 }}>
+          <Button variant="outlined" onClick={onLoadMore} disabled={loadingMore}>
+            {loadingMore ? 'Cargando...' : 'Cargar más notificaciones'}
+          </Button>
+        </Box>
+      }
       <Typography
         variant="caption"
         color="text.secondary"
@@ -4,7 +4,7 @@ import { useForm } from 'react-hook-form';
 import * as yup from 'yup';
 import { yupResolver } from '@hookform/resolvers/yup';
 import { AuthContext } from '../context/AuthContext';
-import { getUserProfile, getProfileById, getNotifications, markNotificationAsRead, markAllNotificationsAsRead, changePassword } from '../api/profilesApi';
+import { getUserProfile, getProfileById, getNotificationsPage, markNotificationAsRead, markAllNotificationsAsRead, changePassword } from '../api/profilesApi';
 import { useNotifications } from '../context/NotificationsContext.jsx';
 import ProfileHeader from './ProfileHeader';
 import ProfileHeaderSkeleton from '../components/ProfileHeaderSkeleton';
@@ -208,6 +208,8 @@ const Profile = () => {
     const [activeSection, setActiveSection] = useState('publications');
     const [notifications, setNotifications] = useState([]);
     const [notificationsLoading, setNotificationsLoading] = useState(false);
+    const [notificationsCursor, setNotificationsCursor] = useState(null);
+    const [notificationsLoadingMore, setNotificationsLoadingMore] = useState(false);
     const [notificationsError, setNotificationsError] = useState(null);
     const [isNavigating, setIsNavigating] = useState(false);
     const { unreadCount: unreadNotificationsCount, refreshUnreadCount } = useNotifications();
@@ -350,22 +352,43 @@ const Profile = () => {
         
         try {
             setNotificationsLoading(true);
-            const notifications = await getNotifications(true);
-            setNotifications(Array.isArray(notifications) ? notifications : []);
+            const page = await getNotificationsPage({ showAll: true });
+            setNotifications(Array.isArray(page?.notifications) ? page.notifications : []);
+            setNotificationsCursor(page?.next_cursor || null);
             setNotificationsError(null);
         } catch (err) {
             setNotificationsError('Error al obtener las notificaciones');
             console.error('Error fetching notifications:', err);
             setNotifications([]);
+            setNotificationsCursor(null);
         } finally {
             setNotificationsLoading(false);
         }
     };
 
+    // Older notifications are fetched one page at a time, on demand.
+    const handleLoadMoreNotifications = async () => {
+        if (!notificationsCursor) return;
+        try {
+            setNotificationsLoadingMore(true);
+            const page = await getNotificationsPage({ showAll: true, cursor: notificationsCursor });
+            setNotifications(prev => {
+                const shown = new Set(prev.map(n => n.id));
+                return [...prev, ...(page?.notifications || []).filter(n => !shown.has(n.id))];
+            });
+            setNotificationsCursor(page?.next_cursor || null);
+        } catch (err) {
+            setNotificationsError('Error al obtener las notificaciones');
+            console.error('Error fetching more notifications:', err);
+        } finally {
+            setNotificationsLoadingMore(false);
+        }
+    };
+
     const handleMarkAsRead = async (notificationId) => {
         try {
             await markNotificationAsRead(notificationId);
-            await fetchNotifications();
+            setNotifications(prev => prev.map(n => (n.id === notificationId ? { ...n, unread: false } : n)));
             await refreshUnreadCount(true);
         } catch (err) {
             console.error('Error marking notification as read:', err);
@@ -428,13 +451,16 @@ const Profile = () => {
                             onMarkAllAsRead={async () => {
                                 try {
                                     await markAllNotificationsAsRead();
-                                    await fetchNotifications();
+                                    setNotifications(prev => prev.map(n => ({ ...n, unread: false })));
                                     await refreshUnreadCount(true);
                                 } catch (err) {
                                     console.error('Error marking all notifications as read:', err);
                                 }
                             }}
                             onRefresh={fetchNotifications}
+                            hasMore={Boolean(notificationsCursor)}
+                            loadingMore={notificationsLoadingMore}
+                            onLoadMore={handleLoadMoreNotifications}
                         />
                     );
                 }
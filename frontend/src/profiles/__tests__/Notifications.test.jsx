@@ -0,0 +1,36 @@
+import { describe, it, expect, vi } from 'vitest';
+import { screen } from '@testing-library/react';
+import userEvent from '@testing-library/user-event';
+import Notifications from '../Notifications';
+import { renderWithProviders } from '../../test/formTestUtils';
+
+const notification = {
+  id: 1,
+  actor: 'ana',
+  verb: 'se registró en tu evento',
+  description: 'ana se registró en tu evento',
+  timestamp: new Date().toISOString(),
+  unread: true,
+};
+
+describe('Notifications', () => {
+  it('asks for the next page when more notifications exist', async () => {
+    const user = userEvent.setup();
+    const onLoadMore = vi.fn();
+    renderWithProviders(
+      <Notifications notifications={[notification]} hasMore onLoadMore={onLoadMore} />,
+    );
+
+    await user.click(screen.getByRole('button', { name: /cargar más notificaciones/i }));
+
+    expect(onLoadMore).toHaveBeenCalledTimes(1);
+  });
+
+  it('hides the action on the last page', () => {
+    renderWithProviders(<Notifications notifications={[notification]} hasMore={false} />);
+
+    expect(
+      screen.queryByRole('button', { name: /cargar más notificaciones/i }),
+    ).not.toBeInTheDocument();
+  });
+});
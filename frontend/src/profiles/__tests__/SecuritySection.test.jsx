@@ -8,7 +8,7 @@ const mockChangePassword = vi.fn();
 vi.mock('../../api/profilesApi', () => ({
   getUserProfile: vi.fn(),
   getProfileById: vi.fn(),
-  getNotifications: vi.fn(),
+  getNotificationsPage: vi.fn(),
   markNotificationAsRead: vi.fn(),
   markAllNotificationsAsRead: vi.fn(),
   changePassword: (...args) => mockChangePassword(...args),
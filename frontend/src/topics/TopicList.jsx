@@ -16,17 +16,23 @@ import AddIcon from '@mui/icons-material/Add';
 import contentApi from '../api/contentApi';
 import { isAuthenticated } from '../context/localStorageUtils';
 
+const TOPICS_PAGE_SIZE = 24;
+
 const TopicList = () => {
     const [topics, setTopics] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null);
     const [loading, setLoading] = useState(true);
+    const [loadingMore, setLoadingMore] = useState(false);
     const [error, setError] = useState(null);
+    const [loadMoreError, setLoadMoreError] = useState(null);
     const navigate = useNavigate();
 
     useEffect(() => {
         const fetchTopics = async () => {
             try {
-                const data = await contentApi.getTopics();
-                setTopics(data);
+                const page = await contentApi.getTopicsPage({ pageSize: TOPICS_PAGE_SIZE });
+                setTopics(page.results || []);
+                setNextCursor(page.next_cursor);
                 setLoading(false);
             } catch (err) {
                 setError('Error al cargar los temas');
@@ -37,6 +43,23 @@ const TopicList = () => {
         fetchTopics();
     }, []);
 
+    const handleLoadMore = async () => {
+        setLoadingMore(true);
+        setLoadMoreError(null);
+        try {
+            const page = await contentApi.getTopicsPage({ cursor: nextCursor, pageSize: TOPICS_PAGE_SIZE });
+            setTopics(prevTopics => {
+                const shown = new Set(prevTopics.map(topic => topic.id));
+                return [...prevTopics, ...(page.results || []).filter(topic => !shown.has(topic.id))];
+            });
+            setNextCursor(page.next_cursor);
+        } catch (err) {
+            setLoadMoreError('Error al cargar más temas');
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     if (loading) return (
         <Box sx={{ display: 'flex', justifyContent: 'center', pt: { xs: 2, md: 4 } }}>
             <CircularProgress />
@@ -109,6 +132,17 @@ const TopicList = () => {
                     </Grid>
                 ))}
             </Grid>
+
+            {loadMoreError && (
+                <Alert severity="error" sx={{ mt: 3 }}>{loadMoreError}</Alert>
+            )}
+            {nextCursor && (
+                <Box sx={{ display: 'flex', justifyContent: 'center', mt: 3 }}>
+                    <Button variant="outlined" onClick={handleLoadMore} disabled={loadingMore}>
+                        {loadingMore ? 'Cargando...' : 'Cargar más temas'}
+                    </Button>
+                </Box>
+            )}
         </Box>
     );
 };
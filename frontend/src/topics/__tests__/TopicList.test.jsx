@@ -0,0 +1,43 @@
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { screen, waitFor } from '@testing-library/react';
+import userEvent from '@testing-library/user-event';
+import TopicList from '../TopicList';
+import { renderWithProviders } from '../../test/formTestUtils';
+
+const mockGetTopicsPage = vi.fn();
+const mockGetTopics = vi.fn();
+
+vi.mock('../../api/contentApi', () => ({
+  default: {
+    getTopicsPage: (...args) => mockGetTopicsPage(...args),
+    getTopics: (...args) => mockGetTopics(...args),
+  },
+}));
+
+const topic = (id) => ({ id, title: `Tema ${id}`, description: '' });
+
+describe('TopicList', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  it('loads one page and fetches the next one on demand', async () => {
+    const user = userEvent.setup();
+    mockGetTopicsPage
+      .mockResolvedValueOnce({ results: [topic(1), topic(2)], next_cursor: 'c1' })
+      .mockResolvedValueOnce({ results: [topic(3)], next_cursor: null });
+    renderWithProviders(<TopicList />);
+
+    expect(await screen.findByText('Tema 2')).toBeInTheDocument();
+    expect(mockGetTopicsPage).toHaveBeenCalledTimes(1);
+    expect(mockGetTopics).not.toHaveBeenCalled();
+
+    await user.click(screen.getByRole('button', { name: /cargar más temas/i }));
+
+    expect(await screen.findByText('Tema 3')).toBeInTheDocument();
+    expect(mockGetTopicsPage).toHaveBeenLastCalledWith(expect.objectContaining({ cursor: 'c1' }));
+    await waitFor(() => {
+      expect(screen.queryByRole('button', { name: /cargar más temas/i })).not.toBeInTheDocument();
+    });
+  });
+});